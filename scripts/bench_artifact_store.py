@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Artifact Store Benchmark
+Times a cross-step reload of a screenplay-sized artifact: plain file read +
+json.load versus ArtifactStore hits with and without a private copy.
+
+Usage: python scripts/bench_artifact_store.py [size_mb] [repeats]
+"""
+
+import sys
+import json
+import time
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.pipeline import artifact_store
+from src.pipeline.artifact_store import ArtifactStore
+
+
+def make_screenplay(size_mb: float) -> dict:
+    """Step 8-shaped artifact of roughly size_mb of JSON"""
+    scenes = []
+    while len(json.dumps(scenes)) < size_mb * 1024 * 1024:
+        n = len(scenes) + 1
+        scenes.append({
+            "scene_number": n,
+            "slugline": f"INT. WAREHOUSE {n} - NIGHT",
+            "beat": "Fun and Games",
+            "emotional_polarity": "+/-",
+            "conflict": "The hero wants out; the crew wants one more job.",
+            "elements": [
+                {"element_type": "action", "content": "Rain hammers the skylight. " * 4},
+                {"element_type": "character", "content": "ALEX"},
+                {"element_type": "dialogue", "content": "We walk away tonight or never. " * 2},
+            ] * 3,
+        })
+    return {"title": "Bench", "scenes": scenes, "metadata": {"version": "1.0.0"}}
+
+
+def best_ms(fn, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000)
+    return min(times)
+
+
+def main():
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 0.64
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "sp_step_8_screenplay.json"
+        path.write_text(json.dumps(make_screenplay(size_mb), indent=2), encoding="utf-8")
+        store = ArtifactStore()
+        store.load("bench", 8, path, copy=False)  # warm
+
+        def file_load():
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        print(f"artifact: {path.stat().st_size / 1024 / 1024:.2f} MB, "
+              f"parser: {'orjson' if artifact_store.orjson else 'json'}, best of {repeats}")
+        print(f"  open + json.load       {best_ms(file_load, repeats):8.2f} ms")
+        print(f"  store hit, copy=True   {best_ms(lambda: store.load('bench', 8, path), repeats):8.2f} ms")
+        print(f"  store hit, copy=False  {best_ms(lambda: store.load('bench', 8, path, copy=False), repeats):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
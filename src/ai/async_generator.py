@@ -0,0 +1,401 @@
+"""
+Async AI Generator for Snowflake Pipeline
+Non-blocking counterpart of AIGenerator so callers can fan out many calls from one event loop
+"""
+
+import os
+import time
+import asyncio
+import logging
+import weakref
+import contextvars
+from typing import Dict, Any, Optional, Tuple
+
+import httpx
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
+
+from src.ai.generator import (
+    AIGenerator, PROVIDERS, provider_api_key, provider_client_options,
+    anthropic_usage, openai_usage, record_usage
+)
+from src.ai.response_cache import ResponseCache, get_response_cache
+from src.ai.telemetry import CallRecord, get_call_telemetry, current_tags
+from src.observability.metrics import get_pipeline_metrics
+from src.observability.tracing import record_span
+from src.ai.rate_limiter import (
+    get_rate_limiter, estimate_tokens, is_rate_limit_error, retry_after_seconds
+)
+
+logger = logging.getLogger(__name__)
+
+# Usage and first-token time of the current task's in-flight call, for telemetry
+_call_usage: contextvars.ContextVar = contextvars.ContextVar("async_call_usage", default=None)
+_first_token_at: contextvars.ContextVar = contextvars.ContextVar("async_first_token_at", default=None)
+
+# Connection pool sizing for the shared HTTP client
+POOL_MAX_CONNECTIONS = 64
+POOL_MAX_KEEPALIVE = 32
+
+# Event-loop-bound resources (HTTP pools, semaphores, SDK clients) cannot be
+# shared across loops, so each running loop gets its own set.
+_loop_state: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+def _state_for_running_loop() -> Dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    state = _loop_state.get(loop)
+    if state is None:
+        state = {"http": None, "semaphores": {}, "clients": {}}
+        _loop_state[loop] = state
+    return state
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Process-wide pooled HTTP client for the running event loop"""
+    state = _state_for_running_loop()
+    client = state["http"]
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=POOL_MAX_KEEPALIVE,
+            ),
+            timeout=httpx.Timeout(1200.0, connect=10.0),
+        )
+        state["http"] = client
+        state["clients"].clear()
+    return client
+
+
+async def close_shared_http_client() -> None:
+    """Close the pooled HTTP client for the running event loop"""
+    state = _state_for_running_loop()
+    if state["http"] is not None:
+        await state["http"].aclose()
+        state["http"] = None
+        state["clients"].clear()
+
+
+class AsyncAIGenerator:
+    """
+    Async AI generator with the same generate/generate_with_validation surface
+    as AIGenerator, built on the async SDK clients.
+
+    Providers, API keys, default models and client options come from the
+    same PROVIDERS registry as AIGenerator, and ``model_config["provider"]``
+    routes a single call to another provider. All instances on an event
+    loop share one HTTP connection pool, and calls are bounded by a
+    per-provider semaphore so a fan-out of dozens of calls cannot exceed
+    the provider's concurrency budget.
+    """
+
+    DEFAULT_CONCURRENCY = {"openai": 16, "anthropic": 8, "xai": 8}
+    STREAM_THRESHOLD = 16000
+
+    # Response parsing is provider- and transport-independent
+    _parse_artifact = AIGenerator._parse_artifact
+    _parse_text_response = AIGenerator._parse_text_response
+    _add_revision_context = AIGenerator._add_revision_context
+    _anthropic_request = AIGenerator._anthropic_request
+    _openai_request = AIGenerator._openai_request
+
+    def __init__(self,
+                 provider: Optional[str] = None,
+                 cache: Optional[ResponseCache] = None,
+                 max_concurrency: Optional[int] = None):
+        """
+        Initialize async AI generator
+
+        Args:
+            provider: "anthropic", "openai", "xai" or "openrouter". If None, auto-detect from API keys
+            cache: Response cache; defaults to the process-wide cache (None if disabled)
+            max_concurrency: In-flight calls allowed for this provider on one loop
+                (env AI_MAX_CONCURRENCY, else a per-provider default)
+        """
+        if provider is None:
+            if os.getenv("OPENAI_API_KEY"):
+                provider = "openai"
+            elif os.getenv("ANTHROPIC_API_KEY"):
+                provider = "anthropic"
+            else:
+                raise ValueError("No API key found. Set ANTHROPIC_API_KEY or OPENAI_API_KEY.")
+
+        self.api_key = provider_api_key(provider)
+        self.default_model = PROVIDERS[provider]["default_model"]
+        self.provider = provider
+        self.cache = cache if cache is not None else get_response_cache()
+        if max_concurrency is None:
+            try:
+                max_concurrency = int(os.getenv("AI_MAX_CONCURRENCY", "0")) or None
+            except ValueError:
+                max_concurrency = None
+        self.max_concurrency = max_concurrency or self.DEFAULT_CONCURRENCY.get(provider, 8)
+        logger.info("AsyncAIGenerator initialized: provider=%s max_concurrency=%d",
+                    provider, self.max_concurrency)
+
+    @property
+    def client(self):
+        """SDK client bound to the running loop's shared connection pool"""
+        return self._client_for(self.provider)
+
+    def _client_for(self, provider: str):
+        """Async SDK client for any registered provider, on the running loop's pool"""
+        http_client = get_shared_http_client()
+        clients = _state_for_running_loop()["clients"]
+        api_key = self.api_key if provider == self.provider else provider_api_key(provider)
+        key = (provider, api_key)
+        client = clients.get(key)
+        if client is None:
+            client_cls = AsyncAnthropic if provider == "anthropic" else AsyncOpenAI
+            client = client_cls(api_key=api_key, http_client=http_client,
+                                **provider_client_options(provider))
+            clients[key] = client
+        return client
+
+    def _semaphore(self, provider: str) -> asyncio.Semaphore:
+        semaphores = _state_for_running_loop()["semaphores"]
+        sem = semaphores.get(provider)
+        if sem is None:
+            limit = (self.max_concurrency if provider == self.provider
+                     else self.DEFAULT_CONCURRENCY.get(provider, 8))
+            sem = asyncio.Semaphore(limit)
+            semaphores[provider] = sem
+        return sem
+
+    def _resolve_call(self, model_config: Optional[Dict[str, Any]]) -> Tuple[str, str, float, int]:
+        """Resolve provider, model and sampling params for one call"""
+        if not model_config:
+            model_config = {}
+
+        # model_config["provider"] routes this call to another provider's client
+        provider = model_config.get("provider") or self.provider
+        if provider not in PROVIDERS:
+            raise ValueError(f"Unsupported provider: {provider}")
+        default_model = self.default_model if provider == self.provider else PROVIDERS[provider]["default_model"]
+        model = model_config.get("model_name", default_model)
+        temperature = model_config.get("temperature", 0.3)
+        max_tokens = model_config.get("max_tokens", 4000)
+        return provider, model, temperature, max_tokens
+
+    async def _discard_cached(self,
+                              prompt_data: Dict[str, str],
+                              model_config: Optional[Dict[str, Any]]) -> None:
+        """Remove the cached response for this request, if any"""
+        if self.cache is None:
+            return
+        provider, model, temperature, max_tokens = self._resolve_call(model_config)
+        key = ResponseCache.make_key(provider, model, prompt_data, temperature, max_tokens)
+        await asyncio.to_thread(self.cache.discard, key)
+
+    async def generate(self,
+                       prompt_data: Dict[str, str],
+                       model_config: Optional[Dict[str, Any]] = None,
+                       max_retries: int = 3,
+                       use_cache: bool = True) -> str:
+        """
+        Generate content using AI model without blocking the event loop
+
+        Args:
+            prompt_data: Dict with "system" and "user" prompts
+            model_config: Model configuration (temperature, max_tokens, etc.)
+            max_retries: Maximum retry attempts
+            use_cache: Set False to bypass the response cache for this call
+
+        Returns:
+            Generated text
+        """
+        provider, model, temperature, max_tokens = self._resolve_call(model_config)
+
+        cache_key = None
+        if self.cache is not None and use_cache:
+            cache_key = ResponseCache.make_key(
+                provider, model, prompt_data, temperature, max_tokens
+            )
+            # The cache is SQLite; keep its I/O off the event loop
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                logger.info("AI cache hit: %d chars (key=%s)", len(cached), cache_key[:12])
+                get_call_telemetry().record(CallRecord(
+                    provider=provider, model=model, outcome="ok",
+                    latency_seconds=0.0, cache_hit=True))
+                return cached
+
+        client = self._client_for(provider)
+        limiter = get_rate_limiter(provider, model)
+        est_tokens = estimate_tokens(prompt_data, max_tokens)
+        started = time.monotonic()
+        span_start = time.time_ns()
+
+        for attempt in range(max_retries):
+            try:
+                async with self._semaphore(provider), limiter.slot_async(est_tokens):
+                    t0 = time.time()
+                    attempt_started = time.monotonic()
+                    _call_usage.set(None)
+                    _first_token_at.set(None)
+                    if provider == "anthropic":
+                        response = await self._generate_anthropic(
+                            prompt_data, model, temperature, max_tokens, client
+                        )
+                    else:  # openai, xai, openrouter (OpenAI-compatible API)
+                        response = await self._generate_openai(
+                            prompt_data, model, temperature, max_tokens, client, provider
+                        )
+                logger.info("AI response (async): %.1fs, %d chars",
+                            time.time() - t0, len(response) if response else 0)
+                self._record_call(provider, model, "ok" if response and response.strip() else "empty",
+                                  started, attempt_started, attempt, span_start)
+                if response:
+                    get_pipeline_metrics().words_generated(provider, model, len(response.split()))
+                if cache_key and response and response.strip():
+                    await asyncio.to_thread(self.cache.put, cache_key, response, provider, model)
+                return response
+
+            except Exception as exc:
+                logger.warning("Async AI call attempt %d/%d failed: %s",
+                               attempt + 1, max_retries, exc)
+                if attempt == max_retries - 1:
+                    _call_usage.set(None)
+                    self._record_call(provider, model, "error", started, None, attempt, span_start)
+                    raise
+                if not (is_rate_limit_error(exc) and retry_after_seconds(exc)):
+                    await asyncio.sleep(2 ** attempt)
+
+    def _record_call(self,
+                     provider: str,
+                     model: str,
+                     outcome: str,
+                     started: float,
+                     attempt_started: Optional[float],
+                     retries: int,
+                     span_start: int) -> None:
+        """Hand one finished call to the telemetry queue and the current trace"""
+        usage = _call_usage.get()
+        first_token = _first_token_at.get()
+        record = CallRecord(
+            provider=provider,
+            model=model,
+            outcome=outcome,
+            latency_seconds=time.monotonic() - started,
+            ttft_seconds=(first_token - attempt_started) if first_token and attempt_started else None,
+            prompt_tokens=usage["input_tokens"] if usage else 0,
+            completion_tokens=usage["output_tokens"] if usage else 0,
+            cached_tokens=usage["cached_input_tokens"] if usage else 0,
+            retries=retries,
+            streamed=first_token is not None,
+        )
+        get_call_telemetry().record(record)
+        # Tasks inherit the caller's context, so the span nests under the awaiting step
+        record_span("ai.generate", span_start, provider=provider, model=model, outcome=outcome,
+                    retries=retries, prompt_tokens=record.prompt_tokens,
+                    completion_tokens=record.completion_tokens, cached_tokens=record.cached_tokens,
+                    ttft_seconds=record.ttft_seconds)
+
+    @staticmethod
+    def _note_usage(provider: str, model: str, usage: Optional[Dict[str, int]]) -> None:
+        _call_usage.set(usage)
+        record_usage(provider, model, usage)
+
+    @staticmethod
+    def _mark_first_token() -> None:
+        if _first_token_at.get() is None:
+            _first_token_at.set(time.monotonic())
+
+    async def _generate_anthropic(self,
+                                  prompt_data: Dict[str, str],
+                                  model: str,
+                                  temperature: float,
+                                  max_tokens: int,
+                                  client) -> str:
+        """Generate using Anthropic Claude"""
+        kwargs = self._anthropic_request(prompt_data, model, temperature, max_tokens)
+        if max_tokens > self.STREAM_THRESHOLD:
+            collected = []
+            async with client.messages.stream(**kwargs) as stream:
+                async for text in stream.text_stream:
+                    self._mark_first_token()
+                    collected.append(text)
+                final = await stream.get_final_message()
+            self._note_usage("anthropic", model, anthropic_usage(getattr(final, "usage", None)))
+            return "".join(collected)
+        response = await client.messages.create(**kwargs)
+        self._note_usage("anthropic", model, anthropic_usage(getattr(response, "usage", None)))
+        return response.content[0].text
+
+    async def _generate_openai(self,
+                               prompt_data: Dict[str, str],
+                               model: str,
+                               temperature: float,
+                               max_tokens: int,
+                               client,
+                               provider: str) -> str:
+        """Generate using OpenAI-compatible chat completions"""
+        kwargs = self._openai_request(prompt_data, model, temperature, max_tokens)
+
+        if max_tokens > self.STREAM_THRESHOLD:
+            kwargs["stream"] = True
+            if provider == "openai":
+                kwargs["stream_options"] = {"include_usage": True}
+            collected = []
+            stream = await client.chat.completions.create(**kwargs)
+            async for chunk in stream:
+                if getattr(chunk, "usage", None) is not None:
+                    self._note_usage(provider, model, openai_usage(chunk.usage))
+                if chunk.choices and chunk.choices[0].delta.content:
+                    self._mark_first_token()
+                    collected.append(chunk.choices[0].delta.content)
+            return "".join(collected)
+        response = await client.chat.completions.create(**kwargs)
+        self._note_usage(provider, model, openai_usage(getattr(response, "usage", None)))
+        return response.choices[0].message.content
+
+    async def generate_with_validation(self,
+                                       prompt_data: Dict[str, str],
+                                       validator,
+                                       model_config: Optional[Dict[str, Any]] = None,
+                                       max_attempts: int = 2) -> Dict[str, Any]:
+        """
+        Generate content and validate, retrying with revision context if needed
+
+        Args:
+            prompt_data: Prompts for generation
+            validator: Validator instance for the step
+            model_config: Model configuration
+            max_attempts: Maximum generation attempts
+
+        Returns:
+            Validated artifact (best effort if attempts run out)
+        """
+        artifact: Dict[str, Any] = {}
+        errors = []
+        for attempt in range(max_attempts):
+            raw_output = await self.generate(prompt_data, model_config)
+            if not raw_output or not raw_output.strip():
+                logger.warning("Empty response on attempt %d/%d — retrying",
+                               attempt + 1, max_attempts)
+                raw_output = await self.generate(prompt_data, model_config)
+                if not raw_output or not raw_output.strip():
+                    continue
+
+            artifact = self._parse_artifact(raw_output, validator)
+            is_valid, errors = validator.validate(artifact)
+            get_call_telemetry().record_validation(type(validator).__name__, is_valid)
+            get_pipeline_metrics().validation("artifact", current_tags().get("step", ""), is_valid)
+            if is_valid:
+                logger.info("Validation PASSED on attempt %d/%d", attempt + 1, max_attempts)
+                return artifact
+
+            # Don't let a rerun replay a response that failed validation
+            await self._discard_cached(prompt_data, model_config)
+
+            logger.warning("Validation FAILED attempt %d/%d: %d errors",
+                           attempt + 1, max_attempts, len(errors))
+            if attempt < max_attempts - 1:
+                prompt_data = self._add_revision_context(
+                    dict(prompt_data), artifact, errors, validator
+                )
+
+        logger.warning("Returning best-effort artifact after %d attempts (%d errors remain)",
+                       max_attempts, len(errors))
+        return artifact
@@ -7,10 +7,11 @@ import json
 import random
 import logging
 from typing import Dict, Any, Optional, List, Union, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
 
-from src.ai.generator import AIGenerator
+from src.ai.generator import AIGenerator, is_provider_configured
 from src.ai.model_selector import ModelSelector
+from src.ai.circuit_breaker import get_circuit_breaker
 
 
 class BulletproofGenerator:
@@ -37,13 +38,12 @@ class BulletproofGenerator:
             ]
         }
         
-        # Circuit breaker state
-        self.failure_counts = {}
-        self.last_failures = {}
-        self.circuit_breaker_threshold = 5  # Fail fast after 5 consecutive failures
+        # Circuit breaker state is shared by every generator in the process
+        self.circuit_breaker = get_circuit_breaker()
         
-        # Retry configuration
-        self.max_retries = 10
+        # Retry configuration: each round tries every healthy provider once,
+        # backing off only between full rounds
+        self.max_rounds = 3
         self.base_retry_delay = 1.0
         self.max_retry_delay = 60.0
         
@@ -58,59 +58,86 @@ class BulletproofGenerator:
         Returns:
             Generated content (never fails)
         """
+        return self.generate_with_status(prompt, config)[0]
+    
+    def generate_with_status(self, prompt: Dict[str, str],
+                             config: Optional[Dict[str, Any]] = None) -> Tuple[str, bool]:
+        """
+        Generate content like generate_guaranteed, reporting whether it fell back
+        
+        Returns:
+            (content, is_fallback) - is_fallback is True when every provider
+            failed and the content is the emergency fallback
+        """
         if not config:
             config = {"temperature": 0.7, "max_tokens": 4000}
         
-        # Try all providers and models with retries (OpenAI/GPT-4o first)
-        for provider in ["openai", "anthropic", "openrouter"]:
-            for model_name in self.fallback_models.get(provider, []):
-                
-                # Check circuit breaker
-                breaker_key = f"{provider}:{model_name}"
-                if self._is_circuit_open(breaker_key):
+        for round_num in range(self.max_rounds):
+            if round_num > 0:
+                # Add jitter to prevent thundering herd
+                delay = min(self.base_retry_delay * (2 ** (round_num - 1)), self.max_retry_delay)
+                time.sleep(delay + random.uniform(0, delay * 0.1))
+            
+            attempted = False
+            # Try all providers and models (OpenAI/GPT first)
+            for provider in ["openai", "anthropic", "openrouter"]:
+                if not is_provider_configured(provider):
                     continue
-                
-                # Try this model with retries
-                result = self._try_model_with_retries(prompt, config, provider, model_name)
-                if result:
-                    self._reset_circuit_breaker(breaker_key)
-                    return result
-                else:
-                    self._record_failure(breaker_key)
+                for model_name in dict.fromkeys(self.fallback_models.get(provider, [])):
+                    breaker_key = f"{provider}:{model_name}"
+                    if not self.circuit_breaker.allow(breaker_key):
+                        continue
+                    
+                    attempted = True
+                    result = self._try_model(prompt, config, provider, model_name)
+                    if result:
+                        self.circuit_breaker.record_success(breaker_key)
+                        return result, False
+            
+            if not attempted:
+                # Every endpoint is open or unconfigured; waiting won't help
+                break
         
         # If all AI generation fails, return guaranteed fallback
-        return self._generate_emergency_fallback(prompt, config)
+        return self._generate_emergency_fallback(prompt, config), True
     
-    def _try_model_with_retries(self, prompt: Dict[str, str], config: Dict[str, Any], 
-                              provider: str, model_name: str) -> Optional[str]:
-        """Try a specific model with exponential backoff retries"""
+    def _try_model(self, prompt: Dict[str, str], config: Dict[str, Any],
+                   provider: str, model_name: str) -> Optional[str]:
+        """Make one attempt on a specific provider/model and update its breaker"""
         
         model_config = config.copy()
         model_config["model_name"] = model_name
         model_config["provider"] = provider
+        breaker_key = f"{provider}:{model_name}"
         
-        for attempt in range(self.max_retries):
-            try:
-                # Add jitter to prevent thundering herd
-                if attempt > 0:
-                    delay = min(self.base_retry_delay * (2 ** attempt), self.max_retry_delay)
-                    jitter = random.uniform(0, delay * 0.1)
-                    time.sleep(delay + jitter)
-                
-                # Try generation
-                result = self.primary_generator.generate(prompt, model_config)
-                
-                # Validate result
-                if self._validate_result(result, prompt):
-                    return result
-                
-            except Exception as e:
-                logging.warning(f"Attempt {attempt+1}/{self.max_retries} failed for {provider}:{model_name}: {e}")
-                if attempt == self.max_retries - 1:
-                    logging.error(f"All {self.max_retries} attempts failed for {provider}:{model_name}")
+        try:
+            # Single attempt: failover to the next provider beats retrying this one
+            result = self.primary_generator.generate(prompt, model_config, max_retries=1)
+        except Exception as e:
+            logging.warning(f"{provider}:{model_name} failed: {e}")
+            if self._is_non_retryable(e):
+                self.circuit_breaker.trip(breaker_key)
+            else:
+                self.circuit_breaker.record_failure(breaker_key)
+            return None
+        
+        # Validate result
+        if self._validate_result(result, prompt):
+            return result
         
+        logging.warning(f"{provider}:{model_name} returned unusable output")
+        # Drop it from the response cache so the next round asks again
+        self.primary_generator._discard_cached(prompt, model_config)
+        self.circuit_breaker.record_failure(breaker_key)
         return None
     
+    @staticmethod
+    def _is_non_retryable(error: Exception) -> bool:
+        """Missing credentials, auth failures and unknown models won't fix themselves"""
+        if isinstance(error, ValueError):
+            return True
+        return getattr(error, "status_code", None) in (401, 403, 404)
+    
     def _validate_result(self, result: str, prompt: Dict[str, str]) -> bool:
         """Validate that the result is usable"""
         if not result or not isinstance(result, str):
@@ -158,36 +185,6 @@ class BulletproofGenerator:
         
         return None
     
-    def _is_circuit_open(self, breaker_key: str) -> bool:
-        """Check if circuit breaker is open for this model"""
-        if breaker_key not in self.failure_counts:
-            return False
-        
-        failure_count = self.failure_counts[breaker_key]
-        last_failure = self.last_failures.get(breaker_key)
-        
-        if failure_count < self.circuit_breaker_threshold:
-            return False
-        
-        # Circuit is open, check if enough time has passed to retry
-        if last_failure and datetime.now() - last_failure < timedelta(minutes=5):
-            return True
-        
-        # Reset and allow retry
-        self._reset_circuit_breaker(breaker_key)
-        return False
-    
-    def _record_failure(self, breaker_key: str):
-        """Record a failure for circuit breaker"""
-        self.failure_counts[breaker_key] = self.failure_counts.get(breaker_key, 0) + 1
-        self.last_failures[breaker_key] = datetime.now()
-    
-    def _reset_circuit_breaker(self, breaker_key: str):
-        """Reset circuit breaker after success"""
-        self.failure_counts[breaker_key] = 0
-        if breaker_key in self.last_failures:
-            del self.last_failures[breaker_key]
-    
     def _generate_emergency_fallback(self, prompt: Dict[str, str], config: Dict[str, Any]) -> str:
         """Generate guaranteed fallback content when all AI fails"""
         
@@ -4,7 +4,7 @@ Never fails to generate prose, with multiple quality tiers and emergency fallbac
 """
 import json
 import random
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
 from src.ai.bulletproof_generator import get_bulletproof_generator
@@ -57,26 +57,41 @@ class BulletproofProseGenerator:
         Returns:
             Generated prose (never fails, always meets minimum)
         """
+        return self.generate_scene_with_status(scene_context, character_bible, word_target, min_words)[0]
+    
+    def generate_scene_with_status(self, 
+                                   scene_context: Dict[str, Any], 
+                                   character_bible: Optional[Dict[str, Any]], 
+                                   word_target: int, 
+                                   min_words: int = 500) -> Tuple[str, bool]:
+        """
+        Generate scene prose like generate_guaranteed_scene, reporting fallbacks
+        
+        Returns:
+            (prose, is_fallback) - is_fallback is True when any part of the
+            prose came from an emergency fallback rather than a model
+        """
         
         # Try high-quality AI generation first
-        prose = self._try_ai_generation(scene_context, character_bible, word_target)
+        prose, is_fallback = self._try_ai_generation(scene_context, character_bible, word_target)
         
         # Validate and extend if needed
         word_count = len(prose.split()) if prose else 0
         
         if word_count >= min_words:
-            return prose
+            return prose, is_fallback
         elif word_count > 0:
             # Extend existing prose to meet minimum
-            return self._extend_prose_to_minimum(prose, scene_context, min_words)
+            prose, extension_fallback = self._extend_prose_to_minimum(prose, scene_context, min_words)
+            return prose, is_fallback or extension_fallback
         else:
             # Generate emergency fallback prose
-            return self._generate_emergency_prose(scene_context, character_bible, min_words)
+            return self._generate_emergency_prose(scene_context, character_bible, min_words), True
     
     def _try_ai_generation(self, 
                          scene_context: Dict[str, Any], 
                          character_bible: Optional[Dict[str, Any]], 
-                         word_target: int) -> str:
+                         word_target: int) -> Tuple[str, bool]:
         """Try AI generation with comprehensive prompt"""
         
         # Build detailed prompt
@@ -84,7 +99,7 @@ class BulletproofProseGenerator:
         config = {"temperature": 0.8, "max_tokens": min(word_target * 6, 8000)}
         
         # Use bulletproof generation
-        return self.bulletproof_generator.generate_guaranteed(prompt, config)
+        return self.bulletproof_generator.generate_with_status(prompt, config)
     
     def _build_prose_prompt(self, 
                           scene_context: Dict[str, Any], 
@@ -136,6 +151,28 @@ REACTIVE SCENE STRUCTURE:
 - Dilemma: {dilemma}
 - Decision: {decision}
 - Stakes: {stakes}
+"""
+        
+        # Continuity comes from the scene hooks rather than neighbouring prose,
+        # so scenes can be drafted independently of each other
+        continuity_lines = []
+        if scene_context.get("previous_outbound_hook"):
+            continuity_lines.append(f"- Previous scene ended on: {scene_context['previous_outbound_hook']}")
+        if scene_context.get("inbound_hook"):
+            continuity_lines.append(f"- Open this scene on: {scene_context['inbound_hook']}")
+        if scene_context.get("outbound_hook"):
+            continuity_lines.append(f"- Close this scene on: {scene_context['outbound_hook']}")
+        if scene_context.get("next_inbound_hook"):
+            continuity_lines.append(f"- Next scene opens on: {scene_context['next_inbound_hook']}")
+        continuity = ""
+        if scene_context.get("story_so_far"):
+            continuity += f"\nSTORY SO FAR:\n{scene_context['story_so_far']}\n"
+        if continuity_lines:
+            continuity += "\nCONTINUITY:\n" + "\n".join(continuity_lines) + "\n"
+        if scene_context.get("previous_scene_text"):
+            continuity += f"""
+PREVIOUS SCENE ENDING (continue directly from here):
+...{scene_context['previous_scene_text']}
 """
         
         system = f"""Write compelling scene prose with vivid sensory details, realistic dialogue, and strong emotional resonance.
@@ -156,7 +193,7 @@ Requirements:
 {char_details}
 
 {scene_elements}
-
+{continuity}
 Write the complete scene in vivid, engaging prose. Focus on:
 1. Opening that establishes mood and stakes
 2. Rising action with concrete details
@@ -171,14 +208,14 @@ Write exactly {word_target} words of polished prose."""
     def _extend_prose_to_minimum(self, 
                                existing_prose: str, 
                                scene_context: Dict[str, Any], 
-                               min_words: int) -> str:
+                               min_words: int) -> Tuple[str, bool]:
         """Extend existing prose to meet minimum word count"""
         
         current_words = len(existing_prose.split())
         needed_words = min_words - current_words
         
         if needed_words <= 0:
-            return existing_prose
+            return existing_prose, False
         
         # Generate extension
         pov = scene_context.get("pov", "Character")
@@ -188,9 +225,9 @@ Write exactly {word_target} words of polished prose."""
             "user": f"Existing scene:\n{existing_prose}\n\nContinue from {pov}'s perspective with exactly {needed_words} more words."
         }
         
-        extension = self.bulletproof_generator.generate_guaranteed(prompt, {"temperature": 0.7})
+        extension, is_fallback = self.bulletproof_generator.generate_with_status(prompt, {"temperature": 0.7})
         
-        return existing_prose + "\n\n" + extension
+        return existing_prose + "\n\n" + extension, is_fallback
     
     def _generate_emergency_prose(self, 
                                 scene_context: Dict[str, Any], 
@@ -0,0 +1,126 @@
+"""
+Circuit Breaker for AI Providers
+Process-wide, thread-safe failure tracking so every generator skips dead endpoints
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Classic three-state breaker keyed by endpoint (e.g. "openai:gpt-5.2").
+
+    After ``failure_threshold`` consecutive failures a key opens and callers
+    skip it immediately. Once ``cooldown_seconds`` have passed exactly one
+    caller is let through as a half-open probe: success closes the breaker,
+    failure re-opens it for another cooldown.
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown_seconds: float = 300.0):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures before a key opens
+            cooldown_seconds: Time an open key waits before a probe is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._state: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        """Return True if a call to ``key`` may proceed now"""
+        with self._lock:
+            state = self._state.get(key, CLOSED)
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN:
+                return False  # a probe is already in flight
+            if time.monotonic() - self._opened_at.get(key, 0.0) >= self.cooldown_seconds:
+                self._state[key] = HALF_OPEN
+                logger.info("Circuit %s half-open: probing", key)
+                return True
+            return False
+
+    def record_success(self, key: str) -> None:
+        """Close the breaker for ``key``"""
+        with self._lock:
+            if self._state.get(key, CLOSED) != CLOSED:
+                logger.info("Circuit %s closed", key)
+            self._state[key] = CLOSED
+            self._failures[key] = 0
+            self._opened_at.pop(key, None)
+
+    def record_failure(self, key: str) -> None:
+        """Count a failure; opens the breaker at the threshold or on a failed probe"""
+        with self._lock:
+            self._failures[key] = self._failures.get(key, 0) + 1
+            state = self._state.get(key, CLOSED)
+            if state == HALF_OPEN or self._failures[key] >= self.failure_threshold:
+                self._open_locked(key)
+
+    def trip(self, key: str) -> None:
+        """Open the breaker immediately (non-retryable errors such as bad credentials)"""
+        with self._lock:
+            self._failures[key] = max(self._failures.get(key, 0), self.failure_threshold)
+            self._open_locked(key)
+
+    def _open_locked(self, key: str) -> None:
+        if self._state.get(key) != OPEN:
+            logger.warning("Circuit %s open after %d failures", key, self._failures.get(key, 0))
+        self._state[key] = OPEN
+        self._opened_at[key] = time.monotonic()
+
+    def state(self, key: str) -> str:
+        with self._lock:
+            return self._state.get(key, CLOSED)
+
+    def failure_count(self, key: str) -> int:
+        with self._lock:
+            return self._failures.get(key, 0)
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Forget state for one key, or for all keys"""
+        with self._lock:
+            if key is None:
+                self._failures.clear()
+                self._opened_at.clear()
+                self._state.clear()
+            else:
+                self._failures.pop(key, None)
+                self._opened_at.pop(key, None)
+                self._state.pop(key, None)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """State and failure count per key"""
+        with self._lock:
+            return {
+                key: {"state": self._state.get(key, CLOSED), "failures": self._failures.get(key, 0)}
+                for key in set(self._state) | set(self._failures)
+            }
+
+
+# Global instance
+_circuit_breaker = None
+_circuit_breaker_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get the process-wide circuit breaker"""
+    global _circuit_breaker
+    with _circuit_breaker_lock:
+        if _circuit_breaker is None:
+            _circuit_breaker = CircuitBreaker()
+        return _circuit_breaker
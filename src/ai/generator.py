@@ -7,7 +7,8 @@ import os
 import json
 import time
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Dict, Any, Optional, List, Iterator, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -21,18 +22,173 @@ except Exception:
 from anthropic import Anthropic
 from openai import OpenAI
 
+from src.ai.response_cache import ResponseCache, get_response_cache
+from src.ai.single_flight import SingleFlight, get_single_flight
+from src.ai.telemetry import CallRecord, get_call_telemetry, current_tags
+from src.observability.metrics import get_pipeline_metrics
+from src.observability.tracing import span, record_span, set_span_attributes
+from src.ai.stream_json import iter_json_array, extract_json
+from src.ai.rate_limiter import (
+    get_rate_limiter, estimate_tokens, is_rate_limit_error, retry_after_seconds
+)
+
+# Per-provider connection settings; every provider except Anthropic speaks
+# the OpenAI-compatible chat completions API.
+PROVIDERS: Dict[str, Dict[str, Any]] = {
+    "anthropic": {
+        "api_key_env": "ANTHROPIC_API_KEY",
+        "default_model": "claude-sonnet-4-5-20250929",
+    },
+    "openai": {
+        "api_key_env": "OPENAI_API_KEY",
+        "default_model": "gpt-5.2-2025-12-11",
+        # 20 min timeout for large screenplay generations (128K tokens)
+        "timeout": 1200.0,
+    },
+    "xai": {
+        "api_key_env": "XAI_API_KEY",
+        "default_model": "grok-4-1-fast-reasoning",
+        "base_url": "https://api.x.ai/v1",
+        "timeout": 600.0,
+    },
+    "openrouter": {
+        "api_key_env": "OPENROUTER_API_KEY",
+        "default_model": "anthropic/claude-sonnet-4-5-20250929",
+        "base_url": "https://openrouter.ai/api/v1",
+        "timeout": 1200.0,
+    },
+}
+
+_clients: Dict[tuple, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def is_provider_configured(provider: str) -> bool:
+    """True if the provider is known and its API key is set"""
+    spec = PROVIDERS.get(provider)
+    return bool(spec and os.getenv(spec["api_key_env"]))
+
+
+def provider_api_key(provider: str) -> str:
+    """API key for a provider; raises ValueError if the provider is unknown or unset"""
+    spec = PROVIDERS.get(provider)
+    if spec is None:
+        raise ValueError(f"Unsupported provider: {provider}")
+    api_key = os.getenv(spec["api_key_env"])
+    if not api_key:
+        raise ValueError(f"{spec['api_key_env']} not found in environment")
+    return api_key
+
+
+def provider_client_options(provider: str) -> Dict[str, Any]:
+    """SDK client constructor arguments for a provider, other than the API key"""
+    spec = PROVIDERS[provider]
+    options = {name: spec[name] for name in ("base_url", "timeout") if name in spec}
+    if provider == "openrouter":
+        options["default_headers"] = {
+            "HTTP-Referer": os.getenv("OPENROUTER_SITE_URL", "http://localhost"),
+            "X-Title": os.getenv("OPENROUTER_SITE_NAME", "snowflake-novel-generator"),
+        }
+    return options
+
+
+def get_provider_client(provider: str):
+    """
+    Get the shared SDK client for a provider, creating it on first use.
+
+    Clients are cached per (provider, API key, client class) so every
+    AIGenerator in the process reuses one connection pool per provider.
+    """
+    api_key = provider_api_key(provider)
+    client_cls = Anthropic if provider == "anthropic" else OpenAI
+    key = (provider, api_key, client_cls)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = client_cls(api_key=api_key, **provider_client_options(provider))
+            _clients[key] = client
+            logger.info("Created %s client", provider)
+        return client
+
+
+def _int(value: Any) -> int:
+    return value if isinstance(value, int) else 0
+
+
+def anthropic_usage(usage: Any) -> Optional[Dict[str, int]]:
+    """Normalize Anthropic usage (input_tokens excludes cache reads/writes)"""
+    if usage is None:
+        return None
+    uncached = _int(getattr(usage, "input_tokens", 0))
+    cached = _int(getattr(usage, "cache_read_input_tokens", 0))
+    cache_write = _int(getattr(usage, "cache_creation_input_tokens", 0))
+    return {
+        "input_tokens": uncached + cached + cache_write,
+        "cached_input_tokens": cached,
+        "uncached_input_tokens": uncached + cache_write,
+        "cache_write_tokens": cache_write,
+        "output_tokens": _int(getattr(usage, "output_tokens", 0)),
+    }
+
+
+def openai_usage(usage: Any) -> Optional[Dict[str, int]]:
+    """Normalize OpenAI-compatible usage (prompt_tokens includes cached tokens)"""
+    if usage is None:
+        return None
+    total = _int(getattr(usage, "prompt_tokens", 0))
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = _int(getattr(details, "cached_tokens", 0)) if details is not None else 0
+    return {
+        "input_tokens": total,
+        "cached_input_tokens": cached,
+        "uncached_input_tokens": max(0, total - cached),
+        "cache_write_tokens": 0,
+        "output_tokens": _int(getattr(usage, "completion_tokens", 0)),
+    }
+
+
+_usage_totals: Dict[tuple, Dict[str, int]] = {}
+_usage_lock = threading.Lock()
+
+
+def record_usage(provider: str, model: str, usage: Optional[Dict[str, int]]) -> None:
+    """Log one call's cached vs uncached input tokens and add it to the totals"""
+    if not usage:
+        return
+    logger.info("AI usage: input=%d (cached=%d, uncached=%d) output=%d",
+                usage["input_tokens"], usage["cached_input_tokens"],
+                usage["uncached_input_tokens"], usage["output_tokens"])
+    with _usage_lock:
+        totals = _usage_totals.setdefault((provider, model), {"calls": 0})
+        totals["calls"] += 1
+        for field, value in usage.items():
+            totals[field] = totals.get(field, 0) + value
+
+
+def get_usage_totals() -> Dict[str, Dict[str, int]]:
+    """Accumulated token usage per "provider:model" for this process"""
+    with _usage_lock:
+        return {f"{p}:{m}": dict(v) for (p, m), v in _usage_totals.items()}
+
+
 class AIGenerator:
     """
     Unified AI generator for all Snowflake steps
     Supports both Anthropic and OpenAI models
     """
     
-    def __init__(self, provider: Optional[str] = None):
+    def __init__(self,
+                 provider: Optional[str] = None,
+                 cache: Optional[ResponseCache] = None,
+                 single_flight: Optional[SingleFlight] = None):
         """
         Initialize AI generator
         
         Args:
-            provider: "anthropic" or "openai". If None, auto-detect based on available API keys
+            provider: "anthropic", "openai", "xai" or "openrouter". If None, auto-detect
+                based on available API keys
+            cache: Response cache; defaults to the process-wide cache (None if disabled)
+            single_flight: Coalescing group; defaults to the process-wide group
         """
         # Auto-detect provider if not specified (prefer OpenAI for GPT-4)
         if provider is None:
@@ -44,38 +200,103 @@ class AIGenerator:
                 raise ValueError("No API key found. Set ANTHROPIC_API_KEY or OPENAI_API_KEY.")
 
         self.provider = provider
+        self.cache = cache if cache is not None else get_response_cache()
+        self.single_flight = single_flight if single_flight is not None else get_single_flight()
         logger.info("AIGenerator initialized: provider=%s", provider)
 
-        if provider == "anthropic":
-            api_key = os.getenv("ANTHROPIC_API_KEY")
-            if not api_key:
-                raise ValueError("ANTHROPIC_API_KEY not found in environment")
-            self.client = Anthropic(api_key=api_key)
-            self.default_model = "claude-sonnet-4-5-20250929"
-        elif provider == "openai":
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
-                raise ValueError("OPENAI_API_KEY not found in environment")
-            # 20 min timeout for large screenplay generations (128K tokens)
-            self.client = OpenAI(api_key=api_key, timeout=1200.0)
-            self.default_model = "gpt-5.2-2025-12-11"
-        elif provider == "xai":
-            api_key = os.getenv("XAI_API_KEY")
-            if not api_key:
-                raise ValueError("XAI_API_KEY not found in environment")
-            self.client = OpenAI(
-                api_key=api_key,
-                base_url="https://api.x.ai/v1",
-                timeout=600.0,
-            )
-            self.default_model = "grok-4-1-fast-reasoning"
-        else:
+        if provider not in PROVIDERS:
             raise ValueError(f"Unsupported provider: {provider}")
+        self.client = get_provider_client(provider)
+        self.default_model = PROVIDERS[provider]["default_model"]
     
+    @property
+    def _local(self) -> threading.local:
+        # Lazily created so subclasses with their own __init__ still work
+        local = self.__dict__.get("_usage_local")
+        if local is None:
+            local = self.__dict__.setdefault("_usage_local", threading.local())
+        return local
+
+    @property
+    def last_usage(self) -> Optional[Dict[str, int]]:
+        """Token usage of this thread's most recent call (None if not reported)"""
+        return getattr(self._local, "last_usage", None)
+
+    def _note_usage(self, usage: Optional[Dict[str, int]]) -> None:
+        self._local.pending_usage = usage
+
+    def _record_usage(self, provider: str, model: str) -> None:
+        """Log cached vs uncached input tokens for the call that just finished"""
+        usage = getattr(self._local, "pending_usage", None)
+        self._local.pending_usage = None
+        self._local.last_usage = usage
+        record_usage(provider, model, usage)
+
+    def _mark_first_token(self) -> None:
+        if getattr(self._local, "first_token_at", None) is None:
+            self._local.first_token_at = time.monotonic()
+
+    def _record_call(self,
+                     provider: str,
+                     model: str,
+                     outcome: str,
+                     started: float,
+                     attempt_started: Optional[float] = None,
+                     retries: int = 0,
+                     cache_hit: bool = False,
+                     stream_started_ns: Optional[int] = None) -> None:
+        """Hand one finished call to the telemetry queue and annotate its trace span"""
+        usage = None if cache_hit else self.last_usage
+        first_token = getattr(self._local, "first_token_at", None)
+        self._local.first_token_at = None
+        record = CallRecord(
+            provider=provider,
+            model=model,
+            outcome=outcome,
+            latency_seconds=time.monotonic() - started,
+            ttft_seconds=(first_token - attempt_started) if first_token and attempt_started else None,
+            prompt_tokens=usage["input_tokens"] if usage else 0,
+            completion_tokens=usage["output_tokens"] if usage else 0,
+            cached_tokens=usage["cached_input_tokens"] if usage else 0,
+            retries=retries,
+            cache_hit=cache_hit,
+            streamed=first_token is not None,
+        )
+        get_call_telemetry().record(record)
+        attributes = dict(outcome=outcome, retries=retries, cache_hit=cache_hit,
+                          prompt_tokens=record.prompt_tokens, completion_tokens=record.completion_tokens,
+                          cached_tokens=record.cached_tokens, ttft_seconds=record.ttft_seconds)
+        if stream_started_ns is None:
+            set_span_attributes(**attributes)
+        else:
+            # stream() is a generator, so it can't hold a span open across its yields
+            record_span("ai.stream", stream_started_ns, provider=provider, model=model, **attributes)
+
+    def _resolve_call(self, model_config: Optional[Dict[str, Any]]) -> Tuple[str, Any, str, float, int]:
+        """Resolve provider, client, model and sampling params for one call"""
+        if not model_config:
+            model_config = {}
+        
+        # model_config["provider"] routes this call to another provider's client
+        provider = model_config.get("provider") or self.provider
+        if provider == self.provider:
+            client = self.client
+            default_model = self.default_model
+        else:
+            client = get_provider_client(provider)
+            default_model = PROVIDERS[provider]["default_model"]
+
+        model = model_config.get("model_name", default_model)
+        # Use temperature from config or default
+        temperature = model_config.get("temperature", 0.3)
+        max_tokens = model_config.get("max_tokens", 4000)  # Increased default for longer content
+        return provider, client, model, temperature, max_tokens
+
     def generate(self,
                  prompt_data: Dict[str, str],
                  model_config: Optional[Dict[str, Any]] = None,
-                 max_retries: int = 3) -> str:
+                 max_retries: int = 3,
+                 use_cache: bool = True) -> str:
         """
         Generate content using AI model
         
@@ -83,81 +304,139 @@ class AIGenerator:
             prompt_data: Dict with "system" and "user" prompts
             model_config: Model configuration (temperature, max_tokens, etc.)
             max_retries: Maximum retry attempts
+            use_cache: Set False to bypass the response cache for this call
             
         Returns:
             Generated text
         """
-        if not model_config:
-            model_config = {}
-        
-        model = model_config.get("model_name", self.default_model)
-        # Use temperature from config or default
-        temperature = model_config.get("temperature", 0.3)
-        max_tokens = model_config.get("max_tokens", 4000)  # Increased default for longer content
+        provider, client, model, temperature, max_tokens = self._resolve_call(model_config)
         
         logger.info("AI generate: model=%s temp=%.1f max_tokens=%d provider=%s",
-                    model, temperature, max_tokens, self.provider)
+                    model, temperature, max_tokens, provider)
+
+        with span("ai.generate", provider=provider, model=model, max_tokens=max_tokens):
+            cache_key = None
+
+            def call():
+                return self._generate_with_retries(
+                    provider, client, prompt_data, model, temperature, max_tokens,
+                    max_retries, cache_key
+                )
+
+            if not use_cache:
+                # Callers bypassing the cache want a fresh response, not a shared one
+                return call()
+
+            request_key = ResponseCache.make_key(
+                provider, model, prompt_data, temperature, max_tokens
+            )
+            if self.cache is not None:
+                cache_key = request_key
+                started = time.monotonic()
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.info("AI cache hit: %d chars (key=%s)", len(cached), cache_key[:12])
+                    self._record_call(provider, model, "ok", started, cache_hit=True)
+                    return cached
+
+            # Identical concurrent calls wait on the first one instead of re-sending it
+            return self.single_flight.do(request_key, call)
+
+    def _generate_with_retries(self,
+                               provider: str,
+                               client,
+                               prompt_data: Dict[str, str],
+                               model: str,
+                               temperature: float,
+                               max_tokens: int,
+                               max_retries: int,
+                               cache_key: Optional[str]) -> str:
+        """Call the provider with rate limiting and exponential backoff"""
+        # Shared per provider+model budget across every thread in the process
+        limiter = get_rate_limiter(provider, model)
+        est_tokens = estimate_tokens(prompt_data, max_tokens)
+        started = time.monotonic()
 
         for attempt in range(max_retries):
             try:
-                t0 = time.time()
-                if self.provider == "anthropic":
-                    response = self._generate_anthropic(
-                        prompt_data, model, temperature, max_tokens
-                    )
-                else:  # openai or xai (both use OpenAI-compatible API)
-                    response = self._generate_openai(
-                        prompt_data, model, temperature, max_tokens
-                    )
+                with limiter.slot(est_tokens):
+                    t0 = time.time()
+                    attempt_started = time.monotonic()
+                    self._local.first_token_at = None
+                    if provider == "anthropic":
+                        response = self._generate_anthropic(
+                            prompt_data, model, temperature, max_tokens, client
+                        )
+                    else:  # openai, xai, openrouter (OpenAI-compatible API)
+                        response = self._generate_openai(
+                            prompt_data, model, temperature, max_tokens, client, provider
+                        )
 
                 elapsed = time.time() - t0
                 resp_len = len(response) if response else 0
                 logger.info("AI response: %.1fs, %d chars", elapsed, resp_len)
+                self._record_usage(provider, model)
+                self._record_call(provider, model, "ok" if response and response.strip() else "empty",
+                                  started, attempt_started, retries=attempt)
+                if response:
+                    get_pipeline_metrics().words_generated(provider, model, len(response.split()))
+                # Never cache empty responses — callers retry those
+                if cache_key and response and response.strip():
+                    self.cache.put(cache_key, response, provider, model)
                 return response
 
             except Exception as exc:
                 logger.warning("AI call attempt %d/%d failed: %s",
                                attempt + 1, max_retries, exc)
                 if attempt == max_retries - 1:
+                    self._local.pending_usage = None
+                    self._local.last_usage = None
+                    self._record_call(provider, model, "error", started, retries=attempt)
                     raise
-                time.sleep(2 ** attempt)  # Exponential backoff
+                # A provider Retry-After already pauses the shared limiter
+                if not (is_rate_limit_error(exc) and retry_after_seconds(exc)):
+                    time.sleep(2 ** attempt)  # Exponential backoff
     
-    def _generate_anthropic(self,
+    def _anthropic_request(self,
                            prompt_data: Dict[str, str],
                            model: str,
                            temperature: float,
-                           max_tokens: int) -> str:
-        """Generate using Anthropic Claude"""
-        kwargs = dict(
+                           max_tokens: int) -> Dict[str, Any]:
+        """Build Anthropic messages API kwargs"""
+        system = prompt_data.get("system", "")
+        prefix = prompt_data.get("cache_prefix")
+        if prefix:
+            # Mark system + shared context as a cacheable prefix
+            system = [
+                {"type": "text", "text": system},
+                {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+            ]
+        return dict(
             model=model,
             max_tokens=max_tokens,
             temperature=temperature,
-            system=prompt_data.get("system", ""),
+            system=system,
             messages=[
                 {"role": "user", "content": prompt_data.get("user", "")}
             ],
         )
-        # Use streaming for large requests to avoid SDK timeout limit
-        if max_tokens > 16000:
-            collected = []
-            with self.client.messages.stream(**kwargs) as stream:
-                for text in stream.text_stream:
-                    collected.append(text)
-            return "".join(collected)
-        else:
-            response = self.client.messages.create(**kwargs)
-            return response.content[0].text
-    
-    def _generate_openai(self,
+
+    def _openai_request(self,
                         prompt_data: Dict[str, str],
                         model: str,
                         temperature: float,
-                        max_tokens: int) -> str:
-        """Generate using OpenAI GPT"""
+                        max_tokens: int) -> Dict[str, Any]:
+        """Build OpenAI-compatible chat completions kwargs"""
         messages = []
 
-        if "system" in prompt_data:
-            messages.append({"role": "system", "content": prompt_data["system"]})
+        # OpenAI-compatible providers cache identical prompt prefixes
+        # automatically, so the shared context goes right after the system prompt
+        system = prompt_data.get("system")
+        prefix = prompt_data.get("cache_prefix")
+        if prefix:
+            system = f"{system}\n\n{prefix}" if system else prefix
+        if system is not None:
+            messages.append({"role": "system", "content": system})
         messages.append({"role": "user", "content": prompt_data.get("user", "")})
 
         # Use correct parameter name based on model
@@ -172,20 +451,148 @@ class AIGenerator:
             kwargs["max_completion_tokens"] = max_tokens
         else:
             kwargs["max_tokens"] = max_tokens
+        return kwargs
+
+    def _stream_anthropic(self, client, kwargs: Dict[str, Any]) -> Iterator[str]:
+        """Yield text deltas from an Anthropic stream"""
+        with client.messages.stream(**kwargs) as stream:
+            for text in stream.text_stream:
+                self._mark_first_token()
+                yield text
+            self._note_usage(anthropic_usage(getattr(stream.get_final_message(), "usage", None)))
+
+    def _stream_openai(self, client, kwargs: Dict[str, Any], include_usage: bool = False) -> Iterator[str]:
+        """Yield text deltas from an OpenAI-compatible stream"""
+        if include_usage:
+            kwargs = {**kwargs, "stream_options": {"include_usage": True}}
+        stream = client.chat.completions.create(**kwargs, stream=True)
+        for chunk in stream:
+            if getattr(chunk, "usage", None) is not None:
+                self._note_usage(openai_usage(chunk.usage))
+            if chunk.choices and chunk.choices[0].delta.content:
+                self._mark_first_token()
+                yield chunk.choices[0].delta.content
+
+    def _generate_anthropic(self,
+                           prompt_data: Dict[str, str],
+                           model: str,
+                           temperature: float,
+                           max_tokens: int,
+                           client=None) -> str:
+        """Generate using Anthropic Claude"""
+        client = client or self.client
+        kwargs = self._anthropic_request(prompt_data, model, temperature, max_tokens)
+        # Use streaming for large requests to avoid SDK timeout limit
+        if max_tokens > 16000:
+            return "".join(self._stream_anthropic(client, kwargs))
+        else:
+            response = client.messages.create(**kwargs)
+            self._note_usage(anthropic_usage(getattr(response, "usage", None)))
+            return response.content[0].text
+    
+    def _generate_openai(self,
+                        prompt_data: Dict[str, str],
+                        model: str,
+                        temperature: float,
+                        max_tokens: int,
+                        client=None,
+                        provider: Optional[str] = None) -> str:
+        """Generate using OpenAI GPT"""
+        client = client or self.client
+        kwargs = self._openai_request(prompt_data, model, temperature, max_tokens)
 
         # Use streaming for large requests to avoid SDK timeout (default 600s)
         # 128K token screenplay takes 10-15 minutes — streaming keeps connection alive
         if max_tokens > 16000:
-            kwargs["stream"] = True
-            collected = []
-            stream = self.client.chat.completions.create(**kwargs)
-            for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    collected.append(chunk.choices[0].delta.content)
-            return "".join(collected)
+            return "".join(self._stream_openai(client, kwargs, (provider or self.provider) == "openai"))
         else:
-            response = self.client.chat.completions.create(**kwargs)
+            response = client.chat.completions.create(**kwargs)
+            self._note_usage(openai_usage(getattr(response, "usage", None)))
             return response.choices[0].message.content
+
+    def stream(self,
+               prompt_data: Dict[str, str],
+               model_config: Optional[Dict[str, Any]] = None,
+               use_cache: bool = True) -> Iterator[str]:
+        """
+        Stream generated text as it arrives
+
+        Same routing, rate limiting and caching as generate(), but text is
+        yielded chunk by chunk. There is no automatic retry once the stream
+        has started; a cache hit is yielded as a single chunk.
+
+        Args:
+            prompt_data: Dict with "system" and "user" prompts
+            model_config: Model configuration (temperature, max_tokens, etc.)
+            use_cache: Set False to bypass the response cache for this call
+
+        Yields:
+            Text deltas
+        """
+        provider, client, model, temperature, max_tokens = self._resolve_call(model_config)
+        logger.info("AI stream: model=%s temp=%.1f max_tokens=%d provider=%s",
+                    model, temperature, max_tokens, provider)
+
+        span_start = time.time_ns()
+        cache_key = None
+        if self.cache is not None and use_cache:
+            cache_key = ResponseCache.make_key(
+                provider, model, prompt_data, temperature, max_tokens
+            )
+            started = time.monotonic()
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("AI cache hit: %d chars (key=%s)", len(cached), cache_key[:12])
+                self._record_call(provider, model, "ok", started, cache_hit=True,
+                                  stream_started_ns=span_start)
+                yield cached
+                return
+
+        collected = []
+        limiter = get_rate_limiter(provider, model)
+        with limiter.slot(estimate_tokens(prompt_data, max_tokens)):
+            t0 = time.time()
+            started = time.monotonic()
+            self._local.first_token_at = None
+            if provider == "anthropic":
+                chunks = self._stream_anthropic(
+                    client, self._anthropic_request(prompt_data, model, temperature, max_tokens)
+                )
+            else:
+                chunks = self._stream_openai(
+                    client, self._openai_request(prompt_data, model, temperature, max_tokens),
+                    provider == "openai",
+                )
+            for text in chunks:
+                collected.append(text)
+                yield text
+
+        response = "".join(collected)
+        logger.info("AI stream complete: %.1fs, %d chars", time.time() - t0, len(response))
+        self._record_usage(provider, model)
+        self._record_call(provider, model, "ok" if response.strip() else "empty", started, started,
+                          stream_started_ns=span_start)
+        get_pipeline_metrics().words_generated(provider, model, len(response.split()))
+        if cache_key and response.strip():
+            self.cache.put(cache_key, response, provider, model)
+
+    def stream_json_array(self,
+                          prompt_data: Dict[str, str],
+                          model_config: Optional[Dict[str, Any]] = None,
+                          array_key: Optional[str] = None) -> Iterator[Any]:
+        """
+        Stream a JSON response and yield array elements as soon as each completes
+
+        Args:
+            prompt_data: Dict with "system" and "user" prompts
+            model_config: Model configuration
+            array_key: Key of the array in the top-level object (e.g. "scenes");
+                None when the model returns a bare array
+
+        Yields:
+            Parsed array elements in order
+        """
+        yield from iter_json_array(self.stream(prompt_data, model_config), array_key)
     
     def generate_with_validation(self,
                                 prompt_data: Dict[str, str],
@@ -222,14 +629,71 @@ class AIGenerator:
                     logger.warning("Empty response on retry — skipping to next attempt")
                     continue
             
-            # Parse response (assuming JSON or structured format)
+            artifact = self._parse_artifact(raw_output, validator)
+
+            # Validate
+            is_valid, errors = validator.validate(artifact)
+            get_call_telemetry().record_validation(validator_name, is_valid)
+            get_pipeline_metrics().validation("artifact", current_tags().get("step", ""), is_valid)
+
+            if is_valid:
+                logger.info("Validation PASSED on attempt %d/%d", attempt + 1, max_attempts)
+                return artifact
+
+            # Don't let a rerun replay a response that failed validation
+            self._discard_cached(prompt_data, model_config)
+
+            # If not valid, add errors to prompt for next attempt
+            logger.warning("Validation FAILED attempt %d/%d: %d errors",
+                          attempt + 1, max_attempts, len(errors))
+            for i, err in enumerate(errors[:5]):
+                safe_err = str(err).encode("ascii", "replace").decode()
+                logger.warning("  error[%d]: %s", i, safe_err)
+
+            if attempt < max_attempts - 1:
+                try:
+                    print(f"Validation attempt {attempt + 1} failed with {len(errors)} errors, retrying...")
+                    print(f"First 3 errors: {errors[:3]}")
+                except UnicodeEncodeError:
+                    print(f"Validation attempt {attempt + 1} failed with {len(errors)} errors, retrying...")
+                    print(f"First 3 errors: (contains non-ASCII characters, see artifact)")
+                prompt_data = self._add_revision_context(
+                    prompt_data, artifact, errors, validator
+                )
+
+        # Return best attempt even if not perfect
+        logger.warning("Returning best-effort artifact after %d attempts (%d errors remain)",
+                       max_attempts, len(errors))
+        return artifact
+    
+    def _discard_cached(self,
+                        prompt_data: Dict[str, str],
+                        model_config: Optional[Dict[str, Any]]) -> None:
+        """Remove the cached response for this request, if any"""
+        if self.cache is None:
+            return
+        provider, _, model, temperature, max_tokens = self._resolve_call(model_config)
+        self.cache.discard(ResponseCache.make_key(
+            provider, model, prompt_data, temperature, max_tokens
+        ))
+
+    def _parse_artifact(self, raw_output: str, validator) -> Dict[str, Any]:
+        """Parse a raw model response into a dict artifact for validation"""
+        # Fast path: a single decode of the first JSON document, skipping any
+        # code fence or preamble without regex passes over the whole response
+        artifact = None
+        if raw_output.lstrip().startswith(("{", "[", "```")):
+            artifact = extract_json(raw_output)
+
+        # Parse response (assuming JSON or structured format)
+        if artifact is None:
             try:
                 # First check if JSON is wrapped in markdown code blocks
                 import re
                 json_match = re.search(r'```(?:json)?\s*({.*?})\s*```', raw_output, re.DOTALL)
                 if json_match:
                     raw_output = json_match.group(1)
-                
+            
                 if raw_output.strip().startswith("{") or raw_output.strip().startswith("["):
                     # Try to fix common JSON issues with newlines in strings
                     # First attempt: direct parse
@@ -247,7 +711,7 @@ class AIGenerator:
                             # Replace actual newlines with \n
                             content = content.replace('\n', '\\n').replace('\r', '\\r')
                             return f'"{content}"'
-                        
+                    
                         # This is a simplified fix - just try to parse the content differently
                         # Extract the long_synopsis or similar content manually
                         if '"long_synopsis"' in raw_output or '"synopsis"' in raw_output:
@@ -268,51 +732,23 @@ class AIGenerator:
             except Exception:
                 # If all parsing fails, just use the raw output
                 artifact = {"content": raw_output}
-            
-            # Ensure artifact is a dict for validation
-            if not isinstance(artifact, dict):
-                # If it's a list, wrap it appropriately based on context
-                if isinstance(artifact, list):
-                    # Try to determine the correct key based on the validator
-                    if hasattr(validator, '__class__') and 'Step9' in validator.__class__.__name__:
-                        artifact = {"scene_briefs": artifact}
-                    elif hasattr(validator, '__class__') and 'Step7' in validator.__class__.__name__:
-                        artifact = {"bibles": artifact}
-                    elif hasattr(validator, '__class__') and 'Step5' in validator.__class__.__name__:
-                        artifact = {"characters": artifact}
-                    else:
-                        artifact = {"content": artifact}
+        
+        # Ensure artifact is a dict for validation
+        if not isinstance(artifact, dict):
+            # If it's a list, wrap it appropriately based on context
+            if isinstance(artifact, list):
+                # Try to determine the correct key based on the validator
+                if hasattr(validator, '__class__') and 'Step9' in validator.__class__.__name__:
+                    artifact = {"scene_briefs": artifact}
+                elif hasattr(validator, '__class__') and 'Step7' in validator.__class__.__name__:
+                    artifact = {"bibles": artifact}
+                elif hasattr(validator, '__class__') and 'Step5' in validator.__class__.__name__:
+                    artifact = {"characters": artifact}
                 else:
-                    artifact = {"content": str(artifact)}
-            
-            # Validate
-            is_valid, errors = validator.validate(artifact)
-
-            if is_valid:
-                logger.info("Validation PASSED on attempt %d/%d", attempt + 1, max_attempts)
-                return artifact
-
-            # If not valid, add errors to prompt for next attempt
-            logger.warning("Validation FAILED attempt %d/%d: %d errors",
-                          attempt + 1, max_attempts, len(errors))
-            for i, err in enumerate(errors[:5]):
-                safe_err = str(err).encode("ascii", "replace").decode()
-                logger.warning("  error[%d]: %s", i, safe_err)
-
-            if attempt < max_attempts - 1:
-                try:
-                    print(f"Validation attempt {attempt + 1} failed with {len(errors)} errors, retrying...")
-                    print(f"First 3 errors: {errors[:3]}")
-                except UnicodeEncodeError:
-                    print(f"Validation attempt {attempt + 1} failed with {len(errors)} errors, retrying...")
-                    print(f"First 3 errors: (contains non-ASCII characters, see artifact)")
-                prompt_data = self._add_revision_context(
-                    prompt_data, artifact, errors, validator
-                )
-
-        # Return best attempt even if not perfect
-        logger.warning("Returning best-effort artifact after %d attempts (%d errors remain)",
-                       max_attempts, len(errors))
+                    artifact = {"content": artifact}
+            else:
+                artifact = {"content": str(artifact)}
+        
         return artifact
     
     def _parse_text_response(self, text: str) -> Dict[str, Any]:
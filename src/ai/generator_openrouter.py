@@ -78,10 +78,7 @@ class OpenRouterGenerator(AIGenerator):
         max_tokens = model_config.get("max_tokens", 4000)
         
         # Build messages
-        messages = []
-        if "system" in prompt_data:
-            messages.append({"role": "system", "content": prompt_data["system"]})
-        messages.append({"role": "user", "content": prompt_data.get("user", "")})
+        messages = self._openai_request(prompt_data, model, temperature, max_tokens)["messages"]
         
         # OpenRouter request
         headers = {
@@ -6,6 +6,9 @@ Ensures minimum word counts through chunked generation
 from typing import Dict, Any, List
 from src.ai.generator import AIGenerator
 
+# Words of the previous chunk carried into the next chunk's prompt
+PREVIOUS_TAIL_WORDS = 150
+
 class ProseGenerator:
     """
     Generates prose with guaranteed minimum length
@@ -103,7 +106,11 @@ Write with:
 
 IMPORTANT: Do not write a summary or outline. Write the actual scene with full prose and emotional depth."""
 
-        user_prompt = f"""Scene Details:
+        story_so_far = ""
+        if scene_brief.get("story_so_far"):
+            story_so_far = f"Story so far:\n{scene_brief['story_so_far']}\n\n"
+        
+        user_prompt = f"""{story_so_far}Scene Details:
 Setting: {scene_brief.get('location', 'appropriate location')} at {scene_brief.get('time', 'appropriate time')}
 Context: {scene_brief.get('summary', '')}
 Previous: {scene_brief.get('inbound_hook', 'scene follows naturally')}
@@ -166,7 +173,8 @@ Write the complete scene now:"""
                 scene_brief,
                 character_bible,
                 target_per_chunk,
-                len(chunks)  # Chunk index for context
+                len(chunks),  # Chunk index for context
+                previous_text=chunks[-1] if chunks else ""
             )
             chunks.append(chunk_prose)
         
@@ -188,12 +196,19 @@ Write the complete scene now:"""
                        scene_brief: Dict[str, Any],
                        character_bible: Dict[str, Any],
                        target_words: int,
-                       chunk_index: int) -> str:
+                       chunk_index: int,
+                       previous_text: str = "") -> str:
         """Generate a single chunk of the scene"""
         
         context = ""
+        if scene_brief.get("story_so_far"):
+            context += f"Story so far:\n{scene_brief['story_so_far']}\n\n"
         if chunk_index > 0:
-            context = "Continue the scene naturally from the previous section. "
+            context += "Continue the scene naturally from the previous section. "
+            if previous_text:
+                # Only the tail is needed for continuity; keeps chunk prompts bounded
+                tail = " ".join(previous_text.split()[-PREVIOUS_TAIL_WORDS:])
+                context += f"It ended:\n...{tail}\n\n"
         
         system_prompt = f"""You are writing part of a novel scene. Write {target_words} words of high-quality prose.
 
@@ -0,0 +1,310 @@
+"""
+Rate Limiting for AI Providers
+Shared token-bucket budgets and AIMD concurrency control per provider+model
+"""
+
+import os
+import re
+import time
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager, asynccontextmanager
+from typing import Dict, Any, Optional, Tuple, List
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Classic token bucket refilled continuously at ``rate_per_minute``.
+
+    A request larger than the bucket capacity is allowed once the bucket is
+    full, so a single oversized call can never deadlock.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_second)
+            self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` can be taken (0 if available now)"""
+        self._refill(now)
+        needed = min(amount, self.capacity)
+        if self.tokens >= needed:
+            return 0.0
+        return (needed - self.tokens) / self.rate_per_second
+
+    def take(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+
+class ProviderRateLimiter:
+    """
+    Budget for one provider+model.
+
+    Requests must fit the requests-per-minute and tokens-per-minute buckets
+    (when configured) and a concurrency limit that grows additively on
+    success and halves when the provider answers with a rate-limit error.
+    A ``Retry-After`` from the provider pauses every caller until it expires.
+    """
+
+    def __init__(self,
+                 provider: str,
+                 model: str,
+                 rpm: Optional[float] = None,
+                 tpm: Optional[float] = None,
+                 initial_concurrency: float = 8,
+                 min_concurrency: float = 1,
+                 max_concurrency: float = 32):
+        self.provider = provider
+        self.model = model
+        self.rpm = rpm
+        self.tpm = tpm
+        self.request_bucket = TokenBucket(rpm) if rpm else None
+        self.token_bucket = TokenBucket(tpm) if tpm else None
+        self.concurrency_limit = float(initial_concurrency)
+        self.min_concurrency = float(min_concurrency)
+        self.max_concurrency = float(max_concurrency)
+
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.requests_total = 0
+        self.throttled_total = 0
+        self.wait_seconds_total = 0.0
+
+        self._cond = threading.Condition()
+
+    def _try_acquire_locked(self, tokens: float) -> float:
+        """Take a slot if possible; otherwise return seconds to wait"""
+        now = time.monotonic()
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.in_flight >= int(self.concurrency_limit):
+            return -1.0  # wait for a release, not a timer
+        waits = []
+        if self.request_bucket:
+            waits.append(self.request_bucket.wait_time(1, now))
+        if self.token_bucket:
+            waits.append(self.token_bucket.wait_time(tokens, now))
+        wait = max(waits) if waits else 0.0
+        if wait > 0:
+            return wait
+        if self.request_bucket:
+            self.request_bucket.take(1)
+        if self.token_bucket:
+            self.token_bucket.take(tokens)
+        self.in_flight += 1
+        self.requests_total += 1
+        return 0.0
+
+    def acquire(self, tokens: float = 0) -> None:
+        """Block until the call fits the budget"""
+        started = time.monotonic()
+        with self._cond:
+            while True:
+                wait = self._try_acquire_locked(tokens)
+                if wait == 0.0:
+                    break
+                self._cond.wait(timeout=None if wait < 0 else wait)
+            self.wait_seconds_total += time.monotonic() - started
+
+    async def acquire_async(self, tokens: float = 0) -> None:
+        """Await until the call fits the budget without blocking the loop"""
+        started = time.monotonic()
+        while True:
+            with self._cond:
+                wait = self._try_acquire_locked(tokens)
+                if wait == 0.0:
+                    self.wait_seconds_total += time.monotonic() - started
+                    return
+            await asyncio.sleep(0.05 if wait < 0 else wait)
+
+    def release(self, outcome: str = "success", retry_after: Optional[float] = None) -> None:
+        """
+        Return a slot and adapt the concurrency limit
+
+        Args:
+            outcome: "success", "rate_limited" or "error"
+            retry_after: Provider-requested pause in seconds (rate limits only)
+        """
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            if outcome == "success":
+                # Additive increase: roughly +1 slot per full window of successes
+                self.concurrency_limit = min(
+                    self.max_concurrency,
+                    self.concurrency_limit + 1.0 / max(self.concurrency_limit, 1.0),
+                )
+            elif outcome == "rate_limited":
+                self.throttled_total += 1
+                self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit / 2)
+                if retry_after:
+                    self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+                logger.warning("Rate limited by %s:%s — concurrency now %d%s",
+                               self.provider, self.model, int(self.concurrency_limit),
+                               f", pausing {retry_after:.1f}s" if retry_after else "")
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, tokens: float = 0):
+        """Hold one request slot; classifies the outcome from any exception"""
+        self.acquire(tokens)
+        try:
+            yield self
+        except Exception as exc:
+            self._release_for_exception(exc)
+            raise
+        except BaseException:
+            # e.g. GeneratorExit when a streaming consumer stops early
+            self.release("error")
+            raise
+        else:
+            self.release("success")
+
+    @asynccontextmanager
+    async def slot_async(self, tokens: float = 0):
+        """Async variant of slot()"""
+        await self.acquire_async(tokens)
+        try:
+            yield self
+        except Exception as exc:
+            self._release_for_exception(exc)
+            raise
+        except BaseException:
+            # e.g. GeneratorExit when a streaming consumer stops early
+            self.release("error")
+            raise
+        else:
+            self.release("success")
+
+    def _release_for_exception(self, exc: BaseException) -> None:
+        if is_rate_limit_error(exc):
+            self.release("rate_limited", retry_after_seconds(exc))
+        else:
+            self.release("error")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current limits and counters"""
+        with self._cond:
+            return {
+                "provider": self.provider,
+                "model": self.model,
+                "concurrency_limit": int(self.concurrency_limit),
+                "in_flight": self.in_flight,
+                "rpm_limit": self.rpm,
+                "tpm_limit": self.tpm,
+                "requests_total": self.requests_total,
+                "throttled_total": self.throttled_total,
+                "wait_seconds_total": round(self.wait_seconds_total, 3),
+                "paused_seconds": max(0.0, self.blocked_until - time.monotonic()),
+            }
+
+
+def estimate_tokens(prompt_data: Dict[str, Any], max_tokens: int) -> int:
+    """Rough token estimate for a call: ~4 chars per prompt token plus the completion budget"""
+    chars = sum(len(v) for v in prompt_data.values() if isinstance(v, str))
+    return chars // 4 + max_tokens
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """True for provider 429 / rate-limit errors from either SDK"""
+    if getattr(exc, "status_code", None) == 429:
+        return True
+    return type(exc).__name__ == "RateLimitError"
+
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Parse '20', '1.5', '6m0s' or '250ms' style header values into seconds"""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_RE.findall(value)
+    if not parts:
+        return None
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(num) * scale[unit] for num, unit in parts)
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """
+    Provider-requested wait from a rate-limit error's response headers.
+
+    Honours retry-after-ms, retry-after and OpenAI's x-ratelimit-reset-*
+    headers; returns None when the error carries no hint.
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    if headers.get("retry-after-ms"):
+        parsed = _parse_duration(headers["retry-after-ms"])
+        if parsed is not None:
+            return parsed / 1000.0
+    for name in ("retry-after", "x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"):
+        if headers.get(name):
+            parsed = _parse_duration(headers[name])
+            if parsed is not None:
+                return parsed
+    return None
+
+
+# Global registry
+_limiters: Dict[Tuple[str, str], ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _env_float(name: str) -> Optional[float]:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r; ignoring", name, raw)
+        return None
+
+
+def get_rate_limiter(provider: str, model: str) -> ProviderRateLimiter:
+    """
+    Get the shared limiter for provider+model.
+
+    Budgets come from <PROVIDER>_RPM / <PROVIDER>_TPM (e.g. OPENAI_TPM) and
+    AI_MAX_CONCURRENCY caps the adaptive concurrency limit.
+    """
+    key = (provider, model)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            prefix = provider.upper()
+            max_concurrency = _env_float("AI_MAX_CONCURRENCY") or 32
+            limiter = ProviderRateLimiter(
+                provider,
+                model,
+                rpm=_env_float(f"{prefix}_RPM"),
+                tpm=_env_float(f"{prefix}_TPM"),
+                initial_concurrency=min(8, max_concurrency),
+                max_concurrency=max_concurrency,
+            )
+            _limiters[key] = limiter
+        return limiter
+
+
+def get_rate_limit_metrics() -> List[Dict[str, Any]]:
+    """Metrics for every limiter created in this process"""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return [limiter.metrics() for limiter in limiters]
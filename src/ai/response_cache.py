@@ -0,0 +1,226 @@
+"""
+Persistent Response Cache for AI Generation
+Content-addressed SQLite cache so reruns never re-pay for identical calls
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path("artifacts") / ".cache" / "ai_responses.sqlite3"
+DEFAULT_MAX_MB = 512
+DEFAULT_MAX_AGE_DAYS = 30
+
+
+class ResponseCache:
+    """
+    Content-addressed cache of raw model responses.
+
+    Entries are keyed on a SHA-256 of (provider, model, prompt_data, sampling
+    params), so any change to the prompt or config is a guaranteed miss.
+    Eviction drops entries older than ``max_age_seconds`` first, then the
+    least recently used entries until the cache fits in ``max_bytes``.
+    """
+
+    def __init__(self,
+                 path: Optional[Path] = None,
+                 max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+                 max_age_seconds: float = DEFAULT_MAX_AGE_DAYS * 86400):
+        """
+        Initialize response cache
+
+        Args:
+            path: SQLite database file (created on first use)
+            max_bytes: Size budget for stored responses
+            max_age_seconds: Entries older than this are evicted
+        """
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                   key TEXT PRIMARY KEY,
+                   provider TEXT,
+                   model TEXT,
+                   response TEXT NOT NULL,
+                   size INTEGER NOT NULL,
+                   created_at REAL NOT NULL,
+                   last_access REAL NOT NULL
+               )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(provider: str,
+                 model: str,
+                 prompt_data: Dict[str, Any],
+                 temperature: float,
+                 max_tokens: int) -> str:
+        """Build the content-addressed key for a generation request"""
+        payload = {
+            "provider": provider,
+            "model": model,
+            "prompt": prompt_data,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.max_age_seconds:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, response: str, provider: str = "", model: str = "") -> None:
+        """Store a response and enforce the size/age budget"""
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, provider, model, response, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, provider, model, response, size, now, now),
+            )
+            self.writes += 1
+            self._evict_locked(now)
+            self._conn.commit()
+
+    def discard(self, key: str) -> bool:
+        """Drop one entry, e.g. a response that failed validation; True if it existed"""
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM responses WHERE key = ?", (key,)
+            ).rowcount
+            self._conn.commit()
+            return removed > 0
+
+    def evict(self) -> int:
+        """Run eviction now; returns number of entries removed"""
+        with self._lock:
+            removed = self._evict_locked(time.time())
+            self._conn.commit()
+            return removed
+
+    def _evict_locked(self, now: float) -> int:
+        """Drop expired entries, then LRU entries until under max_bytes"""
+        removed = self._conn.execute(
+            "DELETE FROM responses WHERE created_at < ?", (now - self.max_age_seconds,)
+        ).rowcount
+
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access ASC"
+            ).fetchall()
+            doomed = []
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                doomed.append((key,))
+                total -= size
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+            removed += len(doomed)
+
+        self.evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached response"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current footprint"""
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": total,
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+# Global instance
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the process-wide response cache, or None if caching is disabled.
+
+    Enabled by AI_CACHE=1 or by setting AI_CACHE_PATH. Budget is tuned with
+    AI_CACHE_MAX_MB and AI_CACHE_MAX_AGE_DAYS.
+    """
+    global _response_cache
+    path = os.getenv("AI_CACHE_PATH", "").strip()
+    enabled = os.getenv("AI_CACHE", "").strip().lower() in ("1", "true", "yes")
+    if not (enabled or path):
+        return None
+
+    with _response_cache_lock:
+        if _response_cache is None:
+            try:
+                max_mb = float(os.getenv("AI_CACHE_MAX_MB", DEFAULT_MAX_MB))
+                max_age_days = float(os.getenv("AI_CACHE_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS))
+            except ValueError:
+                logger.warning("Invalid AI_CACHE_MAX_MB/AI_CACHE_MAX_AGE_DAYS; using defaults")
+                max_mb, max_age_days = DEFAULT_MAX_MB, DEFAULT_MAX_AGE_DAYS
+            _response_cache = ResponseCache(
+                Path(path) if path else None,
+                max_bytes=int(max_mb * 1024 * 1024),
+                max_age_seconds=max_age_days * 86400,
+            )
+            logger.info("AI response cache enabled at %s", _response_cache.path)
+        return _response_cache
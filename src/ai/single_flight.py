@@ -0,0 +1,89 @@
+"""
+Single-Flight Request Coalescing
+Identical concurrent AI calls share one in-flight request instead of each paying for it
+"""
+
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive with the same key while it is running wait on the leader's future
+    and receive the same result or exception. The key is forgotten as soon
+    as the call finishes, so later calls always run fresh.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run ``fn`` once per in-flight ``key`` and return its result"""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                future = Future()
+                self._inflight[key] = future
+                self.calls += 1
+                leader = True
+
+        if not leader:
+            logger.info("Coalesced identical in-flight AI call (key=%s)", key[:12])
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            self._finish(key)
+            future.set_exception(exc)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: str) -> None:
+        # Forget the key before publishing so late arrivals start a fresh call
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._inflight)
+
+    def stats(self) -> Dict[str, Any]:
+        """Leader and coalesced call counters"""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._inflight),
+            }
+
+
+# Global instance
+_single_flight = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the process-wide single-flight group for AI calls"""
+    global _single_flight
+    with _single_flight_lock:
+        if _single_flight is None:
+            _single_flight = SingleFlight()
+        return _single_flight
@@ -0,0 +1,184 @@
+"""
+Streaming JSON Extraction
+Incrementally parses a model's streamed output and yields array elements as they complete
+"""
+
+import json
+import logging
+from typing import Any, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = " \t\r\n"
+
+
+class JSONArrayStreamParser:
+    """
+    Incremental scanner for one JSON array inside a streamed response.
+
+    Feed text chunks as they arrive; every element of the target array is
+    returned from ``feed`` as soon as its closing brace/bracket is seen, so
+    scene 1 can be validated while scene 40 is still being generated.
+
+    The target array is either a bare top-level array or, when ``array_key``
+    is given, the value of that key in the top-level object (e.g. "scenes").
+    Text before the JSON (prose, ```json fences) is skipped, and only the
+    element currently being scanned is buffered.
+    """
+
+    def __init__(self, array_key: Optional[str] = None, keep_text: bool = False):
+        """
+        Initialize parser
+
+        Args:
+            array_key: Key of the array in the top-level object; None for a bare array
+            keep_text: Also retain the full raw text (see ``text``) for fallback parsing
+        """
+        self.array_key = array_key
+        self.keep_text = keep_text
+        self._chunks: List[str] = []
+
+        self._buf = ""
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._target_depth: Optional[int] = None
+        self._elem_start: Optional[int] = None
+        self._key_start: Optional[int] = None
+        self._last_key: Optional[str] = None
+        self._after_colon = False
+        self.done = False
+        self.count = 0
+
+    @property
+    def text(self) -> str:
+        """Full raw text fed so far (only when keep_text=True)"""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Consume a chunk; return elements completed by it"""
+        if self.keep_text:
+            self._chunks.append(chunk)
+        if self.done or not chunk:
+            return []
+
+        out: List[Any] = []
+        buf = self._buf + chunk
+        i = len(self._buf)
+        n = len(buf)
+
+        while i < n and not self.done:
+            c = buf[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        try:
+                            self._last_key = json.loads(buf[self._key_start:i + 1])
+                        except json.JSONDecodeError:
+                            self._last_key = None
+                        self._key_start = None
+                i += 1
+                continue
+
+            # Prose or fences before the JSON document: wait for { or [
+            if self._depth == 0 and c not in "{[":
+                i += 1
+                continue
+
+            in_target = self._target_depth is not None and self._depth == self._target_depth
+
+            if in_target and self._elem_start is None and c not in _WHITESPACE + ",]":
+                self._elem_start = i
+
+            if c == '"':
+                self._in_string = True
+                if self._depth == 1 and self._target_depth is None:
+                    self._key_start = i
+                    self._after_colon = False
+            elif c == ":":
+                self._after_colon = self._depth == 1
+            elif c in "{[":
+                if self._target_depth is None and c == "[" and (
+                        self._depth == 0
+                        or (self._depth == 1 and self._after_colon
+                            and self.array_key is not None and self._last_key == self.array_key)):
+                    self._target_depth = self._depth + 1
+                self._depth += 1
+                self._after_colon = False
+            elif c in "}]":
+                self._depth -= 1
+                if self._target_depth is not None:
+                    if self._depth == self._target_depth and self._elem_start is not None:
+                        self._emit(buf[self._elem_start:i + 1], out)
+                    elif self._depth == self._target_depth - 1:
+                        # Closing the target array: flush a trailing scalar
+                        if self._elem_start is not None:
+                            self._emit(buf[self._elem_start:i], out)
+                        self.done = True
+            elif c == "," and in_target and self._elem_start is not None:
+                self._emit(buf[self._elem_start:i], out)
+            elif c not in _WHITESPACE and self._depth == 1:
+                self._after_colon = False
+
+            i += 1
+
+        # Keep only what an unfinished element or key still needs
+        keep_from = i
+        for start in (self._elem_start, self._key_start):
+            if start is not None:
+                keep_from = min(keep_from, start)
+        if self._elem_start is not None:
+            self._elem_start -= keep_from
+        if self._key_start is not None:
+            self._key_start -= keep_from
+        self._buf = buf[keep_from:i]
+        return out
+
+    def _emit(self, raw: str, out: List[Any]) -> None:
+        self._elem_start = None
+        raw = raw.strip()
+        if not raw:
+            return
+        try:
+            out.append(json.loads(raw))
+            self.count += 1
+        except json.JSONDecodeError as exc:
+            logger.warning("Skipping malformed streamed array element (%d chars): %s", len(raw), exc)
+
+
+def iter_json_array(chunks: Iterable[str], array_key: Optional[str] = None) -> Iterator[Any]:
+    """
+    Yield elements of a JSON array from an iterable of text chunks
+
+    Args:
+        chunks: Streamed text (e.g. from AIGenerator.stream)
+        array_key: Key of the array in the top-level object; None for a bare array
+    """
+    parser = JSONArrayStreamParser(array_key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
+
+def extract_json(text: str) -> Optional[Any]:
+    """
+    Single-pass extraction of the JSON object/array in ``text``.
+
+    Skips any prose or code fence before the document and ignores trailing
+    text after it. Only the first ``{``/``[`` is tried: if the document
+    starting there does not decode, a nested fragment is not a substitute,
+    so None is returned and callers fall back to their repair paths.
+    """
+    starts = [p for p in (text.find("{"), text.find("[")) if p != -1]
+    if not starts:
+        return None
+    try:
+        value, _ = json.JSONDecoder().raw_decode(text, min(starts))
+        return value
+    except json.JSONDecodeError:
+        return None
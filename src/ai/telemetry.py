@@ -0,0 +1,246 @@
+"""
+AI Call Telemetry
+Per-call latency, token, cost and retry records aggregated into Prometheus histograms and counters
+"""
+
+import os
+import json
+import time
+import queue
+import logging
+import threading
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from src.observability.metrics import Histogram, get_pipeline_metrics
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300, 600, 1200)
+TTFT_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60)
+RECENT_CALLS = 1000
+
+# Step/scene tags for calls made in this context (set by the orchestrators and steps)
+_call_tags: contextvars.ContextVar = contextvars.ContextVar("ai_call_tags", default={})
+
+
+@contextmanager
+def call_tags(**tags: Any) -> Iterator[Dict[str, Any]]:
+    """Tag every AI call made inside the block (e.g. step="step_8", scene=12)"""
+    merged = {**_call_tags.get(), **{k: v for k, v in tags.items() if v is not None}}
+    token = _call_tags.set(merged)
+    try:
+        yield merged
+    finally:
+        _call_tags.reset(token)
+
+
+def current_tags() -> Dict[str, Any]:
+    return dict(_call_tags.get())
+
+
+@dataclass
+class CallRecord:
+    """One logical AI call (all retries included)"""
+    provider: str
+    model: str
+    outcome: str                       # "ok", "empty", "error"
+    latency_seconds: float
+    step: str = ""
+    scene: Optional[Any] = None
+    ttft_seconds: Optional[float] = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    retries: int = 0
+    cache_hit: bool = False
+    streamed: bool = False
+    cost_usd: float = 0.0
+    ts: float = field(default_factory=time.time)
+
+
+def _load_pricing() -> Dict[str, Dict[str, float]]:
+    """USD per million tokens by model, from AI_PRICING_JSON ({"model": {"input": x, "output": y}})"""
+    raw = os.getenv("AI_PRICING_JSON", "").strip()
+    if not raw:
+        return {}
+    try:
+        return {m: {k: float(v) for k, v in p.items()} for m, p in json.loads(raw).items()}
+    except (ValueError, AttributeError):
+        logger.warning("Invalid AI_PRICING_JSON; costs will not be reported")
+        return {}
+
+
+class CallTelemetry:
+    """
+    Collects CallRecords without blocking the calling thread.
+
+    ``record`` only enqueues; records are folded into the aggregates
+    lazily, when metrics are read (or every few hundred records), so a
+    generation thread never waits on aggregation. Prometheus labels are
+    provider, model and step; scene numbers stay in the recent-call ring
+    to keep label cardinality bounded.
+    """
+
+    LABELS = ("provider", "model", "step")
+
+    def __init__(self, pricing: Optional[Dict[str, Dict[str, float]]] = None, recent: int = RECENT_CALLS):
+        """
+        Initialize telemetry
+
+        Args:
+            pricing: USD per million input/output tokens by model (None reads AI_PRICING_JSON)
+            recent: Raw call records kept for drill-down
+        """
+        self.pricing = pricing if pricing is not None else _load_pricing()
+        self._pending: "queue.SimpleQueue[Tuple[str, Any]]" = queue.SimpleQueue()
+        self._pending_count = 0
+        self._lock = threading.Lock()
+        self.recent: Deque[CallRecord] = deque(maxlen=recent)
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.ttft = Histogram(TTFT_BUCKETS)
+        self.counters: Dict[str, Dict[Tuple, float]] = {}
+
+    def cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+        price = self.pricing.get(model)
+        if not price:
+            return 0.0
+        return (prompt_tokens * price.get("input", 0.0) + completion_tokens * price.get("output", 0.0)) / 1e6
+
+    def record(self, record: CallRecord) -> None:
+        """Queue a finished call (tags from the current context fill in step/scene)"""
+        tags = _call_tags.get()
+        if not record.step:
+            record.step = str(tags.get("step", ""))
+        if record.scene is None:
+            record.scene = tags.get("scene")
+        if not record.cost_usd:
+            record.cost_usd = self.cost(record.model, record.prompt_tokens - record.cached_tokens,
+                                        record.completion_tokens)
+        self._enqueue(("call", record))
+
+    def record_validation(self, validator: str, valid: bool) -> None:
+        """Queue one validation outcome for generate_with_validation"""
+        step = str(_call_tags.get().get("step", ""))
+        self._enqueue(("validation", (validator, step, "valid" if valid else "invalid")))
+
+    def _enqueue(self, item: Tuple[str, Any]) -> None:
+        self._pending.put(item)
+        self._pending_count += 1
+        if self._pending_count >= 256:
+            self._drain()
+
+    def _drain(self) -> None:
+        with self._lock:
+            self._pending_count = 0
+            while True:
+                try:
+                    kind, item = self._pending.get_nowait()
+                except queue.Empty:
+                    return
+                if kind == "call":
+                    self._fold(item)
+                else:
+                    self._inc("validations_total", item, 1)
+
+    def _inc(self, name: str, labels: Tuple, amount: float) -> None:
+        series = self.counters.setdefault(name, {})
+        series[labels] = series.get(labels, 0) + amount
+
+    def _fold(self, r: CallRecord) -> None:
+        labels = (r.provider, r.model, r.step)
+        self.recent.append(r)
+        self._inc("calls_total", labels + (r.outcome,), 1)
+        if r.cache_hit:
+            self._inc("cache_hits_total", labels, 1)
+            return
+        self.latency.observe(labels, r.latency_seconds)
+        if r.ttft_seconds is not None:
+            self.ttft.observe(labels, r.ttft_seconds)
+        self._inc("retries_total", labels, r.retries)
+        self._inc("prompt_tokens_total", labels, r.prompt_tokens)
+        self._inc("completion_tokens_total", labels, r.completion_tokens)
+        self._inc("cached_prompt_tokens_total", labels, r.cached_tokens)
+        self._inc("cost_usd_total", labels, r.cost_usd)
+        self._inc("latency_seconds_total", labels, r.latency_seconds)
+
+    def summary(self, by: Tuple[str, ...] = ("step", "model")) -> List[Dict[str, Any]]:
+        """Wall time, tokens and cost grouped by ``by``, largest wall time first"""
+        self._drain()
+        with self._lock:
+            calls = list(self.recent)
+        groups: Dict[Tuple, Dict[str, Any]] = {}
+        for r in calls:
+            key = tuple(getattr(r, f) for f in by)
+            g = groups.setdefault(key, {**dict(zip(by, key)), "calls": 0, "latency_seconds": 0.0,
+                                        "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0,
+                                        "retries": 0, "cache_hits": 0})
+            g["calls"] += 1
+            g["latency_seconds"] += r.latency_seconds
+            g["prompt_tokens"] += r.prompt_tokens
+            g["completion_tokens"] += r.completion_tokens
+            g["cost_usd"] += r.cost_usd
+            g["retries"] += r.retries
+            g["cache_hits"] += int(r.cache_hit)
+        return sorted(groups.values(), key=lambda g: g["latency_seconds"], reverse=True)
+
+    def recent_calls(self, n: int = 100) -> List[Dict[str, Any]]:
+        self._drain()
+        with self._lock:
+            return [asdict(r) for r in list(self.recent)[-n:]]
+
+    def prometheus_text(self) -> str:
+        """Prometheus exposition of every aggregate"""
+        self._drain()
+        help_text = {
+            "calls_total": ("counter", "AI calls by outcome (ok, empty, error)"),
+            "cache_hits_total": ("counter", "AI calls served from the response cache"),
+            "retries_total": ("counter", "Provider retries across AI calls"),
+            "prompt_tokens_total": ("counter", "Prompt tokens sent"),
+            "cached_prompt_tokens_total": ("counter", "Prompt tokens served from the provider prompt cache"),
+            "completion_tokens_total": ("counter", "Completion tokens received"),
+            "cost_usd_total": ("counter", "Estimated spend in USD (AI_PRICING_JSON)"),
+            "latency_seconds_total": ("counter", "Wall time spent in AI calls"),
+            "validations_total": ("counter", "Validation outcomes in generate_with_validation"),
+        }
+        label_names = {"calls_total": self.LABELS + ("outcome",),
+                       "validations_total": ("validator", "step", "result")}
+        lines: List[str] = []
+        with self._lock:
+            for name, hist, text in (
+                ("latency_seconds", self.latency, "AI call latency including retries"),
+                ("ttft_seconds", self.ttft, "Time to first token (streamed calls only)"),
+            ):
+                metric = f"snowflake_ai_call_{name}"
+                lines.append(f"# HELP {metric} {text}")
+                lines.append(f"# TYPE {metric} histogram")
+                lines.extend(hist.lines(metric, self.LABELS))
+                lines.append("")
+            for name, (kind, text) in help_text.items():
+                metric = f"snowflake_ai_{name}"
+                names = label_names.get(name, self.LABELS)
+                lines.append(f"# HELP {metric} {text}")
+                lines.append(f"# TYPE {metric} {kind}")
+                for labels, value in sorted(self.counters.get(name, {}).items()):
+                    rendered = ",".join(f'{k}="{v}"' for k, v in zip(names, labels))
+                    lines.append(f"{metric}{{{rendered}}} {value:g}")
+                lines.append("")
+        return "\n".join(lines)
+
+
+# Global instance
+_call_telemetry = None
+_call_telemetry_lock = threading.Lock()
+
+
+def get_call_telemetry() -> CallTelemetry:
+    """Get the process-wide AI call telemetry"""
+    global _call_telemetry
+    with _call_telemetry_lock:
+        if _call_telemetry is None:
+            _call_telemetry = CallTelemetry()
+            get_pipeline_metrics().watch_queue("ai_telemetry_pending", _call_telemetry._pending.qsize)
+        return _call_telemetry
@@ -229,30 +229,19 @@ async def execute_step(
                     brief_data = json.load(f)
                     brief = brief_data.get('brief', '')
         
-        # Execute step based on number
+        # Select step; it runs in a worker thread so its network waits
+        # don't block the event loop for other requests
         if step_number == 0:
-            success, artifact, message = pipeline.execute_step_0(brief or "A story")
+            step_func = lambda: pipeline.execute_step_0(brief or "A story")
         elif step_number == 1:
-            success, artifact, message = pipeline.execute_step_1(brief or "A story")
-        elif step_number == 2:
-            success, artifact, message = pipeline.execute_step_2()
-        elif step_number == 3:
-            success, artifact, message = pipeline.execute_step_3()
-        elif step_number == 4:
-            success, artifact, message = pipeline.execute_step_4()
-        elif step_number == 5:
-            success, artifact, message = pipeline.execute_step_5()
-        elif step_number == 6:
-            success, artifact, message = pipeline.execute_step_6()
-        elif step_number == 7:
-            success, artifact, message = pipeline.execute_step_7()
-        elif step_number == 8:
-            success, artifact, message = pipeline.execute_step_8()
-        elif step_number == 9:
-            success, artifact, message = pipeline.execute_step_9()
+            step_func = lambda: pipeline.execute_step_1(brief or "A story")
         elif step_number == 10:
             target_words = request.additional_params.get('target_words', 90000)
-            success, artifact, message = pipeline.execute_step_10(target_words)
+            step_func = lambda: pipeline.execute_step_10(target_words)
+        else:
+            step_func = getattr(pipeline, f"execute_step_{step_number}")
+        
+        success, artifact, message = await asyncio.to_thread(step_func)
         
         if not success:
             raise HTTPException(status_code=422, detail=message)
@@ -315,7 +304,7 @@ async def generate_full_novel(
                         "status": "executing"
                     })
                     
-                    success, _, message = step_func()
+                    success, _, message = await asyncio.to_thread(step_func)
                     if not success:
                         emit_event(project_id, "generation_failed", {
                             "step": i,
@@ -0,0 +1,287 @@
+"""
+Asynchronous Event Bus
+Bounded queue and batching writer thread that fan observability events out to pluggable sinks
+"""
+
+import json
+import queue
+import sqlite3
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .event_log import EventLog
+
+logger = logging.getLogger(__name__)
+
+Event = Tuple[str, Dict[str, Any]]  # (project_id, event)
+
+BLOCK = "block"
+DROP_NEW = "drop_new"
+DROP_OLDEST = "drop_oldest"
+POLICIES = (BLOCK, DROP_NEW, DROP_OLDEST)
+
+
+class EventSink(ABC):
+    """Destination for batches of events; called only from the writer thread"""
+
+    name = "sink"
+
+    @abstractmethod
+    def write_batch(self, events: List[Event]) -> None:
+        """Write one batch of events"""
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class JSONLSink(EventSink):
+    """Appends events to each project's indexed JSONL log (one write per project per batch)"""
+
+    name = "jsonl"
+
+    def __init__(self, path_for: Callable[[str], Path]):
+        """
+        Args:
+            path_for: Maps a project id to its events log path
+        """
+        self.path_for = path_for
+        self._logs: Dict[Path, EventLog] = {}
+
+    def write_batch(self, events: List[Event]) -> None:
+        by_project: Dict[str, List[str]] = {}
+        for project_id, event in events:
+            by_project.setdefault(project_id, []).append(json.dumps(event) + "\n")
+        for project_id, lines in by_project.items():
+            path = self.path_for(project_id)
+            log = self._logs.get(path)
+            if log is None:
+                log = self._logs[path] = EventLog(path)
+            log.append(lines)
+
+
+class SQLiteSink(EventSink):
+    """Stores events in a SQLite table (one transaction per batch)"""
+
+    name = "sqlite"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Only the writer thread uses the connection after construction
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS events (
+                   id INTEGER PRIMARY KEY AUTOINCREMENT,
+                   project_id TEXT NOT NULL,
+                   ts TEXT,
+                   type TEXT,
+                   event TEXT NOT NULL
+               )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_events_project ON events(project_id, id)")
+        self._conn.commit()
+
+    def write_batch(self, events: List[Event]) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO events (project_id, ts, type, event) VALUES (?, ?, ?, ?)",
+                [(pid, e.get("ts"), e.get("type"), json.dumps(e)) for pid, e in events],
+            )
+
+    def recent(self, project_id: str, n: int = 200) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT event FROM events WHERE project_id = ? ORDER BY id DESC LIMIT ?", (project_id, n)
+        ).fetchall()
+        return [json.loads(row[0]) for row in reversed(rows)]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class RingBufferSink(EventSink):
+    """Keeps the last ``capacity`` events per project in memory for live dashboards"""
+
+    name = "ring"
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._buffers: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def write_batch(self, events: List[Event]) -> None:
+        with self._lock:
+            for project_id, event in events:
+                buf = self._buffers.get(project_id)
+                if buf is None:
+                    buf = self._buffers[project_id] = deque(maxlen=self.capacity)
+                buf.append(event)
+
+    def recent(self, project_id: str, n: int = 200) -> List[Dict[str, Any]]:
+        with self._lock:
+            buf = self._buffers.get(project_id)
+            return list(buf)[-n:] if buf and n > 0 else []
+
+    def has(self, project_id: str) -> bool:
+        with self._lock:
+            return project_id in self._buffers
+
+
+class CallbackSink(EventSink):
+    """Adapts a per-batch function into a sink"""
+
+    def __init__(self, name: str, fn: Callable[[List[Event]], None]):
+        self.name = name
+        self.fn = fn
+
+    def write_batch(self, events: List[Event]) -> None:
+        self.fn(events)
+
+
+class EventBus:
+    """
+    Non-blocking event emission.
+
+    ``emit`` only enqueues; a single writer thread drains the queue in
+    batches of up to ``batch_size`` and hands each batch to every sink, so
+    callers never touch disk. When the queue is full the policy decides:
+    ``block`` waits for room, ``drop_new`` discards the new event and
+    ``drop_oldest`` discards the oldest queued one. A failing sink is
+    logged and never stops the others.
+    """
+
+    def __init__(self,
+                 sinks: List[EventSink],
+                 max_queue: int = 10000,
+                 batch_size: int = 256,
+                 policy: str = BLOCK):
+        """
+        Initialize event bus
+
+        Args:
+            sinks: Destinations for every event
+            max_queue: Events buffered before the policy applies
+            batch_size: Most events handed to sinks in one call
+            policy: "block", "drop_new" or "drop_oldest"
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown event policy {policy!r}; expected one of {POLICIES}")
+        self.sinks = list(sinks)
+        self.batch_size = max(1, batch_size)
+        self.policy = policy
+        self._queue: "queue.Queue[Event]" = queue.Queue(maxsize=max(1, max_queue))
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._idle = threading.Condition()
+        self._unfinished = 0
+        self.emitted = 0
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self.sink_errors = 0
+
+    def emit(self, project_id: str, event: Dict[str, Any]) -> bool:
+        """Queue an event; returns False if it was dropped"""
+        if self._thread is None:
+            self._start()
+        with self._idle:
+            self._unfinished += 1
+        item = (project_id, event)
+        try:
+            if self.policy == BLOCK:
+                self._queue.put(item)
+            elif self.policy == DROP_NEW:
+                self._queue.put_nowait(item)
+            else:
+                while True:
+                    try:
+                        self._queue.put_nowait(item)
+                        break
+                    except queue.Full:
+                        try:
+                            self._queue.get_nowait()
+                        except queue.Empty:
+                            continue
+                        self._record_drop()
+        except queue.Full:
+            self._record_drop()
+            return False
+        with self._idle:
+            self.emitted += 1
+        return True
+
+    def _record_drop(self) -> None:
+        with self._idle:
+            self.dropped += 1
+            self._finish(1)
+
+    def _finish(self, count: int) -> None:
+        self._unfinished -= count
+        if self._unfinished <= 0:
+            self._idle.notify_all()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every queued event reached the sinks; returns False on timeout"""
+        with self._idle:
+            drained = self._idle.wait_for(lambda: self._unfinished <= 0, timeout)
+        for sink in self.sinks:
+            try:
+                sink.flush()
+            except Exception:
+                logger.exception("Event sink %s failed to flush", sink.name)
+        return drained
+
+    def get_sink(self, name: str) -> Optional[EventSink]:
+        for sink in self.sinks:
+            if sink.name == name:
+                return sink
+        return None
+
+    def _start(self) -> None:
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="event-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for sink in self.sinks:
+                try:
+                    sink.write_batch(batch)
+                except Exception:
+                    self.sink_errors += 1
+                    logger.exception("Event sink %s failed on a batch of %d", sink.name, len(batch))
+            with self._idle:
+                self.written += len(batch)
+                self.batches += 1
+                self._finish(len(batch))
+
+    def depth(self) -> int:
+        """Events queued but not yet handed to the sinks"""
+        return self._queue.qsize()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._idle:
+            return {
+                "queued": self._queue.qsize(),
+                "emitted": self.emitted,
+                "dropped": self.dropped,
+                "written": self.written,
+                "batches": self.batches,
+                "sink_errors": self.sink_errors,
+                "policy": self.policy,
+                "sinks": [s.name for s in self.sinks],
+            }
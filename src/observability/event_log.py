@@ -0,0 +1,245 @@
+"""
+Indexed Event Log
+Segmented JSONL event log with a fixed-width offset index for O(n) tail and cursor reads
+"""
+
+import json
+import time
+import struct
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# One index record per event: (segment number, byte offset of its line)
+RECORD = struct.Struct("<IQ")
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+
+
+class EventLog:
+    """
+    Append-only JSONL event log split into segments, plus an offset index.
+
+    Segment 0 is the project's ``events.log`` (so existing readers keep
+    working); later segments are ``events.1.log``, ``events.2.log``, ...
+    ``events.idx`` holds one fixed-width record per event, so event ``i``
+    is found with a single seek and a cursor is simply an event count.
+    Data is written before its index records, so readers never see an
+    index entry for a line that isn't on disk. The log is written by one
+    thread per process (the event bus writer) and may be read from
+    anywhere, including other processes. Readers never write the index:
+    complete lines past its end (a log from before the index, or a writer
+    between its two writes) are found by scanning forward from the last
+    indexed line, and count as events after the indexed ones.
+    """
+
+    def __init__(self, path: Path, segment_bytes: int = DEFAULT_SEGMENT_BYTES):
+        """
+        Initialize event log
+
+        Args:
+            path: Segment 0 (the project's events.log)
+            segment_bytes: Start a new segment once the active one reaches this size
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix(".idx")
+        self.segment_bytes = segment_bytes
+        self._lock = threading.Lock()
+        self._active: Optional[Tuple[int, int]] = None  # (segment, size) once recovered
+        # Readers' scan past the index: (index key, segment, position, skip_first, records)
+        self._scan_lock = threading.Lock()
+        self._scan: Optional[Tuple[Tuple[int, int, int], int, int, bool, List[Tuple[int, int]]]] = None
+
+    def segment_path(self, segment: int) -> Path:
+        if segment == 0:
+            return self.path
+        return self.path.with_name(f"{self.path.stem}.{segment}{self.path.suffix}")
+
+    def count(self) -> int:
+        """Number of events on disk (the cursor after the newest event)"""
+        indexed, unindexed, _ = self._snapshot()
+        return indexed + len(unindexed)
+
+    def _indexed_count(self) -> int:
+        try:
+            return self.index_path.stat().st_size // RECORD.size
+        except FileNotFoundError:
+            return 0
+
+    def _snapshot(self) -> Tuple[int, List[Tuple[int, int]], Tuple[int, int]]:
+        """
+        Indexed event count, (segment, offset) records for the complete lines
+        after the last indexed one, and the (segment, offset) where those end.
+        The scan resumes where the previous call stopped until the index
+        moves; the returned list is only ever appended to, so callers should
+        bound their slices.
+        """
+        indexed = self._indexed_count()
+        if indexed:
+            with open(self.index_path, "rb") as f:
+                f.seek((indexed - 1) * RECORD.size)
+                segment, offset = RECORD.unpack(f.read(RECORD.size))
+        else:
+            segment, offset = 0, 0
+        key = (indexed, segment, offset)
+
+        with self._scan_lock:
+            if self._scan and self._scan[0] == key:
+                _, segment, pos, skip_first, records = self._scan
+            else:
+                pos, skip_first, records = offset, bool(indexed), []
+            segment, pos, skip_first = self._scan_lines(segment, pos, skip_first, records)
+            self._scan = (key, segment, pos, skip_first, records)
+        return indexed, records, (segment, pos)
+
+    def _scan_lines(self, segment: int, pos: int, skip_first: bool,
+                    records: List[Tuple[int, int]]) -> Tuple[int, int, bool]:
+        """Record complete lines from ``pos`` on, following later segments; returns where it stopped"""
+        while True:
+            try:
+                with open(self.segment_path(segment), "rb") as f:
+                    f.seek(pos)
+                    for line in iter(f.readline, b""):
+                        if not line.endswith(b"\n"):
+                            return segment, pos, skip_first
+                        if skip_first:
+                            skip_first = False
+                        elif line.strip():
+                            records.append((segment, pos))
+                        pos += len(line)
+            except FileNotFoundError:
+                return segment, pos, skip_first
+            if not self.segment_path(segment + 1).exists():
+                return segment, pos, skip_first
+            segment, pos = segment + 1, 0
+
+    # ── Writing ────────────────────────────────────────────────────────
+
+    def append(self, lines: List[str]) -> int:
+        """
+        Append serialized events (each ending in a newline)
+
+        Returns:
+            Cursor after the last appended event
+        """
+        with self._lock:
+            if self._active is None:
+                self._recover_locked()
+            segment, size = self._active
+            if size >= self.segment_bytes:
+                segment, size = segment + 1, 0
+
+            data = bytearray()
+            records = bytearray()
+            for line in lines:
+                records += RECORD.pack(segment, size + len(data))
+                data += line.encode("utf-8")
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.segment_path(segment), "ab") as f:
+                f.write(data)
+            with open(self.index_path, "ab") as f:
+                f.write(records)
+            self._active = (segment, size + len(data))
+            return self.count()
+
+    def _recover_locked(self) -> None:
+        """Bring the index in line with the segments (legacy logs, crashes between writes)"""
+        index_size = self.index_path.stat().st_size if self.index_path.exists() else 0
+        whole = index_size - index_size % RECORD.size
+        if whole != index_size:
+            with open(self.index_path, "r+b") as f:
+                f.truncate(whole)
+
+        # Index any complete lines written after the last indexed one,
+        # and cut off a partial trailing line
+        _, unindexed, (segment, end) = self._snapshot()
+        if unindexed:
+            with open(self.index_path, "ab") as f:
+                f.write(b"".join(RECORD.pack(*record) for record in unindexed))
+            logger.info("Indexed %d unindexed events in %s", len(unindexed), self.path)
+        path = self.segment_path(segment)
+        if not path.exists():
+            end = 0
+        elif path.stat().st_size != end:
+            with open(path, "r+b") as f:
+                f.truncate(end)
+        self._active = (segment, end)
+
+    # ── Reading ────────────────────────────────────────────────────────
+
+    def read(self, start: int, stop: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """Events with cursor positions in [start, stop) as (cursor after event, event) pairs"""
+        indexed, unindexed, _ = self._snapshot()
+        start, stop = max(0, start), min(stop, indexed + len(unindexed))
+        if start >= stop:
+            return []
+        records: List[Tuple[int, int]] = []
+        if start < indexed:
+            with open(self.index_path, "rb") as f:
+                f.seek(start * RECORD.size)
+                records = list(RECORD.iter_unpack(f.read((min(stop, indexed) - start) * RECORD.size)))
+        records += unindexed[max(start, indexed) - indexed:stop - indexed]
+
+        out: List[Tuple[int, Dict[str, Any]]] = []
+        handle, handle_segment = None, None
+        try:
+            for i, (segment, offset) in enumerate(records):
+                if segment != handle_segment:
+                    if handle:
+                        handle.close()
+                    handle, handle_segment = open(self.segment_path(segment), "rb"), segment
+                    handle.seek(offset)
+                elif handle.tell() != offset:
+                    handle.seek(offset)
+                line = handle.readline()
+                try:
+                    out.append((start + i + 1, json.loads(line)))
+                except json.JSONDecodeError:
+                    logger.warning("Skipping malformed event %d in %s", start + i, self.path)
+        finally:
+            if handle:
+                handle.close()
+        return out
+
+    def tail(self, n: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Last ``n`` events and the cursor after them"""
+        count = self.count()
+        return [e for _, e in self.read(count - max(0, n), count)], count
+
+    def since(self, cursor: int, limit: int = 1000) -> Tuple[List[Dict[str, Any]], int]:
+        """Up to ``limit`` events after ``cursor`` and the cursor to resume from"""
+        entries = self.read(cursor, cursor + max(0, limit))
+        return [e for _, e in entries], entries[-1][0] if entries else max(0, min(cursor, self.count()))
+
+    def wait_for(self, cursor: int, timeout: float, poll_seconds: float = 0.25) -> bool:
+        """Block until there are events after ``cursor``; False on timeout"""
+        deadline = time.monotonic() + timeout
+        while self.count() <= cursor:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(poll_seconds, remaining))
+        return True
+
+
+# Shared readers, one per log path
+_event_logs: Dict[Path, EventLog] = {}
+_event_logs_lock = threading.Lock()
+
+
+def get_event_log(path: Path) -> EventLog:
+    """
+    Process-wide EventLog for ``path``
+
+    Reusing one instance keeps its scan of lines past the index, so a log
+    without an index is scanned once rather than on every read.
+    """
+    path = Path(path)
+    with _event_logs_lock:
+        log = _event_logs.get(path)
+        if log is None:
+            log = _event_logs[path] = EventLog(path)
+        return log
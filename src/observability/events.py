@@ -1,12 +1,20 @@
+import os
 import json
 import time
+import atexit
 import psutil
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, asdict
 
+from .state_store import get_state_store
+from .event_log import get_event_log
+from .metrics import get_pipeline_metrics
+from .history import BoundedHistory
+from .event_bus import EventBus, JSONLSink, SQLiteSink, RingBufferSink, CallbackSink, BLOCK
+
 ARTIFACTS_DIR = Path("artifacts")
 
 
@@ -38,8 +46,8 @@ class MetricsCollector:
     """Collects system and application metrics"""
     
     def __init__(self):
-        self.metrics_history: List[PerformanceMetrics] = []
-        self.health_history: List[HealthStatus] = []
+        self.metrics_history = BoundedHistory()
+        self.health_history = BoundedHistory()
         self._collecting = False
         self._thread = None
         self._lock = threading.RLock()
@@ -82,13 +90,6 @@ class MetricsCollector:
                     pipeline_active=True  # Will be updated by pipeline
                 )
                 self.health_history.append(health)
-                
-                # Keep only last 1000 entries
-                if len(self.metrics_history) > 1000:
-                    self.metrics_history = self.metrics_history[-1000:]
-                if len(self.health_history) > 1000:
-                    self.health_history = self.health_history[-1000:]
-                    
             except Exception:
                 pass  # Don't break observability
                 
@@ -96,11 +97,11 @@ class MetricsCollector:
             
     def get_latest_metrics(self) -> Optional[PerformanceMetrics]:
         """Get latest metrics"""
-        return self.metrics_history[-1] if self.metrics_history else None
+        return self.metrics_history.last()
         
     def get_latest_health(self) -> Optional[HealthStatus]:
         """Get latest health status"""
-        return self.health_history[-1] if self.health_history else None
+        return self.health_history.last()
 
 
 # Global metrics collector
@@ -118,11 +119,59 @@ def _project_paths(project_id: str) -> Dict[str, Path]:
     }
 
 
-def emit_event(project_id: str, event_type: str, payload: Dict[str, Any]) -> None:
-    """Enhanced event emission with metrics integration"""
-    paths = _project_paths(project_id)
-    paths["base"].mkdir(parents=True, exist_ok=True)
+# Global event bus
+_event_bus = None
+_event_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    """
+    Get the process-wide event bus.
 
+    Sinks: the per-project events.log, status.json and an in-memory ring
+    (EVENT_RING_SIZE per project), plus SQLite when EVENT_SQLITE_PATH is set.
+    Queue size, batch size and full-queue policy come from EVENT_QUEUE_SIZE,
+    EVENT_BATCH_SIZE and EVENT_QUEUE_POLICY (block, drop_new, drop_oldest).
+    """
+    global _event_bus
+    with _event_bus_lock:
+        if _event_bus is None:
+            try:
+                queue_size = int(os.getenv("EVENT_QUEUE_SIZE", 10000))
+                batch_size = int(os.getenv("EVENT_BATCH_SIZE", 256))
+                ring_size = int(os.getenv("EVENT_RING_SIZE", 1000))
+            except ValueError:
+                queue_size, batch_size, ring_size = 10000, 256, 1000
+            sinks = [
+                JSONLSink(lambda project_id: _project_paths(project_id)["events"]),
+                CallbackSink("status", _update_status),
+                RingBufferSink(ring_size),
+            ]
+            sqlite_path = os.getenv("EVENT_SQLITE_PATH", "").strip()
+            if sqlite_path:
+                sinks.append(SQLiteSink(Path(sqlite_path)))
+            _event_bus = EventBus(
+                sinks,
+                max_queue=queue_size,
+                batch_size=batch_size,
+                policy=os.getenv("EVENT_QUEUE_POLICY", BLOCK).strip().lower() or BLOCK,
+            )
+            atexit.register(_event_bus.flush)
+            get_pipeline_metrics().watch_queue("event_bus", _event_bus.depth)
+        return _event_bus
+
+
+def recent_events(project_id: str, n: int = 200) -> Optional[List[Dict[str, Any]]]:
+    """Latest events from the in-memory ring, or None if this process hasn't seen the project"""
+    ring = get_event_bus().get_sink("ring")
+    if ring is None or not ring.has(project_id):
+        return None
+    get_event_bus().flush(timeout=1.0)
+    return ring.recent(project_id, n)
+
+
+def emit_event(project_id: str, event_type: str, payload: Dict[str, Any]) -> None:
+    """Enhanced event emission with metrics integration (queued; never touches disk here)"""
     # Enrich event with current metrics
     latest_metrics = _metrics_collector.get_latest_metrics()
     latest_health = _metrics_collector.get_latest_health()
@@ -130,32 +179,22 @@ def emit_event(project_id: str, event_type: str, payload: Dict[str, Any]) -> Non
     event = {
         "ts": datetime.utcnow().isoformat(),
         "type": event_type,
-        "payload": payload,
+        "payload": dict(payload),
         "system_metrics": asdict(latest_metrics) if latest_metrics else None,
         "health_status": asdict(latest_health) if latest_health else None,
     }
+    get_event_bus().emit(project_id, event)
 
-    with _metrics_collector._lock:
-        # Append to JSONL events
-        with open(paths["events"], "a", encoding="utf-8") as f:
-            f.write(json.dumps(event) + "\n")
 
-        # Update status.json with enhanced information
-        try:
-            if paths["status"].exists():
-                with open(paths["status"], "r", encoding="utf-8") as f:
-                    status = json.load(f)
-            else:
-                status = {
-                    "project_id": project_id,
-                    "current_step": 0,
-                    "steps": {},
-                    "last_updated": None,
-                    "total_events": 0,
-                    "pipeline_health": "unknown",
-                    "performance_summary": {},
-                }
+def _update_status(events: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """Event-bus sink: fold a batch of events into each project's status.json"""
+    store = get_state_store()
+    for project_id, event in events:
+        payload = event["payload"]
+        health = event.get("health_status")
+        metrics = event.get("system_metrics")
 
+        def apply(status: Dict[str, Any]) -> int:
             # Update step information
             step_key = payload.get("step_key")
             if step_key:
@@ -171,26 +210,29 @@ def emit_event(project_id: str, event_type: str, payload: Dict[str, Any]) -> Non
             status["total_events"] = status.get("total_events", 0) + 1
 
             # Update health status
-            if latest_health:
+            if health:
                 status["pipeline_health"] = "healthy" if all([
-                    latest_health.ai_provider_healthy,
-                    latest_health.disk_space_healthy,
-                    latest_health.memory_healthy
+                    health["ai_provider_healthy"],
+                    health["disk_space_healthy"],
+                    health["memory_healthy"]
                 ]) else "degraded"
 
             # Update performance summary
-            if latest_metrics:
+            if metrics:
                 status["performance_summary"] = {
-                    "cpu_percent": latest_metrics.cpu_percent,
-                    "memory_mb": int(latest_metrics.memory_mb),
-                    "last_updated": latest_metrics.timestamp
+                    "cpu_percent": metrics["cpu_percent"],
+                    "memory_mb": int(metrics["memory_mb"]),
+                    "last_updated": metrics["timestamp"]
                 }
+            return status["total_events"]
 
-            with open(paths["status"], "w", encoding="utf-8") as f:
-                json.dump(status, f, indent=2)
+        try:
+            total_events = store.update(
+                _project_paths(project_id)["status"], apply, lambda: _initial_status(project_id)
+            )
 
             # Save detailed metrics periodically
-            if status["total_events"] % 10 == 0:  # Every 10 events
+            if total_events % 10 == 0:  # Every 10 events
                 save_metrics_snapshot(project_id)
 
         except Exception:
@@ -198,6 +240,31 @@ def emit_event(project_id: str, event_type: str, payload: Dict[str, Any]) -> Non
             pass
 
 
+def _initial_status(project_id: str) -> Dict[str, Any]:
+    return {
+        "project_id": project_id,
+        "current_step": 0,
+        "steps": {},
+        "last_updated": None,
+        "total_events": 0,
+        "pipeline_health": "unknown",
+        "performance_summary": {},
+    }
+
+
+def flush_status(project_id: Optional[str] = None) -> None:
+    """Drain queued events and write pending status.json updates now (e.g. at a step boundary)"""
+    get_event_bus().flush()
+    store = get_state_store()
+    try:
+        if project_id is None:
+            store.flush()
+        else:
+            store.flush(_project_paths(project_id)["status"])
+    except OSError:
+        pass
+
+
 def start_monitoring(project_id: str):
     """Start comprehensive monitoring for a project"""
     _metrics_collector.start_collection(project_id)
@@ -225,8 +292,8 @@ def save_metrics_snapshot(project_id: str):
             # Save metrics history
             metrics_data = {
                 "timestamp": datetime.utcnow().isoformat(),
-                "metrics_history": [asdict(m) for m in _metrics_collector.metrics_history[-100:]],  # Last 100
-                "health_history": [asdict(h) for h in _metrics_collector.health_history[-100:]]
+                "metrics_history": [asdict(m) for m in _metrics_collector.metrics_history.recent(100)],  # Last 100
+                "health_history": [asdict(h) for h in _metrics_collector.health_history.recent(100)]
             }
 
             with open(paths["metrics"], "w", encoding="utf-8") as f:
@@ -295,19 +362,18 @@ def get_project_summary(project_id: str) -> Dict[str, Any]:
     try:
         paths = _project_paths(project_id)
 
+        # Recent events from memory when this process is the one emitting them
+        # (before taking the collector lock, which the event writer also uses)
+        memory_events = recent_events(project_id, 50)
+
         with _metrics_collector._lock:
             # Load status
-            status = {}
-            if paths["status"].exists():
-                with open(paths["status"], "r", encoding="utf-8") as f:
-                    status = json.load(f)
+            status = get_state_store().load(paths["status"], default={})
 
             # Load recent events
-            events = []
-            if paths["events"].exists():
-                with open(paths["events"], "r", encoding="utf-8") as f:
-                    lines = f.read().strip().split('\n')[-50:]  # Last 50 events
-                    events = [json.loads(line) for line in lines if line.strip()]
+            events = memory_events or []
+            if memory_events is None:
+                events, _ = get_event_log(paths["events"]).tail(50)  # Last 50 events
 
             # Load metrics
             metrics = {}
@@ -0,0 +1,128 @@
+"""
+Bounded History
+Fixed-size in-process history with lifetime aggregates, for services that keep "recent N" records
+"""
+
+import threading
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+DEFAULT_MAXLEN = 1000
+
+
+class _RunningStats:
+    """Count, sum, min and max of every value ever added"""
+
+    __slots__ = ("count", "total", "minimum", "maximum")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.minimum if self.minimum is not None else 0.0,
+            "max": self.maximum if self.maximum is not None else 0.0,
+        }
+
+
+class BoundedHistory:
+    """
+    The last ``maxlen`` records of an append-only stream, plus aggregates
+    over everything ever appended.
+
+    Old records fall off the front in O(1) instead of being trimmed by
+    copying the list. ``fields`` maps a name to a function extracting a
+    number from a record (running count/sum/mean/min/max); ``keys`` maps a
+    name to a function extracting a category (running counts). Extractors
+    that raise or return None skip that record for that aggregate, so
+    statistics never need to rescan the retained records.
+    """
+
+    def __init__(self, maxlen: int = DEFAULT_MAXLEN,
+                 fields: Optional[Dict[str, Callable[[Any], Optional[float]]]] = None,
+                 keys: Optional[Dict[str, Callable[[Any], Any]]] = None):
+        self.maxlen = max(1, int(maxlen))
+        self._items: Deque[Any] = deque(maxlen=self.maxlen)
+        self._fields = dict(fields or {})
+        self._keys = dict(keys or {})
+        self._stats = {name: _RunningStats() for name in self._fields}
+        self._counts: Dict[str, Dict[Any, int]] = {name: {} for name in self._keys}
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def append(self, item: Any) -> None:
+        with self._lock:
+            self._items.append(item)
+            self._total += 1
+            for name, extract in self._fields.items():
+                try:
+                    value = extract(item)
+                except Exception:
+                    continue
+                if value is not None:
+                    self._stats[name].add(float(value))
+            for name, extract in self._keys.items():
+                try:
+                    key = extract(item)
+                except Exception:
+                    continue
+                if key is not None:
+                    counts = self._counts[name]
+                    counts[key] = counts.get(key, 0) + 1
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(self._items))
+
+    def __getitem__(self, index: int) -> Any:
+        return self._items[index]
+
+    def recent(self, n: int) -> List[Any]:
+        """The newest ``n`` retained records, oldest first"""
+        with self._lock:
+            if n <= 0:
+                return []
+            return list(islice(reversed(self._items), n))[::-1]
+
+    def last(self) -> Optional[Any]:
+        with self._lock:
+            return self._items[-1] if self._items else None
+
+    @property
+    def total(self) -> int:
+        """Records appended over the history's lifetime, including evicted ones"""
+        return self._total
+
+    def stats(self, name: str) -> Dict[str, float]:
+        with self._lock:
+            return self._stats[name].as_dict()
+
+    def counts(self, name: str) -> Dict[Any, int]:
+        with self._lock:
+            return dict(self._counts[name])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._total = 0
+            self._stats = {name: _RunningStats() for name in self._fields}
+            self._counts = {name: {} for name in self._keys}
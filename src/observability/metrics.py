@@ -0,0 +1,248 @@
+"""
+Pipeline Metrics
+In-process Prometheus registry for pipeline throughput: steps, scenes, words, validations, checkpoints, shots, queues
+"""
+
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STEP_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600)
+
+
+class Histogram:
+    """Cumulative-bucket histogram per label set (Prometheus semantics)"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = tuple(sorted(buckets))
+        self.series: Dict[Tuple, List[float]] = {}  # labels -> [bucket counts..., +Inf, sum]
+
+    def observe(self, labels: Tuple, value: float) -> None:
+        row = self.series.get(labels)
+        if row is None:
+            row = self.series[labels] = [0.0] * (len(self.buckets) + 2)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                row[i] += 1
+        row[-2] += 1
+        row[-1] += value
+
+    def lines(self, name: str, label_names: Tuple[str, ...]) -> List[str]:
+        out = []
+        for labels, row in sorted(self.series.items()):
+            base = ",".join(f'{k}="{v}"' for k, v in zip(label_names, labels))
+            sep = "," if base else ""
+            for bound, count in zip(self.buckets, row):
+                out.append(f'{name}_bucket{{{base}{sep}le="{bound}"}} {int(count)}')
+            out.append(f'{name}_bucket{{{base}{sep}le="+Inf"}} {int(row[-2])}')
+            out.append(f"{name}_sum{{{base}}} {row[-1]:.6f}")
+            out.append(f"{name}_count{{{base}}} {int(row[-2])}")
+        return out
+
+
+class RateWindow:
+    """
+    Trailing-window rate kept in one bucket per second, so memory and
+    read cost are fixed by the window length, not by the event count.
+    """
+
+    def __init__(self, window_seconds: int = 300):
+        self.window = max(1, int(window_seconds))
+        self._amounts = [0.0] * self.window
+        self._seconds = [-1] * self.window
+
+    def add(self, amount: float, now: Optional[float] = None) -> None:
+        second = int(time.monotonic() if now is None else now)
+        i = second % self.window
+        if self._seconds[i] != second:
+            self._seconds[i] = second
+            self._amounts[i] = 0.0
+        self._amounts[i] += amount
+
+    def per_second(self, now: Optional[float] = None) -> float:
+        second = int(time.monotonic() if now is None else now)
+        total = sum(a for a, s in zip(self._amounts, self._seconds) if second - s < self.window)
+        return total / self.window
+
+
+class MetricsRegistry:
+    """
+    Counters, gauges, histograms and windowed rates by name.
+
+    Updates take one short lock; a scrape renders what is already
+    aggregated plus any registered callback gauges, so its cost does not
+    depend on how much work (or how many projects) came before.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._meta: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {}  # name -> (type, help, labels)
+        self._values: Dict[str, Dict[Tuple, float]] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._rates: Dict[str, Tuple[RateWindow, float]] = {}
+        self._callbacks: Dict[str, Dict[Tuple, Callable[[], float]]] = {}
+
+    def _declare(self, name: str, kind: str, help_text: str, labels: Tuple[str, ...]) -> None:
+        known = self._meta.setdefault(name, (kind, help_text, labels))
+        if known[0] != kind or known[2] != labels:
+            raise ValueError(f"Metric {name} already registered as {known[0]}{known[2]}")
+
+    def counter(self, name: str, help_text: str, labels: Tuple[str, ...] = ()) -> None:
+        with self._lock:
+            self._declare(name, "counter", help_text, labels)
+            self._values.setdefault(name, {})
+
+    def gauge(self, name: str, help_text: str, labels: Tuple[str, ...] = ()) -> None:
+        with self._lock:
+            self._declare(name, "gauge", help_text, labels)
+            self._values.setdefault(name, {})
+
+    def histogram(self, name: str, help_text: str, labels: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = STEP_BUCKETS) -> None:
+        with self._lock:
+            self._declare(name, "histogram", help_text, labels)
+            self._histograms.setdefault(name, Histogram(buckets))
+
+    def rate(self, name: str, help_text: str, window_seconds: int = 300, per: float = 1.0) -> None:
+        """Gauge reporting the trailing-window rate of ``mark`` amounts, scaled to ``per`` seconds"""
+        with self._lock:
+            self._declare(name, "gauge", help_text, ())
+            self._rates.setdefault(name, (RateWindow(window_seconds), per))
+
+    def inc(self, name: str, amount: float = 1, **labels: Any) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            series = self._values[name]
+            series[key] = series.get(key, 0) + amount
+
+    def set(self, name: str, value: float, **labels: Any) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            self._values[name][key] = value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = self._key(name, labels)
+        with self._lock:
+            self._histograms[name].observe(key, value)
+
+    def mark(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self._rates[name][0].add(amount)
+
+    def set_callback(self, name: str, fn: Callable[[], float], **labels: Any) -> None:
+        """Gauge value read from ``fn`` at scrape time (e.g. a queue's qsize)"""
+        key = self._key(name, labels)
+        with self._lock:
+            self._callbacks.setdefault(name, {})[key] = fn
+
+    def get(self, name: str, **labels: Any) -> float:
+        key = self._key(name, labels)
+        with self._lock:
+            if name in self._rates:
+                window, per = self._rates[name]
+                return window.per_second() * per
+            return self._values.get(name, {}).get(key, 0)
+
+    def _key(self, name: str, labels: Dict[str, Any]) -> Tuple:
+        return tuple(str(labels.get(label, "")) for label in self._meta[name][2])
+
+    def prometheus_text(self) -> str:
+        """Prometheus exposition of every registered metric"""
+        with self._lock:
+            callbacks = {name: dict(series) for name, series in self._callbacks.items()}
+        sampled: Dict[str, Dict[Tuple, float]] = {}
+        for name, series in callbacks.items():
+            for key, fn in series.items():
+                try:
+                    sampled.setdefault(name, {})[key] = float(fn())
+                except Exception as e:
+                    logger.debug("Metric callback %s failed: %s", name, e)
+
+        lines: List[str] = []
+        with self._lock:
+            for name, (kind, help_text, label_names) in self._meta.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                if kind == "histogram":
+                    lines.extend(self._histograms[name].lines(name, label_names))
+                elif name in self._rates:
+                    window, per = self._rates[name]
+                    lines.append(f"{name} {window.per_second() * per:g}")
+                else:
+                    series = {**self._values.get(name, {}), **sampled.get(name, {})}
+                    for key, value in sorted(series.items()):
+                        rendered = ",".join(f'{k}="{v}"' for k, v in zip(label_names, key))
+                        lines.append(f"{name}{{{rendered}}} {value:g}" if rendered else f"{name} {value:g}")
+                lines.append("")
+        return "\n".join(lines)
+
+
+class PipelineMetrics:
+    """Named pipeline metrics on a registry, with one method per thing the pipelines report"""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or MetricsRegistry()
+        r = self.registry
+        r.counter("snowflake_steps_completed_total", "Pipeline steps finished", ("pipeline", "step", "result"))
+        r.histogram("snowflake_step_duration_seconds", "Pipeline step wall time", ("pipeline", "step"))
+        r.counter("snowflake_scenes_drafted_total", "Scenes drafted (prose scenes, screenplay scenes)", ("pipeline",))
+        r.rate("snowflake_scenes_drafted_per_minute", "Scenes drafted per minute over the last 5 minutes", per=60)
+        r.counter("snowflake_words_generated_total", "Words in AI responses", ("provider", "model"))
+        r.rate("snowflake_words_generated_per_second", "Words generated per second over the last 5 minutes")
+        r.counter("snowflake_validation_attempts_total", "Validation attempts by kind and result",
+                  ("kind", "step", "result"))
+        r.counter("snowflake_checkpoint_runs_total", "Diagnostic checkpoint runs", ("step",))
+        r.counter("snowflake_checkpoint_failures_total", "Failed checks across diagnostic checkpoint runs", ("step",))
+        r.counter("snowflake_shots_produced_total", "Shots produced by the shot pipeline")
+        r.gauge("snowflake_queue_depth", "Items waiting in in-process queues", ("queue",))
+
+    def step_finished(self, pipeline: str, step: Any, success: bool, seconds: float) -> None:
+        self.registry.inc("snowflake_steps_completed_total", pipeline=pipeline, step=step,
+                          result="success" if success else "failure")
+        self.registry.observe("snowflake_step_duration_seconds", seconds, pipeline=pipeline, step=step)
+
+    def scenes_drafted(self, pipeline: str, count: int = 1) -> None:
+        self.registry.inc("snowflake_scenes_drafted_total", count, pipeline=pipeline)
+        self.registry.mark("snowflake_scenes_drafted_per_minute", count)
+
+    def words_generated(self, provider: str, model: str, words: int) -> None:
+        self.registry.inc("snowflake_words_generated_total", words, provider=provider, model=model)
+        self.registry.mark("snowflake_words_generated_per_second", words)
+
+    def validation(self, kind: str, step: Any, valid: bool) -> None:
+        self.registry.inc("snowflake_validation_attempts_total", kind=kind, step=step,
+                          result="valid" if valid else "invalid")
+
+    def checkpoint(self, step: Any, checks_failed: int) -> None:
+        self.registry.inc("snowflake_checkpoint_runs_total", step=step)
+        self.registry.inc("snowflake_checkpoint_failures_total", checks_failed, step=step)
+
+    def shots_produced(self, count: int) -> None:
+        self.registry.inc("snowflake_shots_produced_total", count)
+
+    def queue_depth(self, queue: str, depth: float) -> None:
+        self.registry.set("snowflake_queue_depth", depth, queue=queue)
+
+    def watch_queue(self, queue: str, fn: Callable[[], float]) -> None:
+        """Sample a queue's depth at scrape time instead of on every put/get"""
+        self.registry.set_callback("snowflake_queue_depth", fn, queue=queue)
+
+    def prometheus_text(self) -> str:
+        return self.registry.prometheus_text()
+
+
+# Global instance
+_pipeline_metrics = None
+_pipeline_metrics_lock = threading.Lock()
+
+
+def get_pipeline_metrics() -> PipelineMetrics:
+    """Get the process-wide pipeline metrics"""
+    global _pipeline_metrics
+    with _pipeline_metrics_lock:
+        if _pipeline_metrics is None:
+            _pipeline_metrics = PipelineMetrics()
+        return _pipeline_metrics
@@ -14,11 +14,29 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 try:
     from observability.events import get_project_summary, _metrics_collector
+    from observability.event_log import EventLog, get_event_log
+    from observability.tracing import trace_dir, list_traces, load_trace, to_chrome_trace, to_otlp
 except ImportError:
     # Fallback if running directly
     from src.observability.events import get_project_summary, _metrics_collector
+    from src.observability.event_log import EventLog, get_event_log
+    from src.observability.tracing import trace_dir, list_traces, load_trace, to_chrome_trace, to_otlp
+
+try:
+    # Same module instance the generators use, so the limiter registry is shared
+    from src.ai.rate_limiter import get_rate_limit_metrics
+    from src.ai.single_flight import get_single_flight
+    from src.ai.telemetry import get_call_telemetry
+    from src.observability.metrics import get_pipeline_metrics
+except ImportError:
+    from ai.rate_limiter import get_rate_limit_metrics
+    from ai.single_flight import get_single_flight
+    from ai.telemetry import get_call_telemetry
+    from observability.metrics import get_pipeline_metrics
 
 ARTIFACTS_DIR = Path("artifacts")
+MAX_LONG_POLL_SECONDS = 30.0
+SSE_KEEPALIVE_SECONDS = 15.0
 
 app = Flask(__name__)
 CORS(app)
@@ -46,15 +64,56 @@ def get_status(project_id):
         return jsonify({}), 404
     return jsonify(json.loads(status_path.read_text(encoding="utf-8")))
 
+def _event_log(project_id: str) -> EventLog:
+    return get_event_log(ARTIFACTS_DIR / project_id / "events.log")
+
 @app.route("/projects/<project_id>/events", methods=["GET"])
 def get_events(project_id):
-    n = int(request.args.get("n", 200))
-    events_path = ARTIFACTS_DIR / project_id / "events.log"
-    if not events_path.exists():
-        return jsonify([])
-    lines = events_path.read_text(encoding="utf-8").strip().splitlines()[-n:]
-    events = [json.loads(l) for l in lines if l.strip()]
-    return jsonify(events)
+    """
+    Latest ``n`` events (cursor in the X-Event-Cursor header), or with
+    ``since=<cursor>`` only newer events as {"events", "cursor"}; ``wait``
+    long-polls up to that many seconds for something new.
+    """
+    try:
+        n = int(request.args.get("n", 200))
+        since = request.args.get("since")
+        cursor = int(since) if since is not None else None
+        wait = min(float(request.args.get("wait", 0)), MAX_LONG_POLL_SECONDS)
+    except ValueError:
+        return jsonify({"error": "n, since and wait must be numbers"}), 400
+    log = _event_log(project_id)
+    if cursor is None:
+        events, cursor = log.tail(n)
+        resp = jsonify(events)
+        resp.headers["X-Event-Cursor"] = str(cursor)
+        return resp
+
+    if wait > 0:
+        log.wait_for(cursor, wait)
+    events, cursor = log.since(cursor, limit=n)
+    return jsonify({"events": events, "cursor": cursor})
+
+@app.route("/projects/<project_id>/events/stream", methods=["GET"])
+def stream_events(project_id):
+    """Server-sent events: pushes each new event (id = cursor), resuming from Last-Event-ID"""
+    log = _event_log(project_id)
+    start = request.headers.get("Last-Event-ID") or request.args.get("since")
+    try:
+        cursor = int(start) if start is not None else log.count()
+    except ValueError:
+        return jsonify({"error": "Invalid event cursor"}), 400
+
+    def generate(cursor: int):
+        while True:
+            if not log.wait_for(cursor, SSE_KEEPALIVE_SECONDS):
+                yield ": keep-alive\n\n"
+                continue
+            for next_cursor, event in log.read(cursor, cursor + 500):
+                yield f"id: {next_cursor}\ndata: {json.dumps(event)}\n\n"
+                cursor = next_cursor
+
+    return Response(generate(cursor), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 
 @app.route("/health", methods=["GET"])
@@ -124,6 +183,62 @@ def health_check():
         }), 503
 
 
+def _rate_limit_metrics_text() -> str:
+    """Prometheus lines for every provider/model rate limiter"""
+    gauges = [
+        ("concurrency_limit", "gauge", "Current adaptive concurrency limit"),
+        ("in_flight", "gauge", "AI calls currently holding a slot"),
+        ("rpm_limit", "gauge", "Configured requests-per-minute budget (0 = unlimited)"),
+        ("tpm_limit", "gauge", "Configured tokens-per-minute budget (0 = unlimited)"),
+        ("paused_seconds", "gauge", "Remaining provider Retry-After pause"),
+        ("requests_total", "counter", "AI calls admitted by the limiter"),
+        ("throttled_total", "counter", "Rate-limit responses received from the provider"),
+        ("wait_seconds_total", "counter", "Total time callers waited for a slot"),
+    ]
+    limiters = get_rate_limit_metrics()
+    lines = []
+    for field, kind, help_text in gauges:
+        name = f"snowflake_ai_ratelimit_{field}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for m in limiters:
+            lines.append(f'{name}{{provider="{m["provider"]}",model="{m["model"]}"}} {m[field] or 0}')
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _single_flight_metrics_text() -> str:
+    """Prometheus lines for AI request coalescing"""
+    stats = get_single_flight().stats()
+    return f"""# HELP snowflake_ai_requests_sent_total AI requests actually sent (after coalescing)
+# TYPE snowflake_ai_requests_sent_total counter
+snowflake_ai_requests_sent_total {stats["calls"]}
+
+# HELP snowflake_ai_coalesced_calls_total AI calls served by an identical in-flight request
+# TYPE snowflake_ai_coalesced_calls_total counter
+snowflake_ai_coalesced_calls_total {stats["coalesced"]}
+
+# HELP snowflake_ai_inflight_requests Distinct AI requests currently in flight
+# TYPE snowflake_ai_inflight_requests gauge
+snowflake_ai_inflight_requests {stats["in_flight"]}
+"""
+
+
+_project_count_cache = {"mtime": None, "count": 0}
+
+
+def _project_count() -> int:
+    """Project directories under ARTIFACTS_DIR, recounted only when the directory's mtime changes"""
+    try:
+        mtime = ARTIFACTS_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+    if mtime != _project_count_cache["mtime"]:
+        _project_count_cache["count"] = sum(1 for p in ARTIFACTS_DIR.iterdir() if p.is_dir())
+        _project_count_cache["mtime"] = mtime
+    return _project_count_cache["count"]
+
+
 @app.route("/metrics", methods=["GET"])
 def metrics_endpoint():
     """Prometheus-style metrics endpoint"""
@@ -158,8 +273,10 @@ snowflake_metrics_collection_active {1 if _metrics_collector._collecting else 0}
 
 # HELP snowflake_total_projects Number of projects in artifacts directory
 # TYPE snowflake_total_projects gauge
-snowflake_total_projects {len([p for p in ARTIFACTS_DIR.iterdir() if p.is_dir()]) if ARTIFACTS_DIR.exists() else 0}
-"""
+snowflake_total_projects {_project_count()}
+
+""" + (_rate_limit_metrics_text() + _single_flight_metrics_text() + get_call_telemetry().prometheus_text()
+       + get_pipeline_metrics().prometheus_text())
         
         return Response(metrics_text, mimetype='text/plain')
         
@@ -171,6 +288,45 @@ snowflake_metrics_error 1
         return Response(error_text, mimetype='text/plain')
 
 
+@app.get("/ai/calls")
+def get_ai_calls():
+    """AI wall time, tokens and cost grouped by step and model, plus the latest raw calls"""
+    telemetry = get_call_telemetry()
+    by = tuple(f for f in request.args.get("by", "step,model").split(",")
+               if f in ("provider", "model", "step", "scene"))
+    return jsonify({
+        "summary": telemetry.summary(by or ("step", "model")),
+        "recent": telemetry.recent_calls(int(request.args.get("n", 50))),
+    })
+
+
+@app.get("/projects/<project_id>/traces")
+def get_traces(project_id):
+    """Traced runs of a project, newest first"""
+    return jsonify(list_traces(trace_dir(ARTIFACTS_DIR, project_id)))
+
+
+@app.get("/projects/<project_id>/traces/<trace_id>")
+def get_trace(project_id, trace_id):
+    """
+    One run's spans. ``format=chrome`` (default) loads as a flame chart in
+    Perfetto or chrome://tracing; ``format=otlp`` is OTLP/JSON; ``format=spans``
+    returns the raw records.
+    """
+    if not all(c in "0123456789abcdef" for c in trace_id):
+        return jsonify({"error": "Invalid trace id"}), 400
+    path = trace_dir(ARTIFACTS_DIR, project_id) / f"{trace_id}.jsonl"
+    if not path.exists():
+        return jsonify({"error": "Trace not found"}), 404
+    spans = load_trace(path)
+    fmt = request.args.get("format", "chrome")
+    if fmt == "otlp":
+        return jsonify(to_otlp(spans))
+    if fmt == "spans":
+        return jsonify(spans)
+    return jsonify(to_chrome_trace(spans))
+
+
 @app.get("/projects/<project_id>/summary")
 def get_project_summary_endpoint(project_id):
     """Get comprehensive project summary"""
@@ -308,6 +464,9 @@ DASHBOARD_HTML = """
     const currentStepEl = document.getElementById('current_step');
     const lastUpdatedEl = document.getElementById('last_updated');
     const pipelineHealthEl = document.getElementById('pipeline_health');
+    let recentEvents = [];
+    let eventCursor = null;
+    let eventProject = null;
 
     async function loadProjects() {
       const res = await fetch('/projects');
@@ -356,18 +515,31 @@ DASHBOARD_HTML = """
       if (!pid) return;
       
       try {
+        // Full tail once per project, then only events after the cursor
+        const incremental = eventCursor !== null && eventProject === pid;
         const [sRes, eRes] = await Promise.all([
           fetch(`/projects/${pid}/status`),
-          fetch(`/projects/${pid}/events?n=50`)
+          fetch(incremental ? `/projects/${pid}/events?n=50&since=${eventCursor}`
+                            : `/projects/${pid}/events?n=50`)
         ]);
         
         let status = {};
         if (sRes.ok) status = await sRes.json();
-        const events = eRes.ok ? await eRes.json() : [];
+        if (eRes.ok) {
+          if (incremental) {
+            const page = await eRes.json();
+            recentEvents = recentEvents.concat(page.events).slice(-50);
+            eventCursor = page.cursor;
+          } else {
+            recentEvents = await eRes.json();
+            eventCursor = parseInt(eRes.headers.get('X-Event-Cursor') || '0', 10);
+            eventProject = pid;
+          }
+        }
         
         // Update main display
         statusPre.textContent = JSON.stringify(status, null, 2);
-        eventsPre.textContent = events.map(e => JSON.stringify(e)).join('\n');
+        eventsPre.textContent = recentEvents.map(e => JSON.stringify(e)).join('\n');
         currentStepEl.textContent = status.current_step ?? '-';
         lastUpdatedEl.textContent = status.last_updated ? new Date(status.last_updated).toLocaleTimeString() : '-';
         
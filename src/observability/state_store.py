@@ -0,0 +1,200 @@
+"""
+Write-Behind JSON State Store
+Keeps project.json/status.json in memory and flushes coalesced changes atomically in the background
+"""
+
+import os
+import copy
+import json
+import time
+import atexit
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_SECONDS = 1.0
+
+
+class WriteBehindStore:
+    """
+    In-memory owner of small, frequently updated JSON documents.
+
+    Documents are read from disk once, then updated in memory under a lock.
+    Changed documents are written by a background thread at most once per
+    ``flush_seconds`` (however many updates arrived in between), each via a
+    temp file and ``os.replace`` so readers never see a partial file.
+    ``flush`` writes immediately, e.g. at step boundaries; everything still
+    pending is flushed at interpreter exit. ``flush_seconds <= 0`` makes
+    every update write through.
+    """
+
+    def __init__(self, flush_seconds: float = DEFAULT_FLUSH_SECONDS):
+        """
+        Initialize store
+
+        Args:
+            flush_seconds: Longest a change may stay unwritten (<= 0 = write-through)
+        """
+        self.flush_seconds = flush_seconds
+        self._docs: Dict[Path, Dict[str, Any]] = {}
+        self._dirty: Dict[Path, int] = {}
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.updates = 0
+        self.writes = 0
+
+    def load(self, path: Path, default: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Current document (a copy)
+
+        Documents this process has updated come from memory; anything else is
+        read from disk without being cached, so files owned by another process
+        are never served stale.
+        """
+        with self._lock:
+            doc = self._get_locked(Path(path), cache=False)
+            if doc is None:
+                return copy.deepcopy(default) if default is not None else None
+            return copy.deepcopy(doc)
+
+    def update(self,
+               path: Path,
+               mutate: Callable[[Dict[str, Any]], Any],
+               default_factory: Optional[Callable[[], Dict[str, Any]]] = None,
+               flush: bool = False) -> Any:
+        """
+        Apply ``mutate`` to a document in memory and schedule its write
+
+        Args:
+            path: JSON file backing the document
+            mutate: Called with the live document; its return value is returned
+            default_factory: Builds the document if it doesn't exist yet
+            flush: Write this document to disk before returning
+
+        Raises:
+            FileNotFoundError: If the document doesn't exist and there is no default_factory
+        """
+        path = Path(path)
+        with self._lock:
+            doc = self._get_locked(path)
+            if doc is None:
+                if default_factory is None:
+                    raise FileNotFoundError(str(path))
+                doc = default_factory()
+                self._docs[path] = doc
+            result = mutate(doc)
+            self._dirty[path] = self._dirty.get(path, 0) + 1
+            self.updates += 1
+        if flush or self.flush_seconds <= 0:
+            self.flush(path)
+        else:
+            self._ensure_flusher()
+        return result
+
+    def put(self, path: Path, doc: Dict[str, Any], flush: bool = False) -> None:
+        """Replace a document wholesale"""
+        def replace(current: Dict[str, Any]) -> None:
+            current.clear()
+            current.update(doc)
+        self.update(path, replace, dict, flush=flush)
+
+    def flush(self, path: Optional[Path] = None) -> None:
+        """Write pending documents now (one path, or all)"""
+        with self._lock:
+            targets = [Path(path)] if path is not None else list(self._dirty)
+            for target in targets:
+                if target in self._dirty:
+                    self._write_locked(target)
+
+    def forget(self, path: Path) -> None:
+        """Flush and drop a document so the next access re-reads disk"""
+        with self._lock:
+            path = Path(path)
+            if path in self._dirty:
+                self._write_locked(path)
+            self._docs.pop(path, None)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._dirty)
+
+    def _get_locked(self, path: Path, cache: bool = True) -> Optional[Dict[str, Any]]:
+        doc = self._docs.get(path)
+        if doc is None and path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                doc = json.load(f)
+            if cache:
+                self._docs[path] = doc
+        return doc
+
+    def _write_locked(self, path: Path) -> None:
+        doc = self._docs.get(path)
+        self._dirty.pop(path, None)
+        if doc is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(doc, f, indent=2)
+            os.replace(tmp, path)
+            self.writes += 1
+        except OSError as e:
+            # Keep it dirty; the next flush retries
+            self._dirty[path] = self._dirty.get(path, 0) + 1
+            logger.warning("Could not write %s: %s", path, e)
+            raise
+
+    def _ensure_flusher(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._flush_loop, name="state-flusher", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            # Coalesce everything that arrives during the interval into one write
+            time.sleep(self.flush_seconds)
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"documents": len(self._docs), "pending": len(self._dirty),
+                    "updates": self.updates, "writes": self.writes}
+
+
+# Global instance
+_state_store = None
+_state_store_lock = threading.Lock()
+
+
+def get_state_store() -> WriteBehindStore:
+    """Get the process-wide state store (interval set by STATE_FLUSH_SECONDS)"""
+    global _state_store
+    with _state_store_lock:
+        if _state_store is None:
+            try:
+                flush_seconds = float(os.getenv("STATE_FLUSH_SECONDS", DEFAULT_FLUSH_SECONDS))
+            except ValueError:
+                logger.warning("Invalid STATE_FLUSH_SECONDS; using default")
+                flush_seconds = DEFAULT_FLUSH_SECONDS
+            _state_store = WriteBehindStore(flush_seconds)
+            atexit.register(_flush_at_exit)
+        return _state_store
+
+
+def _flush_at_exit() -> None:
+    try:
+        _state_store.flush()
+    except OSError:
+        pass
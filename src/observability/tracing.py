@@ -0,0 +1,260 @@
+"""
+Run Tracing
+Nested spans (pipeline -> step -> act/scene -> AI call) carried in contextvars and written per run
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TRACES_DIRNAME = "traces"
+
+# Innermost open span in this context. Threads started from a pool only see
+# it when submitted through contextvars.copy_context().run; asyncio tasks
+# inherit it automatically.
+_current_span: contextvars.ContextVar = contextvars.ContextVar("trace_span", default=None)
+
+
+def tracing_enabled() -> bool:
+    return os.getenv("SNOWFLAKE_TRACING", "1").lower() not in ("0", "false", "no")
+
+
+class TraceWriter:
+    """Appends finished spans of one trace as JSON lines"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+@dataclass
+class Span:
+    """One timed unit of work; parent_id is empty for the run's root span"""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str = ""
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    thread: str = field(default_factory=lambda: threading.current_thread().name)
+    writer: Optional[TraceWriter] = field(default=None, repr=False, compare=False)
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update({k: v for k, v in attributes.items() if v is not None})
+
+    def to_record(self) -> Dict[str, Any]:
+        """Stored form: OTLP span field names with a flat attribute dict"""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "attributes": self.attributes,
+            "status": self.status,
+            "thread": self.thread,
+        }
+
+
+def _new_id(nbytes: int) -> str:
+    return os.urandom(nbytes).hex()
+
+
+@contextmanager
+def _open_span(name: str, parent: Optional[Span], trace_id: str, writer: TraceWriter,
+               attributes: Dict[str, Any]) -> Iterator[Span]:
+    s = Span(name=name, trace_id=trace_id, span_id=_new_id(8),
+             parent_id=parent.span_id if parent else "", writer=writer)
+    s.set(**attributes)
+    token = _current_span.set(s)
+    try:
+        yield s
+    except BaseException as exc:
+        s.status = "error"
+        s.set(error=f"{type(exc).__name__}: {exc}")
+        raise
+    finally:
+        _current_span.reset(token)
+        s.end_ns = time.time_ns()
+        writer.write(s.to_record())
+
+
+@contextmanager
+def trace_run(name: str, directory: Path, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Start a trace for one pipeline run, written to ``<directory>/<trace_id>.jsonl``.
+
+    Inside an existing trace this is just a child span, so a traced
+    pipeline can call another without splitting the run. Yields None when
+    SNOWFLAKE_TRACING=0.
+    """
+    parent = _current_span.get()
+    if parent is not None:
+        with _open_span(name, parent, parent.trace_id, parent.writer, attributes) as s:
+            yield s
+        return
+    if not tracing_enabled():
+        yield None
+        return
+
+    trace_id = _new_id(16)
+    writer = TraceWriter(Path(directory) / f"{trace_id}.jsonl")
+    try:
+        with _open_span(name, None, trace_id, writer, attributes) as s:
+            yield s
+    finally:
+        writer.close()
+        logger.info("Trace %s written to %s", trace_id, writer.path)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Child span of the current one; a no-op (yields None) outside a traced run"""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    with _open_span(name, parent, parent.trace_id, parent.writer, attributes) as s:
+        yield s
+
+
+def record_span(name: str, start_ns: int, **attributes: Any) -> None:
+    """
+    Write an already-finished child span of the current one. For work that
+    can't hold a context open, such as a generator yielding to its caller.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return
+    s = Span(name=name, trace_id=parent.trace_id, span_id=_new_id(8),
+             parent_id=parent.span_id, start_ns=start_ns, end_ns=time.time_ns())
+    s.set(**attributes)
+    parent.writer.write(s.to_record())
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def set_span_attributes(**attributes: Any) -> None:
+    """Annotate the current span, if any"""
+    s = _current_span.get()
+    if s is not None:
+        s.set(**attributes)
+
+
+# ── Reading and export ────────────────────────────────────────────────
+
+def trace_dir(project_dir: Path, project_id: Optional[str]) -> Path:
+    """``<project_dir>/<project_id>/traces`` (``<project_dir>/traces`` without a project)"""
+    return Path(project_dir) / (project_id or "") / TRACES_DIRNAME
+
+
+def load_trace(path: Path) -> List[Dict[str, Any]]:
+    """Span records of one trace file, ordered by start time (torn last line skipped)"""
+    spans = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                spans.append(json.loads(line))
+            except ValueError:
+                continue
+    return sorted(spans, key=lambda s: s["startTimeUnixNano"])
+
+
+def list_traces(directory: Path) -> List[Dict[str, Any]]:
+    """Root span summary for every trace in a directory, newest first"""
+    out = []
+    for path in Path(directory).glob("*.jsonl"):
+        spans = load_trace(path)
+        roots = [s for s in spans if not s["parentSpanId"]]
+        root = roots[0] if roots else None
+        out.append({
+            "trace_id": path.stem,
+            "name": root["name"] if root else None,
+            "start": root["startTimeUnixNano"] / 1e9 if root else None,
+            "duration_seconds": (root["endTimeUnixNano"] - root["startTimeUnixNano"]) / 1e9 if root else None,
+            "status": root["status"] if root else "incomplete",
+            "spans": len(spans),
+        })
+    return sorted(out, key=lambda t: t["start"] or 0, reverse=True)
+
+
+def to_chrome_trace(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Chrome Trace Event format, one lane per thread; opens as a flame chart
+    in Perfetto (ui.perfetto.dev), chrome://tracing or speedscope.
+    """
+    lanes: Dict[str, int] = {}
+    events = []
+    for s in spans:
+        tid = lanes.setdefault(s["thread"], len(lanes) + 1)
+        events.append({
+            "name": s["name"],
+            "cat": s["name"].split(".")[0],
+            "ph": "X",
+            "ts": s["startTimeUnixNano"] / 1000,
+            "dur": (s["endTimeUnixNano"] - s["startTimeUnixNano"]) / 1000,
+            "pid": 1,
+            "tid": tid,
+            "args": {**s["attributes"], "status": s["status"], "span_id": s["spanId"]},
+        })
+    for thread, tid in lanes.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": thread}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: List[Dict[str, Any]], service_name: str = "snowflake") -> Dict[str, Any]:
+    """OTLP/JSON ExportTraceServiceRequest body (importable by Jaeger, Tempo, etc.)"""
+    return {"resourceSpans": [{
+        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+        "scopeSpans": [{
+            "scope": {"name": "snowflake.tracing"},
+            "spans": [{
+                "traceId": s["traceId"],
+                "spanId": s["spanId"],
+                "parentSpanId": s["parentSpanId"],
+                "name": s["name"],
+                "kind": 1,
+                "startTimeUnixNano": str(s["startTimeUnixNano"]),
+                "endTimeUnixNano": str(s["endTimeUnixNano"]),
+                "attributes": [{"key": k, "value": _otlp_value(v)}
+                               for k, v in {**s["attributes"], "thread.name": s["thread"]}.items()],
+                "status": {"code": 2 if s["status"] == "error" else 1},
+            } for s in spans],
+        }],
+    }]}
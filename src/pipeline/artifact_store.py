@@ -0,0 +1,185 @@
+"""
+Cross-Step Artifact Store
+In-process LRU of step artifacts so hot reloads skip the file read, and read-only reloads the JSON parse
+"""
+
+import os
+import json
+import mmap
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson isn't installed
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 64
+MMAP_THRESHOLD = 1024 * 1024
+
+
+def _parse(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data).decode("utf-8"))
+
+
+class ArtifactStore:
+    """
+    Lazily loaded, content-addressed cache of step artifacts.
+
+    Artifact bytes, and the parsed value once a read-only caller asks for
+    it, are kept in an LRU keyed by (project, step, SHA-256 of the file
+    bytes). A stat signature per path (mtime, size, inode) lets an unchanged
+    file skip even the read; a changed file is re-read and hashed, and its
+    cached entry reused if the content is known. The JSON files on disk remain the
+    source of truth, so anything that writes them is picked up on the next
+    load without explicit invalidation.
+
+    ``load`` returns a private copy by default because steps mutate the
+    artifacts they are given. The copy is a fresh parse of the cached bytes,
+    which is faster than a recursive copy of the parsed value; pass
+    ``copy=False`` for the shared value, which callers must not mutate.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize artifact store
+
+        Args:
+            max_entries: Parsed artifacts kept in memory
+        """
+        self.max_entries = max(1, max_entries)
+        # key -> [file bytes, shared parsed value (None until a read-only load)]
+        self._entries: "OrderedDict[Tuple[str, Any, str], List[Any]]" = OrderedDict()
+        self._signatures: Dict[str, Tuple[Tuple[int, int, int], Tuple[str, Any, str]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(self, project_id: str, step: Any, path: Path, copy: bool = True) -> Optional[Any]:
+        """
+        Load an artifact, from memory when its file is unchanged
+
+        Args:
+            project_id: Project the artifact belongs to
+            step: Step identifier (int or e.g. "3b")
+            path: JSON file holding the artifact
+            copy: Return a private copy the caller may mutate
+
+        Returns:
+            Parsed artifact, or None if the file doesn't exist
+        """
+        path = Path(path)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        path_key = str(path)
+
+        with self._lock:
+            known = self._signatures.get(path_key)
+            entry = self._entries.get(known[1]) if known and known[0] == signature else None
+            if entry is not None:
+                self._entries.move_to_end(known[1])
+                self.hits += 1
+
+        if entry is None:
+            digest, data = self._read(path, project_id, step)
+            key = (project_id, step, digest)
+            with self._lock:
+                self._signatures[path_key] = (signature, key)
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = self._entries[key] = [data, None]
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+                        self.evictions += 1
+                else:
+                    self._entries.move_to_end(key)
+
+        if copy:
+            return _parse(entry[0])
+        # The shared value is parsed on first read-only use and must not be mutated
+        if entry[1] is None:
+            entry[1] = _parse(entry[0])
+        return entry[1]
+
+    def _read(self, path: Path, project_id: str, step: Any) -> Tuple[str, bytes]:
+        """Hash a file's bytes, reusing the cached bytes when the content is known"""
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= MMAP_THRESHOLD:
+                # Large artifacts (full screenplays/drafts): hash straight from the mapping
+                # and only copy the bytes out if the content is new
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        digest = hashlib.sha256(view).hexdigest()
+                        cached = self._cached(project_id, step, digest)
+                        return digest, cached if cached is not None else bytes(view)
+                    finally:
+                        view.release()
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        cached = self._cached(project_id, step, digest)
+        return digest, cached if cached is not None else data
+
+    def _cached(self, project_id: str, step: Any, digest: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get((project_id, step, digest))
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[0]
+
+    def content_hash(self, project_id: str, step: Any, path: Path) -> Optional[str]:
+        """SHA-256 of an artifact file's bytes (cached alongside the parsed value)"""
+        if self.load(project_id, step, path, copy=False) is None:
+            return None
+        with self._lock:
+            known = self._signatures.get(str(Path(path)))
+            return known[1][2] if known else None
+
+    def invalidate(self, project_id: Optional[str] = None) -> None:
+        """Drop cached artifacts (for one project, or all)"""
+        with self._lock:
+            for key in [k for k in self._entries if project_id is None or k[0] == project_id]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# Global instance
+_artifact_store = None
+_artifact_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Get the process-wide artifact store (size set by ARTIFACT_CACHE_ENTRIES)"""
+    global _artifact_store
+    with _artifact_store_lock:
+        if _artifact_store is None:
+            try:
+                max_entries = int(os.getenv("ARTIFACT_CACHE_ENTRIES", DEFAULT_MAX_ENTRIES))
+            except ValueError:
+                logger.warning("Invalid ARTIFACT_CACHE_ENTRIES; using default")
+                max_entries = DEFAULT_MAX_ENTRIES
+            _artifact_store = ArtifactStore(max_entries)
+        return _artifact_store
@@ -0,0 +1,162 @@
+"""
+DAG Step Scheduler
+Runs pipeline steps as soon as their dependencies finish, independent steps in parallel
+"""
+
+import time
+import logging
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+from src.observability.metrics import get_pipeline_metrics
+
+logger = logging.getLogger(__name__)
+
+StepTask = Callable[[], Tuple[bool, str]]
+
+
+class DAGScheduler:
+    """
+    Dispatches steps of a dependency graph onto a bounded worker pool.
+
+    A step becomes ready once every dependency that is part of the run has
+    succeeded. After the first failure no new steps are started; steps
+    already running are allowed to finish and the rest are reported as
+    skipped. Dependencies outside the run (e.g. steps completed earlier)
+    are treated as satisfied.
+    """
+
+    def __init__(self, dependencies: Dict[int, List[int]], max_workers: int = 3):
+        """
+        Initialize scheduler
+
+        Args:
+            dependencies: step -> steps it depends on
+            max_workers: Maximum steps running at once (1 = strictly sequential)
+        """
+        self.dependencies = dependencies
+        self.max_workers = max(1, max_workers)
+
+    def run(self,
+            tasks: Dict[int, StepTask],
+            on_start: Optional[Callable[[int, float], None]] = None,
+            on_finish: Optional[Callable[[int, bool, str, float], None]] = None) -> Dict[str, Any]:
+        """
+        Execute tasks in dependency order
+
+        Args:
+            tasks: step -> callable returning (success, message)
+            on_start: Called with (step, seconds waited since ready) when a step starts
+            on_finish: Called with (step, success, message, duration_seconds)
+
+        Returns:
+            Run summary: success, completed, failed, skipped, timings, critical path
+        """
+        deps = {
+            step: [d for d in self.dependencies.get(step, []) if d in tasks]
+            for step in tasks
+        }
+        self._check_acyclic(deps)
+
+        completed: List[int] = []
+        failed: Dict[int, str] = {}
+        timings: Dict[int, Tuple[float, float]] = {}
+        ready_at: Dict[int, float] = {}
+        pending = set(tasks)
+        running: Dict[Any, int] = {}
+        lock = threading.Lock()
+        run_start = time.monotonic()
+
+        def run_step(step: int) -> Tuple[bool, str]:
+            started = time.monotonic()
+            with lock:
+                timings[step] = (started, started)
+            if on_start:
+                on_start(step, started - ready_at[step])
+            try:
+                success, message = tasks[step]()
+            except Exception as e:
+                logger.exception("Step %s raised", step)
+                success, message = False, f"Exception: {e}"
+            finished = time.monotonic()
+            with lock:
+                timings[step] = (started, finished)
+            if on_finish:
+                on_finish(step, success, message, finished - started)
+            return success, message
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dag-step") as pool:
+            while pending or running:
+                if not failed:
+                    # Lowest step number first keeps sequential runs in 0..10 order
+                    for step in sorted(pending):
+                        if len(running) >= self.max_workers:
+                            break
+                        if all(d in completed for d in deps[step]):
+                            pending.discard(step)
+                            ready_at[step] = time.monotonic()
+                            # Each step runs in a copy of the caller's context (trace span, call tags)
+                            running[pool.submit(contextvars.copy_context().run, run_step, step)] = step
+                # Steps whose dependencies are done but have no free worker
+                get_pipeline_metrics().queue_depth("dag_ready_steps", sum(
+                    1 for step in pending if all(d in completed for d in deps[step])
+                ))
+                if not running:
+                    break
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    success, message = future.result()
+                    if success:
+                        completed.append(step)
+                    else:
+                        failed[step] = message
+
+        critical_path = self._critical_path(deps, timings, completed)
+        return {
+            "success": not failed and not pending,
+            "completed": completed,
+            "failed": failed,
+            "skipped": sorted(pending),
+            "timings": {s: {"start": t[0] - run_start, "end": t[1] - run_start} for s, t in timings.items()},
+            "wall_seconds": time.monotonic() - run_start,
+            "critical_path": critical_path,
+            "critical_path_seconds": sum(timings[s][1] - timings[s][0] for s in critical_path),
+        }
+
+    @staticmethod
+    def _check_acyclic(deps: Dict[int, List[int]]) -> None:
+        visiting, done = set(), set()
+
+        def visit(step: int) -> None:
+            if step in done:
+                return
+            if step in visiting:
+                raise ValueError(f"Dependency cycle through step {step}")
+            visiting.add(step)
+            for d in deps.get(step, []):
+                visit(d)
+            visiting.discard(step)
+            done.add(step)
+
+        for step in deps:
+            visit(step)
+
+    @staticmethod
+    def _critical_path(deps: Dict[int, List[int]],
+                       timings: Dict[int, Tuple[float, float]],
+                       completed: List[int]) -> List[int]:
+        """Chain of steps that determined the finish time (last-finishing dependency at each hop)"""
+        if not completed:
+            return []
+        step = max(completed, key=lambda s: timings[s][1])
+        path = [step]
+        while True:
+            finished_deps = [d for d in deps.get(step, []) if d in timings]
+            if not finished_deps:
+                break
+            step = max(finished_deps, key=lambda d: timings[d][1])
+            path.append(step)
+        return list(reversed(path))
@@ -3,8 +3,11 @@ Snowflake Pipeline Orchestrator
 Manages the execution of all 11 Snowflake Method steps
 """
 
+import os
 import sys
 import json
+import hashlib
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime
@@ -22,8 +25,61 @@ from src.pipeline.steps.step_7_character_bibles import Step7CharacterBibles
 from src.pipeline.steps.step_8_scene_list import Step8SceneList
 from src.pipeline.steps.step_9_scene_briefs_v2 import Step9SceneBriefsV2 as Step9SceneBriefs
 from src.pipeline.steps.step_10_first_draft import Step10FirstDraft
-from src.observability.events import emit_event
-from src.ui.progress_tracker import ProgressTracker, StepProgressContext, get_global_tracker
+from src.pipeline.dag_scheduler import DAGScheduler
+from src.pipeline.artifact_store import get_artifact_store
+from src.ai.telemetry import call_tags
+from src.observability.tracing import trace_run, span, trace_dir
+from src.observability.metrics import get_pipeline_metrics
+from src.observability.events import emit_event, flush_status
+from src.observability.state_store import get_state_store
+from src.ui.progress_tracker import ProgressTracker, get_global_tracker
+
+# Map of dependencies: step -> steps whose artifacts it consumes
+STEP_DEPENDENCIES = {
+    1: [0],           # Step 1 depends on Step 0
+    2: [0, 1],        # Step 2 depends on Steps 0 and 1
+    3: [0, 1, 2],     # Step 3 depends on Steps 0, 1, and 2
+    4: [0, 1, 2],     # Step 4 depends on Steps 0, 1, and 2
+    5: [3],           # Step 5 depends on Step 3
+    6: [2, 4],        # Step 6 depends on Steps 2 and 4
+    7: [3, 5],        # Step 7 depends on Steps 3 and 5
+    8: [6, 7],        # Step 8 depends on Steps 6 and 7
+    9: [8],           # Step 9 depends on Step 8
+    10: [8, 9]        # Step 10 depends on Steps 8 and 9
+}
+
+# Artifacts each step folds into the hash_upstream it records
+UPSTREAM_HASH_INPUTS = {
+    1: [0],
+    2: [0, 1],
+    3: [0, 1, 2],
+    4: [2],
+    5: [3],
+    6: [4],
+    7: [5],
+    8: [6, 7],
+    9: [8],
+    10: [7, 8, 9]
+}
+
+# Artifact file written by each step
+STEP_ARTIFACT_FILES = {
+    0: "step_0_first_things_first.json",
+    1: "step_1_one_sentence_summary.json",
+    2: "step_2_one_paragraph_summary.json",
+    3: "step_3_character_summaries.json",
+    4: "step_4_one_page_synopsis.json",
+    5: "step_5_character_synopses.json",
+    6: "step_6_long_synopsis.json",
+    7: "step_7_character_bibles.json",
+    8: "step_8_scene_list.json",
+    9: "step_9_scene_briefs.json",
+    10: "step_10_manuscript.json"
+}
+
+# Steps allowed to run at once in execute_all_steps (1 = strictly sequential)
+DEFAULT_MAX_PARALLEL_STEPS = 3
+
 
 class SnowflakePipeline:
     """
@@ -59,6 +115,8 @@ class SnowflakePipeline:
         
         self.current_project_id = None
         self.pipeline_state = {}
+        # Steps may finish concurrently under the DAG scheduler
+        self._state_lock = threading.Lock()
     
     def create_project(self, project_name: str) -> str:
         """
@@ -93,8 +151,7 @@ class SnowflakePipeline:
         # Save project metadata
         meta_path = project_path / "project.json"
         try:
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                json.dump(project_meta, f, indent=2)
+            get_state_store().put(meta_path, project_meta, flush=True)
         except PermissionError as e:
             raise PermissionError(f"Cannot write project metadata to {meta_path}. File may be locked by another process or antivirus. Details: {e}")
 
@@ -117,8 +174,10 @@ class SnowflakePipeline:
         if not project_path.exists():
             raise FileNotFoundError(f"Project {project_id} not found")
         
-        with open(project_path, 'r', encoding='utf-8') as f:
-            project_meta = json.load(f)
+        # Explicit loads re-read disk so edits made outside this process are picked up
+        store = get_state_store()
+        store.forget(project_path)
+        project_meta = store.load(project_path)
 
         self.current_project_id = project_id
         emit_event(project_id, "project_loaded", {"project_name": project_meta.get('project_name'), "current_step": project_meta.get('current_step')})
@@ -169,7 +228,8 @@ class SnowflakePipeline:
         )
         
         if success:
-            self._update_project_state(1, artifact)
+            # Keep the brief so Step 1 can be rebuilt later without the caller supplying it again
+            self._update_project_state(1, artifact, {"story_brief": story_brief})
             emit_event(self.current_project_id, "step_complete", {"step": 1, "step_key": "step_1", "valid": True})
         else:
             emit_event(self.current_project_id, "step_failed", {"step": 1, "step_key": "step_1", "message": message})
@@ -363,79 +423,232 @@ class SnowflakePipeline:
             emit_event(self.current_project_id, "step_failed", {"step": 10, "step_key": "step_10", "message": message})
         return success, artifact, message
     
-    def execute_all_steps(self, initial_brief: str, story_brief: str, target_words: int = 90000) -> bool:
+    def execute_all_steps(self,
+                          initial_brief: str,
+                          story_brief: str,
+                          target_words: int = 90000,
+                          max_parallel_steps: Optional[int] = None) -> bool:
         """
         Execute the complete Snowflake pipeline with progress tracking
         
+        Steps are scheduled from STEP_DEPENDENCIES, so independent steps
+        (e.g. Step 3 and Step 4) run concurrently.
+        
         Args:
             initial_brief: The user's story idea/brief for Step 0
             story_brief: User's story concept for Step 1
             target_words: Target word count for the novel
+            max_parallel_steps: Steps allowed to run at once (env
+                PIPELINE_MAX_PARALLEL_STEPS, default 3; 1 = sequential)
             
         Returns:
             True if all steps completed successfully
         """
-        self.progress_tracker.start_pipeline(11)
-        
-        step_configs = [
-            (0, "First Things First", "Identifying core story elements"),
-            (1, "One Sentence Summary", "Creating logline"),
-            (2, "One Paragraph Summary", "Expanding to paragraph with disasters"),
-            (3, "Character Summaries", "Developing main characters"),
-            (4, "One Page Synopsis", "Expanding paragraph to page"),
-            (5, "Character Synopses", "Detailed character development"),
-            (6, "Long Synopsis", "Full story synopsis"),
-            (7, "Character Bibles", "Complete character profiles"),
-            (8, "Scene List", "Breaking story into scenes"),
-            (9, "Scene Briefs", "Detailed scene planning"),
-            (10, "First Draft", f"Writing complete {target_words}-word novel")
-        ]
-        
-        all_success = True
-        
-        for step_num, step_name, description in step_configs:
-            with StepProgressContext(self.progress_tracker, step_num, step_name, description) as step_ctx:
-                try:
-                    if step_num == 0:
-                        success, artifact, message = self.execute_step_0(initial_brief)
-                    elif step_num == 1:
-                        success, artifact, message = self.execute_step_1(story_brief)
-                    elif step_num == 2:
-                        success, artifact, message = self.execute_step_2()
-                    elif step_num == 3:
-                        success, artifact, message = self.execute_step_3()
-                    elif step_num == 4:
-                        success, artifact, message = self.execute_step_4()
-                    elif step_num == 5:
-                        success, artifact, message = self.execute_step_5()
-                    elif step_num == 6:
-                        success, artifact, message = self.execute_step_6()
-                    elif step_num == 7:
-                        success, artifact, message = self.execute_step_7()
-                    elif step_num == 8:
-                        success, artifact, message = self.execute_step_8()
-                    elif step_num == 9:
-                        success, artifact, message = self.execute_step_9()
-                    elif step_num == 10:
-                        success, artifact, message = self.execute_step_10(target_words)
-                    
-                    if success:
-                        step_ctx.log_info(f"Completed successfully", "success")
-                        step_ctx.set_result(True, message)
-                    else:
-                        step_ctx.log_info(f"Failed: {message}", "error")
-                        step_ctx.set_result(False, message)
-                        all_success = False
-                        break
-                        
-                except Exception as e:
-                    step_ctx.log_info(f"Exception: {str(e)}", "error")
-                    step_ctx.set_result(False, f"Exception: {str(e)}")
-                    all_success = False
-                    break
-        
-        self.progress_tracker.finish_pipeline(all_success)
-        return all_success
+        result = self._run_steps(list(range(11)), initial_brief, story_brief,
+                                 target_words, max_parallel_steps)
+        return result["success"]
+    
+    def plan_incremental_rebuild(self) -> Dict[int, str]:
+        """
+        Work out which steps are stale ("make" semantics)
+        
+        A step is stale if its artifact is missing, if the upstream hash
+        stored in its metadata no longer matches the hash of its current
+        inputs, or if any step it depends on is stale.
+        
+        Returns:
+            Stale step -> reason, in step order (empty if everything is fresh)
+        """
+        stale: Dict[int, str] = {}
+        for step_num in range(11):
+            stale_deps = [d for d in STEP_DEPENDENCIES.get(step_num, []) if d in stale]
+            if stale_deps:
+                stale[step_num] = f"upstream step {stale_deps[0]} is stale"
+                continue
+            artifact = self._load_step_artifact(step_num, copy=False)
+            if not artifact:
+                stale[step_num] = "artifact missing"
+                continue
+            if step_num == 0:
+                continue
+            stored = artifact.get("metadata", {}).get("hash_upstream")
+            if not stored:
+                stale[step_num] = "no upstream hash recorded"
+            elif stored != self.compute_upstream_hash(step_num):
+                stale[step_num] = "inputs changed"
+        return stale
+    
+    def compute_upstream_hash(self, step_number: int) -> Optional[str]:
+        """
+        Hash of a step's current inputs, computed exactly as the step records it
+        
+        Args:
+            step_number: Step 1-10 (Step 0 has no upstream artifacts)
+            
+        Returns:
+            SHA-256 hex digest, or None if an input artifact is missing
+        """
+        if step_number not in UPSTREAM_HASH_INPUTS:
+            return None
+        a = {s: self._load_step_artifact(s, copy=False) for s in UPSTREAM_HASH_INPUTS[step_number]}
+        if any(artifact is None for artifact in a.values()):
+            return None
+        
+        # Payload layout mirrors each step's own upstream_hash computation
+        if step_number == 1:
+            payload = json.dumps(a[0], sort_keys=True)
+        elif step_number == 2:
+            payload = json.dumps({"step_0": a[0], "step_1": a[1]}, sort_keys=True)
+        elif step_number == 3:
+            payload = json.dumps({"step_0": a[0], "step_1": a[1], "step_2": a[2]}, sort_keys=True)
+        elif step_number == 8:
+            payload = json.dumps(a[6], sort_keys=True) + json.dumps(a[7], sort_keys=True)
+        elif step_number == 10:
+            payload = json.dumps({"step9": a[9], "step7": a[7], "step8": a[8]}, sort_keys=True)
+        else:
+            payload = json.dumps(a[UPSTREAM_HASH_INPUTS[step_number][0]], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def execute_incremental(self,
+                            initial_brief: Optional[str] = None,
+                            story_brief: Optional[str] = None,
+                            target_words: int = 90000,
+                            max_parallel_steps: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Rerun only the stale steps of the current project
+        
+        Inside the list-shaped steps, unchanged scenes are reused: Step 9
+        keeps briefs whose scene is unchanged and Step 10 keeps checkpointed
+        prose whose scene, brief and prompt are unchanged, so editing one
+        scene only regenerates that scene.
+        
+        Args:
+            initial_brief: Brief for Step 0 (only needed if Step 0 is stale)
+            story_brief: Story concept for Step 1 (only needed if Step 1 is stale;
+                defaults to the one saved when Step 1 last ran)
+            target_words: Target word count for the novel
+            max_parallel_steps: Steps allowed to run at once
+            
+        Returns:
+            Dict with success, stale (step -> reason), rebuilt and failed steps
+        """
+        stale = self.plan_incremental_rebuild()
+        emit_event(self.current_project_id, "incremental_plan", {
+            "stale": {f"step_{s}": reason for s, reason in stale.items()},
+        })
+        if not stale:
+            return {"success": True, "stale": {}, "rebuilt": [], "failed": {}}
+        
+        result = self._run_steps(sorted(stale), initial_brief, story_brief or self._saved_story_brief(),
+                                 target_words, max_parallel_steps)
+        return {
+            "success": result["success"],
+            "stale": stale,
+            "rebuilt": sorted(result["completed"]),
+            "failed": result["failed"],
+        }
+    
+    def _run_steps(self,
+                   steps: List[int],
+                   initial_brief: Optional[str],
+                   story_brief: Optional[str],
+                   target_words: int,
+                   max_parallel_steps: Optional[int]) -> Dict[str, Any]:
+        """Schedule the given steps on the DAG scheduler and return its summary"""
+        if max_parallel_steps is None:
+            try:
+                max_parallel_steps = int(os.getenv("PIPELINE_MAX_PARALLEL_STEPS", DEFAULT_MAX_PARALLEL_STEPS))
+            except ValueError:
+                max_parallel_steps = DEFAULT_MAX_PARALLEL_STEPS
+
+        self.progress_tracker.start_pipeline(len(steps))
+        
+        step_configs = {
+            0: ("First Things First", "Identifying core story elements"),
+            1: ("One Sentence Summary", "Creating logline"),
+            2: ("One Paragraph Summary", "Expanding to paragraph with disasters"),
+            3: ("Character Summaries", "Developing main characters"),
+            4: ("One Page Synopsis", "Expanding paragraph to page"),
+            5: ("Character Synopses", "Detailed character development"),
+            6: ("Long Synopsis", "Full story synopsis"),
+            7: ("Character Bibles", "Complete character profiles"),
+            8: ("Scene List", "Breaking story into scenes"),
+            9: ("Scene Briefs", "Detailed scene planning"),
+            10: ("First Draft", f"Writing complete {target_words}-word novel")
+        }
+        
+        def requires(brief, name, runner):
+            if brief is None:
+                return lambda: (False, {}, f"{name} is required to rebuild this step")
+            return runner
+        
+        step_runners = {
+            0: requires(initial_brief, "initial_brief", lambda: self.execute_step_0(initial_brief)),
+            1: requires(story_brief, "story_brief", lambda: self.execute_step_1(story_brief)),
+            2: self.execute_step_2,
+            3: self.execute_step_3,
+            4: self.execute_step_4,
+            5: self.execute_step_5,
+            6: self.execute_step_6,
+            7: self.execute_step_7,
+            8: self.execute_step_8,
+            9: self.execute_step_9,
+            10: lambda: self.execute_step_10(target_words),
+        }
+        
+        def make_task(step_num):
+            def task():
+                with call_tags(step=f"step_{step_num}"), \
+                        span(f"step.{step_num}", step=step_num, step_name=step_configs[step_num][0]) as s:
+                    success, artifact, message = step_runners[step_num]()
+                    if s is not None:
+                        s.set(success=success)
+                return success, message
+            return task
+        
+        def on_start(step_num, waited):
+            step_name, description = step_configs[step_num]
+            self.progress_tracker.start_step(step_num, step_name, description)
+            emit_event(self.current_project_id, "dag_step_start", {
+                "step": step_num, "step_key": f"step_{step_num}",
+                "waited_ms": int(waited * 1000),
+            })
+        
+        def on_finish(step_num, success, message, duration):
+            step_name, _ = step_configs[step_num]
+            get_pipeline_metrics().step_finished("snowflake", step_num, success, duration)
+            if success:
+                self.progress_tracker.log_step_info(f"{step_name} completed successfully", "success")
+            else:
+                self.progress_tracker.log_step_info(f"{step_name} failed: {message}", "error")
+            self.progress_tracker.finish_step(success, message, step_num=step_num)
+            emit_event(self.current_project_id, "dag_step_finish", {
+                "step": step_num, "step_key": f"step_{step_num}",
+                "success": success, "duration_ms": int(duration * 1000),
+            })
+        
+        scheduler = DAGScheduler(STEP_DEPENDENCIES, max_workers=max_parallel_steps)
+        with trace_run("snowflake_pipeline", trace_dir(self.project_dir, self.current_project_id),
+                       project_id=self.current_project_id, steps=",".join(map(str, steps))) as root:
+            result = scheduler.run(
+                {step_num: make_task(step_num) for step_num in steps},
+                on_start=on_start,
+                on_finish=on_finish,
+            )
+            if root is not None:
+                root.set(success=result["success"], critical_path=",".join(map(str, result["critical_path"])))
+        
+        emit_event(self.current_project_id, "pipeline_dag_complete", {
+            "success": result["success"],
+            "failed": sorted(result["failed"]),
+            "skipped": result["skipped"],
+            "wall_seconds": round(result["wall_seconds"], 3),
+            "critical_path": result["critical_path"],
+            "critical_path_seconds": round(result["critical_path_seconds"], 3),
+        })
+        
+        self.progress_tracker.finish_pipeline(result["success"])
+        return result
     
     def validate_step(self, step_number: int) -> Tuple[bool, str]:
         """
@@ -488,7 +701,7 @@ class SnowflakePipeline:
         # Check each step
         step_status = {}
         for step_num in range(11):
-            artifact = self._load_step_artifact(step_num)
+            artifact = self._load_step_artifact(step_num, copy=False)
             if artifact:
                 is_valid, message = self.validate_step(step_num)
                 step_status[f"step_{step_num}"] = {
@@ -516,110 +729,111 @@ class SnowflakePipeline:
             )
         }
     
-    def regenerate_downstream(self, from_step: int) -> List[str]:
+    def regenerate_downstream(self,
+                              from_step: int,
+                              target_words: int = 90000,
+                              max_parallel_steps: Optional[int] = None,
+                              story_brief: Optional[str] = None) -> List[str]:
         """
         Regenerate all downstream artifacts after a change
         
         Args:
             from_step: Step number that changed
+            target_words: Target word count passed to Step 10
+            max_parallel_steps: Steps allowed to run at once
+            story_brief: Story concept for Step 1 (defaults to the one saved
+                when Step 1 last ran)
             
         Returns:
             List of regenerated steps
-        """
-        regenerated = []
-        
-        # Map of dependencies
-        dependencies = {
-            1: [0],           # Step 1 depends on Step 0
-            2: [0, 1],        # Step 2 depends on Steps 0 and 1
-            3: [0, 1, 2],     # Step 3 depends on Steps 0, 1, and 2
-            4: [0, 1, 2],     # Step 4 depends on Steps 0, 1, and 2
-            5: [3],           # Step 5 depends on Step 3
-            6: [2, 4],        # Step 6 depends on Steps 2 and 4
-            7: [3, 5],        # Step 7 depends on Steps 3 and 5
-            8: [6, 7],        # Step 8 depends on Steps 6 and 7
-            9: [8],           # Step 9 depends on Step 8
-            10: [8, 9]        # Step 10 depends on Steps 8 and 9
-        }
-        
-        # Find all steps that need regeneration
-        for step, deps in dependencies.items():
-            if from_step in deps and step > from_step:
-                # This step needs regeneration
-                # (Implementation would call appropriate execute method)
-                regenerated.append(f"step_{step}")
         
-        return regenerated
+        Raises:
+            ValueError: If Step 1 is downstream and no story brief is available
+        """
+        # Transitive closure over STEP_DEPENDENCIES
+        downstream = set()
+        for step in sorted(STEP_DEPENDENCIES):
+            deps = STEP_DEPENDENCIES[step]
+            if from_step in deps or downstream.intersection(deps):
+                downstream.add(step)
+        if not downstream:
+            return []
+        
+        if 1 in downstream:
+            story_brief = story_brief or self._saved_story_brief()
+            if not story_brief:
+                raise ValueError("story_brief is required to regenerate Step 1; none is saved for this project")
+        
+        result = self._run_steps(sorted(downstream), None, story_brief, target_words, max_parallel_steps)
+        return [f"step_{step}" for step in sorted(result["completed"])]
     
-    def _load_step_artifact(self, step_number: int) -> Optional[Dict[str, Any]]:
-        """Load artifact for specific step"""
+    def _saved_story_brief(self) -> Optional[str]:
+        """Story brief recorded in project.json the last time Step 1 ran"""
+        if not self.current_project_id:
+            return None
+        project_meta = get_state_store().load(self.project_dir / self.current_project_id / "project.json")
+        return (project_meta or {}).get("story_brief")
+    
+    def _load_step_artifact(self, step_number: int, copy: bool = True) -> Optional[Dict[str, Any]]:
+        """Load artifact for specific step (copy=False for a shared, read-only artifact)"""
         if not self.current_project_id:
             return None
         
-        step_files = {
-            0: "step_0_first_things_first.json",
-            1: "step_1_one_sentence_summary.json",
-            2: "step_2_one_paragraph_summary.json",
-            3: "step_3_character_summaries.json",
-            4: "step_4_one_page_synopsis.json",
-            5: "step_5_character_synopses.json",
-            6: "step_6_long_synopsis.json",
-            7: "step_7_character_bibles.json",
-            8: "step_8_scene_list.json",
-            9: "step_9_scene_briefs.json",
-            10: "step_10_manuscript.json"
-        }
-        
-        artifact_path = self.project_dir / self.current_project_id / step_files.get(step_number, "")
+        artifact_path = self.project_dir / self.current_project_id / STEP_ARTIFACT_FILES.get(step_number, "")
         
         if not artifact_path.exists():
             return None
 
         try:
-            with open(artifact_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return get_artifact_store().load(self.current_project_id, step_number, artifact_path, copy=copy)
         except PermissionError as e:
             emit_event(self.current_project_id, "file_error", {"path": str(artifact_path), "error": f"Cannot read artifact: {e}"})
             return None
     
-    def _update_project_state(self, step_number: int, artifact: Dict[str, Any]):
+    def _update_project_state(self,
+                              step_number: int,
+                              artifact: Dict[str, Any],
+                              meta_updates: Optional[Dict[str, Any]] = None):
         """Update project state after step completion"""
         if not self.current_project_id:
             return
         
+        with self._state_lock:
+            self._write_project_state(step_number, artifact, meta_updates)
+
+    def _write_project_state(self,
+                             step_number: int,
+                             artifact: Dict[str, Any],
+                             meta_updates: Optional[Dict[str, Any]] = None):
         project_path = self.project_dir / self.current_project_id / "project.json"
 
-        try:
-            with open(project_path, 'r', encoding='utf-8') as f:
-                project_meta = json.load(f)
-        except PermissionError as e:
-            emit_event(self.current_project_id, "file_error", {"path": str(project_path), "error": str(e)})
-            return
+        def apply(project_meta: Dict[str, Any]) -> int:
+            project_meta.update(meta_updates or {})
+            project_meta['current_step'] = max(project_meta.get('current_step', 0), step_number)
 
-        # Update metadata
-        project_meta['current_step'] = max(project_meta.get('current_step', 0), step_number)
-        emit_event(self.current_project_id, "state_updated", {"current_step": project_meta['current_step'], "step_key": f"step_{step_number}"})
-        
-        steps_completed = project_meta.get('steps_completed', [])
-        if step_number not in steps_completed:
-            steps_completed.append(step_number)
-            steps_completed.sort()
-        project_meta['steps_completed'] = steps_completed
-        
-        project_meta['last_updated'] = datetime.utcnow().isoformat()
+            steps_completed = project_meta.get('steps_completed', [])
+            if step_number not in steps_completed:
+                steps_completed.append(step_number)
+                steps_completed.sort()
+            project_meta['steps_completed'] = steps_completed
 
-        # After Step 2, copy opening/final image to project metadata
-        if step_number == 2:
-            project_meta['opening_image'] = artifact.get('opening_image', '')
-            project_meta['final_image'] = artifact.get('final_image', '')
+            project_meta['last_updated'] = datetime.utcnow().isoformat()
 
-        # Save updated metadata
+            # After Step 2, copy opening/final image to project metadata
+            if step_number == 2:
+                project_meta['opening_image'] = artifact.get('opening_image', '')
+                project_meta['final_image'] = artifact.get('final_image', '')
+            return project_meta['current_step']
+
+        # Step boundary: project.json and any coalesced status.json updates go to disk now
         try:
-            with open(project_path, 'w', encoding='utf-8') as f:
-                json.dump(project_meta, f, indent=2)
+            current_step = get_state_store().update(project_path, apply, flush=True)
         except PermissionError as e:
             emit_event(self.current_project_id, "file_error", {"path": str(project_path), "error": str(e)})
-
+            return
+        emit_event(self.current_project_id, "state_updated", {"current_step": current_step, "step_key": f"step_{step_number}"})
+        flush_status(self.current_project_id)
+    
     def export_project(self, format: str = "json") -> Path:
         """
         Export complete project bundle
@@ -644,7 +858,7 @@ class SnowflakePipeline:
             
             # Add all artifacts
             for step in range(11):
-                artifact = self._load_step_artifact(step)
+                artifact = self._load_step_artifact(step, copy=False)
                 if artifact:
                     bundle["artifacts"][f"step_{step}"] = artifact
             
@@ -0,0 +1,95 @@
+"""
+Per-Scene Checkpointing for List-Shaped Steps
+Persists each finished scene immediately so long steps can resume after a crash
+"""
+
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+def content_hash(data: Any) -> str:
+    """Stable SHA-256 of JSON-serializable data (same scheme as upstream hashes)"""
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+class SceneCheckpointLog:
+    """
+    Append-only JSONL log of finished scenes.
+
+    Each line records one scene with the hashes of its brief and prompt.
+    A scene is reused on resume only if both hashes still match; the last
+    record for a scene number wins, so regenerated scenes simply append.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize checkpoint log
+
+        Args:
+            path: JSONL file under the project directory
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._records: Optional[Dict[int, Dict[str, Any]]] = None
+        self.reused = 0
+        self.written = 0
+
+    def load(self) -> Dict[int, Dict[str, Any]]:
+        """Load the latest record per scene number"""
+        with self._lock:
+            return dict(self._load_locked())
+
+    def _load_locked(self) -> Dict[int, Dict[str, Any]]:
+        if self._records is None:
+            self._records = {}
+            if self.path.exists():
+                with open(self.path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            # Torn final line from a crash mid-write
+                            continue
+                        self._records[record["scene_number"]] = record
+        return self._records
+
+    def lookup(self, scene_number: int, brief_hash: str, prompt_hash: str) -> Optional[Dict[str, Any]]:
+        """Return the checkpointed scene data if its inputs are unchanged"""
+        with self._lock:
+            record = self._load_locked().get(scene_number)
+            if (record
+                    and record.get("brief_hash") == brief_hash
+                    and record.get("prompt_hash") == prompt_hash):
+                self.reused += 1
+                return record["scene"]
+        return None
+
+    def append(self,
+               scene_number: int,
+               brief_hash: str,
+               prompt_hash: str,
+               scene: Dict[str, Any],
+               upstream_hash: Optional[str] = None) -> None:
+        """Durably append one finished scene"""
+        record = {
+            "scene_number": scene_number,
+            "brief_hash": brief_hash,
+            "prompt_hash": prompt_hash,
+            "upstream_hash": upstream_hash,
+            "scene": scene,
+        }
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._load_locked()[scene_number] = record
+            self.written += 1
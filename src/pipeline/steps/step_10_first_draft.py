@@ -2,8 +2,12 @@
 Step 10 Implementation: First Draft
 Generate the complete manuscript from scene briefs
 """
+import os
 import json
 import hashlib
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
@@ -14,9 +18,35 @@ from src.ai.model_selector import ModelSelector
 from src.ai.prose_generator import ProseGenerator
 from src.ai.bulletproof_generator import get_bulletproof_generator
 from src.ai.bulletproof_prose_generator import get_bulletproof_prose_generator
+from src.ai.telemetry import call_tags
+from src.observability.tracing import span
+from src.observability.metrics import get_pipeline_metrics
+from src.pipeline.scene_checkpoint import SceneCheckpointLog, content_hash
+from src.pipeline.story_state import StoryState, get_story_state
 
 class Step10FirstDraft:
-    def __init__(self, project_dir: str = "artifacts"):
+    DEFAULT_MAX_WORKERS = 4
+    PREVIOUS_TEXT_CHARS = 1500
+    SCENE_CHECKPOINT_FILE = "step_10_scenes.jsonl"
+
+    def __init__(self,
+                 project_dir: str = "artifacts",
+                 max_workers: Optional[int] = None,
+                 serialize_dependencies: bool = True):
+        """
+        Args:
+            project_dir: Directory to store artifacts
+            max_workers: Scenes drafted concurrently (env STEP10_MAX_WORKERS, default 4)
+            serialize_dependencies: Draft scenes marked ``depends_on_previous``
+                after the previous scene, with its closing prose as context
+        """
+        if max_workers is None:
+            try:
+                max_workers = int(os.getenv("STEP10_MAX_WORKERS", self.DEFAULT_MAX_WORKERS))
+            except ValueError:
+                max_workers = self.DEFAULT_MAX_WORKERS
+        self.max_workers = max(1, max_workers)
+        self.serialize_dependencies = serialize_dependencies
         self.project_dir = Path(project_dir)
         self.project_dir.mkdir(parents=True, exist_ok=True)
         self.validator = Step10Validator()
@@ -61,16 +91,25 @@ class Step10FirstDraft:
         scenes = step8_artifact.get("scenes", [])
         briefs = step9_artifact.get("scene_briefs", [])
         character_bibles = step7_artifact.get("bibles", [])
+        pairs = list(zip(scenes, briefs))
+        total = len(pairs)
         
-        # Generate prose for each scene
-        chapters = []
-        current_chapter = {
-            "number": 1,
-            "title": "Chapter 1",
-            "scenes": []
-        }
+        # Chapter layout depends only on scene order, so it is fixed up front
+        # and assembly stays deterministic however drafting interleaves.
+        chapter_numbers = self._plan_chapters([scene for scene, _ in pairs])
+        chains = self._build_scene_chains(pairs)
+        workers = max(1, min(self.max_workers, len(chains)))
         
-        print(f"Generating prose for {len(scenes)} scenes...")
+        # Every finished scene is persisted immediately; unchanged scenes
+        # from an earlier (crashed or edited) run are reused on resume.
+        checkpoint = SceneCheckpointLog(self.project_dir / project_id / self.SCENE_CHECKPOINT_FILE)
+        
+        # The story so far is built from the scene plan rather than drafted
+        # prose, so each scene's digest is known before any drafting starts
+        story_state = get_story_state(self.project_dir, project_id)
+        story_state.sync({**scene, "scene_number": i + 1} for i, (scene, _) in enumerate(pairs))
+        
+        print(f"Generating prose for {total} scenes ({workers} concurrent)...")
         
         # Import progress tracker
         try:
@@ -79,69 +118,53 @@ class Step10FirstDraft:
         except ImportError:
             tracker = None
         
-        for i, (scene, brief) in enumerate(zip(scenes, briefs)):
-            scene_num = i + 1
-            
-            # Check for chapter break
-            chapter_hint = scene.get("chapter_hint", "")
-            if chapter_hint and i > 0:
-                # Check if this starts a new chapter
-                if f"Ch{len(chapters)+1}" in chapter_hint:
-                    chapters.append(current_chapter)
-                    current_chapter = {
-                        "number": len(chapters) + 1,
-                        "title": f"Chapter {len(chapters) + 1}",
-                        "scenes": []
-                    }
-            
-            # Get POV character bible
-            pov_name = scene.get("pov", "Unknown")
-            pov_bible = self._get_character_bible(pov_name, character_bibles)
-            
-            # Generate scene prose with guaranteed length
-            word_target = scene.get("word_target", 2500)
-            scene_summary = scene.get("summary", "Scene description")[:40]
-            
-            # Update progress
-            if tracker:
-                tracker.update_step_progress(i, len(scenes), f"Ch{len(chapters)+1} Scene {scene_num}: {scene_summary}... ({word_target}w)")
-            else:
-                print(f"  Generating scene {scene_num}/{len(scenes)} ({pov_name} POV, target: {word_target} words)...")
-            
-            # Combine scene and brief data
-            scene_context = {**scene, **brief}
-            
-            # Use bulletproof prose generator - NEVER fails
-            prose = self.bulletproof_prose_generator.generate_guaranteed_scene(
-                scene_context,
-                pov_bible,
-                word_target,
-                min_words=max(word_target // 2, 500)  # At least 500 words minimum
-            )
-            
-            actual_words = len(prose.split())
-            if not tracker:
-                print(f"    Generated {actual_words} words")
-            
-            scene_data = {
-                "scene_number": scene_num,
-                "pov": pov_name,
-                "type": brief.get("type", "Unknown"),
-                "summary": scene.get("summary", ""),
-                "prose": prose,
-                "word_count": len(prose.split())
-            }
-            
-            current_chapter["scenes"].append(scene_data)
+        drafted: List[Optional[Dict[str, Any]]] = [None] * total
+        progress_lock = threading.Lock()
+        completed = [0]
+        
+        def on_scene_drafted(index: int, scene_data: Dict[str, Any]):
+            drafted[index] = scene_data
+            with progress_lock:
+                completed[0] += 1
+                get_pipeline_metrics().queue_depth("step10_scenes_remaining", total - completed[0])
+                summary = scene_data["summary"][:40]
+                if tracker:
+                    if completed[0] < total:
+                        tracker.update_step_progress(
+                            completed[0], total,
+                            f"Ch{chapter_numbers[index]} Scene {index + 1}: {summary}... ({scene_data['word_count']}w)",
+                            step_num=10,
+                        )
+                else:
+                    print(f"  Scene {index + 1}/{total} ({scene_data['pov']} POV): "
+                          f"{scene_data['word_count']} words")
+        
+        def draft_chain(chain: List[int]):
+            previous_prose = None
+            for index in chain:
+                with call_tags(scene=index + 1), span("scene.draft", scene=index + 1):
+                    scene_data = self._draft_scene(
+                        index, pairs, character_bibles, previous_prose, checkpoint, upstream_hash,
+                        story_state
+                    )
+                previous_prose = scene_data["prose"]
+                on_scene_drafted(index, scene_data)
         
-        # Add final chapter
-        if current_chapter["scenes"]:
-            chapters.append(current_chapter)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="step10") as pool:
+            # Each chain runs in a copy of this context so step tags and the trace span reach its AI calls
+            for future in [pool.submit(contextvars.copy_context().run, draft_chain, chain)
+                           for chain in chains]:
+                future.result()
+        
+        chapters = self._assemble_chapters(drafted, chapter_numbers)
+        if checkpoint.reused:
+            print(f"Resumed {checkpoint.reused}/{total} scenes from checkpoint")
         
         # Final progress update
         if tracker:
             total_words = sum(scene["word_count"] for ch in chapters for scene in ch["scenes"])
-            tracker.update_step_progress(len(scenes), len(scenes), f"Complete! {len(chapters)} chapters, {total_words:,} words")
+            tracker.update_step_progress(total, total, f"Complete! {len(chapters)} chapters, {total_words:,} words",
+                                         step_num=10)
         
         # Create manuscript artifact
         artifact = {
@@ -178,6 +201,113 @@ class Step10FirstDraft:
         
         return True, artifact, f"Step 10 manuscript saved to {path}"
     
+    def _plan_chapters(self, scenes: List[Dict[str, Any]]) -> List[int]:
+        """Chapter number for each scene, using the scene list's chapter hints"""
+        chapter_numbers = []
+        current = 1
+        for i, scene in enumerate(scenes):
+            chapter_hint = scene.get("chapter_hint", "")
+            if chapter_hint and i > 0 and f"Ch{current}" in chapter_hint:
+                current += 1
+            chapter_numbers.append(current)
+        return chapter_numbers
+    
+    def _build_scene_chains(self, pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[List[int]]:
+        """
+        Group scene indices into chains that must be drafted in order.
+        
+        Scenes are independent by default (continuity comes from the hooks).
+        A scene that declares ``depends_on_previous`` joins the chain of the
+        scene before it, so only true hard dependencies are serialized.
+        """
+        chains: List[List[int]] = []
+        for i, (scene, brief) in enumerate(pairs):
+            hard_dependency = bool(scene.get("depends_on_previous") or brief.get("depends_on_previous"))
+            if i > 0 and hard_dependency and self.serialize_dependencies:
+                chains[-1].append(i)
+            else:
+                chains.append([i])
+        return chains
+    
+    def _draft_scene(self,
+                     index: int,
+                     pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+                     character_bibles: List[Dict[str, Any]],
+                     previous_prose: Optional[str] = None,
+                     checkpoint: Optional[SceneCheckpointLog] = None,
+                     upstream_hash: Optional[str] = None,
+                     story_state: Optional[StoryState] = None) -> Dict[str, Any]:
+        """Draft one scene (or reuse its checkpoint); continuity comes from neighbouring hooks"""
+        scene, brief = pairs[index]
+        pov_name = scene.get("pov", "Unknown")
+        pov_bible = self._get_character_bible(pov_name, character_bibles)
+        word_target = scene.get("word_target", 2500)
+        
+        # Combine scene and brief data, plus the hooks on either side
+        scene_context = {**scene, **brief}
+        if index > 0:
+            prev_scene, prev_brief = pairs[index - 1]
+            prev_hook = prev_brief.get("outbound_hook") or prev_scene.get("outbound_hook")
+            if prev_hook:
+                scene_context["previous_outbound_hook"] = prev_hook
+        if index + 1 < len(pairs):
+            next_scene, next_brief = pairs[index + 1]
+            next_hook = next_brief.get("inbound_hook") or next_scene.get("inbound_hook")
+            if next_hook:
+                scene_context["next_inbound_hook"] = next_hook
+        if previous_prose:
+            scene_context["previous_scene_text"] = previous_prose[-self.PREVIOUS_TEXT_CHARS:]
+        story_so_far = story_state.digest(before_scene=index + 1) if story_state else ""
+        if story_so_far:
+            scene_context["story_so_far"] = story_so_far
+        
+        brief_hash = content_hash({"scene": scene, "brief": brief})
+        prompt_hash = content_hash(self.bulletproof_prose_generator._build_prose_prompt(
+            scene_context, pov_bible, word_target
+        ))
+        if checkpoint:
+            saved = checkpoint.lookup(index + 1, brief_hash, prompt_hash)
+            if saved:
+                return saved
+        
+        # Use bulletproof prose generator - NEVER fails
+        prose, is_fallback = self.bulletproof_prose_generator.generate_scene_with_status(
+            scene_context,
+            pov_bible,
+            word_target,
+            min_words=max(word_target // 2, 500)  # At least 500 words minimum
+        )
+        
+        scene_data = {
+            "scene_number": index + 1,
+            "pov": pov_name,
+            "type": brief.get("type", "Unknown"),
+            "summary": scene.get("summary", ""),
+            "prose": prose,
+            "word_count": len(prose.split())
+        }
+        # Fallback prose keeps the run going but isn't checkpointed, so a
+        # resume drafts the scene again instead of reusing the placeholder
+        if checkpoint and not is_fallback:
+            checkpoint.append(index + 1, brief_hash, prompt_hash, scene_data, upstream_hash)
+        get_pipeline_metrics().scenes_drafted("novel")
+        return scene_data
+    
+    def _assemble_chapters(self,
+                           drafted: List[Dict[str, Any]],
+                           chapter_numbers: List[int]) -> List[Dict[str, Any]]:
+        """Assemble drafted scenes into chapters in scene order"""
+        chapters: List[Dict[str, Any]] = []
+        for scene_data, number in zip(drafted, chapter_numbers):
+            if not chapters or chapters[-1]["number"] != number:
+                chapters.append({
+                    "number": number,
+                    "title": f"Chapter {number}",
+                    "scenes": []
+                })
+            chapters[-1]["scenes"].append(scene_data)
+        return chapters
+    
     def _get_character_bible(self, 
                             character_name: str, 
                             bibles: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -1,8 +1,12 @@
 """
 Step 9 Implementation V2: Scene Briefs with Better Generation
 """
+import os
 import json
 import hashlib
+import logging
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
@@ -11,14 +15,35 @@ from src.pipeline.validators.step_9_validator import Step9Validator
 from src.ai.generator import AIGenerator
 from src.ai.model_selector import ModelSelector
 from src.ai.bulletproof_generator import get_bulletproof_generator
+from src.pipeline.scene_checkpoint import content_hash
+from src.ai.telemetry import call_tags
+from src.observability.tracing import span
+
+logger = logging.getLogger(__name__)
+
 
 class Step9SceneBriefsV2:
-    def __init__(self, project_dir: str = "artifacts"):
+    DEFAULT_MAX_WORKERS = 4
+    SCENE_RETRIES = 2
+
+    def __init__(self, project_dir: str = "artifacts", max_workers: Optional[int] = None):
+        """
+        Args:
+            project_dir: Directory to store artifacts
+            max_workers: Briefs generated concurrently (env STEP9_MAX_WORKERS, default 4).
+                1 restores strictly sequential generation.
+        """
         self.project_dir = Path(project_dir)
         self.project_dir.mkdir(parents=True, exist_ok=True)
         self.validator = Step9Validator()
         self.generator = AIGenerator()
         self.bulletproof_generator = get_bulletproof_generator()
+        if max_workers is None:
+            try:
+                max_workers = int(os.getenv("STEP9_MAX_WORKERS", self.DEFAULT_MAX_WORKERS))
+            except ValueError:
+                max_workers = self.DEFAULT_MAX_WORKERS
+        self.max_workers = max(1, max_workers)
 
     def execute(self,
                 step8_artifact: Dict[str, Any],
@@ -31,9 +56,10 @@ class Step9SceneBriefsV2:
         
         # Get all scenes
         all_scenes = step8_artifact.get("scenes", [])
-        scene_briefs = []
+        total = len(all_scenes)
+        workers = max(1, min(self.max_workers, total))
         
-        print(f"Generating {len(all_scenes)} scene briefs individually...")
+        print(f"Generating {total} scene briefs individually ({workers} concurrent)...")
         
         # Import progress tracker
         try:
@@ -42,26 +68,47 @@ class Step9SceneBriefsV2:
         except ImportError:
             tracker = None
         
-        # Generate each brief individually for better quality
-        for i, scene in enumerate(all_scenes):
-            scene_num = i + 1
-            
-            # Update progress
-            if tracker:
-                tracker.update_step_progress(i, len(all_scenes), f"Scene {scene_num}: {scene.get('summary', 'No summary')[:50]}...")
-            else:
-                print(f"  Generating brief {scene_num}/{len(all_scenes)}...", end="")
-            
-            # Generate brief for this specific scene
-            brief = self._generate_single_brief(scene, scene_num, step8_artifact, model_config)
-            scene_briefs.append(brief)
-            
-            if not tracker:
-                print(" done")
+        # Each brief depends only on its scene and the shared step8 artifact,
+        # so briefs are generated concurrently and slotted back by index.
+        scene_briefs: List[Optional[Dict[str, Any]]] = [None] * total
+        
+        # Briefs whose scene is unchanged since the last run are kept as-is,
+        # so editing one scene only regenerates that scene's brief.
+        scene_hashes = [self._scene_hash(scene, i + 1, model_config) for i, scene in enumerate(all_scenes)]
+        previous = self._load_previous_briefs(project_id)
+        reused = 0
+        for i, scene_hash in enumerate(scene_hashes):
+            if scene_hash in previous:
+                scene_briefs[i] = previous[scene_hash]
+                reused += 1
+        if reused:
+            print(f"Reusing {reused}/{total} unchanged scene briefs")
+        
+        fallbacks = set()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="step9") as pool:
+            # Copy the context per scene so step tags and the trace span reach each brief's AI calls
+            futures = {
+                pool.submit(contextvars.copy_context().run, self._generate_brief_with_retry,
+                            scene, i + 1, step8_artifact, model_config): i
+                for i, scene in enumerate(all_scenes)
+                if scene_briefs[i] is None
+            }
+            for done, future in enumerate(as_completed(futures), reused + 1):
+                i = futures[future]
+                scene_briefs[i], is_fallback = future.result()
+                if is_fallback:
+                    fallbacks.add(i)
+                summary = all_scenes[i].get('summary', 'No summary')[:50]
+                if tracker:
+                    if done < total:
+                        tracker.update_step_progress(done, total, f"Scene {i + 1}: {summary}...", step_num=9)
+                else:
+                    print(f"  Brief {i + 1} done ({done}/{total})")
         
         # Final progress update
         if tracker:
-            tracker.update_step_progress(len(all_scenes), len(all_scenes), "All scene briefs generated")
+            tracker.update_step_progress(len(all_scenes), len(all_scenes), "All scene briefs generated",
+                                         step_num=9)
         
         # Create artifact
         artifact = {"scene_briefs": scene_briefs}
@@ -71,6 +118,10 @@ class Step9SceneBriefsV2:
         
         # Add metadata even if validation fails
         artifact = self.add_metadata(artifact, project_id, "step9_v2", model_config, upstream_hash)
+        # Fallback briefs get no hash, so the next run generates them again
+        artifact["metadata"]["scene_hashes"] = [
+            None if i in fallbacks else scene_hash for i, scene_hash in enumerate(scene_hashes)
+        ]
         path = self.save_artifact(artifact, project_id)
         
         if not ok:
@@ -81,6 +132,43 @@ class Step9SceneBriefsV2:
         
         return True, artifact, f"Step 9 artifact saved to {path}"
     
+    @staticmethod
+    def _scene_hash(scene: Dict[str, Any], scene_num: int, model_config: Dict[str, Any]) -> str:
+        """Hash of everything a single brief is generated from"""
+        return content_hash({"scene_number": scene_num, "scene": scene, "model_config": model_config})
+    
+    def _load_previous_briefs(self, project_id: str) -> Dict[str, Dict[str, Any]]:
+        """Briefs from the previous run keyed by the hash of the scene they were built from"""
+        path = self.project_dir / project_id / "step_9_scene_briefs.json"
+        if not path.exists():
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Ignoring unreadable previous scene briefs: %s", exc)
+            return {}
+        hashes = previous.get("metadata", {}).get("scene_hashes", [])
+        briefs = previous.get("scene_briefs", [])
+        return {h: brief for h, brief in zip(hashes, briefs) if h and brief}
+    
+    def _generate_brief_with_retry(self,
+                                   scene: Dict[str, Any],
+                                   scene_num: int,
+                                   step8_artifact: Dict[str, Any],
+                                   model_config: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Generate one brief, retrying only this scene; never raises. Returns (brief, is_fallback)"""
+        with call_tags(scene=scene_num), span("scene.brief", scene=scene_num) as s:
+            for attempt in range(self.SCENE_RETRIES):
+                try:
+                    return self._generate_single_brief(scene, scene_num, step8_artifact, model_config), False
+                except Exception as exc:
+                    logger.warning("Scene %d brief attempt %d/%d failed: %s",
+                                   scene_num, attempt + 1, self.SCENE_RETRIES, exc)
+            if s is not None:
+                s.set(fallback=True)
+            return self._create_fallback_brief(scene, scene_num), True
+    
     def _generate_single_brief(self, 
                               scene: Dict[str, Any], 
                               scene_num: int,
@@ -108,8 +196,11 @@ class Step9SceneBriefsV2:
                 disaster_anchor, conflict_info  
             )
         
-        # Generate with bulletproof reliability
-        response = self.bulletproof_generator.generate_guaranteed(prompt, model_config)
+        # Generate with bulletproof reliability; its emergency output isn't a
+        # brief, so treat it as a failed attempt and let the caller retry
+        response, is_fallback = self.bulletproof_generator.generate_with_status(prompt, model_config)
+        if is_fallback:
+            raise RuntimeError("every provider failed")
         
         # Parse response
         brief = self._parse_brief_response(response, scene_type)
@@ -199,7 +290,7 @@ Generate the brief now:"""
         return {"system": system, "user": user}
     
     def _parse_brief_response(self, response: str, scene_type: str) -> Dict[str, Any]:
-        """Parse AI response into brief structure with bulletproof fallbacks"""
+        """Parse AI response into brief structure; raises ValueError if no valid brief is found"""
         
         # Try multiple JSON parsing strategies
         parsed_json = self._extract_json_from_response(response)
@@ -213,8 +304,7 @@ Generate the brief now:"""
         if self._validate_brief_fields(brief, scene_type):
             return brief
         
-        # Emergency fallback - create minimal valid brief
-        return self._create_emergency_brief(scene_type)
+        raise ValueError(f"response has no valid {scene_type} brief")
     
     def _extract_json_from_response(self, response: str) -> Optional[Dict[str, Any]]:
         """Extract JSON with multiple strategies"""
@@ -306,27 +396,6 @@ Generate the brief now:"""
         
         return True
     
-    def _create_emergency_brief(self, scene_type: str) -> Dict[str, Any]:
-        """Create emergency brief when all parsing fails"""
-        if scene_type == "Proactive":
-            return {
-                "type": "Proactive",
-                "goal": "complete critical mission objective before the deadline expires",
-                "conflict": "hostile forces actively work to prevent success using superior resources",
-                "setback": "initial strategy fails completely, situation becomes significantly worse",
-                "stakes": "total failure means permanent loss of what matters most",
-                "links": {"character_goal_id": "protagonist_goal"}
-            }
-        else:
-            return {
-                "type": "Reactive", 
-                "reaction": "overwhelming shock and disbelief, physical symptoms of extreme stress",
-                "dilemma": "must choose between two terrible options that both cause severe damage",
-                "decision": "commits to desperate action despite enormous personal cost and risk",
-                "stakes": "either choice leads to devastating consequences for innocent people",
-                "links": {"character_goal_id": "protagonist_goal"}
-            }
-    
     def _create_fallback_brief(self, scene: Dict[str, Any], scene_num: int) -> Dict[str, Any]:
         """Create a concrete fallback brief"""
         scene_type = scene.get("type", "Proactive")
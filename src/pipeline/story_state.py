@@ -0,0 +1,203 @@
+"""
+Rolling Story-State Summary Cache
+Keeps a compact, incrementally updated "story so far" per project so long-context prompts stay small
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterable
+
+from src.pipeline.scene_checkpoint import content_hash
+
+STORY_STATE_FILE = "story_state.json"
+
+
+def _clip(text: Any, limit: int) -> str:
+    text = " ".join(str(text or "").split())
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+class StoryState:
+    """
+    Size-bounded digest of a story, updated one scene at a time.
+
+    The state after each scene (character states, open threads and the last
+    few scene beats) is kept as a snapshot chained to the snapshot before
+    it, so asking for the story so far before any scene is a lookup, and a
+    scene that changes only invalidates the snapshots after it. Snapshots
+    are persisted to ``story_state.json`` in the project directory.
+
+    Works with both screenplay scenes (slugline, characters_present,
+    emotional_end, conflict) and novel scenes (pov, summary, outbound_hook).
+    """
+
+    def __init__(self,
+                 path: Optional[Path] = None,
+                 recent_beats: int = 3,
+                 max_characters: int = 10,
+                 max_threads: int = 6,
+                 line_chars: int = 120):
+        """
+        Initialize story state
+
+        Args:
+            path: JSON file to persist snapshots to (None keeps them in memory)
+            recent_beats: Scene beat lines kept in the digest
+            max_characters: Most recently seen characters kept
+            max_threads: Open threads (conflicts/hooks) kept
+            line_chars: Truncation length for every text field
+        """
+        self.path = Path(path) if path else None
+        self.recent_beats = recent_beats
+        self.max_characters = max_characters
+        self.max_threads = max_threads
+        self.line_chars = line_chars
+        self._lock = threading.Lock()
+        self._snapshots: Dict[int, Dict[str, Any]] = self._load()
+        self.hits = 0
+        self.updates = 0
+
+    def _load(self) -> Dict[int, Dict[str, Any]]:
+        if not self.path or not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return {int(n): snap for n, snap in data.get("snapshots", {}).items()}
+
+    def _save_locked(self) -> None:
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "snapshots": self._snapshots}, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def update(self, scene: Dict[str, Any]) -> None:
+        """Fold one scene into the state (no-op if it and everything before it are unchanged)"""
+        with self._lock:
+            if self._update_locked(scene):
+                self._save_locked()
+
+    def sync(self, scenes: Iterable[Dict[str, Any]]) -> None:
+        """Bring the state in line with a full scene list, recomputing only from the first change"""
+        with self._lock:
+            changed = False
+            for scene in sorted(scenes, key=lambda s: s.get("scene_number", 0)):
+                changed = self._update_locked(scene) or changed
+            if changed:
+                self._save_locked()
+
+    def _update_locked(self, scene: Dict[str, Any]) -> bool:
+        number = int(scene.get("scene_number", 0))
+        base = self._base_locked(number)
+        key = content_hash({"base": base["key"] if base else None, "scene": scene})
+        current = self._snapshots.get(number)
+        if current and current["key"] == key:
+            self.hits += 1
+            return False
+
+        state = self._apply(base["state"] if base else None, scene, number)
+        self._snapshots[number] = {"key": key, "state": state}
+        # Later snapshots were built on the old version of this scene
+        for later in [n for n in self._snapshots if n > number]:
+            del self._snapshots[later]
+        self.updates += 1
+        return True
+
+    def _base_locked(self, number: int) -> Optional[Dict[str, Any]]:
+        earlier = [n for n in self._snapshots if n < number]
+        return self._snapshots[max(earlier)] if earlier else None
+
+    def _apply(self, previous: Optional[Dict[str, Any]], scene: Dict[str, Any], number: int) -> Dict[str, Any]:
+        state = {
+            "characters": dict(previous["characters"]) if previous else {},
+            "threads": list(previous["threads"]) if previous else [],
+            "beats": list(previous["beats"]) if previous else [],
+        }
+
+        def clip(value: Any) -> str:
+            return _clip(value, self.line_chars)
+
+        # Characters: latest known state, most recently seen last
+        names = scene.get("characters_present") or ([scene["pov"]] if scene.get("pov") else [])
+        status = scene.get("emotional_end") or scene.get("summary") or ""
+        for name in names:
+            state["characters"].pop(name, None)
+            state["characters"][name] = {"scene": number, "state": clip(status)}
+        while len(state["characters"]) > self.max_characters:
+            state["characters"].pop(next(iter(state["characters"])))
+
+        # Open threads: the newest unresolved conflicts/hooks
+        for thread in (scene.get("conflict"), scene.get("outbound_hook")):
+            thread = clip(thread)
+            if thread and thread not in state["threads"]:
+                state["threads"].append(thread)
+        state["threads"] = state["threads"][-self.max_threads:]
+
+        # Beats: one line per recent scene
+        where = scene.get("slugline") or scene.get("location") or ""
+        what = scene.get("summary") or scene.get("conflict") or ""
+        arc = ""
+        if scene.get("emotional_start") or scene.get("emotional_end"):
+            arc = f" | Emotion: {scene.get('emotional_start', '?')} -> {scene.get('emotional_end', '?')}"
+        beat = scene.get("beat")
+        state["beats"].append(
+            f"Scene {number}{f' [{beat}]' if beat else ''} {clip(where)} | {clip(what)}{arc}"
+        )
+        state["beats"] = state["beats"][-self.recent_beats:]
+        return state
+
+    def digest(self, before_scene: Optional[int] = None) -> str:
+        """
+        Compact story-so-far text
+
+        Args:
+            before_scene: Summarize everything before this scene number
+                (None = everything folded in so far)
+        """
+        with self._lock:
+            numbers = [n for n in self._snapshots if before_scene is None or n < before_scene]
+            if not numbers:
+                return ""
+            state = self._snapshots[max(numbers)]["state"]
+
+        parts = []
+        if state["characters"]:
+            parts.append("CHARACTERS NOW: " + "; ".join(
+                f"{name} (sc {info['scene']}): {info['state']}"
+                for name, info in reversed(list(state["characters"].items()))
+            ))
+        if state["threads"]:
+            parts.append("OPEN THREADS: " + "; ".join(state["threads"]))
+        if state["beats"]:
+            parts.append("RECENT SCENES:\n" + "\n".join(state["beats"]))
+        return "\n".join(parts)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"snapshots": len(self._snapshots), "hits": self.hits, "updates": self.updates}
+
+
+# Per-project instances
+_story_states: Dict[str, StoryState] = {}
+_story_states_lock = threading.Lock()
+
+
+def get_story_state(project_dir: Any, project_id: Optional[str]) -> StoryState:
+    """Get the story state for a project (in-memory only when there is no project id)"""
+    if not project_id:
+        return StoryState()
+    path = Path(project_dir) / project_id / STORY_STATE_FILE
+    key = str(path.resolve())
+    with _story_states_lock:
+        state = _story_states.get(key)
+        if state is None:
+            state = StoryState(path)
+            _story_states[key] = state
+        return state
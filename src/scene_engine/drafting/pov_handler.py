@@ -5,11 +5,13 @@ TaskMaster Task 44.4: Implement POV and Tense Handling Logic
 Ensures generated prose consistently applies specified POV and tense from Scene Cards.
 """
 
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Tuple
 from enum import Enum
 import re
 import logging
 
+from ..text_profile import text_profile
+
 
 class POVType(Enum):
     """Point of view types"""
@@ -173,9 +175,9 @@ class POVHandler:
     def _split_sentences(self, prose: str) -> List[str]:
         """Split prose into sentences for processing"""
         
-        # Simple sentence splitting (could be enhanced with more sophisticated NLP)
-        sentences = re.split(r'[.!?]+\s+', prose)
-        return [s.strip() for s in sentences if s.strip()]
+        # Split where terminal punctuation is followed by whitespace; shared
+        # with the other analyzers through the cached text profile
+        return list(text_profile(prose).spaced_sentences)
     
     def _apply_pov_conversion(self, sentence: str, target_pov: POVType) -> str:
         """Convert sentence to target POV"""
@@ -15,6 +15,7 @@ from ..models import SceneCard, SceneType
 from .prose_generators import ProactiveProseGenerator, ReactiveProseGenerator
 from .pov_handler import POVHandler, POVType, TenseType
 from .exposition_tracker import ExpositionTracker, ExpositionBudget
+from ...observability.history import BoundedHistory
 
 
 class DraftingStatus(Enum):
@@ -105,7 +106,16 @@ class SceneDraftingService:
         self.exposition_tracker = ExpositionTracker()
         
         # Statistics
-        self.drafting_history = []
+        self.drafting_history = BoundedHistory(
+            fields={
+                'word_count': lambda entry: entry['response'].word_count,
+                'processing_time': lambda entry: entry['response'].processing_time_seconds,
+            },
+            keys={
+                'success': lambda entry: bool(entry['response'].success),
+                'generator': lambda entry: entry['response'].generator_used,
+            }
+        )
         
     def draft_scene_prose(self, request: DraftingRequest) -> DraftingResponse:
         """
@@ -362,22 +372,19 @@ class SceneDraftingService:
         if not self.drafting_history:
             return {'total_drafts': 0}
         
-        total_drafts = len(self.drafting_history)
-        successful_drafts = sum(1 for entry in self.drafting_history if entry['response'].success)
-        
-        avg_word_count = sum(entry['response'].word_count for entry in self.drafting_history) / total_drafts
-        avg_processing_time = sum(entry['response'].processing_time_seconds for entry in self.drafting_history) / total_drafts
+        # Lifetime aggregates kept by the history, so no rescan of retained drafts
+        total_drafts = self.drafting_history.total
+        successful_drafts = self.drafting_history.counts('success').get(True, 0)
+        generators = self.drafting_history.counts('generator')
         
         return {
             'total_drafts': total_drafts,
             'successful_drafts': successful_drafts,
             'success_rate': successful_drafts / total_drafts,
-            'average_word_count': avg_word_count,
-            'average_processing_time': avg_processing_time,
+            'average_word_count': self.drafting_history.stats('word_count')['mean'],
+            'average_processing_time': self.drafting_history.stats('processing_time')['mean'],
             'generators_used': {
-                'proactive': sum(1 for entry in self.drafting_history 
-                               if entry['response'].generator_used == "ProactiveProseGenerator"),
-                'reactive': sum(1 for entry in self.drafting_history 
-                               if entry['response'].generator_used == "ReactiveProseGenerator")
+                'proactive': generators.get("ProactiveProseGenerator", 0),
+                'reactive': generators.get("ReactiveProseGenerator", 0)
             }
         }
\ No newline at end of file
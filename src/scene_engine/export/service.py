@@ -40,6 +40,7 @@ except ImportError:
     PDF_AVAILABLE = False
 
 from ..models import SceneCard, SceneType
+from ...observability.history import BoundedHistory
 from ..persistence.service import PersistenceService
 
 
@@ -719,7 +720,13 @@ class ExportService:
     def __init__(self, persistence_service: Optional[PersistenceService] = None):
         self.persistence_service = persistence_service or PersistenceService()
         self.template_manager = ExportTemplateManager()
-        self.export_history = []
+        self.export_history = BoundedHistory(
+            fields={'processing_time': lambda e: e['response'].processing_time_seconds},
+            keys={
+                'success': lambda e: bool(e['response'].success),
+                'format': lambda e: e['response'].format_used.value if e['response'].format_used else None
+            }
+        )
         
         # Initialize format handlers
         self.format_handlers = {
@@ -963,19 +970,12 @@ class ExportService:
         if not self.export_history:
             return {'total_exports': 0}
         
-        total_exports = len(self.export_history)
-        successful_exports = sum(1 for export in self.export_history if export['response'].success)
-        
-        # Format usage
-        format_usage = {}
-        for export in self.export_history:
-            format_type = export['response'].format_used
-            if format_type:
-                format_usage[format_type.value] = format_usage.get(format_type.value, 0) + 1
+        total_exports = self.export_history.total
+        successful_exports = self.export_history.counts('success').get(True, 0)
         
-        # Processing times
-        processing_times = [export['response'].processing_time_seconds for export in self.export_history]
-        avg_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0
+        # Format usage and processing times come from the history's running aggregates
+        format_usage = self.export_history.counts('format')
+        avg_processing_time = self.export_history.stats('processing_time')['mean']
         
         return {
             'total_exports': total_exports,
@@ -19,6 +19,7 @@ from ..models import (
     ProactiveScene, ReactiveScene
 )
 from ..validation.service import SceneValidationService, ValidationRequest
+from ...observability.history import BoundedHistory
 
 
 class GenerationMode(Enum):
@@ -153,10 +154,13 @@ class AIModelInterface:
     """Interface for AI model integration"""
     
     def __init__(self, model_type: AIModel, api_key: Optional[str] = None, 
-                 endpoint: Optional[str] = None):
+                 endpoint: Optional[str] = None, generator: Optional[Any] = None):
         self.model_type = model_type
         self.api_key = api_key
         self.endpoint = endpoint
+        # Optional AsyncAIGenerator; when set, calls go to the real provider
+        # and concurrent workflows share its connection pool
+        self.generator = generator
         self.model_config = self._get_model_config()
     
     def _get_model_config(self) -> Dict[str, Any]:
@@ -187,6 +191,13 @@ class AIModelInterface:
     
     async def generate_content(self, prompt: str, **kwargs) -> str:
         """Generate content using the AI model"""
+        if self.generator is not None:
+            config = {
+                "temperature": kwargs.get("temperature", self.model_config["temperature"]),
+                "max_tokens": kwargs.get("max_tokens", self.model_config["max_tokens"]),
+            }
+            return await self.generator.generate({"user": prompt}, config)
+        
         # This is a placeholder - actual implementation would depend on specific model APIs
         if self.model_type == AIModel.CLAUDE:
             return await self._generate_claude(prompt, **kwargs)
@@ -511,7 +522,17 @@ class SceneGenerationEngine:
         self.model_interface = model_interface or AIModelInterface(AIModel.CLAUDE)
         self.validation_service = validation_service or SceneValidationService()
         self.prompt_builder = PromptBuilder()
-        self.generation_history = []
+        self.generation_history = BoundedHistory(
+            fields={
+                'generation_time': lambda g: g['response'].generation_time_seconds,
+                'successful_quality': lambda g: (g['response'].snowflake_compliance_score
+                                                 if g['response'].success else None),
+            },
+            keys={
+                'success': lambda g: bool(g['response'].success),
+                'model': lambda g: g['response'].model_used,
+            }
+        )
         
     async def generate_scene(self, request: GenerationRequest) -> GenerationResponse:
         """Generate a scene based on the request"""
@@ -765,21 +786,15 @@ class SceneGenerationEngine:
         if not self.generation_history:
             return {'total_generations': 0}
         
-        successful_generations = [g for g in self.generation_history 
-                                if g['response'].success]
-        
-        total_time = sum(g['response'].generation_time_seconds 
-                        for g in self.generation_history)
-        avg_time = total_time / len(self.generation_history)
-        
-        avg_quality = sum(g['response'].snowflake_compliance_score 
-                         for g in successful_generations) / len(successful_generations) if successful_generations else 0
+        # Lifetime aggregates kept by the history, so no rescan of retained responses
+        total = self.generation_history.total
+        successful = self.generation_history.counts('success').get(True, 0)
         
         return {
-            'total_generations': len(self.generation_history),
-            'successful_generations': len(successful_generations),
-            'success_rate': len(successful_generations) / len(self.generation_history),
-            'average_generation_time': avg_time,
-            'average_quality_score': avg_quality,
-            'models_used': list(set(g['response'].model_used for g in self.generation_history))
+            'total_generations': total,
+            'successful_generations': successful,
+            'success_rate': successful / total,
+            'average_generation_time': self.generation_history.stats('generation_time')['mean'],
+            'average_quality_score': self.generation_history.stats('successful_quality')['mean'],
+            'models_used': list(self.generation_history.counts('model'))
         }
\ No newline at end of file
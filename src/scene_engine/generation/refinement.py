@@ -16,6 +16,7 @@ import hashlib
 
 from ..models import SceneCard, SceneType, ViewpointType, TenseType
 from ..validation.service import SceneValidationService, ValidationRequest, ValidationResponse
+from ..text_profile import text_profile
 
 
 class RefinementType(Enum):
@@ -188,7 +189,7 @@ class ContentAnalyzer:
         return RefinementReport(
             content_id=content_id,
             analysis_timestamp=start_time,
-            original_word_count=len(prose_content.split()),
+            original_word_count=text_profile(prose_content).word_count,
             issues_found=issues,
             suggestions_made=suggestions,
             overall_quality_score=quality_scores['overall'],
@@ -289,9 +290,10 @@ class ContentAnalyzer:
         """Analyze prose style issues"""
         
         issues = []
+        profile = text_profile(prose_content)
         
         # Check for repetitive sentence structure
-        sentences = re.split(r'[.!?]+', prose_content)
+        sentences = profile.sentence_pieces
         if len(sentences) > 3:
             similar_starts = 0
             for i in range(len(sentences) - 1):
@@ -312,7 +314,7 @@ class ContentAnalyzer:
         
         # Check for excessive adverbs
         adverbs = re.findall(r'\b\w+ly\b', prose_content)
-        if len(adverbs) > len(prose_content.split()) * 0.05:  # More than 5% adverbs
+        if len(adverbs) > profile.word_count * 0.05:  # More than 5% adverbs
             issues.append(RefinementIssue(
                 issue_id="",
                 refinement_type=RefinementType.STYLE,
@@ -327,7 +329,7 @@ class ContentAnalyzer:
         passive_count = sum(len(re.findall(pattern, prose_content, re.IGNORECASE)) 
                            for pattern in passive_patterns)
         
-        if passive_count > len(prose_content.split()) * 0.03:  # More than 3% passive
+        if passive_count > profile.word_count * 0.03:  # More than 3% passive
             issues.append(RefinementIssue(
                 issue_id="",
                 refinement_type=RefinementType.STYLE,
@@ -344,16 +346,11 @@ class ContentAnalyzer:
         
         issues = []
         
-        # Check for POV consistency
-        pov_indicators = {
-            'first': [r'\b(I|me|my|mine)\b'],
-            'third': [r'\b(he|she|him|her|his|hers)\b']
-        }
+        profile = text_profile(prose_content)
         
-        first_person_count = sum(len(re.findall(pattern, prose_content, re.IGNORECASE))
-                               for pattern in pov_indicators['first'])
-        third_person_count = sum(len(re.findall(pattern, prose_content, re.IGNORECASE))
-                               for pattern in pov_indicators['third'])
+        # Check for POV consistency
+        first_person_count = profile.count('i', 'me', 'my', 'mine')
+        third_person_count = profile.count('he', 'she', 'him', 'her', 'his', 'hers')
         
         if first_person_count > 0 and third_person_count > 0:
             if min(first_person_count, third_person_count) > 2:  # Significant presence of both
@@ -367,8 +364,8 @@ class ContentAnalyzer:
                 ))
         
         # Check for tense consistency
-        past_tense = len(re.findall(r'\b(was|were|had|went|came|said|did)\b', prose_content, re.IGNORECASE))
-        present_tense = len(re.findall(r'\b(is|are|has|goes|comes|says|does)\b', prose_content, re.IGNORECASE))
+        past_tense = profile.count('was', 'were', 'had', 'went', 'came', 'said', 'did')
+        present_tense = profile.count('is', 'are', 'has', 'goes', 'comes', 'says', 'does')
         
         if past_tense > 0 and present_tense > 0:
             if min(past_tense, present_tense) > max(past_tense, present_tense) * 0.3:
@@ -389,7 +386,7 @@ class ContentAnalyzer:
         issues = []
         
         # Check for dialogue presence and quality
-        dialogue_matches = re.findall(r'"[^"]*"', prose_content)
+        dialogue_matches = text_profile(prose_content).dialogue
         
         if dialogue_matches:
             # Check for untagged dialogue
@@ -433,11 +430,13 @@ class ContentAnalyzer:
         
         issues = []
         
+        profile = text_profile(prose_content)
+        
         # Analyze sentence length variety
-        sentences = [s.strip() for s in re.split(r'[.!?]+', prose_content) if s.strip()]
+        sentences = profile.sentences
         
         if sentences:
-            lengths = [len(s.split()) for s in sentences]
+            lengths = profile.sentence_lengths
             avg_length = sum(lengths) / len(lengths)
             
             # Check for monotonous sentence length
@@ -455,7 +454,7 @@ class ContentAnalyzer:
                 ))
             
             # Check for extremely long sentences
-            very_long = [s for s in sentences if len(s.split()) > 35]
+            very_long = [s for s, length in zip(sentences, lengths) if length > 35]
             if len(very_long) > len(sentences) * 0.2:  # More than 20% very long
                 issues.append(RefinementIssue(
                     issue_id="",
@@ -468,7 +467,7 @@ class ContentAnalyzer:
                 ))
         
         # Analyze paragraph length
-        paragraphs = [p.strip() for p in prose_content.split('\n\n') if p.strip()]
+        paragraphs = profile.paragraphs
         
         if paragraphs:
             # Check for wall-of-text paragraphs
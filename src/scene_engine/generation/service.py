@@ -22,6 +22,7 @@ from ..models import SceneCard, SceneType, ViewpointType, TenseType
 from ..validation.service import SceneValidationService
 from ..persistence.service import PersistenceService
 from ..chaining.generator import ChainLinkGenerator
+from ...observability.history import BoundedHistory
 
 
 @dataclass
@@ -127,7 +128,10 @@ class SceneGenerationService:
         
         # Workflow tracking
         self.active_workflows = {}
-        self.workflow_history = []
+        self.workflow_history = BoundedHistory(
+            fields={'duration': lambda w: (w['end_time'] - w['start_time']).total_seconds()},
+            keys={'status': lambda w: w.get('status')}
+        )
         
     async def generate_scene_complete(self, request: GenerationWorkflowRequest) -> GenerationWorkflowResponse:
         """Execute complete scene generation workflow"""
@@ -511,23 +515,16 @@ class SceneGenerationService:
     def get_workflow_statistics(self) -> Dict[str, Any]:
         """Get comprehensive workflow statistics"""
         
-        total_workflows = len(self.workflow_history)
-        successful_workflows = len([w for w in self.workflow_history 
-                                  if w.get('status') == 'completed'])
+        total_workflows = self.workflow_history.total
+        successful_workflows = self.workflow_history.counts('status').get('completed', 0)
         
         if total_workflows == 0:
             return {'total_workflows': 0}
         
         success_rate = successful_workflows / total_workflows
         
-        # Calculate average processing time
-        processing_times = []
-        for workflow in self.workflow_history:
-            if 'end_time' in workflow and 'start_time' in workflow:
-                duration = (workflow['end_time'] - workflow['start_time']).total_seconds()
-                processing_times.append(duration)
-        
-        avg_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0
+        # Running average over every finished workflow, including evicted ones
+        avg_processing_time = self.workflow_history.stats('duration')['mean']
         
         # Get generation engine statistics
         generation_stats = self.generation_engine.get_generation_statistics()
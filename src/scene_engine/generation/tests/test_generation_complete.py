@@ -155,7 +155,7 @@ class TestSceneGenerationEngine:
         assert engine.model_interface == mock_ai_model
         assert engine.validation_service == mock_validation_service
         assert isinstance(engine.prompt_builder, PromptBuilder)
-        assert engine.generation_history == []
+        assert len(engine.generation_history) == 0
     
     @pytest.mark.asyncio
     async def test_successful_scene_generation(self, mock_ai_model, mock_validation_service, sample_generation_request):
@@ -255,7 +255,7 @@ class TestSceneGenerationEngine:
         engine = SceneGenerationEngine(mock_ai_model, mock_validation_service)
         
         # Add mock generation history
-        engine.generation_history = [
+        for generation in [
             {
                 'response': Mock(success=True, generation_time_seconds=2.5, snowflake_compliance_score=0.8, model_used='claude')
             },
@@ -265,7 +265,8 @@ class TestSceneGenerationEngine:
             {
                 'response': Mock(success=True, generation_time_seconds=3.2, snowflake_compliance_score=0.9, model_used='claude')
             }
-        ]
+        ]:
+            engine.generation_history.append(generation)
         
         stats = engine.get_generation_statistics()
         
@@ -863,11 +864,12 @@ class TestSceneGenerationService:
         )
         
         # Add mock workflow history
-        service.workflow_history = [
+        for workflow in [
             {'status': 'completed', 'start_time': datetime.now(), 'end_time': datetime.now()},
             {'status': 'failed', 'start_time': datetime.now(), 'end_time': datetime.now()},
             {'status': 'completed', 'start_time': datetime.now(), 'end_time': datetime.now()}
-        ]
+        ]:
+            service.workflow_history.append(workflow)
         
         stats = service.get_workflow_statistics()
         
@@ -899,11 +901,11 @@ class TestSceneGenerationService:
             scene_purpose="Original scene"
         )
         
-        service.workflow_history = [{
+        service.workflow_history.append({
             'workflow_id': 'original_123',
             'request': original_request,
             'status': 'completed'
-        }]
+        })
         
         # Test regeneration with feedback
         feedback = {
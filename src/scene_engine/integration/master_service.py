@@ -26,6 +26,7 @@ from ..chaining.generator import ChainLinkGenerator
 from ..generation.service import SceneGenerationService, GenerationWorkflowRequest
 from ..quality.service import QualityAssessmentService
 from ..export.service import ExportService, ExportRequest
+from ...observability.history import BoundedHistory
 
 
 class EventType(Enum):
@@ -122,7 +123,7 @@ class EventSystem:
     def __init__(self, max_queue_size: int = 1000):
         self.event_queue = Queue(maxsize=max_queue_size)
         self.subscribers = {}
-        self.event_history = []
+        self.event_history = BoundedHistory(keys={'event_type': lambda e: e.event_type.value})
         self.is_running = False
         self.worker_thread = None
         
@@ -150,11 +151,6 @@ class EventSystem:
         try:
             self.event_queue.put(event, block=False)
             self.event_history.append(event)
-            
-            # Keep history limited
-            if len(self.event_history) > 1000:
-                self.event_history = self.event_history[-500:]
-                
         except Exception as e:
             self.logger.error(f"Failed to publish event: {e}")
     
@@ -195,14 +191,9 @@ class EventSystem:
     
     def get_event_statistics(self) -> Dict[str, Any]:
         """Get event system statistics"""
-        event_counts = {}
-        for event in self.event_history:
-            event_type = event.event_type.value
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
-        
         return {
-            'total_events': len(self.event_history),
-            'event_counts_by_type': event_counts,
+            'total_events': self.event_history.total,
+            'event_counts_by_type': self.event_history.counts('event_type'),
             'queue_size': self.event_queue.qsize(),
             'subscriber_count': sum(len(subs) for subs in self.subscribers.values()),
             'is_running': self.is_running
@@ -217,7 +208,7 @@ class WorkflowEngine:
         self.scene_engine = scene_engine
         self.workflows = {}
         self.active_executions = {}
-        self.execution_history = []
+        self.execution_history = BoundedHistory()
         
         # Setup logging
         self.logger = logging.getLogger("WorkflowEngine")
@@ -474,7 +465,7 @@ class SceneEngineAPI:
     def __init__(self, scene_engine: 'SceneEngineMaster'):
         self.scene_engine = scene_engine
         self.api_routes = {}
-        self.request_history = []
+        self.request_history = BoundedHistory()
         
         # Setup logging
         self.logger = logging.getLogger("SceneEngineAPI")
@@ -848,12 +839,12 @@ class SceneEngineMaster:
         stats['workflows'] = {
             'registered_workflows': len(self.workflow_engine.workflows),
             'active_executions': len(self.workflow_engine.active_executions),
-            'total_executions': len(self.workflow_engine.execution_history)
+            'total_executions': self.workflow_engine.execution_history.total
         }
         
         # API statistics
         stats['api'] = {
-            'total_requests': len(self.api.request_history),
+            'total_requests': self.api.request_history.total,
             'registered_routes': len(self.api.api_routes)
         }
         
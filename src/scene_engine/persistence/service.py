@@ -9,7 +9,6 @@ versioning, content analysis, and coordinated CRUD operations.
 from typing import List, Optional, Dict, Any, Union, Tuple
 from datetime import datetime
 import hashlib
-import re
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc, func
 
@@ -22,6 +21,7 @@ from .crud import (
     CharacterCRUD, SceneSequenceCRUD, create_crud_manager
 )
 from ..models import SceneCard, SceneType
+from ..text_profile import text_profile
 from ..chaining.models import ChainLink, ChainSequence
 
 
@@ -48,17 +48,17 @@ class ProseAnalyzer:
         """Perform comprehensive content analysis"""
         
         # Basic metrics
-        word_count = len(content.split())
+        profile = text_profile(content)
+        word_count = profile.word_count
         character_count = len(content)
         reading_time = max(1, word_count // 250)  # 250 WPM average
         
         # Sentence analysis
-        sentences = re.split(r'[.!?]+', content)
-        sentence_count = len([s for s in sentences if s.strip()])
+        sentence_count = len(profile.sentences)
         avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
         
         # Readability approximation (Flesch-Kincaid inspired)
-        syllable_count = ProseAnalyzer._estimate_syllables(content)
+        syllable_count = profile.syllable_count
         readability_score = 206.835 - (1.015 * avg_sentence_length) - (84.6 * (syllable_count / word_count)) if word_count > 0 else 0
         readability_score = max(0, min(100, readability_score))  # Clamp to 0-100
         
@@ -69,7 +69,7 @@ class ProseAnalyzer:
         keywords = ProseAnalyzer._extract_keywords(content)
         
         # Dialogue ratio
-        dialogue_words = len(re.findall(r'"[^"]*"', content))
+        dialogue_words = len(profile.dialogue)
         dialogue_ratio = dialogue_words / word_count if word_count > 0 else 0
         
         return {
@@ -88,22 +88,7 @@ class ProseAnalyzer:
     @staticmethod
     def _estimate_syllables(text: str) -> int:
         """Estimate syllable count using simple heuristics"""
-        # Remove non-alphabetic characters and convert to lowercase
-        text = re.sub(r'[^a-zA-Z\s]', '', text.lower())
-        words = text.split()
-        
-        total_syllables = 0
-        for word in words:
-            # Count vowel groups
-            syllables = len(re.findall(r'[aeiouy]+', word))
-            # Subtract silent 'e' at end
-            if word.endswith('e'):
-                syllables -= 1
-            # Every word has at least one syllable
-            syllables = max(1, syllables)
-            total_syllables += syllables
-            
-        return total_syllables
+        return text_profile(text).syllable_count
     
     @staticmethod
     def _analyze_sentiment(content: str) -> float:
@@ -120,10 +105,10 @@ class ProseAnalyzer:
             'scream', 'fear', 'terror', 'dark', 'death', 'evil'
         ]
         
-        words = re.findall(r'\b\w+\b', content.lower())
+        profile = text_profile(content)
         
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
+        positive_count = profile.count(*positive_words)
+        negative_count = profile.count(*negative_words)
         
         total_sentiment_words = positive_count + negative_count
         
@@ -155,14 +140,9 @@ class ProseAnalyzer:
             'might', 'must', 'may'
         }
         
-        # Extract words, filter stop words and short words
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', content.lower())
-        words = [word for word in words if word not in stop_words]
-        
-        # Count frequency
-        word_freq = {}
-        for word in words:
-            word_freq[word] = word_freq.get(word, 0) + 1
+        # Count frequency of alphabetic words of 3+ letters, skipping stop words
+        word_freq = {word: count for word, count in text_profile(content).word_counts.items()
+                     if len(word) >= 3 and word.isascii() and word.isalpha() and word not in stop_words}
         
         # Sort by frequency and return top keywords
         sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
@@ -14,6 +14,8 @@ from datetime import datetime
 from enum import Enum
 
 from ..models import SceneCard, SceneType
+from ..text_profile import text_profile, estimate_syllables
+from ...observability.history import BoundedHistory
 
 
 class QualityDimension(Enum):
@@ -102,10 +104,9 @@ class ReadabilityAnalyzer:
             )
         
         # Basic text metrics
-        words = content.split()
-        word_count = len(words)
-        sentences = [s.strip() for s in re.split(r'[.!?]+', content) if s.strip()]
-        sentence_count = len(sentences)
+        profile = text_profile(content)
+        word_count = profile.word_count
+        sentence_count = len(profile.sentences)
         
         if word_count == 0 or sentence_count == 0:
             return QualityScore(
@@ -115,7 +116,7 @@ class ReadabilityAnalyzer:
             )
         
         # Calculate syllable count (approximation)
-        syllable_count = ReadabilityAnalyzer._estimate_syllables(content)
+        syllable_count = profile.syllable_count
         
         # Flesch Reading Ease
         avg_sentence_length = word_count / sentence_count
@@ -132,8 +133,7 @@ class ReadabilityAnalyzer:
         recommendations = []
         
         # Sentence length variety
-        sentence_lengths = [len(s.split()) for s in sentences]
-        length_variance = ReadabilityAnalyzer._calculate_variance(sentence_lengths)
+        length_variance = ReadabilityAnalyzer._calculate_variance(profile.sentence_lengths)
         
         if length_variance < 5:
             factors.append("Low sentence length variety")
@@ -142,8 +142,7 @@ class ReadabilityAnalyzer:
             factors.append("Good sentence length variety")
         
         # Complex word analysis
-        complex_words = [word for word in words if ReadabilityAnalyzer._is_complex_word(word)]
-        complex_ratio = len(complex_words) / word_count
+        complex_ratio = profile.complex_word_count / word_count
         
         if complex_ratio > 0.15:  # More than 15% complex words
             factors.append("High proportion of complex words")
@@ -178,17 +177,7 @@ class ReadabilityAnalyzer:
     @staticmethod
     def _estimate_syllables(text: str) -> int:
         """Estimate syllable count"""
-        text = re.sub(r'[^a-zA-Z\s]', '', text.lower())
-        words = text.split()
-        
-        total_syllables = 0
-        for word in words:
-            syllables = len(re.findall(r'[aeiouy]+', word))
-            if word.endswith('e'):
-                syllables -= 1
-            total_syllables += max(1, syllables)
-        
-        return total_syllables
+        return text_profile(text).syllable_count
     
     @staticmethod
     def _calculate_variance(numbers: List[float]) -> float:
@@ -207,11 +196,7 @@ class ReadabilityAnalyzer:
         if len(clean_word) < 3:
             return False
         
-        syllables = len(re.findall(r'[aeiouy]+', clean_word))
-        if clean_word.endswith('e'):
-            syllables -= 1
-        
-        return max(1, syllables) >= 3
+        return estimate_syllables(clean_word) >= 3
 
 
 class CoherenceAnalyzer:
@@ -238,11 +223,10 @@ class CoherenceAnalyzer:
             'meanwhile', 'however', 'therefore', 'consequently', 'furthermore', 'moreover'
         ]
         
-        transition_count = sum(1 for word in transition_words 
-                              if re.search(r'\b' + word + r'\b', content, re.IGNORECASE))
+        profile = text_profile(content)
+        transition_count = sum(1 for word in transition_words if profile.has_word(word))
         
-        sentences = [s.strip() for s in re.split(r'[.!?]+', content) if s.strip()]
-        sentence_count = len(sentences)
+        sentence_count = len(profile.sentences)
         
         if sentence_count > 0:
             transition_ratio = transition_count / sentence_count
@@ -257,12 +241,10 @@ class CoherenceAnalyzer:
         
         # Pronoun reference analysis
         pronouns = ['he', 'she', 'it', 'they', 'him', 'her', 'them']
-        pronoun_count = sum(len(re.findall(r'\b' + pronoun + r'\b', content, re.IGNORECASE)) 
-                          for pronoun in pronouns)
+        pronoun_count = profile.count(*pronouns)
         
         if pronoun_count > 0:
-            words = content.split()
-            pronoun_ratio = pronoun_count / len(words)
+            pronoun_ratio = pronoun_count / profile.word_count
             
             if 0.02 <= pronoun_ratio <= 0.08:  # Appropriate range
                 factors.append("Balanced pronoun usage")
@@ -276,10 +258,8 @@ class CoherenceAnalyzer:
         past_tense_indicators = ['was', 'were', 'had', 'did', 'went', 'came', 'said']
         present_tense_indicators = ['is', 'are', 'has', 'does', 'goes', 'comes', 'says']
         
-        past_count = sum(len(re.findall(r'\b' + word + r'\b', content, re.IGNORECASE)) 
-                        for word in past_tense_indicators)
-        present_count = sum(len(re.findall(r'\b' + word + r'\b', content, re.IGNORECASE)) 
-                           for word in present_tense_indicators)
+        past_count = profile.count(*past_tense_indicators)
+        present_count = profile.count(*present_tense_indicators)
         
         if past_count > 0 or present_count > 0:
             total_tense = past_count + present_count
@@ -294,7 +274,7 @@ class CoherenceAnalyzer:
                 coherence_score -= 0.2
         
         # Dialogue integration
-        dialogue_matches = re.findall(r'"[^"]*"', content)
+        dialogue_matches = profile.dialogue
         if dialogue_matches:
             # Check for dialogue tags and attribution
             dialogue_with_tags = 0
@@ -337,8 +317,9 @@ class CoherenceAnalyzer:
         coherence_bonus = 0.0
         
         # Check POV consistency
+        content_lower = text_profile(content).lower
         pov_character = scene_card.pov.lower()
-        if pov_character in content.lower():
+        if pov_character in content_lower:
             factors.append("POV character appears in content")
             coherence_bonus += 0.05
         else:
@@ -346,7 +327,7 @@ class CoherenceAnalyzer:
             recommendations.append("Ensure POV character is clearly present in the scene")
         
         # Check setting consistency
-        if scene_card.place and scene_card.place.lower() in content.lower():
+        if scene_card.place and scene_card.place.lower() in content_lower:
             factors.append("Setting consistent with scene metadata")
             coherence_bonus += 0.05
         
@@ -354,14 +335,14 @@ class CoherenceAnalyzer:
         if scene_card.scene_type == SceneType.PROACTIVE:
             # Look for action and goal-oriented language
             action_words = ['tried', 'attempted', 'sought', 'searched', 'fought', 'ran', 'climbed']
-            if any(word in content.lower() for word in action_words):
+            if any(word in content_lower for word in action_words):
                 factors.append("Content matches proactive scene type")
                 coherence_bonus += 0.1
         
         elif scene_card.scene_type == SceneType.REACTIVE:
             # Look for emotional and reflective language
             emotion_words = ['felt', 'thought', 'realized', 'wondered', 'considered', 'reflected']
-            if any(word in content.lower() for word in emotion_words):
+            if any(word in content_lower for word in emotion_words):
                 factors.append("Content matches reactive scene type")
                 coherence_bonus += 0.1
         
@@ -400,7 +381,7 @@ class QualityMetricsEngine:
             )
         
         # Paragraph analysis
-        paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
+        paragraphs = text_profile(content).paragraphs
         paragraph_count = len(paragraphs)
         
         if paragraph_count >= 3:
@@ -457,6 +438,7 @@ class QualityMetricsEngine:
         """Assess alignment with scene structure requirements"""
         
         alignment_score = 0.0
+        profile = text_profile(content)
         
         if scene_card.scene_type == SceneType.PROACTIVE and scene_card.proactive:
             # Check for goal, conflict, setback indicators
@@ -464,9 +446,9 @@ class QualityMetricsEngine:
             conflict_indicators = ['but', 'however', 'unfortunately', 'blocked', 'stopped']
             setback_indicators = ['failed', 'couldn\'t', 'impossible', 'too late']
             
-            has_goal = any(indicator in content.lower() for indicator in goal_indicators)
-            has_conflict = any(indicator in content.lower() for indicator in conflict_indicators)
-            has_setback = any(indicator in content.lower() for indicator in setback_indicators)
+            has_goal = profile.contains_any(goal_indicators)
+            has_conflict = profile.contains_any(conflict_indicators)
+            has_setback = profile.contains_any(setback_indicators)
             
             if has_goal and has_conflict and has_setback:
                 factors.append("Clear Goal-Conflict-Setback structure")
@@ -486,9 +468,9 @@ class QualityMetricsEngine:
             dilemma_indicators = ['choice', 'decision', 'options', 'what if', 'should']
             decision_indicators = ['decided', 'chose', 'would', 'must', 'going to']
             
-            has_reaction = any(indicator in content.lower() for indicator in reaction_indicators)
-            has_dilemma = any(indicator in content.lower() for indicator in dilemma_indicators)
-            has_decision = any(indicator in content.lower() for indicator in decision_indicators)
+            has_reaction = profile.contains_any(reaction_indicators)
+            has_dilemma = profile.contains_any(dilemma_indicators)
+            has_decision = profile.contains_any(decision_indicators)
             
             if has_reaction and has_dilemma and has_decision:
                 factors.append("Clear Reaction-Dilemma-Decision structure")
@@ -519,12 +501,10 @@ class QualityMetricsEngine:
             )
         
         # Dialogue presence and quality
-        dialogue_matches = re.findall(r'"[^"]*"', content)
-        words = content.split()
+        profile = text_profile(content)
         
-        if dialogue_matches and words:
-            dialogue_words = sum(len(match.split()) for match in dialogue_matches)
-            dialogue_ratio = dialogue_words / len(words)
+        if profile.dialogue and profile.word_count:
+            dialogue_ratio = profile.dialogue_word_count / profile.word_count
             
             if 0.2 <= dialogue_ratio <= 0.6:  # Good balance
                 factors.append("Good dialogue-to-narrative balance")
@@ -545,8 +525,7 @@ class QualityMetricsEngine:
             'tasted', 'bitter', 'sweet', 'salty'  # Gustatory
         ]
         
-        sensory_count = sum(1 for word in sensory_words 
-                          if re.search(r'\b' + word + r'\b', content, re.IGNORECASE))
+        sensory_count = sum(1 for word in sensory_words if profile.has_word(word))
         
         if sensory_count >= 3:
             factors.append("Rich sensory details")
@@ -561,8 +540,7 @@ class QualityMetricsEngine:
             'frustrated', 'delighted', 'worried', 'confident', 'surprised'
         ]
         
-        emotion_count = sum(1 for word in emotion_words 
-                          if re.search(r'\b' + word + r'\b', content, re.IGNORECASE))
+        emotion_count = sum(1 for word in emotion_words if profile.has_word(word))
         
         if emotion_count >= 2:
             factors.append("Strong emotional content")
@@ -577,8 +555,7 @@ class QualityMetricsEngine:
             'pulled', 'rushed', 'dashed', 'leaped', 'struck'
         ]
         
-        action_count = sum(1 for word in action_words 
-                         if re.search(r'\b' + word + r'\b', content, re.IGNORECASE))
+        action_count = sum(1 for word in action_words if profile.has_word(word))
         
         if action_count >= 2:
             factors.append("Dynamic action elements")
@@ -638,9 +615,8 @@ class QualityMetricsEngine:
             technical_score -= 0.05
         
         # Check for capitalization after periods
-        sentences = re.split(r'[.!?]+\s+', content)
-        lowercase_starts = sum(1 for sentence in sentences[1:] 
-                             if sentence and sentence[0].islower())
+        sentences = text_profile(content).spaced_sentences
+        lowercase_starts = sum(1 for sentence in sentences[1:] if sentence[0].islower())
         
         if lowercase_starts > 0:
             factors.append("Capitalization issues")
@@ -667,11 +643,12 @@ class QualityMetricsEngine:
         factors = []
         recommendations = []
         compliance_score = 0.5  # Start neutral
+        profile = text_profile(content)
+        content_lower = profile.lower
         
         # Scene crucible alignment
         if scene_card.scene_crucible:
             crucible_words = scene_card.scene_crucible.lower().split()
-            content_lower = content.lower()
             
             matching_words = sum(1 for word in crucible_words 
                                if len(word) > 3 and word in content_lower)
@@ -699,12 +676,9 @@ class QualityMetricsEngine:
         if scene_card.scene_type == SceneType.PROACTIVE:
             if scene_card.proactive:
                 # Check for clear goal, conflict, setback progression
-                goal_present = any(word in content.lower() 
-                                 for word in ['wanted', 'needed', 'goal', 'objective'])
-                conflict_present = any(word in content.lower() 
-                                     for word in ['but', 'however', 'obstacle', 'problem'])
-                setback_present = any(word in content.lower() 
-                                    for word in ['failed', 'couldn\'t', 'worse'])
+                goal_present = profile.contains_any(['wanted', 'needed', 'goal', 'objective'])
+                conflict_present = profile.contains_any(['but', 'however', 'obstacle', 'problem'])
+                setback_present = profile.contains_any(['failed', 'couldn\'t', 'worse'])
                 
                 structure_elements = sum([goal_present, conflict_present, setback_present])
                 compliance_score += (structure_elements / 3) * 0.3
@@ -718,12 +692,9 @@ class QualityMetricsEngine:
         elif scene_card.scene_type == SceneType.REACTIVE:
             if scene_card.reactive:
                 # Check for reaction, dilemma, decision progression
-                reaction_present = any(word in content.lower() 
-                                     for word in ['felt', 'realized', 'emotion'])
-                dilemma_present = any(word in content.lower() 
-                                    for word in ['choice', 'decision', 'what if'])
-                decision_present = any(word in content.lower() 
-                                     for word in ['decided', 'chose', 'would'])
+                reaction_present = profile.contains_any(['felt', 'realized', 'emotion'])
+                dilemma_present = profile.contains_any(['choice', 'decision', 'what if'])
+                decision_present = profile.contains_any(['decided', 'chose', 'would'])
                 
                 structure_elements = sum([reaction_present, dilemma_present, decision_present])
                 compliance_score += (structure_elements / 3) * 0.3
@@ -757,11 +728,12 @@ class QualityMetricsEngine:
     def _check_viewpoint_consistency(self, content: str, viewpoint: str) -> float:
         """Check viewpoint consistency throughout content"""
         
+        profile = text_profile(content)
+        
         if viewpoint == "third":
             # Should predominantly use third person pronouns
-            third_person = len(re.findall(r'\b(he|she|him|her|his|hers|they|them|their)\b', 
-                                        content, re.IGNORECASE))
-            first_person = len(re.findall(r'\b(I|me|my|mine)\b', content, re.IGNORECASE))
+            third_person = profile.count('he', 'she', 'him', 'her', 'his', 'hers', 'they', 'them', 'their')
+            first_person = profile.count('i', 'me', 'my', 'mine')
             
             if third_person + first_person == 0:
                 return 0.5  # No clear pronouns
@@ -770,9 +742,8 @@ class QualityMetricsEngine:
         
         elif viewpoint == "first":
             # Should predominantly use first person pronouns
-            first_person = len(re.findall(r'\b(I|me|my|mine)\b', content, re.IGNORECASE))
-            third_person = len(re.findall(r'\b(he|she|him|her|his|hers)\b', 
-                                        content, re.IGNORECASE))
+            first_person = profile.count('i', 'me', 'my', 'mine')
+            third_person = profile.count('he', 'she', 'him', 'her', 'his', 'hers')
             
             if third_person + first_person == 0:
                 return 0.5
@@ -782,12 +753,29 @@ class QualityMetricsEngine:
         return 0.5  # Default for other viewpoints
 
 
+def _quality_band(quality: float) -> str:
+    if quality >= 0.9:
+        return 'excellent'
+    if quality >= 0.7:
+        return 'good'
+    if quality >= 0.5:
+        return 'fair'
+    return 'poor'
+
+
 class QualityAssessmentService:
     """Complete quality assessment service integrating all analyzers"""
     
     def __init__(self):
         self.metrics_engine = QualityMetricsEngine()
-        self.assessment_history = []
+        self.assessment_history = BoundedHistory(
+            fields={
+                'overall_quality': lambda a: a['report'].overall_quality,
+                'content_length': lambda a: a['content_length'],
+                'processing_time': lambda a: a['report'].processing_time_seconds,
+            },
+            keys={'quality_band': lambda a: _quality_band(a['report'].overall_quality)}
+        )
     
     def assess_content_quality(self, content: str, scene_card: Optional[SceneCard] = None,
                              custom_weights: Optional[Dict[QualityDimension, float]] = None) -> QualityReport:
@@ -796,10 +784,8 @@ class QualityAssessmentService:
         start_time = datetime.utcnow()
         content_id = f"quality_{int(start_time.timestamp())}"
         
-        # Basic content statistics
-        words = content.split()
-        sentences = [s.strip() for s in re.split(r'[.!?]+', content) if s.strip()]
-        paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
+        # Basic content statistics (the analyzers below reuse this profile)
+        profile = text_profile(content)
         
         # Perform all assessments
         readability_score = ReadabilityAnalyzer.analyze_readability(content)
@@ -845,9 +831,9 @@ class QualityAssessmentService:
             snowflake_compliance_score=snowflake_score,
             overall_quality=overall_quality,
             weighted_score=weighted_score,
-            word_count=len(words),
-            sentence_count=len(sentences),
-            paragraph_count=len(paragraphs),
+            word_count=profile.word_count,
+            sentence_count=len(profile.sentences),
+            paragraph_count=len(profile.paragraphs),
             processing_time_seconds=processing_time,
             analysis_completeness=1.0
         )
@@ -897,7 +883,7 @@ class QualityAssessmentService:
         if len(self.assessment_history) < 2:
             return {'message': 'Insufficient data for trend analysis'}
         
-        recent_assessments = self.assessment_history[-limit:]
+        recent_assessments = self.assessment_history.recent(limit)
         
         # Calculate trend for overall quality
         overall_scores = [assessment['report'].overall_quality for assessment in recent_assessments]
@@ -987,29 +973,16 @@ class QualityAssessmentService:
         if not self.assessment_history:
             return {'total_assessments': 0}
         
-        total_assessments = len(self.assessment_history)
-        
-        # Average quality scores
-        overall_qualities = [assessment['report'].overall_quality for assessment in self.assessment_history]
-        avg_overall_quality = sum(overall_qualities) / len(overall_qualities)
-        
-        # Content length statistics
-        content_lengths = [assessment['content_length'] for assessment in self.assessment_history]
-        avg_content_length = sum(content_lengths) / len(content_lengths)
-        
-        # Processing time statistics
-        processing_times = [assessment['report'].processing_time_seconds for assessment in self.assessment_history]
-        avg_processing_time = sum(processing_times) / len(processing_times)
+        # Lifetime aggregates kept by the history, so no rescan of retained reports
+        quality = self.assessment_history.stats('overall_quality')
+        bands = self.assessment_history.counts('quality_band')
         
         return {
-            'total_assessments': total_assessments,
-            'average_overall_quality': avg_overall_quality,
-            'average_content_length': avg_content_length,
-            'average_processing_time': avg_processing_time,
+            'total_assessments': self.assessment_history.total,
+            'average_overall_quality': quality['mean'],
+            'average_content_length': self.assessment_history.stats('content_length')['mean'],
+            'average_processing_time': self.assessment_history.stats('processing_time')['mean'],
             'quality_distribution': {
-                'excellent': sum(1 for q in overall_qualities if q >= 0.9),
-                'good': sum(1 for q in overall_qualities if 0.7 <= q < 0.9),
-                'fair': sum(1 for q in overall_qualities if 0.5 <= q < 0.7),
-                'poor': sum(1 for q in overall_qualities if q < 0.5)
+                band: bands.get(band, 0) for band in ('excellent', 'good', 'fair', 'poor')
             }
         }
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""
+Unit tests for the shared text profile
+
+Tests tokenization, sentence and dialogue extraction, syllable estimates,
+whole-word counts and memoization.
+"""
+
+from ..text_profile import text_profile, estimate_syllables
+
+
+class TestTextProfile:
+    """Test the single-pass text profile"""
+
+    def test_tokens_sentences_and_paragraphs(self):
+        """Test the basic splits"""
+        profile = text_profile('He ran. She said "stop now!"\n\nThe end came quickly...')
+
+        assert profile.word_count == 10
+        assert profile.sentences == ('He ran', 'She said "stop now', '"\n\nThe end came quickly')
+        assert profile.sentence_lengths == (2, 4, 5)
+        assert profile.sentence_pieces[-1] == ''
+        assert profile.spaced_sentences == ('He ran', 'She said "stop now!"\n\nThe end came quickly...')
+        assert len(profile.paragraphs) == 2
+
+    def test_dialogue_and_word_counts(self):
+        """Test dialogue spans and whole-word counting"""
+        profile = text_profile('"I know," he said. "He knows," I said. Theme: them.')
+
+        assert profile.dialogue == ('"I know,"', '"He knows,"')
+        assert profile.dialogue_word_count == 4
+        assert profile.count('i') == 2
+        assert profile.count('he', 'them') == 3  # 'Theme' is not 'them'
+        assert profile.has_word('knows') and not profile.has_word('know,')
+        assert profile.contains_any(['theme:'])
+
+    def test_syllables(self):
+        """Test syllable and complex-word estimates"""
+        assert estimate_syllables('cake') == 1
+        assert estimate_syllables('beautiful') == 3
+
+        profile = text_profile('Beautiful cake -- 42')
+        assert profile.syllable_count == 4  # tokens without letters are skipped
+        assert profile.complex_word_count == 1
+
+    def test_profiles_are_memoized(self):
+        """Test the same content reuses one profile"""
+        content = 'The same scene, assessed by every analyzer.'
+        assert text_profile(content) is text_profile(''.join([content]))
@@ -0,0 +1,116 @@
+"""
+Shared Text Profile for Scene Engine Analyzers
+
+Tokenizes prose once and keeps the pieces every analyzer needs: whitespace
+tokens, sentence splits, syllable estimates, dialogue spans, paragraphs and
+lowercase word counts. Profiles are memoized by content, so the quality,
+triage, refinement, persistence and POV analyzers assessing the same scene
+share one tokenization.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Tuple
+
+PROFILE_CACHE_SIZE = 256
+
+_SENTENCE_BREAK = re.compile(r'[.!?]+')
+_SPACED_SENTENCE_BREAK = re.compile(r'[.!?]+\s+')
+_DIALOGUE = re.compile(r'"[^"]*"')
+_WORD = re.compile(r'\w+')
+_NON_ALPHA = re.compile(r'[^a-zA-Z]')
+_VOWEL_GROUP = re.compile(r'[aeiouy]+')
+
+
+def estimate_syllables(word: str) -> int:
+    """Vowel groups in a lowercase alphabetic word, less a silent final 'e' (at least 1)"""
+    syllables = len(_VOWEL_GROUP.findall(word))
+    if word.endswith('e'):
+        syllables -= 1
+    return max(1, syllables)
+
+
+@dataclass(frozen=True)
+class TextProfile:
+    """
+    Tokenized view of one piece of prose.
+
+    Profiles are shared between callers through the cache, so treat every
+    field (including ``word_counts``) as read-only.
+    """
+    text: str
+    lower: str
+    tokens: Tuple[str, ...]            # content.split()
+    lower_tokens: Tuple[str, ...]      # tokens lowercased, punctuation kept
+    sentence_pieces: Tuple[str, ...]   # raw split on runs of . ! ?, empty pieces included
+    sentences: Tuple[str, ...]         # sentence_pieces stripped, empty ones dropped
+    spaced_sentences: Tuple[str, ...]  # split only where . ! ? is followed by whitespace
+    sentence_lengths: Tuple[int, ...]  # whitespace tokens per sentence
+    paragraphs: Tuple[str, ...]        # non-empty blocks between blank lines
+    dialogue: Tuple[str, ...]          # double-quoted spans, quotes included
+    syllable_count: int
+    complex_word_count: int            # tokens of 3+ letters and 3+ syllables
+    word_counts: Counter               # lowercase \w+ runs (pronouns, tense markers, keywords)
+
+    @property
+    def word_count(self) -> int:
+        return len(self.tokens)
+
+    @property
+    def dialogue_word_count(self) -> int:
+        return sum(len(span.split()) for span in self.dialogue)
+
+    def count(self, *words: str) -> int:
+        """Occurrences of the given lowercase words, matched as whole words"""
+        return sum(self.word_counts[word] for word in words)
+
+    def has_word(self, word: str) -> bool:
+        return self.word_counts[word] > 0
+
+    def contains_any(self, phrases: Iterable[str]) -> bool:
+        """Case-insensitive substring test, for phrases and word stems"""
+        return any(phrase in self.lower for phrase in phrases)
+
+
+def _build_profile(content: str) -> TextProfile:
+    lower = content.lower()
+    tokens = tuple(content.split())
+    lower_tokens = tuple(token.lower() for token in tokens)
+
+    syllable_count = 0
+    complex_word_count = 0
+    for token in lower_tokens:
+        letters = _NON_ALPHA.sub('', token)
+        if not letters:
+            continue
+        syllables = estimate_syllables(letters)
+        syllable_count += syllables
+        if len(letters) >= 3 and syllables >= 3:
+            complex_word_count += 1
+
+    sentence_pieces = tuple(_SENTENCE_BREAK.split(content))
+    sentences = tuple(s.strip() for s in sentence_pieces if s.strip())
+
+    return TextProfile(
+        text=content,
+        lower=lower,
+        tokens=tokens,
+        lower_tokens=lower_tokens,
+        sentence_pieces=sentence_pieces,
+        sentences=sentences,
+        spaced_sentences=tuple(s.strip() for s in _SPACED_SENTENCE_BREAK.split(content) if s.strip()),
+        sentence_lengths=tuple(len(s.split()) for s in sentences),
+        paragraphs=tuple(p.strip() for p in content.split('\n\n') if p.strip()),
+        dialogue=tuple(_DIALOGUE.findall(content)),
+        syllable_count=syllable_count,
+        complex_word_count=complex_word_count,
+        word_counts=Counter(_WORD.findall(lower)),
+    )
+
+
+@lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def text_profile(content: str) -> TextProfile:
+    """Profile of ``content``, computed once and reused while it stays in the LRU cache"""
+    return _build_profile(content)
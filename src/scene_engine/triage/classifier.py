@@ -9,11 +9,11 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import logging
-import re
 
 from ..models import SceneCard, SceneType
 from ..validation.service import ValidationReport
 from .service import TriageDecision
+from ..text_profile import text_profile
 
 
 @dataclass  
@@ -156,7 +156,7 @@ class TriageClassifier:
         # Prose quality score if prose available
         if prose_content:
             metrics.prose_quality_score = self._calculate_prose_quality_score(prose_content, criteria)
-            metrics.word_count = len(prose_content.split())
+            metrics.word_count = text_profile(prose_content).word_count
             metrics.dialogue_percentage = self._calculate_dialogue_percentage(prose_content)
             metrics.exposition_percentage = self._estimate_exposition_percentage(prose_content)
             metrics.pov_consistency = self._analyze_pov_consistency(prose_content)
@@ -228,8 +228,10 @@ class TriageClassifier:
         
         score = 0.0
         
+        profile = text_profile(prose_content)
+        
         # Word count within acceptable range
-        word_count = len(prose_content.split())
+        word_count = profile.word_count
         if criteria.min_word_count <= word_count <= criteria.max_word_count:
             score += 0.2
         elif word_count < criteria.min_word_count:
@@ -238,11 +240,10 @@ class TriageClassifier:
             score += max(0, 0.2 * (criteria.max_word_count / word_count))
         
         # Sentence variety and structure
-        sentences = re.split(r'[.!?]+', prose_content)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = profile.sentences
         
         if sentences:
-            avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences)
+            avg_sentence_length = sum(profile.sentence_lengths) / len(sentences)
             if 8 <= avg_sentence_length <= 20:  # Good range
                 score += 0.15
         
@@ -256,7 +257,7 @@ class TriageClassifier:
             score += 0.2
         
         # Vocabulary variety (simplified check)
-        words = prose_content.lower().split()
+        words = profile.lower_tokens
         unique_words = len(set(words))
         vocabulary_ratio = unique_words / len(words) if words else 0
         if vocabulary_ratio > 0.6:  # Good vocabulary variety
@@ -437,7 +438,7 @@ class TriageClassifier:
     
     def _calculate_dialogue_percentage(self, prose: str) -> float:
         """Calculate percentage of content that is dialogue"""
-        words = prose.split()
+        words = text_profile(prose).tokens
         dialogue_words = 0
         in_dialogue = False
         
@@ -452,15 +453,18 @@ class TriageClassifier:
     def _estimate_exposition_percentage(self, prose: str) -> float:
         """Estimate exposition percentage (simplified)"""
         exposition_indicators = ['had been', 'years ago', 'in the past', 'used to', 'was known for']
-        words = prose.lower().split()
-        exposition_words = sum(1 for word in words if any(indicator in prose.lower() for indicator in exposition_indicators))
+        profile = text_profile(prose)
+        words = profile.tokens
+        # Every word counts once any indicator appears anywhere in the prose
+        exposition_words = len(words) if profile.contains_any(exposition_indicators) else 0
         
         return min(0.5, exposition_words / len(words)) if words else 0.0
     
     def _analyze_pov_consistency(self, prose: str) -> float:
         """Analyze POV consistency (simplified)"""
-        first_person_count = prose.lower().count(' i ') + prose.lower().count(' my ')
-        third_person_count = prose.lower().count(' he ') + prose.lower().count(' she ') + prose.lower().count(' they ')
+        prose_lower = text_profile(prose).lower
+        first_person_count = prose_lower.count(' i ') + prose_lower.count(' my ')
+        third_person_count = prose_lower.count(' he ') + prose_lower.count(' she ') + prose_lower.count(' they ')
         
         if first_person_count + third_person_count == 0:
             return 0.5  # Neutral
@@ -472,8 +476,9 @@ class TriageClassifier:
     
     def _analyze_tense_consistency(self, prose: str) -> float:
         """Analyze tense consistency (simplified)"""
-        past_indicators = prose.lower().count('was') + prose.lower().count('were') + prose.lower().count('had')
-        present_indicators = prose.lower().count('is') + prose.lower().count('are') + prose.lower().count('am')
+        prose_lower = text_profile(prose).lower
+        past_indicators = prose_lower.count('was') + prose_lower.count('were') + prose_lower.count('had')
+        present_indicators = prose_lower.count('is') + prose_lower.count('are') + prose_lower.count('am')
         
         if past_indicators + present_indicators == 0:
             return 0.5
@@ -486,7 +491,7 @@ class TriageClassifier:
     def _analyze_sensory_details(self, prose: str) -> float:
         """Analyze sensory detail content (simplified)"""
         sensory_words = ['saw', 'heard', 'felt', 'smelled', 'tasted', 'looked', 'sounded', 'seemed']
-        words = prose.lower().split()
+        words = text_profile(prose).lower_tokens
         sensory_count = sum(1 for word in words if word in sensory_words)
         
         return min(1.0, sensory_count / max(len(words) // 25, 1))  # Normalized score
@@ -494,7 +499,7 @@ class TriageClassifier:
     def _analyze_emotional_content(self, prose: str) -> float:
         """Analyze emotional content (simplified)"""
         emotion_words = ['felt', 'angry', 'sad', 'happy', 'fear', 'joy', 'love', 'hate', 'worried', 'excited']
-        words = prose.lower().split()
+        words = text_profile(prose).lower_tokens
         emotion_count = sum(1 for word in words if word in emotion_words)
         
         return min(1.0, emotion_count / max(len(words) // 30, 1))
@@ -503,12 +508,12 @@ class TriageClassifier:
         """Check for good prose flow (simplified)"""
         # Look for transition words and varied sentence starts
         transition_words = ['however', 'meanwhile', 'then', 'but', 'and', 'yet', 'so']
-        return any(word in prose.lower() for word in transition_words)
+        return text_profile(prose).contains_any(transition_words)
     
     def _basic_grammar_check(self, prose: str) -> bool:
         """Basic grammar check (simplified)"""
         # Check for capitalization and punctuation
-        sentences = re.split(r'[.!?]+', prose)
+        sentences = text_profile(prose).sentence_pieces
         properly_capitalized = sum(1 for s in sentences if s.strip() and s.strip()[0].isupper())
         
         return properly_capitalized / len(sentences) > 0.8 if sentences else False
@@ -516,7 +521,7 @@ class TriageClassifier:
     def _check_prose_structure_alignment(self, scene_card: SceneCard, prose: str) -> float:
         """Check if prose aligns with scene card structure (simplified)"""
         
-        prose_lower = prose.lower()
+        prose_lower = text_profile(prose).lower
         alignment_score = 0.5  # Base score
         
         if scene_card.scene_type == SceneType.PROACTIVE and hasattr(scene_card, 'proactive'):
@@ -18,6 +18,7 @@ from ..validation.service import SceneValidationService
 from ..drafting.service import SceneDraftingService, DraftingRequest
 from .corrections import SceneTypeCorrector, PartRewriter, CompressionDecider
 from .emotion_targeting import EmotionTargeter, EmotionTarget
+from ...observability.history import BoundedHistory
 
 
 class RedesignStep(Enum):
@@ -111,7 +112,14 @@ class RedesignPipeline:
         self.drafting_service = SceneDraftingService()
         
         # Pipeline statistics
-        self.redesign_history = []
+        self.redesign_history = BoundedHistory(
+            fields={
+                'quality_improvement': lambda entry: entry['response'].quality_improvement,
+                'attempts': lambda entry: entry['response'].redesign_attempts,
+            },
+            keys={'success': lambda entry: bool(entry['response'].success)}
+        )
+        self.step_usage = {step.value: 0 for step in RedesignStep}
     
     def redesign_scene(self, request: RedesignRequest) -> RedesignResponse:
         """
@@ -249,6 +257,8 @@ class RedesignPipeline:
                 'response': response,
                 'timestamp': start_time
             })
+            for step in response.steps_executed:
+                self.step_usage[step.value] += 1
         
         return response
     
@@ -469,29 +479,17 @@ class RedesignPipeline:
         if not self.redesign_history:
             return {'total_redesigns': 0}
         
-        total_redesigns = len(self.redesign_history)
-        successful_redesigns = sum(1 for entry in self.redesign_history if entry['response'].success)
-        
-        # Step usage statistics
-        step_usage = {step.value: 0 for step in RedesignStep}
-        for entry in self.redesign_history:
-            for step in entry['response'].steps_executed:
-                step_usage[step.value] += 1
-        
-        # Quality improvement statistics
-        quality_improvements = [entry['response'].quality_improvement for entry in self.redesign_history]
-        avg_quality_improvement = sum(quality_improvements) / len(quality_improvements)
-        
-        # Attempt statistics
-        attempt_counts = [entry['response'].redesign_attempts for entry in self.redesign_history]
-        avg_attempts = sum(attempt_counts) / len(attempt_counts)
+        # Lifetime aggregates kept by the history, so no rescan of retained redesigns
+        total_redesigns = self.redesign_history.total
+        successful_redesigns = self.redesign_history.counts('success').get(True, 0)
+        step_usage = dict(self.step_usage)
         
         return {
             'total_redesigns': total_redesigns,
             'successful_redesigns': successful_redesigns,
             'success_rate': successful_redesigns / total_redesigns,
-            'average_quality_improvement': avg_quality_improvement,
-            'average_attempts': avg_attempts,
+            'average_quality_improvement': self.redesign_history.stats('quality_improvement')['mean'],
+            'average_attempts': self.redesign_history.stats('attempts')['mean'],
             'step_usage_counts': step_usage,
             'step_usage_percentages': {
                 step: (count / total_redesigns * 100) if total_redesigns > 0 else 0
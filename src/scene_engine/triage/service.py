@@ -16,6 +16,7 @@ from ..validation.service import SceneValidationService, ValidationReport
 from ..drafting.service import SceneDraftingService, DraftingRequest
 from .classifier import TriageClassifier, ClassificationCriteria
 from .redesign import RedesignPipeline, RedesignRequest
+from ...observability.history import BoundedHistory
 
 
 class TriageDecision(Enum):
@@ -102,8 +103,21 @@ class SceneTriageService:
         self.redesign_pipeline = RedesignPipeline()
         
         # Statistics
-        self.triage_history = []
+        self.triage_history = BoundedHistory(
+            fields={
+                'processing_time': lambda entry: entry['response'].processing_time_seconds,
+                'classification_score': lambda entry: entry['response'].classification_score,
+            },
+            keys={
+                # True/False for redesigns that succeeded/failed; skipped when none was applied
+                'redesign_success': lambda entry: (
+                    bool(entry['response'].redesign_results.get('success', False))
+                    if entry['response'].redesign_applied else None
+                ),
+            }
+        )
         self.decision_counts = {decision.value: 0 for decision in TriageDecision}
+        self.component_counts: Dict[str, int] = {}
         
     def evaluate_scene(self, request: TriageRequest) -> TriageResponse:
         """
@@ -194,6 +208,8 @@ class SceneTriageService:
                 'response': response,
                 'timestamp': start_time
             })
+            for component in response.components_evaluated:
+                self.component_counts[component] = self.component_counts.get(component, 0) + 1
         
         return response
     
@@ -313,17 +329,15 @@ class SceneTriageService:
         if not self.triage_history:
             return {'total_evaluations': 0}
         
-        total_evaluations = len(self.triage_history)
-        
-        # Calculate averages
-        avg_processing_time = sum(entry['response'].processing_time_seconds for entry in self.triage_history) / total_evaluations
-        avg_classification_score = sum(entry['response'].classification_score for entry in self.triage_history) / total_evaluations
+        # Lifetime aggregates kept by the history, so no rescan of retained evaluations
+        total_evaluations = self.triage_history.total
+        avg_processing_time = self.triage_history.stats('processing_time')['mean']
+        avg_classification_score = self.triage_history.stats('classification_score')['mean']
         
         # Redesign statistics
-        redesign_applied_count = sum(1 for entry in self.triage_history if entry['response'].redesign_applied)
-        successful_redesigns = sum(1 for entry in self.triage_history 
-                                 if entry['response'].redesign_applied and 
-                                    entry['response'].redesign_results.get('success', False))
+        redesigns = self.triage_history.counts('redesign_success')
+        redesign_applied_count = sum(redesigns.values())
+        successful_redesigns = redesigns.get(True, 0)
         
         return {
             'total_evaluations': total_evaluations,
@@ -345,12 +359,8 @@ class SceneTriageService:
     def _calculate_component_usage_stats(self) -> Dict[str, Any]:
         """Calculate component usage statistics"""
         
-        component_counts = {}
-        total_evaluations = len(self.triage_history)
-        
-        for entry in self.triage_history:
-            for component in entry['response'].components_evaluated:
-                component_counts[component] = component_counts.get(component, 0) + 1
+        component_counts = dict(self.component_counts)
+        total_evaluations = self.triage_history.total
         
         component_percentages = {
             component: (count / total_evaluations * 100) if total_evaluations > 0 else 0
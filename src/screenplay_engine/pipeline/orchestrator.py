@@ -3,10 +3,14 @@ Screenplay Engine Orchestrator
 Runs the 9-step Save the Cat pipeline from Snowflake input to formatted screenplay.
 """
 
+import os
 import json
 import hashlib
 import time
 import logging
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
@@ -19,6 +23,10 @@ from src.screenplay_engine.models import (
     BeatSheet, TheBoard, Screenplay, MarketingValidation,
     LawResult, DiagnosticResult,
 )
+from src.pipeline.artifact_store import get_artifact_store
+from src.ai.telemetry import call_tags
+from src.observability.tracing import trace_run, span, trace_dir
+from src.observability.metrics import get_pipeline_metrics
 
 
 class ScreenplayPipeline:
@@ -63,11 +71,32 @@ class ScreenplayPipeline:
     # Max revision attempts per checkpoint
     MAX_CHECKPOINT_REVISIONS = 2
 
-    def __init__(self, project_dir: str = "artifacts", screenplay_mode: str = "act_by_act"):
+    # Steps that don't feed their own checkpoint and can run while it does.
+    # They consume the checked step's artifact, so they are re-run if a
+    # revision changes it.
+    SPECULATIVE_BRANCHES = {
+        3: ["3b", "3c"],
+        5: ["5b"],
+    }
+
+    def __init__(self, project_dir: str = "artifacts", screenplay_mode: str = "act_by_act",
+                 speculative_checkpoints: Optional[bool] = None):
+        """
+        Args:
+            project_dir: Directory to store artifacts
+            screenplay_mode: "monolithic", "scene_by_scene", or "act_by_act"
+            speculative_checkpoints: Run SPECULATIVE_BRANCHES concurrently with
+                the Step 3/5 checkpoint (env SCREENPLAY_SPECULATIVE_CHECKPOINTS, default off)
+        """
         self.project_dir = Path(project_dir)
         self.project_dir.mkdir(parents=True, exist_ok=True)
         self.current_project_id: Optional[str] = None
         self.screenplay_mode = screenplay_mode  # "monolithic", "scene_by_scene", or "act_by_act"
+        if speculative_checkpoints is None:
+            speculative_checkpoints = os.getenv("SCREENPLAY_SPECULATIVE_CHECKPOINTS", "0").lower() in ("1", "true", "yes")
+        self.speculative_checkpoints = speculative_checkpoints
+        # Speculative branches update project state while a checkpoint runs
+        self._state_lock = threading.Lock()
 
         # Lazy-loaded step executors
         self._steps: Dict[int, Any] = {}
@@ -173,13 +202,19 @@ class ScreenplayPipeline:
         logger.info("STEP %s: %s — START", step_num, step_name)
         t0 = time.time()
         try:
-            success, artifact, message = executor_fn()
+            with call_tags(step=f"sp_step_{step_num}"), \
+                    span(f"step.{step_num}", step=str(step_num), step_name=step_name) as s:
+                success, artifact, message = executor_fn()
+                if s is not None:
+                    s.set(success=success)
         except Exception as exc:
             elapsed = time.time() - t0
             logger.error("STEP %s: %s — EXCEPTION after %.1fs: %s",
                         step_num, step_name, elapsed, exc)
+            get_pipeline_metrics().step_finished("screenplay", step_num, False, elapsed)
             raise
         elapsed = time.time() - t0
+        get_pipeline_metrics().step_finished("screenplay", step_num, success, elapsed)
         status = "PASS" if success else "FAIL"
         logger.info("STEP %s: %s — %s (%.1fs)", step_num, step_name, status, elapsed)
         if not success:
@@ -303,9 +338,13 @@ class ScreenplayPipeline:
         logger.info("=" * 40)
         logger.info("CHECKPOINT after Step %d — START", step_num)
 
-        result = self._checkpoint_runner.run_checkpoint(
-            step_num, ckpt_artifacts, self.current_project_id,
-        )
+        with span("checkpoint.check", step=step_num, revision=0) as s:
+            result = self._checkpoint_runner.run_checkpoint(
+                step_num, ckpt_artifacts, self.current_project_id,
+            )
+            if s is not None:
+                s.set(checks_passed=result.checks_passed, checks_run=result.checks_run)
+        self._record_checkpoint_metrics(step_num, result)
 
         if result.passed:
             logger.info("CHECKPOINT after Step %d — ALL PASSED (%d/%d)",
@@ -336,9 +375,10 @@ class ScreenplayPipeline:
             logger.info("Revision attempt %d/%d for Step %d",
                        revision_attempt + 1, self.MAX_CHECKPOINT_REVISIONS, step_num)
 
-            revised_artifact = self._call_step_revise(
-                step_num, revision_reason, all_artifacts, snowflake_artifacts,
-            )
+            with span("checkpoint.revise", step=step_num, revision=revision_attempt + 1):
+                revised_artifact = self._call_step_revise(
+                    step_num, revision_reason, all_artifacts, snowflake_artifacts,
+                )
 
             if revised_artifact is None:
                 logger.warning("Step %d revise() failed or not available, keeping current artifact",
@@ -349,9 +389,13 @@ class ScreenplayPipeline:
             ckpt_artifacts = self._build_checkpoint_artifacts(
                 step_num, revised_artifact, all_artifacts,
             )
-            result = self._checkpoint_runner.run_checkpoint(
-                step_num, ckpt_artifacts, self.current_project_id,
-            )
+            with span("checkpoint.check", step=step_num, revision=revision_attempt + 1) as s:
+                result = self._checkpoint_runner.run_checkpoint(
+                    step_num, ckpt_artifacts, self.current_project_id,
+                )
+                if s is not None:
+                    s.set(checks_passed=result.checks_passed, checks_run=result.checks_run)
+            self._record_checkpoint_metrics(step_num, result)
 
             # Only keep revision if it scored >= the current best
             if result.checks_passed >= best_score:
@@ -380,6 +424,78 @@ class ScreenplayPipeline:
         )
         return best_artifact
 
+    @staticmethod
+    def _record_checkpoint_metrics(step_num: int, result) -> None:
+        metrics = get_pipeline_metrics()
+        metrics.checkpoint(step_num, result.checks_run - result.checks_passed)
+        metrics.validation("checkpoint", step_num, result.passed)
+
+    def _run_checkpoint_with_speculation(
+        self,
+        step_num: int,
+        artifact: Dict[str, Any],
+        branch: List[str],
+        executors: Dict[Any, Any],
+        all_artifacts: Dict[Any, Dict[str, Any]],
+        snowflake_artifacts: Dict[str, Any],
+    ) -> Optional[Tuple[Any, str]]:
+        """
+        Run a step's checkpoint while its independent branch steps run speculatively.
+
+        The branch is built from the unrevised artifact. If the checkpoint's
+        revision leaves the artifact's content unchanged the speculative
+        results are kept; otherwise they are discarded and the branch is
+        re-run against the revised artifact.
+
+        Returns:
+            None on success, or (step_key, message) for the branch step that failed.
+        """
+        # The checkpoint only reads earlier steps, so it gets its own snapshot
+        # and the branch fills in its keys of all_artifacts on this thread.
+        all_artifacts[step_num] = artifact
+        checkpoint_artifacts = dict(all_artifacts)
+        speculative: Dict[Any, Tuple[bool, str]] = {}
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"checkpoint-{step_num}") as pool:
+            checkpoint = pool.submit(
+                contextvars.copy_context().run,
+                self._run_checkpoint_and_revise, step_num, artifact, checkpoint_artifacts, snowflake_artifacts,
+            )
+            logger.info("Step %d checkpoint running; speculatively starting Steps %s",
+                        step_num, ", ".join(branch))
+            for key in branch:
+                success, branch_artifact, message = executors[key]()
+                speculative[key] = (success, message)
+                if not success:
+                    break
+                all_artifacts[key] = branch_artifact
+            final = checkpoint.result()
+
+        all_artifacts[step_num] = final
+        if self._content_fingerprint(final) == self._content_fingerprint(artifact):
+            logger.info("Step %d unchanged by checkpoint — keeping speculative Steps %s",
+                        step_num, ", ".join(branch))
+            for key, (success, message) in speculative.items():
+                if not success:
+                    return key, message
+            return None
+
+        logger.info("Step %d revised by checkpoint — re-running Steps %s",
+                    step_num, ", ".join(branch))
+        for key in branch:
+            all_artifacts.pop(key, None)
+        for key in branch:
+            success, branch_artifact, message = executors[key]()
+            if not success:
+                return key, message
+            all_artifacts[key] = branch_artifact
+        return None
+
+    @staticmethod
+    def _content_fingerprint(artifact: Dict[str, Any]) -> str:
+        """Hash of an artifact's content, ignoring metadata such as timestamps and versions."""
+        content = {k: v for k, v in artifact.items() if k != "metadata"}
+        return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
     def _build_checkpoint_artifacts(
         self,
         step_num: int,
@@ -635,12 +751,28 @@ class ScreenplayPipeline:
         fail, feeds failures into the step's revise() method (max 2 attempts).
         This catches structural problems incrementally instead of only at the end.
 
+        With speculative_checkpoints enabled, 3b/3c run alongside the Step 3
+        checkpoint and 5b alongside the Step 5 checkpoint; they are re-run only
+        if the revision actually changes the checked artifact.
+
+        Each run is traced (pipeline -> step -> act/checkpoint -> AI call)
+        to <project>/traces/<trace_id>.jsonl.
+
         Args:
             snowflake_artifacts: Dict with keys 'step_0' through 'step_9' from Snowflake output
 
         Returns:
             (success, final_artifact, message)
         """
+        with trace_run("screenplay_pipeline", trace_dir(self.project_dir, self.current_project_id),
+                       project_id=self.current_project_id, mode=self.screenplay_mode) as root:
+            success, artifacts, message = self._run_full_pipeline(snowflake_artifacts)
+            if root is not None:
+                root.set(success=success)
+        return success, artifacts, message
+
+    def _run_full_pipeline(self, snowflake_artifacts: Dict[str, Any]) -> Tuple[bool, Dict[str, Any], str]:
+        """Body of run_full_pipeline, inside the run's trace."""
         artifacts: Dict[Any, Dict[str, Any]] = {}
 
         # Steps 1-6 with new World Bible (3b), Full Cast (3c), Visual Bible (5b).
@@ -683,20 +815,37 @@ class ScreenplayPipeline:
                     self.current_project_id)
         logger.info("=" * 60)
 
+        def generation_failed(step_key, message):
+            elapsed = time.time() - pipeline_t0
+            logger.error(
+                "PIPELINE FAILED at Step %s after %.1fs: %s",
+                step_key,
+                elapsed,
+                self._safe_log_text(message),
+            )
+            return False, artifacts, f"Pipeline failed at Step {step_key} ({self.STEP_NAMES[step_key]}): {message}"
+
+        executors = {step_key: executor for step_key, executor, _ in generation_steps}
+        branches = self.SPECULATIVE_BRANCHES if self.speculative_checkpoints else {}
+        done_speculatively = set()
+
         # Run generation steps (1 → 3b → 3c → 4 → 5 → 5b → 6)
         for step_key, executor, run_ckpt in generation_steps:
+            if step_key in done_speculatively:
+                continue
             success, artifact, message = executor()
             if not success:
-                elapsed = time.time() - pipeline_t0
-                logger.error(
-                    "PIPELINE FAILED at Step %s after %.1fs: %s",
-                    step_key,
-                    elapsed,
-                    self._safe_log_text(message),
-                )
-                return False, artifacts, f"Pipeline failed at Step {step_key} ({self.STEP_NAMES[step_key]}): {message}"
+                return generation_failed(step_key, message)
 
             # Only run diagnostic checkpoints on core STC structure steps (integer keys 1-6)
+            if run_ckpt and isinstance(step_key, int) and step_key in branches:
+                failure = self._run_checkpoint_with_speculation(
+                    step_key, artifact, branches[step_key], executors, artifacts, snowflake_artifacts,
+                )
+                done_speculatively.update(branches[step_key])
+                if failure:
+                    return generation_failed(*failure)
+                continue
             if run_ckpt and isinstance(step_key, int):
                 artifact = self._run_checkpoint_and_revise(
                     step_key, artifact, artifacts, snowflake_artifacts,
@@ -791,6 +940,10 @@ class ScreenplayPipeline:
         if not self.current_project_id:
             return
 
+        with self._state_lock:
+            self._write_project_state(step_number, artifact)
+
+    def _write_project_state(self, step_number: Any, artifact: Dict[str, Any]):
         meta_path = self.project_dir / self.current_project_id / "screenplay_project.json"
 
         try:
@@ -818,8 +971,8 @@ class ScreenplayPipeline:
         except PermissionError:
             pass
 
-    def _load_step_artifact(self, step_number: int) -> Optional[Dict[str, Any]]:
-        """Load a saved step artifact from disk."""
+    def _load_step_artifact(self, step_number: int, copy: bool = True) -> Optional[Dict[str, Any]]:
+        """Load a saved step artifact from disk (copy=False for a shared, read-only artifact)."""
         if not self.current_project_id:
             return None
 
@@ -843,8 +996,7 @@ class ScreenplayPipeline:
             return None
 
         try:
-            with open(artifact_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return get_artifact_store().load(self.current_project_id, step_number, artifact_path, copy=copy)
         except PermissionError:
             return None
 
@@ -1158,34 +1158,35 @@ Generate ALL scenes now. Write FULL scenes, not outlines."""
             format_value=format_value,
         )
 
-        # Inject world, cast, and visual context if available
-        extra_context = ""
-        if world_context:
-            extra_context += f"\nWORLD CONTEXT (from World Bible — use for setting descriptions in action lines):\n{world_context}\n"
-        if cast_context:
-            extra_context += f"\nFULL CAST (from Full Cast Bible — characters with voice profiles and physical descriptions):\n{cast_context}\n"
-        if visual_context:
-            extra_context += f"\nVISUAL STYLE (from Visual Bible — apply to action line descriptions):\n{visual_context}\n"
-
-        if extra_context:
-            # Insert before "SCENE WRITING RULES" section
-            marker = "SCENE WRITING RULES"
-            if marker in user_prompt:
-                idx = user_prompt.index(marker)
-                user_prompt = user_prompt[:idx] + extra_context + "\n" + user_prompt[idx:]
-            else:
-                user_prompt += extra_context
+        # World, cast, and visual context are identical for every call on a
+        # project, so they go in the provider-cacheable prefix
+        shared_context = self._build_shared_context(world_context, cast_context, visual_context)
 
         # Calculate prompt hash for tracking
-        prompt_content = f"{self.SYSTEM_PROMPT}{user_prompt}{self.VERSION}"
+        prompt_content = f"{self.SYSTEM_PROMPT}{shared_context}{user_prompt}{self.VERSION}"
         prompt_hash = hashlib.sha256(prompt_content.encode()).hexdigest()
 
-        return {
+        prompt = {
             "system": self.SYSTEM_PROMPT,
             "user": user_prompt,
             "prompt_hash": prompt_hash,
             "version": self.VERSION,
         }
+        if shared_context:
+            prompt["cache_prefix"] = shared_context
+        return prompt
+
+    @staticmethod
+    def _build_shared_context(world_context: str = "", cast_context: str = "", visual_context: str = "") -> str:
+        """Story-bible context shared by all Step 8 calls for a project (cacheable prefix)."""
+        extra_context = ""
+        if world_context:
+            extra_context += f"\nWORLD CONTEXT (from World Bible — use for setting descriptions in action lines):\n{world_context}\n"
+        if cast_context:
+            extra_context += f"\nFULL CAST (from Full Cast Bible — characters with voice profiles and physical descriptions):\n{cast_context}\n"
+        if visual_context:
+            extra_context += f"\nVISUAL STYLE (from Visual Bible — apply to action line descriptions):\n{visual_context}\n"
+        return extra_context.strip()
 
     def generate_revision_prompt(
         self,
@@ -2970,32 +2971,21 @@ character cues) to fix the problems. Full scenes, not outlines."""
             num_cards=len(act_cards),
         )
 
-        # Inject world, cast, and visual context if available
-        extra_context = ""
-        if world_context:
-            extra_context += f"\nWORLD CONTEXT (from World Bible — use for setting descriptions in action lines):\n{world_context}\n"
-        if cast_context:
-            extra_context += f"\nFULL CAST (from Full Cast Bible — characters with voice profiles and physical descriptions):\n{cast_context}\n"
-        if visual_context:
-            extra_context += f"\nVISUAL STYLE (from Visual Bible — apply to action line descriptions):\n{visual_context}\n"
+        # Stable across all acts -> provider-cacheable prefix
+        shared_context = self._build_shared_context(world_context, cast_context, visual_context)
 
-        if extra_context:
-            marker = "SCENE WRITING RULES"
-            if marker in user_prompt:
-                idx = user_prompt.index(marker)
-                user_prompt = user_prompt[:idx] + extra_context + "\n" + user_prompt[idx:]
-            else:
-                user_prompt += extra_context
-
-        prompt_content = f"{self.ACT_GENERATION_SYSTEM}{user_prompt}{self.VERSION}"
+        prompt_content = f"{self.ACT_GENERATION_SYSTEM}{shared_context}{user_prompt}{self.VERSION}"
         prompt_hash = hashlib.sha256(prompt_content.encode()).hexdigest()
 
-        return {
+        prompt = {
             "system": self.ACT_GENERATION_SYSTEM,
             "user": user_prompt,
             "prompt_hash": prompt_hash,
             "version": self.VERSION,
         }
+        if shared_context:
+            prompt["cache_prefix"] = shared_context
+        return prompt
 
     def generate_act_diagnostic_prompt(
         self,
@@ -12,8 +12,11 @@ import json
 import os
 import re
 import uuid
+import shutil
 import hashlib
 import logging
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List, Set
@@ -23,6 +26,11 @@ logger = logging.getLogger(__name__)
 from src.screenplay_engine.pipeline.validators.step_8_validator import Step8Validator
 from src.screenplay_engine.pipeline.prompts.step_8_prompt import Step8Prompt
 from src.ai.generator import AIGenerator
+from src.ai.stream_json import JSONArrayStreamParser
+from src.ai.telemetry import current_tags
+from src.pipeline.story_state import get_story_state
+from src.observability.tracing import span
+from src.observability.metrics import get_pipeline_metrics
 
 
 # Milestone check definitions for each act break (used by scene_by_scene mode)
@@ -52,6 +60,10 @@ MILESTONE_CHECKS = {
     ),
 }
 
+class ActCheckerError(RuntimeError):
+    """The checker could not produce diagnostics for an act."""
+
+
 # Act boundaries for act-by-act mode
 ACT_DEFINITIONS = [
     ("Act 1", 0, 10),     # Cards 1-10  (Set-Up through Break into Two)
@@ -83,6 +95,8 @@ class Step8Screenplay:
     DEFAULT_REVISION_MAX_TOKENS = 24000
     DEFAULT_MAX_REVISIONS = 4
     DEFAULT_CHECKER_RETRIES = 2
+    # Closing scenes compared (and opening scenes reconciled) in pipelined act mode
+    DEFAULT_RECONCILE_SCENES = 2
 
     def __init__(self, project_dir: str = "artifacts"):
         self.project_dir = Path(project_dir)
@@ -198,7 +212,7 @@ class Step8Screenplay:
             visual_context=ctx.get("visual_context", ""),
         )
 
-        raw = self.generator.generate(prompt, model_config)
+        raw = self._stream_monolithic(prompt, model_config)
         screenplay = self._parse_screenplay(raw)
 
         # Add metadata
@@ -219,6 +233,25 @@ class Step8Screenplay:
         scene_count = len(screenplay.get("scenes", []))
         return True, screenplay, f"Monolithic screenplay saved to {save_path} ({scene_count} scenes)"
 
+    def _stream_monolithic(self, prompt: Dict[str, str], model_config: Dict[str, Any]) -> str:
+        """Stream the monolithic response, checking each scene structurally as it completes."""
+        parser = JSONArrayStreamParser("scenes", keep_text=True)
+        try:
+            for chunk in self.generator.stream(prompt, model_config):
+                # One chunk can complete several scenes; index each from where the batch starts
+                batch = parser.feed(chunk)
+                start = parser.count - len(batch)
+                for index, scene in enumerate(batch, start):
+                    is_valid, errors = self.validator.validate_scene(scene, index)
+                    logger.info("MONOLITHIC: scene %d streamed%s", index + 1,
+                                "" if is_valid else f" ({len(errors)} structural errors)")
+        except Exception as e:
+            # Streams are not retried mid-flight; fall back to the retrying call
+            logger.warning("MONOLITHIC: stream failed after %d scenes (%s), retrying without streaming",
+                           parser.count, e)
+            return self.generator.generate(prompt, model_config)
+        return parser.text
+
     # ══════════════════════════════════════════════════════════════════════
     # MODE 2: SCENE-BY-SCENE (v3.0.0 — one scene at a time, GPT self-check)
     # ══════════════════════════════════════════════════════════════════════
@@ -246,6 +279,8 @@ class Step8Screenplay:
         scenes_revised = 0
         scenes_diag_passed = 0
 
+        story_state = get_story_state(self.project_dir, ctx["project_id"])
+
         logger.info("SCENE-BY-SCENE: %d board cards", len(board_cards))
 
         for i, card in enumerate(board_cards):
@@ -254,7 +289,8 @@ class Step8Screenplay:
             logger.info("--- Scene %d/%d (card %d, beat: %s) ---",
                         scene_number, len(board_cards), card_num, card.get("beat", "?"))
 
-            prev_summary = self._build_previous_summary(scenes[-3:])
+            # Compact cached digest of everything written so far
+            prev_summary = story_state.digest(before_scene=scene_number)
 
             # 1. Generate single scene
             prompt = self.prompt_generator.generate_single_scene_prompt(
@@ -325,6 +361,7 @@ class Step8Screenplay:
             if emotion:
                 emotions_seen.add(emotion.lower().strip())
             scenes.append(scene)
+            story_state.update(scene)
 
             if scene_number in milestone_indices:
                 guidance = self._run_milestone_check(
@@ -368,6 +405,10 @@ class Step8Screenplay:
           2. Grok evaluates the act with fresh eyes (9 Ch.7 checks + Covenant of the Arc)
           3. If Grok finds problems, GPT rewrites based on Grok's specific feedback
           4. Move to next act with completed acts as context
+
+        With SCREENPLAY_PIPELINE_ACTS=1 the next act is drafted from this act's
+        first draft while steps 2-3 run; if the revision changes the act's
+        closing scenes, the next act's opening scenes get a reconciliation pass.
         """
         board_cards = ctx["board_cards"]
 
@@ -460,218 +501,80 @@ class Step8Screenplay:
         all_scenes: List[Dict[str, Any]] = []
         acts_revised = 0
         total_grok_failures = 0
+        acts_reconciled = 0
 
-        logger.info("ACT-BY-ACT GENERATION: %d acts, %d total cards", len(acts), len(board_cards))
-
-        for act_idx, (act_label, act_cards) in enumerate(acts):
-            start_scene = len(all_scenes) + 1
-            logger.info("=" * 50)
-            logger.info("ACT %d/%d: %s (%d cards, starting scene %d)",
-                        act_idx + 1, len(acts), act_label, len(act_cards), start_scene)
-
-            # 1. GPT writes all scenes for this act
-            act_prompt = self.prompt_generator.generate_act_prompt(
-                act_cards=act_cards,
-                hero_summary=ctx["hero_summary"],
-                characters_summary=ctx["characters_summary"],
-                genre=ctx["genre"],
-                logline=ctx["logline"],
-                title=ctx["title"],
-                previous_scenes=all_scenes,
-                character_identifiers=ctx["character_identifiers"],
-                act_label=act_label,
-                start_scene_number=start_scene,
-                world_context=ctx.get("world_context", ""),
-                cast_context=ctx.get("cast_context", ""),
-                visual_context=ctx.get("visual_context", ""),
-            )
-
-            writer_label = "Grok" if swap_models else "GPT"
-            logger.info(
-                "Generating %s with %s (temp=%.2f, writer_tokens=%d, checker_tokens=%d)...",
-                act_label,
-                writer_label,
-                float(writer_config.get("temperature", 0.0)),
-                int(writer_config.get("max_tokens", 0)),
-                int(checker_config.get("max_tokens", 0)),
-            )
-            raw = writer.generate(act_prompt, writer_config)
-            act_scenes = self._parse_act_scenes(raw, start_scene)
-
-            if not act_scenes:
-                logger.error("%s: GPT returned no parseable scenes!", act_label)
-                continue
-
-            logger.info("%s: %s generated %d scenes", act_label, writer_label, len(act_scenes))
-
-            # Structural validation on each scene
-            for i, scene in enumerate(act_scenes):
-                scene_idx = len(all_scenes) + i
-                is_valid, errors = self.validator.validate_scene(scene, scene_idx)
-                if not is_valid:
-                    logger.warning("  Scene %d structural: %d errors", scene.get("scene_number", "?"), len(errors))
-
-            # 2. Grok evaluates the act with fresh eyes
-            logger.info("Grok checking %s...", act_label)
-            diag_prompt = self.prompt_generator.generate_act_diagnostic_prompt(
-                act_scenes=act_scenes,
-                hero_name=ctx["hero_name"],
-                antagonist_name=ctx["antagonist_name"],
-                characters_summary=ctx["characters_summary"],
-                character_identifiers=ctx["character_identifiers"],
-                act_label=act_label,
-                previous_scenes=all_scenes,
-            )
-
-            try:
-                diagnostics = self._run_act_checker_with_retry(
-                    checker=checker,
-                    checker_config=checker_config,
-                    diag_prompt=diag_prompt,
-                    act_label=act_label,
-                    phase="initial check",
-                )
-                failures = [d for d in diagnostics if not d.get("passed", True)]
-                passed = sum(1 for d in diagnostics if d.get("passed", True))
-
-                logger.info("Grok %s result: %d/%d passed", act_label, passed, len(diagnostics))
-                for f in failures:
-                    logger.warning("  FAIL: %s — %s", f.get("check_name", "?"),
-                                  f.get("problem_details", "")[:120])
-                    total_grok_failures += 1
+        # Use smaller token limit for targeted scene revisions (not full act)
+        revision_config = dict(writer_config)
+        revision_config["max_tokens"] = revision_tokens  # Targeted rewrites only
 
-            except Exception as e:
-                logger.error("Checker diagnostic failed for %s: %s", act_label, e)
-                return False, {}, (
-                    f"Checker diagnostic failed for {act_label}: {e}. "
-                    "Refusing to continue with unverified act output."
-                )
+        run = {
+            "writer": writer, "writer_config": writer_config,
+            "writer_label": "Grok" if swap_models else "GPT",
+            "checker": checker, "checker_config": checker_config,
+            "revision_config": revision_config, "max_revisions": max_revisions,
+        }
 
-            # 3. Revision loop: Grok found problems → GPT rewrites ONLY broken scenes → Grok re-checks
-            MAX_REVISIONS = max_revisions
-            revision_round = 0
+        # Pipelined mode: act N+1 is drafted from act N's first draft while
+        # act N is still being checked and revised.
+        pipelined = os.getenv("SCREENPLAY_PIPELINE_ACTS", "").lower() in ("1", "true", "yes")
+        reconcile_tail = self._env_int(
+            "SCREENPLAY_RECONCILE_SCENES", self.DEFAULT_RECONCILE_SCENES, minimum=1,
+        )
 
-            # Use smaller token limit for targeted scene revisions (not full act)
-            revision_config = dict(writer_config)
-            revision_config["max_tokens"] = revision_tokens  # Targeted rewrites only
+        logger.info("ACT-BY-ACT GENERATION: %d acts, %d total cards%s",
+                    len(acts), len(board_cards), " (pipelined)" if pipelined else "")
 
-            while failures and revision_round < MAX_REVISIONS:
-                revision_round += 1
+        next_draft: Optional[List[Dict[str, Any]]] = None
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="act-checker") as checker_pool:
+            for act_idx, (act_label, act_cards) in enumerate(acts):
+                start_scene = len(all_scenes) + 1
+                logger.info("=" * 50)
+                logger.info("ACT %d/%d: %s (%d cards, starting scene %d)",
+                            act_idx + 1, len(acts), act_label, len(act_cards), start_scene)
 
-                # Count how many specific scenes are broken
-                failing_scene_nums = set()
-                for f in failures:
-                    for sn in f.get("failing_scene_numbers", []):
-                        failing_scene_nums.add(int(sn))
-                # Fallback: extract scene numbers from problem text
-                if not failing_scene_nums:
-                    import re as _re
-                    for f in failures:
-                        found = _re.findall(r"[Ss]cene\s+(\d+)", f.get("problem_details", ""))
-                        for sn_str in found:
-                            failing_scene_nums.add(int(sn_str))
-
-                logger.info("Revising %s round %d/%d — %d scenes broken (%s), %d checks failing...",
-                            act_label, revision_round, MAX_REVISIONS,
-                            len(failing_scene_nums), sorted(failing_scene_nums),
-                            len(failures))
-
-                revision_prompt = self.prompt_generator.generate_act_revision_prompt(
-                    act_scenes=act_scenes,
-                    failures=failures,
-                    act_cards=act_cards,
-                    hero_summary=ctx["hero_summary"],
-                    characters_summary=ctx["characters_summary"],
-                    character_identifiers=ctx["character_identifiers"],
-                    previous_scenes=all_scenes,
-                    act_label=act_label,
-                    title=ctx["title"],
-                    logline=ctx["logline"],
-                    genre=ctx["genre"],
-                    revision_round=revision_round,
-                )
+                # 1. GPT writes all scenes for this act (unless drafted ahead)
+                if next_draft is not None:
+                    act_scenes = next_draft
+                else:
+                    act_scenes = self._draft_act(run, ctx, act_label, act_cards, all_scenes, start_scene)
+                next_draft = None
 
-                try:
-                    revised_raw = writer.generate(revision_prompt, revision_config)
-                    revised_scenes = self._parse_act_scenes(revised_raw, start_scene)
+                if not act_scenes:
+                    logger.error("%s: GPT returned no parseable scenes!", act_label)
+                    continue
 
-                    if revised_scenes:
-                        # Merge: replace ONLY the revised scenes, keep the rest unchanged
-                        revised_by_num = {s.get("scene_number"): s for s in revised_scenes}
-                        merged_count = 0
-                        for idx, orig_scene in enumerate(act_scenes):
-                            sn = orig_scene.get("scene_number")
-                            if sn in revised_by_num:
-                                act_scenes[idx] = revised_by_num[sn]
-                                merged_count += 1
-                        acts_revised += 1
-                        logger.info("%s revision %d: merged %d revised scenes (of %d broken)",
-                                    act_label, revision_round, merged_count, len(failing_scene_nums))
-                    else:
-                        logger.warning("%s revision %d: GPT returned 0 scenes, keeping previous",
-                                      act_label, revision_round)
-                        break
-                except Exception as e:
-                    logger.error("%s revision %d failed: %s — keeping previous", act_label, revision_round, e)
-                    break
+                draft_scenes = [dict(scene) for scene in act_scenes]
+                has_next = act_idx + 1 < len(acts)
 
-                # Re-evaluate with Grok after revision
-                logger.info("Grok re-checking %s after revision %d...", act_label, revision_round)
-                diag_prompt = self.prompt_generator.generate_act_diagnostic_prompt(
-                    act_scenes=act_scenes,
-                    hero_name=ctx["hero_name"],
-                    antagonist_name=ctx["antagonist_name"],
-                    characters_summary=ctx["characters_summary"],
-                    character_identifiers=ctx["character_identifiers"],
-                    act_label=act_label,
-                    previous_scenes=all_scenes,
+                # 2-3. Grok checks the act and GPT revises; in pipelined mode
+                # the next act is drafted meanwhile from this act's first draft
+                check = checker_pool.submit(
+                    contextvars.copy_context().run,
+                    self._check_and_revise_act, run, ctx, act_label, act_cards, act_scenes, list(all_scenes),
                 )
-
+                if pipelined and has_next:
+                    next_label, next_cards = acts[act_idx + 1]
+                    next_draft = self._draft_act(
+                        run, ctx, next_label, next_cards,
+                        all_scenes + draft_scenes, start_scene + len(draft_scenes),
+                    )
                 try:
-                    diagnostics = self._run_act_checker_with_retry(
-                        checker=checker,
-                        checker_config=checker_config,
-                        diag_prompt=diag_prompt,
-                        act_label=act_label,
-                        phase=f"revision {revision_round} re-check",
+                    act_scenes, revisions, grok_failures = check.result()
+                except ActCheckerError as e:
+                    return False, {}, str(e)
+                acts_revised += revisions
+                total_grok_failures += grok_failures
+
+                # Reconcile the speculative draft only if this act's ending changed
+                if next_draft and self._closing_scenes_changed(draft_scenes, act_scenes, reconcile_tail):
+                    next_label, next_cards = acts[act_idx + 1]
+                    next_draft = self._reconcile_act_opening(
+                        run, ctx, next_label, next_cards, next_draft,
+                        all_scenes + act_scenes, reconcile_tail,
                     )
-                    failures = [d for d in diagnostics if not d.get("passed", True)]
-                    passed = sum(1 for d in diagnostics if d.get("passed", True))
-
-                    logger.info("Grok re-check %s round %d: %d/%d passed",
-                                act_label, revision_round, passed, len(diagnostics))
-                    for f in failures:
-                        failing_nums = f.get("failing_scene_numbers", [])
-                        logger.warning("  STILL FAILING: %s (scenes %s) — %s",
-                                      f.get("check_name", "?"), failing_nums,
-                                      f.get("problem_details", "")[:150])
-                        total_grok_failures += 1
-
-                    if not failures:
-                        logger.info("%s: Grok approved after %d revision(s)", act_label, revision_round)
-
-                except Exception as e:
-                    logger.warning("Checker re-check failed for %s round %d: %s — accepting revised act",
-                                   act_label, revision_round, e)
-                    # Treat Grok re-check failure as non-fatal — the revision was
-                    # applied successfully, only the verification call failed.
-                    # Break out of revision loop and accept the revised act.
-                    failures = []
-                    break
-
-            if not failures and revision_round == 0:
-                logger.info("%s: Grok approved — no revision needed", act_label)
-            elif failures and revision_round >= MAX_REVISIONS:
-                remaining = [f.get("check_name", "?") for f in failures]
-                failing_scenes = set()
-                for f in failures:
-                    for sn in f.get("failing_scene_numbers", []):
-                        failing_scenes.add(int(sn))
-                logger.warning("%s: %d checks still failing after %d revisions: %s (scenes: %s)",
-                              act_label, len(failures), MAX_REVISIONS,
-                              ", ".join(remaining), sorted(failing_scenes))
+                    acts_reconciled += 1
 
-            all_scenes.extend(act_scenes)
+                all_scenes.extend(act_scenes)
 
         # Assemble full screenplay
         logger.info("=" * 50)
@@ -686,6 +589,8 @@ class Step8Screenplay:
         screenplay["metadata"]["acts_revised"] = acts_revised
         screenplay["metadata"]["total_grok_failures"] = total_grok_failures
         screenplay["metadata"]["checker_model"] = checker_config.get("model_name", "unknown")
+        screenplay["metadata"]["pipelined_acts"] = pipelined
+        screenplay["metadata"]["acts_reconciled"] = acts_reconciled
 
         # Full validation
         is_valid, errors = self.validator.validate(screenplay)
@@ -703,6 +608,313 @@ class Step8Screenplay:
             f"({len(all_scenes)} scenes, {acts_revised} acts revised by Grok feedback)"
         )
 
+    def _draft_act(
+        self,
+        run: Dict[str, Any],
+        ctx: Dict[str, Any],
+        act_label: str,
+        act_cards: List[Dict[str, Any]],
+        previous_scenes: List[Dict[str, Any]],
+        start_scene: int,
+    ) -> List[Dict[str, Any]]:
+        """Write the first draft of one act and run structural validation on it."""
+        act_prompt = self.prompt_generator.generate_act_prompt(
+            act_cards=act_cards,
+            hero_summary=ctx["hero_summary"],
+            characters_summary=ctx["characters_summary"],
+            genre=ctx["genre"],
+            logline=ctx["logline"],
+            title=ctx["title"],
+            previous_scenes=previous_scenes,
+            character_identifiers=ctx["character_identifiers"],
+            act_label=act_label,
+            start_scene_number=start_scene,
+            world_context=ctx.get("world_context", ""),
+            cast_context=ctx.get("cast_context", ""),
+            visual_context=ctx.get("visual_context", ""),
+        )
+
+        writer_config = run["writer_config"]
+        logger.info(
+            "Generating %s with %s (temp=%.2f, writer_tokens=%d, checker_tokens=%d)...",
+            act_label,
+            run["writer_label"],
+            float(writer_config.get("temperature", 0.0)),
+            int(writer_config.get("max_tokens", 0)),
+            int(run["checker_config"].get("max_tokens", 0)),
+        )
+        with span("act.draft", act=act_label, start_scene=start_scene) as s:
+            raw = run["writer"].generate(act_prompt, writer_config)
+            act_scenes = self._parse_act_scenes(raw, start_scene)
+            if s is not None:
+                s.set(scenes=len(act_scenes))
+        if not act_scenes:
+            return []
+        get_pipeline_metrics().scenes_drafted("screenplay", len(act_scenes))
+
+        logger.info("%s: %s generated %d scenes", act_label, run["writer_label"], len(act_scenes))
+
+        # Structural validation on each scene
+        for i, scene in enumerate(act_scenes):
+            scene_idx = len(previous_scenes) + i
+            is_valid, errors = self.validator.validate_scene(scene, scene_idx)
+            if not is_valid:
+                logger.warning("  Scene %d structural: %d errors", scene.get("scene_number", "?"), len(errors))
+        return act_scenes
+
+    def _check_and_revise_act(
+        self,
+        run: Dict[str, Any],
+        ctx: Dict[str, Any],
+        act_label: str,
+        act_cards: List[Dict[str, Any]],
+        act_scenes: List[Dict[str, Any]],
+        previous_scenes: List[Dict[str, Any]],
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        """
+        Grok checks one act and GPT rewrites only the broken scenes until it passes.
+
+        Returns:
+            (final act scenes, revision rounds merged, Grok failures seen)
+
+        Raises:
+            ActCheckerError: if the initial check cannot produce diagnostics.
+        """
+        checker = run["checker"]
+        checker_config = run["checker_config"]
+        writer = run["writer"]
+        start_scene = len(previous_scenes) + 1
+        acts_revised = 0
+        total_grok_failures = 0
+
+        # 2. Grok evaluates the act with fresh eyes
+        logger.info("Grok checking %s...", act_label)
+        diag_prompt = self.prompt_generator.generate_act_diagnostic_prompt(
+            act_scenes=act_scenes,
+            hero_name=ctx["hero_name"],
+            antagonist_name=ctx["antagonist_name"],
+            characters_summary=ctx["characters_summary"],
+            character_identifiers=ctx["character_identifiers"],
+            act_label=act_label,
+            previous_scenes=previous_scenes,
+        )
+
+        try:
+            diagnostics = self._run_act_checker_with_retry(
+                checker=checker,
+                checker_config=checker_config,
+                diag_prompt=diag_prompt,
+                act_label=act_label,
+                phase="initial check",
+            )
+            failures = [d for d in diagnostics if not d.get("passed", True)]
+            passed = sum(1 for d in diagnostics if d.get("passed", True))
+
+            logger.info("Grok %s result: %d/%d passed", act_label, passed, len(diagnostics))
+            for f in failures:
+                logger.warning("  FAIL: %s — %s", f.get("check_name", "?"),
+                              f.get("problem_details", "")[:120])
+                total_grok_failures += 1
+
+        except Exception as e:
+            logger.error("Checker diagnostic failed for %s: %s", act_label, e)
+            raise ActCheckerError(
+                f"Checker diagnostic failed for {act_label}: {e}. "
+                "Refusing to continue with unverified act output."
+            ) from e
+
+        # 3. Revision loop: Grok found problems → GPT rewrites ONLY broken scenes → Grok re-checks
+        MAX_REVISIONS = run["max_revisions"]
+        revision_round = 0
+        revision_config = run["revision_config"]
+
+        while failures and revision_round < MAX_REVISIONS:
+            revision_round += 1
+
+            # Count how many specific scenes are broken
+            failing_scene_nums = set()
+            for f in failures:
+                for sn in f.get("failing_scene_numbers", []):
+                    failing_scene_nums.add(int(sn))
+            # Fallback: extract scene numbers from problem text
+            if not failing_scene_nums:
+                for f in failures:
+                    found = re.findall(r"[Ss]cene\s+(\d+)", f.get("problem_details", ""))
+                    for sn_str in found:
+                        failing_scene_nums.add(int(sn_str))
+
+            logger.info("Revising %s round %d/%d — %d scenes broken (%s), %d checks failing...",
+                        act_label, revision_round, MAX_REVISIONS,
+                        len(failing_scene_nums), sorted(failing_scene_nums),
+                        len(failures))
+
+            revision_prompt = self.prompt_generator.generate_act_revision_prompt(
+                act_scenes=act_scenes,
+                failures=failures,
+                act_cards=act_cards,
+                hero_summary=ctx["hero_summary"],
+                characters_summary=ctx["characters_summary"],
+                character_identifiers=ctx["character_identifiers"],
+                previous_scenes=previous_scenes,
+                act_label=act_label,
+                title=ctx["title"],
+                logline=ctx["logline"],
+                genre=ctx["genre"],
+                revision_round=revision_round,
+            )
+
+            try:
+                with span("act.revision", act=act_label, round=revision_round,
+                          failing_scenes=len(failing_scene_nums)):
+                    revised_raw = writer.generate(revision_prompt, revision_config)
+                    revised_scenes = self._parse_act_scenes(revised_raw, start_scene)
+
+                if revised_scenes:
+                    # Merge: replace ONLY the revised scenes, keep the rest unchanged
+                    merged_count = self._merge_revised_scenes(act_scenes, revised_scenes)
+                    acts_revised += 1
+                    logger.info("%s revision %d: merged %d revised scenes (of %d broken)",
+                                act_label, revision_round, merged_count, len(failing_scene_nums))
+                else:
+                    logger.warning("%s revision %d: GPT returned 0 scenes, keeping previous",
+                                  act_label, revision_round)
+                    break
+            except Exception as e:
+                logger.error("%s revision %d failed: %s — keeping previous", act_label, revision_round, e)
+                break
+
+            # Re-evaluate with Grok after revision
+            logger.info("Grok re-checking %s after revision %d...", act_label, revision_round)
+            diag_prompt = self.prompt_generator.generate_act_diagnostic_prompt(
+                act_scenes=act_scenes,
+                hero_name=ctx["hero_name"],
+                antagonist_name=ctx["antagonist_name"],
+                characters_summary=ctx["characters_summary"],
+                character_identifiers=ctx["character_identifiers"],
+                act_label=act_label,
+                previous_scenes=previous_scenes,
+            )
+
+            try:
+                diagnostics = self._run_act_checker_with_retry(
+                    checker=checker,
+                    checker_config=checker_config,
+                    diag_prompt=diag_prompt,
+                    act_label=act_label,
+                    phase=f"revision {revision_round} re-check",
+                )
+                failures = [d for d in diagnostics if not d.get("passed", True)]
+                passed = sum(1 for d in diagnostics if d.get("passed", True))
+
+                logger.info("Grok re-check %s round %d: %d/%d passed",
+                            act_label, revision_round, passed, len(diagnostics))
+                for f in failures:
+                    failing_nums = f.get("failing_scene_numbers", [])
+                    logger.warning("  STILL FAILING: %s (scenes %s) — %s",
+                                  f.get("check_name", "?"), failing_nums,
+                                  f.get("problem_details", "")[:150])
+                    total_grok_failures += 1
+
+                if not failures:
+                    logger.info("%s: Grok approved after %d revision(s)", act_label, revision_round)
+
+            except Exception as e:
+                logger.warning("Checker re-check failed for %s round %d: %s — accepting revised act",
+                               act_label, revision_round, e)
+                # Treat Grok re-check failure as non-fatal — the revision was
+                # applied successfully, only the verification call failed.
+                # Break out of revision loop and accept the revised act.
+                failures = []
+                break
+
+        if not failures and revision_round == 0:
+            logger.info("%s: Grok approved — no revision needed", act_label)
+        elif failures and revision_round >= MAX_REVISIONS:
+            remaining = [f.get("check_name", "?") for f in failures]
+            failing_scenes = set()
+            for f in failures:
+                for sn in f.get("failing_scene_numbers", []):
+                    failing_scenes.add(int(sn))
+            logger.warning("%s: %d checks still failing after %d revisions: %s (scenes: %s)",
+                          act_label, len(failures), MAX_REVISIONS,
+                          ", ".join(remaining), sorted(failing_scenes))
+
+        return act_scenes, acts_revised, total_grok_failures
+
+    @staticmethod
+    def _merge_revised_scenes(act_scenes: List[Dict[str, Any]], revised_scenes: List[Dict[str, Any]]) -> int:
+        """Replace scenes in place by scene_number; returns how many were replaced."""
+        revised_by_num = {s.get("scene_number"): s for s in revised_scenes}
+        merged_count = 0
+        for idx, orig_scene in enumerate(act_scenes):
+            sn = orig_scene.get("scene_number")
+            if sn in revised_by_num:
+                act_scenes[idx] = revised_by_num[sn]
+                merged_count += 1
+        return merged_count
+
+    @staticmethod
+    def _closing_scenes_changed(draft: List[Dict[str, Any]], final: List[Dict[str, Any]], tail: int) -> bool:
+        """True if revision changed any of the act's last ``tail`` scenes."""
+        def fingerprint(scenes):
+            return json.dumps(scenes[-tail:], sort_keys=True, default=str)
+        return fingerprint(draft) != fingerprint(final)
+
+    def _reconcile_act_opening(
+        self,
+        run: Dict[str, Any],
+        ctx: Dict[str, Any],
+        act_label: str,
+        act_cards: List[Dict[str, Any]],
+        act_scenes: List[Dict[str, Any]],
+        previous_scenes: List[Dict[str, Any]],
+        tail: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Cheap continuity pass for an act drafted ahead of its predecessor's revision.
+
+        Rewrites only the act's opening ``tail`` scenes so they follow on from
+        the revised ending; the rest of the draft is kept. The act still gets
+        its own full Grok check afterwards.
+        """
+        opening = [s.get("scene_number") for s in act_scenes[:tail]]
+        logger.info("%s: previous act's closing scenes were revised — reconciling scenes %s",
+                    act_label, opening)
+        fix = ("The closing scenes of the previous act were revised after this act was drafted. "
+               "Rewrite this scene so it follows on directly from the revised ending "
+               "(character positions, information, emotional state), keeping its board card beat.")
+        continuity_failure = {
+            "check_name": "Continuity With Previous Act",
+            "passed": False,
+            "failing_scene_numbers": opening,
+            "fix_per_scene": {str(sn): fix for sn in opening},
+            "problem_details": "Opening scenes were drafted against an earlier version of the previous act.",
+            "fix_suggestion": fix,
+        }
+        prompt = self.prompt_generator.generate_act_revision_prompt(
+            act_scenes=act_scenes,
+            failures=[continuity_failure],
+            act_cards=act_cards,
+            hero_summary=ctx["hero_summary"],
+            characters_summary=ctx["characters_summary"],
+            character_identifiers=ctx["character_identifiers"],
+            previous_scenes=previous_scenes,
+            act_label=act_label,
+            title=ctx["title"],
+            logline=ctx["logline"],
+            genre=ctx["genre"],
+        )
+        try:
+            with span("act.reconcile", act=act_label, scenes=len(opening)):
+                raw = run["writer"].generate(prompt, run["revision_config"])
+                revised = self._parse_act_scenes(raw, len(previous_scenes) + 1)
+        except Exception as e:
+            logger.warning("%s reconciliation failed: %s — keeping speculative draft", act_label, e)
+            return act_scenes
+        merged = self._merge_revised_scenes(act_scenes, revised)
+        logger.info("%s: reconciled %d opening scenes", act_label, merged)
+        return act_scenes
+
     def _split_into_acts(self, board_cards: List[Dict[str, Any]]) -> List[Tuple[str, List[Dict[str, Any]]]]:
         """Split board cards into acts based on ACT_DEFINITIONS."""
         acts = []
@@ -761,31 +973,36 @@ class Step8Screenplay:
         )
         last_error: Optional[Exception] = None
 
-        for attempt in range(1, retries + 1):
-            try:
-                diag_raw = checker.generate(diag_prompt, checker_config)
-                logger.debug(
-                    "Grok %s raw attempt %d/%d (%d chars): %s",
-                    phase, attempt, retries, len(diag_raw), diag_raw[:500],
-                )
-                diagnostics = self._extract_diagnostics_from_raw(diag_raw, act_label)
-                return diagnostics
-            except Exception as exc:
-                last_error = exc
-                if attempt < retries:
-                    logger.warning(
-                        "Checker %s failed for %s (attempt %d/%d): %s; retrying",
-                        phase, act_label, attempt, retries, exc,
-                    )
-                else:
-                    logger.error(
-                        "Checker %s failed for %s after %d/%d attempts: %s",
-                        phase, act_label, attempt, retries, exc,
+        with span("act.checker", act=act_label, phase=phase) as s:
+            for attempt in range(1, retries + 1):
+                if s is not None:
+                    s.set(attempts=attempt)
+                try:
+                    diag_raw = checker.generate(diag_prompt, checker_config)
+                    logger.debug(
+                        "Grok %s raw attempt %d/%d (%d chars): %s",
+                        phase, attempt, retries, len(diag_raw), diag_raw[:500],
                     )
+                    diagnostics = self._extract_diagnostics_from_raw(diag_raw, act_label)
+                    get_pipeline_metrics().validation("act_checker", current_tags().get("step", ""), True)
+                    return diagnostics
+                except Exception as exc:
+                    last_error = exc
+                    get_pipeline_metrics().validation("act_checker", current_tags().get("step", ""), False)
+                    if attempt < retries:
+                        logger.warning(
+                            "Checker %s failed for %s (attempt %d/%d): %s; retrying",
+                            phase, act_label, attempt, retries, exc,
+                        )
+                    else:
+                        logger.error(
+                            "Checker %s failed for %s after %d/%d attempts: %s",
+                            phase, act_label, attempt, retries, exc,
+                        )
 
-        raise last_error or RuntimeError(
-            f"Checker {phase} failed for {act_label} with unknown error"
-        )
+            raise last_error or RuntimeError(
+                f"Checker {phase} failed for {act_label} with unknown error"
+            )
 
     def _extract_diagnostics_from_raw(
         self,
@@ -1272,30 +1489,6 @@ class Step8Screenplay:
             return ""
         return "\n\n".join(sections)
 
-    def _build_previous_summary(self, last_n_scenes: List[Dict[str, Any]]) -> str:
-        """Build continuity summary from last N scenes (slugline + conflict + emotional arc)."""
-        if not last_n_scenes:
-            return ""
-
-        parts = []
-        for s in last_n_scenes:
-            num = s.get("scene_number", "?")
-            slug = s.get("slugline", "?")
-            conflict = s.get("conflict", "?")
-            e_start = s.get("emotional_start", "?")
-            e_end = s.get("emotional_end", "?")
-            beat = s.get("beat", "?")
-            # Truncate conflict to keep context lean
-            if len(conflict) > 100:
-                conflict = conflict[:100] + "..."
-            parts.append(
-                f"Scene {num} [{beat}] {slug} | "
-                f"Conflict: {conflict} | "
-                f"Emotion: {e_start} -> {e_end}"
-            )
-
-        return "\n".join(parts)
-
     def _parse_single_scene(self, raw_content: str) -> Dict[str, Any]:
         """Parse AI output into a single scene dict. Never raises."""
         if not raw_content:
@@ -1869,6 +2062,12 @@ class Step8Screenplay:
         version = artifact.get("metadata", {}).get("version", "unknown")
         file_path = snapshot_path / f"sp_step_8_v{version}_{timestamp}.json"
 
+        # The artifact was just loaded from disk: copy the file rather than
+        # re-serializing the whole screenplay
+        saved_path = self.project_dir / project_id / "sp_step_8_screenplay.json"
+        if saved_path.exists():
+            shutil.copyfile(saved_path, file_path)
+            return
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(artifact, f, indent=2, ensure_ascii=False)
 
@@ -5,21 +5,28 @@ After Step 8 diagnostics identify failing scenes, this step:
 1. Parses the diagnostic output to build a per-scene task map
 2. Deduplicates across checks (scene 7 might fail two checks)
 3. Calls Grok to rewrite ONLY the failing scenes with minimum changes
-4. Provides full prior-scene context so Grok can maintain continuity
-5. Splices rewrites back into the screenplay
+4. Provides bounded prior-scene context (the last few scenes in full plus a
+   cached story-state digest of the rest) so Grok can maintain continuity
+5. Rewrites scenes concurrently and splices them back into the screenplay
 6. Optionally re-runs diagnostics to verify improvement
 
 Key constraint from user: "it should not do like a full on rewrite, just change
 enough that the rule isn't violated or whatever"
 """
 
+import os
 import json
 import logging
 import time
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Tuple, List
 from pathlib import Path
 
 from src.ai.generator import AIGenerator
+from src.pipeline.story_state import StoryState, get_story_state
+from src.ai.telemetry import call_tags
+from src.observability.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -33,11 +40,35 @@ class Step8bTargetedRewrite:
     Grok to rewrite only those scenes with minimum changes.
     """
 
-    VERSION = "1.0.0"
+    VERSION = "1.1.0"
+    DEFAULT_MAX_WORKERS = 4
+    DEFAULT_CONTEXT_SCENES = 3
 
-    def __init__(self, project_dir: str = "artifacts"):
+    def __init__(self,
+                 project_dir: str = "artifacts",
+                 max_workers: Optional[int] = None,
+                 context_scenes: Optional[int] = None):
+        """
+        Args:
+            project_dir: Directory to store artifacts
+            max_workers: Scenes rewritten concurrently (env STEP8B_MAX_WORKERS, default 4)
+            context_scenes: Previous scenes given in full to each rewrite
+                (env STEP8B_CONTEXT_SCENES, default 3); earlier scenes are
+                summarized by the project's cached story-state digest
+        """
         self.project_dir = Path(project_dir)
         self.project_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max(1, max_workers if max_workers is not None
+                               else self._env_int("STEP8B_MAX_WORKERS", self.DEFAULT_MAX_WORKERS))
+        self.context_scenes = max(0, context_scenes if context_scenes is not None
+                                  else self._env_int("STEP8B_CONTEXT_SCENES", self.DEFAULT_CONTEXT_SCENES))
+
+    @staticmethod
+    def _env_int(name: str, default: int) -> int:
+        try:
+            return int(os.getenv(name, default))
+        except ValueError:
+            return default
 
     def execute(
         self,
@@ -95,22 +126,28 @@ class Step8bTargetedRewrite:
         hero = step_3_artifact.get("hero", step_3_artifact.get("hero_profile", {}))
         hero_name = hero.get("name", "HERO")
 
-        # 4. Rewrite each failing scene
-        rewritten_count = 0
-        failed_rewrites = []
-
+        # 4. Rewrite failing scenes concurrently. Every rewrite sees the
+        # original screenplay as context, so results don't depend on order.
+        original_scenes = list(scenes)
+        story_state = get_story_state(self.project_dir, project_id)
+        story_state.sync(original_scenes)
+        targets = []
         for scene_num in sorted(scene_tasks.keys()):
-            original_scene = scenes_by_num.get(scene_num)
-            if not original_scene:
+            if scene_num not in scenes_by_num:
                 logger.warning("Scene %d not found in screenplay — skipping", scene_num)
                 continue
+            targets.append(scene_num)
+
+        workers = max(1, min(self.max_workers, len(targets)))
+        logger.info("Rewriting %d scenes (%d concurrent, %d context scenes)",
+                    len(targets), workers, self.context_scenes)
 
+        def rewrite(scene_num: int) -> Optional[Dict[str, Any]]:
+            original_scene = scenes_by_num[scene_num]
             tasks = scene_tasks[scene_num]
             logger.info("Rewriting scene %d (%d fixes needed)...", scene_num, len(tasks))
-
-            # Build previous scenes context (all scenes before this one)
-            prev_scenes = [s for s in scenes if s.get("scene_number", 0) < scene_num]
-
+            prev_scenes, earlier_synopsis = self._build_context_window(
+                original_scenes, scene_num, story_state)
             prompt = self._build_scene_rewrite_prompt(
                 original_scene=original_scene,
                 tasks=tasks,
@@ -118,37 +155,50 @@ class Step8bTargetedRewrite:
                 title=title,
                 logline=logline,
                 hero_name=hero_name,
+                earlier_synopsis=earlier_synopsis,
             )
-
             try:
-                raw = grok.generate(prompt, grok_config)
+                with call_tags(scene=scene_num), span("scene.rewrite", scene=scene_num, fixes=len(tasks)):
+                    raw = grok.generate(prompt, grok_config)
                 rewritten_scene = self._parse_rewritten_scene(raw, scene_num)
-
-                if rewritten_scene and rewritten_scene.get("elements"):
-                    # Preserve structural metadata from original
-                    rewritten_scene["scene_number"] = scene_num
-                    rewritten_scene["board_card_number"] = original_scene.get("board_card_number", scene_num)
-                    rewritten_scene.setdefault("beat", original_scene.get("beat", ""))
-                    rewritten_scene.setdefault("emotional_start", original_scene.get("emotional_start", ""))
-                    rewritten_scene.setdefault("emotional_end", original_scene.get("emotional_end", ""))
-                    rewritten_scene.setdefault("conflict", original_scene.get("conflict", ""))
-                    rewritten_scene.setdefault("characters_present", original_scene.get("characters_present", []))
-                    rewritten_scene.setdefault("slugline", original_scene.get("slugline", ""))
-
-                    # Splice into screenplay
-                    for i, s in enumerate(scenes):
-                        if s.get("scene_number") == scene_num:
-                            scenes[i] = rewritten_scene
-                            break
-                    rewritten_count += 1
-                    logger.info("  Scene %d rewritten successfully", scene_num)
-                else:
-                    logger.warning("  Scene %d: Grok returned empty/unparseable result", scene_num)
-                    failed_rewrites.append(scene_num)
-
             except Exception as e:
                 logger.error("  Scene %d rewrite failed: %s", scene_num, e)
+                return None
+            if not (rewritten_scene and rewritten_scene.get("elements")):
+                logger.warning("  Scene %d: Grok returned empty/unparseable result", scene_num)
+                return None
+
+            # Preserve structural metadata from original
+            rewritten_scene["scene_number"] = scene_num
+            rewritten_scene["board_card_number"] = original_scene.get("board_card_number", scene_num)
+            rewritten_scene.setdefault("beat", original_scene.get("beat", ""))
+            rewritten_scene.setdefault("emotional_start", original_scene.get("emotional_start", ""))
+            rewritten_scene.setdefault("emotional_end", original_scene.get("emotional_end", ""))
+            rewritten_scene.setdefault("conflict", original_scene.get("conflict", ""))
+            rewritten_scene.setdefault("characters_present", original_scene.get("characters_present", []))
+            rewritten_scene.setdefault("slugline", original_scene.get("slugline", ""))
+            logger.info("  Scene %d rewritten successfully", scene_num)
+            return rewritten_scene
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="step8b") as pool:
+            # One context copy per scene so step tags and the trace span follow each rewrite
+            futures = [pool.submit(contextvars.copy_context().run, rewrite, n) for n in targets]
+            results = [future.result() for future in futures]
+
+        # Splice into screenplay
+        rewritten_count = 0
+        failed_rewrites = []
+        for scene_num, rewritten_scene in zip(targets, results):
+            if rewritten_scene is None:
                 failed_rewrites.append(scene_num)
+                continue
+            for i, s in enumerate(scenes):
+                if s.get("scene_number") == scene_num:
+                    scenes[i] = rewritten_scene
+                    break
+            rewritten_count += 1
+        if rewritten_count:
+            story_state.sync(scenes)
 
         # 5. Update screenplay artifact
         screenplay_artifact["scenes"] = scenes
@@ -250,6 +300,24 @@ class Step8bTargetedRewrite:
 
         return scene_tasks
 
+    def _build_context_window(
+        self, scenes: List[Dict[str, Any]], scene_num: int, story_state: StoryState
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Bounded continuity context for one rewrite.
+
+        Returns the last ``context_scenes`` scenes before ``scene_num`` in full
+        and the cached story-state digest of everything before them, so prompt
+        size stays constant however deep into the screenplay the scene is.
+        """
+        prev_all = [s for s in scenes if s.get("scene_number", 0) < scene_num]
+        split = max(0, len(prev_all) - self.context_scenes)
+        window = prev_all[split:]
+        if not split:
+            return window, ""
+        first_in_window = window[0].get("scene_number", scene_num) if window else scene_num
+        return window, story_state.digest(before_scene=first_in_window)
+
     def _build_scene_rewrite_prompt(
         self,
         original_scene: Dict[str, Any],
@@ -258,6 +326,7 @@ class Step8bTargetedRewrite:
         title: str,
         logline: str,
         hero_name: str,
+        earlier_synopsis: str = "",
     ) -> Dict[str, str]:
         """Build Grok prompt for rewriting a single scene."""
 
@@ -275,7 +344,7 @@ class Step8bTargetedRewrite:
             )
         fixes_block = "\n\n".join(fix_lines)
 
-        # Build prior scenes context (full text for continuity)
+        # Build prior scenes context (full text of the nearest scenes for continuity)
         if prev_scenes:
             prev_parts = []
             for s in prev_scenes:
@@ -287,6 +356,10 @@ class Step8bTargetedRewrite:
             )
         else:
             prev_section = "(This is the first scene.)"
+        if earlier_synopsis:
+            prev_section = (
+                f"STORY SO FAR (earlier scenes, compressed):\n{earlier_synopsis}\n\n{prev_section}"
+            )
 
         system_prompt = (
             "You are a precise screenplay editor. You make MINIMUM TARGETED CHANGES to fix "
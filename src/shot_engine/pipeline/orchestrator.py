@@ -17,6 +17,7 @@ from src.shot_engine.pipeline.steps.step_v4_pacing import StepV4Pacing
 from src.shot_engine.pipeline.steps.step_v5_transitions import StepV5Transitions
 from src.shot_engine.pipeline.steps.step_v6_prompts import StepV6Prompts
 from src.shot_engine.pipeline.validators.shot_list_validator import ShotListValidator
+from src.observability.metrics import get_pipeline_metrics
 
 
 class ShotPipeline:
@@ -96,6 +97,7 @@ class ShotPipeline:
 
             # V6: Generate prompts (+ full cast, visual bible, world bible)
             shot_list = self.v6.process(shot_list, hero_artifact, context=ctx)
+            get_pipeline_metrics().shots_produced(shot_list.total_shots)
 
             # Validate
             is_valid, errors = self.validator.validate(
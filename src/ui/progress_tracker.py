@@ -4,6 +4,7 @@ Provides real-time feedback and progress indicators for long-running operations
 """
 import time
 import sys
+import threading
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 
@@ -17,6 +18,9 @@ class ProgressTracker:
         self.step_start_time = None
         self.total_start_time = None
         self.step_progress = {}
+        # Start times of steps still running; DAG runs can overlap steps
+        self.active_steps: Dict[int, float] = {}
+        self._lock = threading.Lock()
         
     def start_pipeline(self, total_steps: int = 11):
         """Start tracking the entire pipeline"""
@@ -27,12 +31,11 @@ class ProgressTracker:
         print()
     
     def start_step(self, step_num: int, step_name: str, description: str = ""):
-        """Start tracking a specific step"""
-        if self.current_step is not None:
-            self._finish_current_step()
-            
-        self.current_step = step_num
-        self.step_start_time = time.time()
+        """Start tracking a specific step; other running steps stay active"""
+        with self._lock:
+            self.active_steps[step_num] = time.time()
+            self.step_progress.pop(step_num, None)
+            self._set_current_step(step_num)
         
         print(f"Step {step_num}: {step_name}")
         if description:
@@ -41,17 +44,21 @@ class ProgressTracker:
             print(f"   Started: {datetime.now().strftime('%H:%M:%S')}")
         print()
     
-    def update_step_progress(self, current: int, total: int, item_description: str = ""):
-        """Update progress within a step"""
-        if self.current_step is None:
-            return
+    def update_step_progress(self, current: int, total: int, item_description: str = "",
+                             *, step_num: int):
+        """Update progress within a running step; step_num is required because DAG runs overlap steps"""
+        with self._lock:
+            if step_num not in self.active_steps:
+                return
+            step_start_time = self.active_steps[step_num]
+            self.step_progress[step_num] = (current, total)
             
         percentage = (current / total) * 100 if total > 0 else 0
         bar_length = 30
         filled_length = int(bar_length * current / total) if total > 0 else 0
         bar = '#' * filled_length + '-' * (bar_length - filled_length)
         
-        elapsed = time.time() - self.step_start_time if self.step_start_time else 0
+        elapsed = time.time() - step_start_time
         if current > 0 and elapsed > 0:
             rate = current / elapsed
             eta_seconds = (total - current) / rate if rate > 0 else 0
@@ -85,30 +92,40 @@ class ProgressTracker:
             
         print(f"   {icon} {message}")
     
-    def finish_step(self, success: bool = True, message: str = ""):
-        """Finish the current step"""
-        if self.current_step is None:
-            return
+    def finish_step(self, success: bool = True, message: str = "", *, step_num: int):
+        """Finish a running step; step_num is required because DAG runs overlap steps"""
+        with self._lock:
+            step = step_num
+            if step not in self.active_steps:
+                return
+            started = self.active_steps.pop(step)
+            if step == self.current_step:
+                # Progress updates fall back to the latest step still running
+                self._set_current_step(
+                    max(self.active_steps, key=self.active_steps.get) if self.active_steps else None
+                )
             
-        elapsed = time.time() - self.step_start_time if self.step_start_time else 0
+        elapsed = time.time() - started
         elapsed_str = str(timedelta(seconds=int(elapsed)))
         
         if success:
-            print(f"   [DONE] Step {self.current_step} completed in {elapsed_str}")
+            print(f"   [DONE] Step {step} completed in {elapsed_str}")
         else:
-            print(f"   [FAIL] Step {self.current_step} failed after {elapsed_str}")
+            print(f"   [FAIL] Step {step} failed after {elapsed_str}")
             
         if message:
             print(f"   {message}")
             
         print()
-        self.current_step = None
-        self.step_start_time = None
     
     def finish_pipeline(self, success: bool = True):
         """Finish tracking the entire pipeline"""
-        if self.current_step is not None:
-            self._finish_current_step()
+        with self._lock:
+            unfinished = sorted(self.active_steps.items())
+            self.active_steps.clear()
+            self._set_current_step(None)
+        for step, started in unfinished:
+            self._report_unfinished_step(step, started)
             
         if self.total_start_time:
             total_elapsed = time.time() - self.total_start_time
@@ -127,12 +144,16 @@ class ProgressTracker:
             else:
                 print("[FAILED] Pipeline failed")
     
-    def _finish_current_step(self):
-        """Internal method to finish current step without message"""
-        if self.current_step and self.step_start_time:
-            elapsed = time.time() - self.step_start_time
-            elapsed_str = str(timedelta(seconds=int(elapsed)))
-            print(f"   [TIME] Step {self.current_step} took {elapsed_str}")
+    def _set_current_step(self, step_num: Optional[int]):
+        """Point current_step/step_start_time at an active step (or clear them)"""
+        self.current_step = step_num
+        self.step_start_time = self.active_steps.get(step_num) if step_num is not None else None
+    
+    def _report_unfinished_step(self, step_num: int, started: float):
+        """Internal method to report a step left running without a message"""
+        elapsed = time.time() - started
+        elapsed_str = str(timedelta(seconds=int(elapsed)))
+        print(f"   [TIME] Step {step_num} took {elapsed_str}")
 
 
 class StepProgressContext:
@@ -153,7 +174,7 @@ class StepProgressContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type is None:
             self.success = True
-        self.tracker.finish_step(self.success, self.message)
+        self.tracker.finish_step(self.success, self.message, step_num=self.step_num)
         return False  # Don't suppress exceptions
     
     def set_result(self, success: bool, message: str = ""):
@@ -163,7 +184,7 @@ class StepProgressContext:
     
     def update_progress(self, current: int, total: int, description: str = ""):
         """Update progress within this step"""
-        self.tracker.update_step_progress(current, total, description)
+        self.tracker.update_step_progress(current, total, description, step_num=self.step_num)
     
     def log_info(self, message: str, level: str = "info"):
         """Log information during this step"""
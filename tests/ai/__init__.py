@@ -0,0 +1 @@
+"""AI layer tests."""
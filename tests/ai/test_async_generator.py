@@ -0,0 +1,118 @@
+"""
+Tests for AsyncAIGenerator: shared pool, per-provider concurrency and validation.
+"""
+
+import asyncio
+import json
+import threading
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from src.ai import async_generator
+from src.ai.async_generator import AsyncAIGenerator, get_shared_http_client
+from src.ai.response_cache import ResponseCache
+
+
+class _FakeCompletions:
+    """Async chat.completions stand-in that tracks peak concurrency"""
+
+    def __init__(self, content="hello", delay=0.01):
+        self.content = content
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        choice = MagicMock()
+        choice.message.content = self.content
+        completion = MagicMock()
+        completion.choices = [choice]
+        return completion
+
+
+@pytest.fixture
+def fake_openai():
+    completions = _FakeCompletions()
+    client = MagicMock()
+    client.chat.completions = completions
+    with patch.object(async_generator, "AsyncOpenAI", return_value=client) as cls:
+        yield completions, cls
+
+
+def test_fan_out_respects_provider_semaphore(fake_openai):
+    completions, _ = fake_openai
+    gen = AsyncAIGenerator(provider="openai", max_concurrency=3)
+
+    async def run():
+        prompts = [{"user": f"prompt {i}"} for i in range(20)]
+        return await asyncio.gather(*(gen.generate(p) for p in prompts))
+
+    results = asyncio.run(run())
+    assert results == ["hello"] * 20
+    assert completions.calls == 20
+    assert completions.peak == 3
+
+
+def test_generators_share_one_pool_per_loop(fake_openai):
+    _, client_cls = fake_openai
+
+    async def run():
+        a = AsyncAIGenerator(provider="openai")
+        b = AsyncAIGenerator(provider="openai")
+        assert a.client is b.client
+        http = get_shared_http_client()
+        assert client_cls.call_args.kwargs["http_client"] is http
+        await async_generator.close_shared_http_client()
+
+    asyncio.run(run())
+
+
+def test_generate_with_validation_parses_json(fake_openai):
+    completions, _ = fake_openai
+    completions.content = json.dumps({"category": "Thriller"})
+    validator = MagicMock()
+    validator.validate.return_value = (True, [])
+    gen = AsyncAIGenerator(provider="openai")
+
+    artifact = asyncio.run(gen.generate_with_validation({"user": "x"}, validator))
+    assert artifact == {"category": "Thriller"}
+
+
+def test_model_config_routes_to_openrouter(fake_openai, monkeypatch):
+    completions, client_cls = fake_openai
+    monkeypatch.setenv("OPENROUTER_API_KEY", "or-key")
+    gen = AsyncAIGenerator(provider="openai")
+
+    result = asyncio.run(gen.generate({"user": "x"}, {"provider": "openrouter"}, use_cache=False))
+    assert result == "hello"
+    kwargs = client_cls.call_args.kwargs
+    assert kwargs["api_key"] == "or-key"
+    assert kwargs["base_url"] == "https://openrouter.ai/api/v1"
+
+
+def test_cache_io_runs_off_the_event_loop(fake_openai, tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    threads = []
+    for name in ("get", "put", "discard"):
+        original = getattr(cache, name)
+        wrapper = (lambda fn: lambda *a: threads.append(threading.get_ident()) or fn(*a))(original)
+        setattr(cache, name, wrapper)
+    validator = MagicMock()
+    validator.validate.return_value = (False, ["bad"])
+    gen = AsyncAIGenerator(provider="openai", cache=cache)
+
+    async def run():
+        await gen.generate_with_validation({"user": "x"}, validator, max_attempts=1)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert len(threads) == 3
+    assert loop_thread not in threads
+    cache.close()
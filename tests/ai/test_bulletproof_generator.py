@@ -0,0 +1,112 @@
+"""
+Tests for provider routing, the shared circuit breaker and BulletproofGenerator failover.
+"""
+
+import time
+
+import pytest
+
+from src.ai.generator import AIGenerator, get_provider_client
+from src.ai.circuit_breaker import CircuitBreaker, get_circuit_breaker, OPEN, HALF_OPEN, CLOSED
+from src.ai.bulletproof_generator import BulletproofGenerator
+from src.ai.response_cache import ResponseCache
+
+
+PROMPT = {"system": "You are a novelist.", "user": "Write one line of prose."}
+
+
+@pytest.fixture(autouse=True)
+def clean_breaker():
+    get_circuit_breaker().reset()
+    yield
+    get_circuit_breaker().reset()
+
+
+class TestProviderRouting:
+    def test_clients_are_cached_per_provider(self):
+        assert get_provider_client("openai") is get_provider_client("openai")
+        assert get_provider_client("openai") is not get_provider_client("anthropic")
+
+    def test_model_config_provider_selects_client(self, mock_ai_clients):
+        gen = AIGenerator(provider="openai")
+        gen.generate(PROMPT, {"provider": "anthropic", "model_name": "claude-x"})
+        assert mock_ai_clients["anthropic"].messages.create.called
+        assert not mock_ai_clients["openai"].chat.completions.create.called
+
+    def test_unconfigured_provider_raises(self, monkeypatch):
+        monkeypatch.delenv("XAI_API_KEY", raising=False)
+        gen = AIGenerator(provider="openai")
+        with pytest.raises(ValueError):
+            gen.generate(PROMPT, {"provider": "xai"})
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_probes_once(self):
+        breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=0.05)
+        breaker.record_failure("k")
+        assert breaker.allow("k")
+        breaker.record_failure("k")
+        assert breaker.state("k") == OPEN
+        assert not breaker.allow("k")
+
+        time.sleep(0.06)
+        assert breaker.allow("k")
+        assert breaker.state("k") == HALF_OPEN
+        assert not breaker.allow("k")  # only one probe at a time
+
+        breaker.record_failure("k")
+        assert breaker.state("k") == OPEN
+
+        time.sleep(0.06)
+        assert breaker.allow("k")
+        breaker.record_success("k")
+        assert breaker.state("k") == CLOSED
+        assert breaker.failure_count("k") == 0
+
+    def test_trip_opens_immediately(self):
+        breaker = CircuitBreaker()
+        breaker.trip("k")
+        assert not breaker.allow("k")
+
+
+class TestBulletproofFailover:
+    def test_fails_over_to_next_provider_without_sleeping(self, mock_ai_clients):
+        mock_ai_clients["openai"].chat.completions.create.side_effect = RuntimeError("503")
+        gen = BulletproofGenerator()
+
+        t0 = time.monotonic()
+        result = gen.generate_guaranteed(PROMPT)
+        assert time.monotonic() - t0 < 1.0
+
+        assert "Psychological Thriller" in result
+        assert mock_ai_clients["anthropic"].messages.create.call_count == 1
+        assert mock_ai_clients["openai"].chat.completions.create.call_count == 1
+        assert get_circuit_breaker().failure_count("openai:gpt-5.2-2025-12-11") == 1
+
+    def test_auth_errors_trip_breaker_for_other_generators(self, mock_ai_clients):
+        class AuthError(Exception):
+            status_code = 401
+
+        mock_ai_clients["openai"].chat.completions.create.side_effect = AuthError("bad key")
+        BulletproofGenerator().generate_guaranteed(PROMPT)
+        BulletproofGenerator().generate_guaranteed(PROMPT)
+
+        # Second generator skipped OpenAI entirely
+        assert mock_ai_clients["openai"].chat.completions.create.call_count == 1
+        assert get_circuit_breaker().state("openai:gpt-5.2-2025-12-11") == OPEN
+
+    def test_rejected_response_is_not_replayed_from_cache(self, mock_ai_clients, tmp_path):
+        mock_ai_clients["openai"].chat.completions.create.return_value.choices[0].message.content = "no"
+        mock_ai_clients["anthropic"].messages.create.return_value.content[0].text = "no"
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        gen = BulletproofGenerator()
+        gen.primary_generator.cache = cache
+        gen.max_rounds = 2
+        gen.base_retry_delay = 0
+
+        _, is_fallback = gen.generate_with_status(PROMPT)
+        assert is_fallback is True
+        # The second round re-sent the request instead of replaying "no"
+        assert mock_ai_clients["openai"].chat.completions.create.call_count == 2
+        assert cache.stats()["entries"] == 0
+        cache.close()
@@ -0,0 +1,77 @@
+"""
+Tests for provider prompt-prefix caching and cached/uncached token reporting.
+"""
+
+from types import SimpleNamespace
+
+from src.ai.generator import AIGenerator, anthropic_usage, openai_usage, get_usage_totals
+from src.screenplay_engine.pipeline.prompts.step_8_prompt import Step8Prompt
+
+
+PROMPT = {"system": "SYS", "cache_prefix": "WORLD BIBLE " * 50, "user": "Write act 2."}
+
+
+def test_anthropic_request_marks_prefix_cacheable():
+    gen = AIGenerator(provider="anthropic")
+    kwargs = gen._anthropic_request(PROMPT, "claude-x", 0.5, 1000)
+    assert kwargs["system"][0] == {"type": "text", "text": "SYS"}
+    assert kwargs["system"][1]["text"] == PROMPT["cache_prefix"]
+    assert kwargs["system"][1]["cache_control"] == {"type": "ephemeral"}
+    assert kwargs["messages"] == [{"role": "user", "content": "Write act 2."}]
+
+
+def test_openai_request_puts_prefix_before_variable_content():
+    gen = AIGenerator(provider="openai")
+    messages = gen._openai_request(PROMPT, "gpt-5.2", 0.5, 1000)["messages"]
+    assert messages[0]["content"] == "SYS\n\n" + PROMPT["cache_prefix"]
+    assert messages[1]["content"] == "Write act 2."
+
+
+def test_prompts_without_prefix_are_unchanged():
+    gen = AIGenerator(provider="anthropic")
+    assert gen._anthropic_request({"system": "S", "user": "U"}, "m", 0.1, 10)["system"] == "S"
+
+
+def test_usage_normalization():
+    a = anthropic_usage(SimpleNamespace(input_tokens=100, cache_read_input_tokens=900,
+                                        cache_creation_input_tokens=0, output_tokens=50))
+    assert a["input_tokens"] == 1000
+    assert a["cached_input_tokens"] == 900
+    assert a["uncached_input_tokens"] == 100
+
+    o = openai_usage(SimpleNamespace(prompt_tokens=1000, completion_tokens=20,
+                                     prompt_tokens_details=SimpleNamespace(cached_tokens=768)))
+    assert o["cached_input_tokens"] == 768
+    assert o["uncached_input_tokens"] == 232
+
+
+def test_generate_reports_per_call_usage(mock_ai_clients):
+    completion = mock_ai_clients["openai"].chat.completions.create.return_value
+    completion.usage = SimpleNamespace(prompt_tokens=2048, completion_tokens=10,
+                                       prompt_tokens_details=SimpleNamespace(cached_tokens=1024))
+    gen = AIGenerator(provider="openai")
+    gen.generate(PROMPT, {"model_name": "usage-test-model"}, use_cache=False)
+
+    assert gen.last_usage["cached_input_tokens"] == 1024
+    assert gen.last_usage["uncached_input_tokens"] == 1024
+    assert get_usage_totals()["openai:usage-test-model"]["cached_input_tokens"] >= 1024
+
+
+def test_step8_act_prompt_moves_story_bibles_into_prefix():
+    prompt = Step8Prompt().generate_act_prompt(
+        act_cards=[{"card_number": 1}], hero_summary="Hero", characters_summary="Chars",
+        genre="Thriller", logline="L", title="T", previous_scenes=[],
+        character_identifiers="", act_label="Act 1", start_scene_number=1,
+        world_context="The drowned city", cast_context="", visual_context="Noir palette",
+    )
+    assert "The drowned city" in prompt["cache_prefix"]
+    assert "Noir palette" in prompt["cache_prefix"]
+    assert "The drowned city" not in prompt["user"]
+
+    again = Step8Prompt().generate_act_prompt(
+        act_cards=[{"card_number": 11}], hero_summary="Hero", characters_summary="Chars",
+        genre="Thriller", logline="L", title="T", previous_scenes=[],
+        character_identifiers="", act_label="Act 2A", start_scene_number=11,
+        world_context="The drowned city", cast_context="", visual_context="Noir palette",
+    )
+    assert again["cache_prefix"] == prompt["cache_prefix"]
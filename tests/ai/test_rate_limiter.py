@@ -0,0 +1,126 @@
+"""
+Tests for the shared token-bucket / AIMD rate limiter.
+"""
+
+import time
+import threading
+
+import pytest
+
+from src.ai.rate_limiter import (
+    TokenBucket,
+    ProviderRateLimiter,
+    estimate_tokens,
+    is_rate_limit_error,
+    retry_after_seconds,
+)
+
+
+class _FakeResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class RateLimitError(Exception):
+    """Mimics the SDKs' 429 error (matched by class name)"""
+
+    def __init__(self, headers=None):
+        super().__init__("429 Too Many Requests")
+        self.status_code = 429
+        self.response = _FakeResponse(headers or {})
+
+
+class TestTokenBucket:
+    def test_wait_time_reflects_refill_rate(self):
+        bucket = TokenBucket(rate_per_minute=60)  # 1 token/second
+        now = bucket.updated
+        assert bucket.wait_time(60, now) == 0.0
+        bucket.take(60)
+        assert bucket.wait_time(1, now) == pytest.approx(1.0)
+        assert bucket.wait_time(1, now + 1.0) == 0.0
+
+    def test_oversized_request_waits_for_full_bucket_only(self):
+        bucket = TokenBucket(rate_per_minute=60)
+        assert bucket.wait_time(10_000, bucket.updated) == 0.0
+
+
+class TestRetryAfter:
+    def test_parses_seconds_and_ms_headers(self):
+        assert retry_after_seconds(RateLimitError({"retry-after": "3"})) == 3.0
+        assert retry_after_seconds(RateLimitError({"retry-after-ms": "250"})) == 0.25
+
+    def test_parses_openai_reset_durations(self):
+        exc = RateLimitError({"x-ratelimit-reset-tokens": "1m30s"})
+        assert retry_after_seconds(exc) == 90.0
+
+    def test_no_hint(self):
+        assert retry_after_seconds(RateLimitError()) is None
+        assert retry_after_seconds(ValueError("boom")) is None
+
+    def test_classifies_rate_limit_errors(self):
+        assert is_rate_limit_error(RateLimitError())
+        assert not is_rate_limit_error(ValueError("boom"))
+
+
+class TestProviderRateLimiter:
+    def test_aimd_halves_on_rate_limit_and_grows_on_success(self):
+        limiter = ProviderRateLimiter("openai", "m", initial_concurrency=8)
+        with pytest.raises(RateLimitError):
+            with limiter.slot():
+                raise RateLimitError()
+        assert limiter.metrics()["concurrency_limit"] == 4
+        assert limiter.throttled_total == 1
+
+        for _ in range(20):
+            with limiter.slot():
+                pass
+        assert limiter.metrics()["concurrency_limit"] > 4
+
+    def test_plain_errors_do_not_shrink_limit(self):
+        limiter = ProviderRateLimiter("openai", "m", initial_concurrency=8)
+        with pytest.raises(ValueError):
+            with limiter.slot():
+                raise ValueError("bad output")
+        assert limiter.metrics()["concurrency_limit"] == 8
+        assert limiter.in_flight == 0
+
+    def test_retry_after_pauses_new_callers(self):
+        limiter = ProviderRateLimiter("openai", "m")
+        with pytest.raises(RateLimitError):
+            with limiter.slot():
+                raise RateLimitError({"retry-after-ms": "200"})
+        t0 = time.monotonic()
+        with limiter.slot():
+            pass
+        assert time.monotonic() - t0 >= 0.15
+
+    def test_concurrency_cap_is_enforced_across_threads(self):
+        limiter = ProviderRateLimiter("openai", "m", initial_concurrency=2, max_concurrency=2)
+        peak = []
+        lock = threading.Lock()
+
+        def worker():
+            with limiter.slot():
+                with lock:
+                    peak.append(limiter.in_flight)
+                time.sleep(0.02)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert max(peak) <= 2
+        assert limiter.requests_total == 8
+
+    def test_request_bucket_spaces_calls(self):
+        limiter = ProviderRateLimiter("openai", "m", rpm=600)  # capacity 600, 10/s
+        limiter.request_bucket.tokens = 0
+        t0 = time.monotonic()
+        with limiter.slot():
+            pass
+        assert time.monotonic() - t0 >= 0.08
+
+
+def test_estimate_tokens_counts_prompt_and_completion():
+    assert estimate_tokens({"system": "a" * 400, "user": "b" * 400}, 1000) == 1200
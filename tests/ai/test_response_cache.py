@@ -0,0 +1,109 @@
+"""
+Tests for the content-addressed AI response cache and its use in AIGenerator.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ai.generator import AIGenerator
+from src.ai.response_cache import ResponseCache
+
+
+PROMPT = {"system": "You are a novelist.", "user": "Write one line."}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ResponseCache(tmp_path / "cache.sqlite3")
+    yield c
+    c.close()
+
+
+class TestResponseCache:
+    def test_key_is_stable_and_content_addressed(self):
+        k1 = ResponseCache.make_key("openai", "gpt", PROMPT, 0.3, 4000)
+        k2 = ResponseCache.make_key("openai", "gpt", dict(PROMPT), 0.3, 4000)
+        assert k1 == k2
+        assert k1 != ResponseCache.make_key("openai", "gpt", PROMPT, 0.7, 4000)
+        assert k1 != ResponseCache.make_key("anthropic", "gpt", PROMPT, 0.3, 4000)
+        assert k1 != ResponseCache.make_key("openai", "gpt", {**PROMPT, "user": "x"}, 0.3, 4000)
+
+    def test_hit_and_miss_counters(self, cache):
+        assert cache.get("k") is None
+        cache.put("k", "hello")
+        assert cache.get("k") == "hello"
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        first = ResponseCache(path)
+        first.put("k", "persisted")
+        first.close()
+        second = ResponseCache(path)
+        assert second.get("k") == "persisted"
+        second.close()
+
+    def test_age_eviction(self, tmp_path):
+        c = ResponseCache(tmp_path / "c.sqlite3", max_age_seconds=0.05)
+        c.put("old", "value")
+        time.sleep(0.1)
+        assert c.get("old") is None
+        assert c.evict() == 1
+        c.close()
+
+    def test_size_eviction_drops_least_recently_used(self, tmp_path):
+        c = ResponseCache(tmp_path / "c.sqlite3", max_bytes=25)
+        c.put("a", "x" * 10)
+        time.sleep(0.01)
+        c.put("b", "y" * 10)
+        time.sleep(0.01)
+        assert c.get("a") is not None  # touch a so b becomes LRU
+        time.sleep(0.01)
+        c.put("c", "z" * 10)
+        assert c.get("b") is None
+        assert c.get("a") is not None
+        assert c.get("c") is not None
+        c.close()
+
+    def test_discard_drops_one_entry(self, cache):
+        cache.put("a", "x")
+        cache.put("b", "y")
+        assert cache.discard("a") is True
+        assert cache.discard("a") is False
+        assert cache.get("a") is None
+        assert cache.get("b") == "y"
+
+
+class TestGeneratorCaching:
+    def test_second_identical_call_is_served_from_cache(self, cache, mock_ai_clients):
+        gen = AIGenerator(provider="openai", cache=cache)
+        first = gen.generate(PROMPT)
+        second = gen.generate(PROMPT)
+        assert first == second
+        assert mock_ai_clients["openai"].chat.completions.create.call_count == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_bypass_skips_cache(self, cache, mock_ai_clients):
+        gen = AIGenerator(provider="openai", cache=cache)
+        gen.generate(PROMPT)
+        gen.generate(PROMPT, use_cache=False)
+        assert mock_ai_clients["openai"].chat.completions.create.call_count == 2
+
+    def test_empty_responses_are_not_cached(self, cache, mock_ai_clients):
+        choice = mock_ai_clients["openai"].chat.completions.create.return_value.choices[0]
+        choice.message.content = ""
+        gen = AIGenerator(provider="openai", cache=cache)
+        gen.generate(PROMPT)
+        assert cache.stats()["entries"] == 0
+
+    def test_responses_failing_validation_are_not_kept(self, cache, mock_ai_clients):
+        validator = MagicMock()
+        validator.validate.return_value = (False, ["missing field"])
+        gen = AIGenerator(provider="openai", cache=cache)
+        gen.generate_with_validation(PROMPT, validator, max_attempts=1)
+        assert cache.stats()["entries"] == 0
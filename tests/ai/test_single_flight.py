@@ -0,0 +1,114 @@
+"""
+Tests for single-flight coalescing of identical in-flight AI calls.
+"""
+
+import threading
+import time
+
+from src.ai.generator import AIGenerator
+from src.ai.single_flight import SingleFlight
+
+
+PROMPT = {"system": "You are a novelist.", "user": "Write one line."}
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        group = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def work():
+            calls.append(1)
+            release.wait(2)
+            return "result"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(group.do("k", work)))
+                   for _ in range(5)]
+        for t in threads:
+            t.start()
+        while group.stats()["coalesced"] < 4:
+            time.sleep(0.005)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert results == ["result"] * 5
+        assert len(calls) == 1
+        assert group.stats() == {"calls": 1, "coalesced": 4, "in_flight": 0}
+
+    def test_exception_reaches_every_waiter(self):
+        group = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def work():
+            started.set()
+            release.wait(2)
+            raise RuntimeError("provider down")
+
+        def call():
+            try:
+                group.do("k", work)
+            except RuntimeError as exc:
+                errors.append(exc)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(2)
+        follower = threading.Thread(target=call)
+        follower.start()
+        while group.stats()["coalesced"] < 1:
+            time.sleep(0.005)
+        release.set()
+        leader.join()
+        follower.join()
+        assert len(errors) == 2
+
+    def test_finished_keys_run_fresh(self):
+        group = SingleFlight()
+        assert group.do("k", lambda: 1) == 1
+        assert group.do("k", lambda: 2) == 2
+        assert group.stats()["coalesced"] == 0
+
+
+def test_generator_coalesces_identical_prompts(mock_ai_clients):
+    release = threading.Event()
+    create = mock_ai_clients["openai"].chat.completions.create
+    response = create.return_value
+
+    def slow_create(**kwargs):
+        release.wait(2)
+        return response
+
+    create.side_effect = slow_create
+    group = SingleFlight()
+    gen = AIGenerator(provider="openai", single_flight=group)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(gen.generate(PROMPT)))
+               for _ in range(3)]
+    for t in threads:
+        t.start()
+    while group.stats()["coalesced"] < 2:
+        time.sleep(0.005)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert create.call_count == 1
+    assert len(results) == 3 and len(set(results)) == 1
+
+
+def test_uncached_calls_are_not_coalesced(mock_ai_clients):
+    create = mock_ai_clients["openai"].chat.completions.create
+    group = SingleFlight()
+    gen = AIGenerator(provider="openai", single_flight=group)
+
+    gen.generate(PROMPT, use_cache=False)
+    gen.generate(PROMPT, use_cache=False)
+
+    assert create.call_count == 2
+    assert group.stats()["calls"] == 0
@@ -0,0 +1,77 @@
+"""
+Tests for incremental JSON array extraction and AIGenerator streaming.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ai.generator import AIGenerator
+from src.ai.stream_json import JSONArrayStreamParser, iter_json_array, extract_json
+
+
+SCENES = [{"scene_number": i, "slugline": f"INT. ROOM {i} - DAY", "text": 'a "quoted" } ] , brace'}
+          for i in range(1, 6)]
+DOC = "Here you go:\n```json\n" + json.dumps({"title": "T [draft]", "scenes": SCENES, "tail": [9]}) + "\n```"
+
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class TestJSONArrayStreamParser:
+    @pytest.mark.parametrize("size", [1, 4, 17, 10_000])
+    def test_yields_each_scene_once_regardless_of_chunking(self, size):
+        assert list(iter_json_array(_chunks(DOC, size), "scenes")) == SCENES
+
+    def test_elements_complete_before_stream_ends(self):
+        parser = JSONArrayStreamParser("scenes")
+        first_scene_end = DOC.index('}, {"scene_number": 2') + 1
+        assert parser.feed(DOC[:first_scene_end]) == [SCENES[0]]
+        assert parser.feed(DOC[first_scene_end:]) == SCENES[1:]
+
+    def test_bare_array_with_scalars(self):
+        assert list(iter_json_array(_chunks('[1, "a,b", {"x": [2]}, null]', 3))) == [1, "a,b", {"x": [2]}, None]
+
+    def test_bare_array_accepted_when_key_expected(self):
+        assert list(iter_json_array([json.dumps(SCENES)], "scenes")) == SCENES
+
+    def test_buffer_stays_bounded(self):
+        parser = JSONArrayStreamParser("scenes")
+        for chunk in _chunks(DOC, 8):
+            parser.feed(chunk)
+            assert len(parser._buf) < 200
+        assert parser.done
+
+    def test_keep_text_retains_raw_response(self):
+        parser = JSONArrayStreamParser("scenes", keep_text=True)
+        for chunk in _chunks(DOC, 50):
+            parser.feed(chunk)
+        assert parser.text == DOC
+
+
+def test_extract_json_skips_fences_and_trailing_text():
+    assert extract_json(DOC)["scenes"] == SCENES
+    assert extract_json('{"a": 1} and some trailing prose') == {"a": 1}
+    assert extract_json("no json here") is None
+
+
+def test_extract_json_does_not_return_nested_fragment():
+    broken = '{"long_synopsis": "a\nb", "meta": {"words": 5}}'  # literal newline inside a string
+    assert extract_json(broken) is None
+
+
+def test_generator_stream_yields_openai_deltas(mock_ai_clients):
+    deltas = _chunks(json.dumps({"scenes": SCENES}), 25)
+    events = []
+    for d in deltas:
+        ev = MagicMock()
+        ev.choices = [MagicMock()]
+        ev.choices[0].delta.content = d
+        events.append(ev)
+    mock_ai_clients["openai"].chat.completions.create.return_value = iter(events)
+
+    gen = AIGenerator(provider="openai")
+    assert list(gen.stream_json_array({"user": "x"}, {"max_tokens": 64000}, "scenes")) == SCENES
+    assert mock_ai_clients["openai"].chat.completions.create.call_args.kwargs["stream"] is True
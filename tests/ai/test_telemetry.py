@@ -0,0 +1,72 @@
+"""
+Tests for AI call telemetry: records from AIGenerator calls, step tags,
+retries, cache hits and the Prometheus exposition.
+"""
+
+import pytest
+
+from src.ai import generator as generator_module
+from src.ai.generator import AIGenerator
+from src.ai.response_cache import ResponseCache
+from src.ai.telemetry import CallTelemetry, CallRecord, call_tags
+
+
+PROMPT = {"system": "You are a novelist.", "user": "Write one line of prose."}
+
+
+@pytest.fixture
+def telemetry(monkeypatch):
+    t = CallTelemetry(pricing={"gpt-test": {"input": 1.0, "output": 2.0}})
+    monkeypatch.setattr(generator_module, "get_call_telemetry", lambda: t)
+    return t
+
+
+class TestCallTelemetry:
+    def test_generate_records_tagged_call(self, mock_ai_clients, telemetry):
+        gen = AIGenerator(provider="openai")
+        with call_tags(step="step_4", scene=7):
+            gen.generate(PROMPT, {"model_name": "gpt-test"}, use_cache=False)
+
+        call = telemetry.recent_calls()[0]
+        assert (call["provider"], call["model"], call["step"], call["scene"]) == ("openai", "gpt-test", "step_4", 7)
+        assert call["outcome"] == "ok" and call["retries"] == 0 and not call["cache_hit"]
+        assert call["latency_seconds"] >= 0
+
+    def test_retries_and_errors_are_counted(self, mock_ai_clients, telemetry, monkeypatch):
+        monkeypatch.setattr(generator_module.time, "sleep", lambda s: None)
+        create = mock_ai_clients["openai"].chat.completions.create
+        ok = create.return_value
+        create.side_effect = [RuntimeError("503"), ok]
+        gen = AIGenerator(provider="openai")
+        gen.generate(PROMPT, {"model_name": "gpt-test"}, use_cache=False)
+
+        create.side_effect = RuntimeError("503")
+        with pytest.raises(RuntimeError):
+            gen.generate(PROMPT, {"model_name": "gpt-test", "temperature": 0.9}, max_retries=2, use_cache=False)
+
+        outcomes = [(c["outcome"], c["retries"]) for c in telemetry.recent_calls()]
+        assert outcomes == [("ok", 1), ("error", 1)]
+        text = telemetry.prometheus_text()
+        assert 'snowflake_ai_retries_total{provider="openai",model="gpt-test",step=""} 2' in text
+        assert 'snowflake_ai_calls_total{provider="openai",model="gpt-test",step="",outcome="error"} 1' in text
+
+    def test_cache_hits_are_recorded(self, mock_ai_clients, telemetry, tmp_path):
+        gen = AIGenerator(provider="openai", cache=ResponseCache(tmp_path / "c.sqlite3"))
+        gen.generate(PROMPT, {"model_name": "gpt-test"})
+        gen.generate(PROMPT, {"model_name": "gpt-test"})
+        assert [c["cache_hit"] for c in telemetry.recent_calls()] == [False, True]
+
+    def test_histograms_cost_and_summary(self):
+        t = CallTelemetry(pricing={"m": {"input": 1.0, "output": 2.0}})
+        t.record(CallRecord("openai", "m", "ok", 3.0, step="step_8", prompt_tokens=1_000_000,
+                            completion_tokens=500_000, ttft_seconds=0.4))
+        t.record(CallRecord("openai", "m", "ok", 40.0, step="step_10"))
+        t.record_validation("Step8Validator", False)
+
+        text = t.prometheus_text()
+        assert 'snowflake_ai_call_latency_seconds_bucket{provider="openai",model="m",step="step_8",le="5"} 1' in text
+        assert 'snowflake_ai_call_latency_seconds_bucket{provider="openai",model="m",step="step_8",le="2"} 0' in text
+        assert 'snowflake_ai_call_ttft_seconds_count{provider="openai",model="m",step="step_8"} 1' in text
+        assert 'snowflake_ai_cost_usd_total{provider="openai",model="m",step="step_8"} 2' in text
+        assert 'snowflake_ai_validations_total{validator="Step8Validator",step="",result="invalid"} 1' in text
+        assert [g["step"] for g in t.summary()] == ["step_10", "step_8"]
@@ -0,0 +1,113 @@
+"""
+Tests for the asynchronous event bus: batching, full-queue policies,
+sink isolation and the default emit_event wiring.
+"""
+
+import json
+import threading
+
+import pytest
+
+from src.observability import events
+from src.observability.event_bus import (
+    EventBus, EventSink, JSONLSink, SQLiteSink, RingBufferSink, CallbackSink,
+    DROP_NEW, DROP_OLDEST,
+)
+
+
+class GatedSink(EventSink):
+    """Holds the writer thread until released, so the queue can fill up"""
+
+    name = "gated"
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+        self.batches = []
+
+    def write_batch(self, batch):
+        self.entered.set()
+        self.gate.wait(5)
+        self.batches.append([e["i"] for _, e in batch])
+
+
+def _fill(bus, sink, n):
+    bus.emit("p", {"i": 0})
+    assert sink.entered.wait(2)  # writer is now stuck on event 0
+    return [bus.emit("p", {"i": i}) for i in range(1, n + 1)]
+
+
+class TestEventBus:
+    def test_events_reach_every_sink_in_batches(self, tmp_path):
+        ring = RingBufferSink(capacity=5)
+        sqlite = SQLiteSink(tmp_path / "events.sqlite3")
+        jsonl = JSONLSink(lambda pid: tmp_path / pid / "events.log")
+        bus = EventBus([jsonl, sqlite, ring], batch_size=4)
+
+        for i in range(10):
+            bus.emit("p", {"i": i})
+        assert bus.flush()
+
+        lines = (tmp_path / "p" / "events.log").read_text().splitlines()
+        assert [json.loads(l)["i"] for l in lines] == list(range(10))
+        assert [e["i"] for e in sqlite.recent("p", 3)] == [7, 8, 9]
+        assert [e["i"] for e in ring.recent("p")] == [5, 6, 7, 8, 9]
+        assert bus.stats()["written"] == 10
+
+    def test_drop_new_policy(self):
+        sink = GatedSink()
+        bus = EventBus([sink], max_queue=2, policy=DROP_NEW)
+        accepted = _fill(bus, sink, 4)
+        sink.gate.set()
+        bus.flush()
+
+        assert accepted == [True, True, False, False]
+        assert sum(sink.batches, []) == [0, 1, 2]
+        assert bus.stats()["dropped"] == 2
+
+    def test_drop_oldest_policy(self):
+        sink = GatedSink()
+        bus = EventBus([sink], max_queue=2, policy=DROP_OLDEST)
+        _fill(bus, sink, 4)
+        sink.gate.set()
+        bus.flush()
+
+        assert sum(sink.batches, []) == [0, 3, 4]
+        assert bus.stats()["dropped"] == 2
+
+    def test_failing_sink_does_not_stop_others(self):
+        ring = RingBufferSink()
+
+        def boom(batch):
+            raise RuntimeError("disk full")
+
+        bus = EventBus([CallbackSink("bad", boom), ring])
+        bus.emit("p", {"i": 1})
+        bus.flush()
+        assert ring.recent("p") == [{"i": 1}]
+        assert bus.stats()["sink_errors"] == 1
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError):
+            EventBus([], policy="maybe")
+
+    def test_sink_without_write_batch_fails_at_construction(self):
+        class IncompleteSink(EventSink):
+            name = "incomplete"
+
+        with pytest.raises(TypeError):
+            IncompleteSink()
+
+
+def test_emit_event_writes_log_and_status_off_thread(tmp_path, monkeypatch):
+    monkeypatch.setattr(events, "ARTIFACTS_DIR", tmp_path)
+    events.emit_event("proj", "step_started", {"step_key": "step_1", "current_step": 1})
+    events.emit_event("proj", "step_completed", {"step_key": "step_1", "status": "completed"})
+    events.flush_status("proj")
+
+    logged = [json.loads(l) for l in (tmp_path / "proj" / "events.log").read_text().splitlines()]
+    assert [e["type"] for e in logged] == ["step_started", "step_completed"]
+    status = json.loads((tmp_path / "proj" / "status.json").read_text())
+    assert status["current_step"] == 1
+    assert status["steps"]["step_1"]["status"] == "completed"
+    assert [e["type"] for e in events.recent_events("proj")] == ["step_started", "step_completed"]
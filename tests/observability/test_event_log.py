@@ -0,0 +1,140 @@
+"""
+Tests for the indexed event log: tail and cursor reads, segment rollover,
+index recovery, and the server's incremental and SSE endpoints.
+"""
+
+import json
+
+from src.observability import server
+from src.observability.event_log import EventLog
+
+
+def _lines(start, stop):
+    return [json.dumps({"i": i}) + "\n" for i in range(start, stop)]
+
+
+class TestEventLog:
+    def test_tail_and_since(self, tmp_path):
+        log = EventLog(tmp_path / "events.log")
+        log.append(_lines(0, 5))
+        assert log.append(_lines(5, 8)) == 8
+
+        events, cursor = log.tail(3)
+        assert [e["i"] for e in events] == [5, 6, 7] and cursor == 8
+
+        events, cursor = log.since(2, limit=4)
+        assert [e["i"] for e in events] == [2, 3, 4, 5] and cursor == 6
+        assert log.since(8) == ([], 8)
+        assert log.since(50) == ([], 8)
+
+    def test_segments_roll_over(self, tmp_path):
+        log = EventLog(tmp_path / "events.log", segment_bytes=30)
+        for i in range(6):
+            log.append(_lines(i, i + 1))
+
+        assert (tmp_path / "events.1.log").exists()
+        events, _ = log.tail(6)
+        assert [e["i"] for e in events] == list(range(6))
+        assert [e["i"] for e in log.since(1, limit=3)[0]] == [1, 2, 3]
+
+    def test_indexes_legacy_log_and_drops_partial_line(self, tmp_path):
+        path = tmp_path / "events.log"
+        path.write_text("".join(_lines(0, 3)) + '{"i": 3', encoding="utf-8")
+
+        log = EventLog(path)
+        log.append(_lines(4, 5))
+
+        events, cursor = log.tail(10)
+        assert [e["i"] for e in events] == [0, 1, 2, 4] and cursor == 4
+
+    def test_recovers_lines_written_without_index(self, tmp_path):
+        path = tmp_path / "events.log"
+        EventLog(path).append(_lines(0, 2))
+        with open(path, "a", encoding="utf-8") as f:
+            f.writelines(_lines(2, 4))  # data landed, index didn't
+
+        log = EventLog(path)
+        log.append(_lines(4, 5))
+        assert [e["i"] for e in log.tail(10)[0]] == [0, 1, 2, 3, 4]
+
+    def test_reads_log_without_index(self, tmp_path):
+        path = tmp_path / "events.log"
+        path.write_text("".join(_lines(0, 4)) + '{"i": 4', encoding="utf-8")
+
+        log = EventLog(path)
+        assert log.count() == 4
+        events, cursor = log.tail(2)
+        assert [e["i"] for e in events] == [2, 3] and cursor == 4
+        assert not log.index_path.exists()  # readers leave the index to the writer
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(', "done": true}\n')
+        assert [e["i"] for e in log.since(3)[0]] == [3, 4]
+
+    def test_reads_past_a_lagging_index(self, tmp_path):
+        path = tmp_path / "events.log"
+        EventLog(path, segment_bytes=30).append(_lines(0, 2))
+        with open(path, "a", encoding="utf-8") as f:
+            f.writelines(_lines(2, 4))  # another process, between data and index writes
+        (tmp_path / "events.1.log").write_text("".join(_lines(4, 6)), encoding="utf-8")
+
+        reader = EventLog(path)
+        assert reader.count() == 6
+        assert [e["i"] for e in reader.since(1, limit=10)[0]] == [1, 2, 3, 4, 5]
+
+        writer = EventLog(path, segment_bytes=30)
+        writer.append(_lines(6, 7))
+        assert writer._indexed_count() == 7
+        assert [e["i"] for e in reader.tail(10)[0]] == list(range(7))
+
+
+class TestEventEndpoints:
+    def test_incremental_and_stream(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "ARTIFACTS_DIR", tmp_path)
+        log = EventLog(tmp_path / "proj" / "events.log")
+        log.append(_lines(0, 5))
+        client = server.app.test_client()
+
+        res = client.get("/projects/proj/events?n=2")
+        assert [e["i"] for e in res.get_json()] == [3, 4]
+        assert res.headers["X-Event-Cursor"] == "5"
+
+        log.append(_lines(5, 7))
+        page = client.get("/projects/proj/events?since=5").get_json()
+        assert [e["i"] for e in page["events"]] == [5, 6] and page["cursor"] == 7
+        assert client.get("/projects/proj/events?since=7&wait=0.05").get_json() == {"events": [], "cursor": 7}
+
+        res = client.get("/projects/proj/events/stream", headers={"Last-Event-ID": "5"})
+        assert res.mimetype == "text/event-stream"
+        stream = res.iter_encoded()
+        assert next(stream) == b'id: 6\ndata: {"i": 5}\n\n'
+        assert next(stream) == b'id: 7\ndata: {"i": 6}\n\n'
+        res.close()
+
+    def test_legacy_log_is_scanned_once_across_requests(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "ARTIFACTS_DIR", tmp_path)
+        (tmp_path / "proj").mkdir()
+        (tmp_path / "proj" / "events.log").write_text("".join(_lines(0, 5)), encoding="utf-8")
+        scan_starts = []
+        scan_lines = server.EventLog._scan_lines
+
+        def spy(self, segment, pos, skip_first, records):
+            scan_starts.append(pos)
+            return scan_lines(self, segment, pos, skip_first, records)
+
+        monkeypatch.setattr(server.EventLog, "_scan_lines", spy)
+        client = server.app.test_client()
+        for _ in range(3):
+            assert [e["i"] for e in client.get("/projects/proj/events?n=2").get_json()] == [3, 4]
+
+        assert scan_starts.count(0) == 1  # later requests resume from the end of the file
+
+    def test_missing_project_has_no_events(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "ARTIFACTS_DIR", tmp_path)
+        assert server.app.test_client().get("/projects/none/events").get_json() == []
+
+    def test_bad_cursor_is_rejected(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "ARTIFACTS_DIR", tmp_path)
+        client = server.app.test_client()
+        assert client.get("/projects/proj/events?since=abc").status_code == 400
+        assert client.get("/projects/proj/events/stream", headers={"Last-Event-ID": "x"}).status_code == 400
@@ -0,0 +1,43 @@
+"""
+Tests for bounded histories: eviction, recent-window reads, and lifetime
+aggregates that survive eviction.
+"""
+
+from src.observability.history import BoundedHistory
+
+
+class TestBoundedHistory:
+    def test_keeps_only_the_newest_records(self):
+        h = BoundedHistory(maxlen=3)
+        for i in range(5):
+            h.append(i)
+        assert list(h) == [2, 3, 4]
+        assert len(h) == 3
+        assert h.total == 5
+        assert h[0] == 2 and h.last() == 4
+        assert h.recent(2) == [3, 4]
+        assert h.recent(10) == [2, 3, 4]
+        assert h.recent(0) == []
+
+    def test_aggregates_cover_evicted_records(self):
+        h = BoundedHistory(
+            maxlen=2,
+            fields={'seconds': lambda r: r['seconds']},
+            keys={'status': lambda r: r.get('status')},
+        )
+        h.append({'seconds': 1.0, 'status': 'completed'})
+        h.append({'seconds': 3.0, 'status': 'failed'})
+        h.append({'seconds': 5.0, 'status': 'completed'})
+        h.append({'status': None})  # no value for either aggregate
+
+        assert h.stats('seconds') == {'count': 3, 'sum': 9.0, 'mean': 3.0, 'min': 1.0, 'max': 5.0}
+        assert h.counts('status') == {'completed': 2, 'failed': 1}
+        assert h.total == 4
+
+    def test_clear_resets_records_and_aggregates(self):
+        h = BoundedHistory(fields={'n': lambda r: r}, keys={'parity': lambda r: r % 2})
+        h.append(1)
+        h.clear()
+        assert not h and h.last() is None and h.total == 0
+        assert h.stats('n')['count'] == 0
+        assert h.counts('parity') == {}
@@ -0,0 +1,62 @@
+"""
+Tests for the pipeline metrics registry: counters, histograms, windowed
+rates, scrape-time queue gauges and the Prometheus exposition.
+"""
+
+import queue
+
+import pytest
+
+from src.observability.metrics import MetricsRegistry, PipelineMetrics, RateWindow
+
+
+class TestPipelineMetrics:
+    def test_step_scene_and_validation_metrics(self):
+        m = PipelineMetrics()
+        m.step_finished("screenplay", "6", True, 42.0)
+        m.step_finished("screenplay", "6", False, 3.0)
+        m.scenes_drafted("screenplay", 10)
+        m.validation("checkpoint", 3, False)
+        m.checkpoint(3, 2)
+        m.shots_produced(120)
+
+        text = m.prometheus_text()
+        assert 'snowflake_steps_completed_total{pipeline="screenplay",step="6",result="success"} 1' in text
+        assert 'snowflake_step_duration_seconds_bucket{pipeline="screenplay",step="6",le="60"} 2' in text
+        assert 'snowflake_step_duration_seconds_bucket{pipeline="screenplay",step="6",le="30"} 1' in text
+        assert 'snowflake_scenes_drafted_total{pipeline="screenplay"} 10' in text
+        assert 'snowflake_scenes_drafted_per_minute 2' in text  # 10 scenes over a 5-minute window
+        assert 'snowflake_validation_attempts_total{kind="checkpoint",step="3",result="invalid"} 1' in text
+        assert 'snowflake_checkpoint_failures_total{step="3"} 2' in text
+        assert "snowflake_shots_produced_total 120" in text
+
+    def test_queue_depth_is_sampled_at_scrape(self):
+        m = PipelineMetrics()
+        q = queue.Queue()
+        m.watch_queue("event_bus", q.qsize)
+        m.queue_depth("dag_ready_steps", 2)
+        q.put(1)
+        q.put(2)
+        q.put(3)
+        text = m.prometheus_text()
+        assert 'snowflake_queue_depth{queue="event_bus"} 3' in text
+        assert 'snowflake_queue_depth{queue="dag_ready_steps"} 2' in text
+
+    def test_conflicting_registration_is_rejected(self):
+        r = MetricsRegistry()
+        r.counter("x_total", "x", ("a",))
+        r.counter("x_total", "x", ("a",))
+        with pytest.raises(ValueError):
+            r.gauge("x_total", "x", ("a",))
+
+
+class TestRateWindow:
+    def test_old_seconds_fall_out_of_the_window(self):
+        w = RateWindow(window_seconds=10)
+        w.add(50, now=100.0)
+        w.add(50, now=105.0)
+        assert w.per_second(now=105.0) == 10
+        assert w.per_second(now=112.0) == 5
+        w.add(20, now=112.0)  # reuses the bucket of second 102
+        assert w.per_second(now=112.0) == 7
+        assert w.per_second(now=200.0) == 0
@@ -0,0 +1,21 @@
+"""
+Tests for the /metrics endpoint: every metric family is declared once.
+"""
+
+from collections import Counter
+
+from src.ai.telemetry import CallRecord, get_call_telemetry
+from src.observability import server
+
+
+def test_metric_families_are_unique():
+    get_call_telemetry().record(CallRecord(provider="openai", model="gpt-test", outcome="ok",
+                                           latency_seconds=0.1))
+    text = server.app.test_client().get("/metrics").get_data(as_text=True)
+
+    families = [line.split()[2] for line in text.splitlines() if line.startswith("# TYPE ")]
+    assert "snowflake_metrics_error" not in families
+    assert "snowflake_ai_calls_total" in families
+    assert "snowflake_ai_requests_sent_total" in families
+    duplicates = [name for name, count in Counter(families).items() if count > 1]
+    assert duplicates == []
@@ -0,0 +1,61 @@
+"""
+Tests for the write-behind state store: coalesced background flushes,
+explicit flushes and atomic writes.
+"""
+
+import json
+import time
+
+import pytest
+
+from src.observability.state_store import WriteBehindStore
+
+
+def _read(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+class TestWriteBehindStore:
+    def test_updates_are_coalesced_into_one_write(self, tmp_path):
+        path = tmp_path / "status.json"
+        store = WriteBehindStore(flush_seconds=0.1)
+
+        for _ in range(50):
+            store.update(path, lambda d: d.__setitem__("n", d.get("n", 0) + 1), dict)
+        assert store.load(path) == {"n": 50}
+        assert store.stats()["writes"] == 0
+
+        deadline = time.monotonic() + 2
+        while store.pending() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert _read(path) == {"n": 50}
+        assert store.stats()["writes"] == 1
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_explicit_flush_and_write_through(self, tmp_path):
+        path = tmp_path / "project.json"
+        store = WriteBehindStore(flush_seconds=60)
+        store.put(path, {"current_step": 0})
+        assert not path.exists()
+        store.flush()
+        assert _read(path) == {"current_step": 0}
+
+        store.update(path, lambda d: d.update(current_step=3), flush=True)
+        assert _read(path)["current_step"] == 3
+
+        direct = WriteBehindStore(flush_seconds=0)
+        direct.update(tmp_path / "x.json", lambda d: d.update(a=1), dict)
+        assert _read(tmp_path / "x.json") == {"a": 1}
+
+    def test_missing_document_without_default_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            WriteBehindStore().update(tmp_path / "none.json", lambda d: None)
+
+    def test_forget_rereads_external_edits(self, tmp_path):
+        path = tmp_path / "project.json"
+        store = WriteBehindStore(flush_seconds=60)
+        store.put(path, {"v": 1}, flush=True)
+        path.write_text(json.dumps({"v": 2}), encoding="utf-8")
+        assert store.load(path) == {"v": 1}
+        store.forget(path)
+        assert store.load(path) == {"v": 2}
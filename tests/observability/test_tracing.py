@@ -0,0 +1,101 @@
+"""
+Tests for run tracing: span nesting, propagation into worker threads and
+asyncio tasks, error status, and the Chrome / OTLP exports.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.observability.tracing import (
+    trace_run, span, record_span, set_span_attributes, load_trace, list_traces,
+    to_chrome_trace, to_otlp,
+)
+
+
+def _only_trace(directory):
+    files = list(directory.glob("*.jsonl"))
+    assert len(files) == 1
+    return load_trace(files[0])
+
+
+class TestTracing:
+    def test_spans_nest_and_are_written_per_run(self, tmp_path):
+        with trace_run("pipeline", tmp_path, project_id="p1"):
+            with span("step.6", step=6):
+                with span("act.draft", act="ACT ONE"):
+                    set_span_attributes(prompt_tokens=120)
+                record_span("ai.stream", 0, model="m")
+
+        spans = {s["name"]: s for s in _only_trace(tmp_path)}
+        assert spans["pipeline"]["parentSpanId"] == ""
+        assert spans["step.6"]["parentSpanId"] == spans["pipeline"]["spanId"]
+        assert spans["act.draft"]["parentSpanId"] == spans["step.6"]["spanId"]
+        assert spans["ai.stream"]["parentSpanId"] == spans["step.6"]["spanId"]
+        assert spans["act.draft"]["attributes"] == {"act": "ACT ONE", "prompt_tokens": 120}
+        assert len({s["traceId"] for s in spans.values()}) == 1
+
+    def test_context_follows_threads_and_tasks(self, tmp_path):
+        async def call(n):
+            with span("ai.generate", n=n):
+                await asyncio.sleep(0)
+
+        async def fan_out():
+            await asyncio.gather(call(1), call(2))
+
+        with trace_run("pipeline", tmp_path):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = [pool.submit(contextvars.copy_context().run, span_in_thread, n) for n in (1, 2)]
+                [f.result() for f in futures]
+            asyncio.run(fan_out())
+
+        spans = _only_trace(tmp_path)
+        root = next(s for s in spans if s["name"] == "pipeline")
+        children = [s for s in spans if s["name"] in ("scene.draft", "ai.generate")]
+        assert len(children) == 4
+        assert all(s["parentSpanId"] == root["spanId"] for s in children)
+
+    def test_errors_mark_the_span_and_propagate(self, tmp_path):
+        with pytest.raises(ValueError):
+            with trace_run("pipeline", tmp_path):
+                with span("act.checker"):
+                    raise ValueError("bad JSON")
+
+        checker = next(s for s in _only_trace(tmp_path) if s["name"] == "act.checker")
+        assert checker["status"] == "error"
+        assert checker["attributes"]["error"] == "ValueError: bad JSON"
+        assert list_traces(tmp_path)[0]["status"] == "error"
+
+    def test_spans_outside_a_run_are_noops(self, tmp_path, monkeypatch):
+        with span("orphan") as s:
+            assert s is None
+        monkeypatch.setenv("SNOWFLAKE_TRACING", "0")
+        with trace_run("pipeline", tmp_path) as root:
+            assert root is None
+        assert not list(tmp_path.glob("*.jsonl"))
+
+    def test_exports(self, tmp_path):
+        with trace_run("pipeline", tmp_path):
+            with span("step.1", step=1, success=True):
+                pass
+        spans = _only_trace(tmp_path)
+
+        chrome = to_chrome_trace(spans)
+        complete = [e for e in chrome["traceEvents"] if e["ph"] == "X"]
+        assert [e["name"] for e in complete] == ["pipeline", "step.1"]
+        assert complete[1]["ts"] >= complete[0]["ts"]
+        assert complete[1]["args"]["step"] == 1
+
+        otlp = to_otlp(spans)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        step = next(s for s in otlp if s["name"] == "step.1")
+        attrs = {a["key"]: a["value"] for a in step["attributes"]}
+        assert attrs["step"] == {"intValue": "1"}
+        assert attrs["success"] == {"boolValue": True}
+        assert step["status"] == {"code": 1}
+
+
+def span_in_thread(n):
+    with span("scene.draft", scene=n):
+        pass
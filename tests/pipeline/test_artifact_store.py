@@ -0,0 +1,75 @@
+"""
+Tests for the artifact store: LRU hits on unchanged files, pickup of
+rewritten files, copy-on-load, shared read-only loads and eviction.
+"""
+
+import json
+import os
+
+from src.pipeline import artifact_store
+from src.pipeline.artifact_store import ArtifactStore
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+class TestArtifactStore:
+    def test_unchanged_file_is_served_from_memory(self, tmp_path):
+        path = tmp_path / "step_8_scene_list.json"
+        _write(path, {"scenes": [{"n": 1}]})
+        store = ArtifactStore()
+
+        first = store.load("p", 8, path)
+        first["scenes"].append({"n": 2})  # callers get private copies
+        second = store.load("p", 8, path)
+
+        assert second == {"scenes": [{"n": 1}]}
+        assert store.stats()["hits"] == 1
+        assert store.stats()["misses"] == 1
+
+    def test_read_only_loads_share_one_value(self, tmp_path):
+        path = tmp_path / "step_8_scene_list.json"
+        _write(path, {"scenes": [{"n": 1}]})
+        store = ArtifactStore()
+
+        private = store.load("p", 8, path)
+        private["scenes"].clear()  # a copy from the first (missing) load is private too
+        shared = store.load("p", 8, path, copy=False)
+
+        assert shared == {"scenes": [{"n": 1}]}
+        assert store.load("p", 8, path, copy=False) is shared
+        assert store.load("p", 8, path) is not shared
+
+    def test_rewritten_file_is_reloaded(self, tmp_path):
+        path = tmp_path / "a.json"
+        _write(path, {"v": 1})
+        store = ArtifactStore()
+        assert store.load("p", 1, path) == {"v": 1}
+        hash_v1 = store.content_hash("p", 1, path)
+
+        _write(path, {"v": 2})
+        os.utime(path, ns=(1, 1))
+        assert store.load("p", 1, path) == {"v": 2}
+        assert store.content_hash("p", 1, path) != hash_v1
+        assert store.load("p", 1, tmp_path / "missing.json") is None
+
+    def test_large_files_are_memory_mapped(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(artifact_store, "MMAP_THRESHOLD", 10)
+        path = tmp_path / "big.json"
+        _write(path, {"text": "x" * 1000})
+        assert ArtifactStore().load("p", 10, path)["text"] == "x" * 1000
+
+    def test_lru_evicts_oldest(self, tmp_path):
+        store = ArtifactStore(max_entries=2)
+        paths = []
+        for i in range(3):
+            paths.append(tmp_path / f"{i}.json")
+            _write(paths[-1], {"i": i})
+            store.load("p", i, paths[-1])
+
+        assert store.stats()["entries"] == 2
+        assert store.stats()["evictions"] == 1
+        store.invalidate("p")
+        assert store.stats()["entries"] == 0
+        assert store.load("p", 0, paths[0]) == {"i": 0}
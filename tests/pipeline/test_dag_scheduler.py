@@ -0,0 +1,163 @@
+"""
+Tests for the DAG step scheduler and its use in SnowflakePipeline.execute_all_steps.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.pipeline.dag_scheduler import DAGScheduler
+from src.pipeline.orchestrator import STEP_DEPENDENCIES, SnowflakePipeline
+from src.ui.progress_tracker import ProgressTracker
+
+
+def _recorder(log, delay=0.0, fail=()):
+    lock = threading.Lock()
+
+    def make(step):
+        def task():
+            with lock:
+                log.append(("start", step))
+            time.sleep(delay)
+            with lock:
+                log.append(("end", step))
+            return step not in fail, f"step {step}"
+        return task
+    return make
+
+
+def _overlapped(log, a, b):
+    """True if a and b were running at the same time"""
+    pos = {event: i for i, event in enumerate(log)}
+    return pos[("start", a)] < pos[("end", b)] and pos[("start", b)] < pos[("end", a)]
+
+
+class TestDAGScheduler:
+    def test_independent_steps_overlap(self):
+        log = []
+        make = _recorder(log, delay=0.05)
+        result = DAGScheduler(STEP_DEPENDENCIES, max_workers=3).run({s: make(s) for s in range(11)})
+
+        assert result["success"]
+        assert sorted(result["completed"]) == list(range(11))
+        assert _overlapped(log, 3, 4)
+        # Dependencies are always respected
+        pos = {event: i for i, event in enumerate(log)}
+        for step, deps in STEP_DEPENDENCIES.items():
+            for d in deps:
+                assert pos[("end", d)] < pos[("start", step)]
+
+    def test_single_worker_runs_in_step_order(self):
+        log = []
+        make = _recorder(log)
+        DAGScheduler(STEP_DEPENDENCIES, max_workers=1).run({s: make(s) for s in range(11)})
+        assert [s for kind, s in log if kind == "start"] == list(range(11))
+
+    def test_failure_stops_new_dispatch(self):
+        log = []
+        make = _recorder(log, fail={3})
+        result = DAGScheduler(STEP_DEPENDENCIES, max_workers=1).run({s: make(s) for s in range(11)})
+
+        assert not result["success"]
+        assert result["failed"] == {3: "step 3"}
+        assert 5 in result["skipped"] and 10 in result["skipped"]
+
+    def test_exceptions_count_as_failures(self):
+        def boom():
+            raise RuntimeError("kaboom")
+        result = DAGScheduler({1: [0]}).run({0: boom, 1: lambda: (True, "")})
+        assert "kaboom" in result["failed"][0]
+        assert result["skipped"] == [1]
+
+    def test_critical_path_follows_last_finishing_dependency(self):
+        tasks = {
+            0: lambda: (True, ""),
+            1: lambda: (time.sleep(0.08), (True, ""))[1],
+            2: lambda: (True, ""),
+            3: lambda: (True, ""),
+        }
+        result = DAGScheduler({1: [0], 2: [0], 3: [1, 2]}, max_workers=2).run(tasks)
+        assert result["critical_path"] == [0, 1, 3]
+
+    def test_cycle_is_rejected(self):
+        with pytest.raises(ValueError):
+            DAGScheduler({0: [1], 1: [0]}).run({0: lambda: (True, ""), 1: lambda: (True, "")})
+
+
+def test_execute_all_steps_emits_dag_events(tmp_path, monkeypatch):
+    events = []
+    monkeypatch.setattr("src.pipeline.orchestrator.emit_event",
+                        lambda pid, kind, payload: events.append((kind, payload)))
+    pipeline = SnowflakePipeline(str(tmp_path))
+    pipeline.create_project("dag test")
+    for step in range(11):
+        if step in (0, 1):
+            monkeypatch.setattr(pipeline, f"execute_step_{step}", lambda *a: (True, {}, "ok"))
+        elif step == 10:
+            monkeypatch.setattr(pipeline, "execute_step_10", lambda *a: (True, {}, "ok"))
+        else:
+            monkeypatch.setattr(pipeline, f"execute_step_{step}", lambda: (True, {}, "ok"))
+
+    assert pipeline.execute_all_steps("brief", "story", max_parallel_steps=3)
+
+    kinds = [k for k, _ in events]
+    assert kinds.count("dag_step_start") == 11
+    assert kinds.count("dag_step_finish") == 11
+    summary = [p for k, p in events if k == "pipeline_dag_complete"][0]
+    assert summary["success"] is True
+    assert summary["critical_path"][0] == 0 and summary["critical_path"][-1] == 10
+
+
+def test_step_progress_reaches_the_tracker(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr("src.pipeline.orchestrator.emit_event", lambda *a: None)
+    pipeline = SnowflakePipeline(str(tmp_path))
+    pipeline.create_project("progress test")
+    seen = []
+
+    def step_9():
+        pipeline.progress_tracker.update_step_progress(1, 2, "Scene 1", step_num=9)
+        seen.append(pipeline.progress_tracker.step_progress[9])
+        return True, {}, "ok"
+
+    for step in range(11):
+        monkeypatch.setattr(pipeline, f"execute_step_{step}",
+                            step_9 if step == 9 else lambda *a: (True, {}, "ok"))
+
+    assert pipeline.execute_all_steps("brief", "story", max_parallel_steps=3)
+
+    assert seen == [(1, 2)]
+    assert "Progress: |" in capsys.readouterr().out
+    assert pipeline.progress_tracker.active_steps == {}
+
+
+def test_overlapping_steps_are_tracked_separately(capsys):
+    tracker = ProgressTracker(show_timestamps=False)
+    tracker.start_step(3, "Character Summaries")
+    tracker.start_step(4, "One Page Synopsis")
+
+    tracker.finish_step(True, step_num=3)
+    assert tracker.current_step == 4
+    tracker.update_step_progress(1, 4, "page", step_num=4)
+    tracker.finish_step(False, step_num=4)
+
+    out = capsys.readouterr().out
+    assert "Step 3 completed" in out and "Step 4 failed" in out
+    assert "Progress: |" in out
+    assert tracker.current_step is None
+
+
+def test_interleaved_progress_is_attributed_to_its_step():
+    tracker = ProgressTracker(show_timestamps=False)
+    tracker.start_step(3, "Character Summaries")
+    tracker.start_step(4, "One Page Synopsis")  # now the current step
+
+    tracker.update_step_progress(1, 5, "character", step_num=3)
+    tracker.update_step_progress(2, 8, "page", step_num=4)
+    tracker.update_step_progress(2, 5, "character", step_num=3)
+    assert tracker.step_progress == {3: (2, 5), 4: (2, 8)}
+
+    tracker.finish_step(False, step_num=3)
+    assert sorted(tracker.active_steps) == [4]
+    tracker.update_step_progress(3, 5, "late update", step_num=3)  # finished steps are ignored
+    assert tracker.step_progress[3] == (2, 5)
@@ -0,0 +1,110 @@
+"""
+Tests for hash-based incremental rebuilds in SnowflakePipeline.
+"""
+
+import hashlib
+import json
+
+import pytest
+
+from src.pipeline.orchestrator import SnowflakePipeline, STEP_ARTIFACT_FILES
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.pipeline.orchestrator.emit_event", lambda *a: None)
+    pipeline = SnowflakePipeline(str(tmp_path))
+    pipeline.create_project("incremental")
+    return pipeline
+
+
+def _write(pipeline, step, artifact):
+    path = pipeline.project_dir / pipeline.current_project_id / STEP_ARTIFACT_FILES[step]
+    path.write_text(json.dumps(artifact), encoding="utf-8")
+
+
+def _build_fresh_tree(pipeline):
+    """Write artifacts 0-10 whose recorded upstream hashes all match"""
+    _write(pipeline, 0, {"category": "thriller"})
+    for step in range(1, 11):
+        _write(pipeline, step, {"content": f"step {step}", "metadata": {}})
+    # Stamping a step changes the inputs of later steps, so stamp in step order
+    for step in range(1, 11):
+        artifact = pipeline._load_step_artifact(step)
+        artifact["metadata"]["hash_upstream"] = pipeline.compute_upstream_hash(step)
+        _write(pipeline, step, artifact)
+
+
+def test_upstream_hash_matches_step_formula(pipeline):
+    step0 = {"category": "thriller"}
+    _write(pipeline, 0, step0)
+    expected = hashlib.sha256(json.dumps(step0, sort_keys=True).encode()).hexdigest()
+    assert pipeline.compute_upstream_hash(1) == expected
+
+
+def test_fresh_tree_has_nothing_to_rebuild(pipeline):
+    _build_fresh_tree(pipeline)
+    assert pipeline.plan_incremental_rebuild() == {}
+
+
+def test_edit_marks_step_and_descendants_stale(pipeline):
+    _build_fresh_tree(pipeline)
+    edited = pipeline._load_step_artifact(8)
+    edited["content"] = "scene 4 rewritten"
+    _write(pipeline, 8, edited)
+
+    stale = pipeline.plan_incremental_rebuild()
+    assert sorted(stale) == [9, 10]
+    assert stale[9] == "inputs changed"
+
+
+def test_missing_artifact_is_stale(pipeline):
+    _build_fresh_tree(pipeline)
+    (pipeline.project_dir / pipeline.current_project_id / STEP_ARTIFACT_FILES[5]).unlink()
+    assert sorted(pipeline.plan_incremental_rebuild()) == [5, 7, 8, 9, 10]
+
+
+def test_execute_incremental_runs_only_stale_steps(pipeline, monkeypatch):
+    _build_fresh_tree(pipeline)
+    edited = pipeline._load_step_artifact(7)
+    edited["content"] = "new bible"
+    _write(pipeline, 7, edited)
+
+    ran = []
+    for step in range(11):
+        runner = (lambda s: (lambda *a: ran.append(s) or (True, {}, "ok")))(step)
+        monkeypatch.setattr(pipeline, f"execute_step_{step}", runner)
+
+    result = pipeline.execute_incremental(max_parallel_steps=1)
+    assert result["success"]
+    assert sorted(ran) == [8, 9, 10]
+    assert result["rebuilt"] == [8, 9, 10]
+
+
+def test_stale_step_0_needs_brief(pipeline):
+    result = pipeline.execute_incremental()
+    assert not result["success"]
+    assert 0 in result["failed"]
+
+
+def test_regenerate_from_step_0_runs_step_1_with_saved_brief(pipeline, monkeypatch):
+    _build_fresh_tree(pipeline)
+    monkeypatch.setattr(pipeline.step1, "execute",
+                        lambda step0, brief, project_id: (True, {"logline": brief}, "ok"))
+    pipeline.execute_step_1("A heist goes wrong")
+
+    briefs = []
+    monkeypatch.setattr(pipeline, "execute_step_1", lambda brief: briefs.append(brief) or (True, {}, "ok"))
+    for step in range(2, 11):
+        monkeypatch.setattr(pipeline, f"execute_step_{step}", lambda *a: (True, {}, "ok"))
+
+    regenerated = pipeline.regenerate_downstream(0, max_parallel_steps=1)
+    assert briefs == ["A heist goes wrong"]
+    assert regenerated == [f"step_{step}" for step in range(1, 11)]
+
+
+def test_regenerate_step_1_without_a_brief_fails_fast(pipeline, monkeypatch):
+    _build_fresh_tree(pipeline)
+    monkeypatch.setattr(pipeline, "execute_step_1", lambda brief: pytest.fail("step 1 ran"))
+    with pytest.raises(ValueError, match="story_brief"):
+        pipeline.regenerate_downstream(0)
@@ -0,0 +1,69 @@
+"""
+Tests for the rolling story-state cache: incremental updates, invalidation
+of later snapshots, persistence and bounded digest size.
+"""
+
+from src.pipeline.story_state import StoryState, get_story_state, STORY_STATE_FILE
+
+
+def _scene(n, **overrides):
+    scene = {
+        "scene_number": n,
+        "slugline": f"INT. ROOM {n} - NIGHT",
+        "characters_present": [f"CHAR{n % 4}"],
+        "emotional_start": "+",
+        "emotional_end": f"mood {n}",
+        "conflict": f"conflict {n}",
+    }
+    scene.update(overrides)
+    return scene
+
+
+class TestStoryState:
+    def test_digest_before_scene_covers_only_earlier_scenes(self):
+        state = StoryState(recent_beats=2)
+        for n in range(1, 6):
+            state.update(_scene(n))
+
+        digest = state.digest(before_scene=4)
+        assert "Scene 3 " in digest and "Scene 2 " in digest
+        assert "Scene 1 " not in digest and "Scene 4 " not in digest
+        assert "CHAR3 (sc 3): mood 3" in digest
+        assert state.digest(before_scene=1) == ""
+
+    def test_sync_reuses_unchanged_prefix_and_drops_later_snapshots(self):
+        state = StoryState()
+        scenes = [_scene(n) for n in range(1, 6)]
+        state.sync(scenes)
+        assert state.stats()["updates"] == 5
+
+        state.sync(scenes)
+        assert state.stats()["updates"] == 5
+
+        scenes[2] = _scene(3, conflict="a new betrayal")
+        state.sync(scenes)
+        assert state.stats()["updates"] == 8  # scenes 3, 4 and 5 recomputed
+        assert "a new betrayal" in state.digest(before_scene=5)
+
+        state.update(_scene(2, conflict="rewritten"))
+        assert state.stats()["snapshots"] == 2
+
+    def test_persists_and_reloads(self, tmp_path):
+        state = get_story_state(tmp_path, "proj")
+        state.sync([_scene(n) for n in range(1, 4)])
+        assert (tmp_path / "proj" / STORY_STATE_FILE).exists()
+        assert get_story_state(tmp_path, "proj") is state
+
+        reloaded = StoryState(tmp_path / "proj" / STORY_STATE_FILE)
+        assert reloaded.digest() == state.digest()
+        reloaded.sync([_scene(n) for n in range(1, 4)])
+        assert reloaded.stats()["updates"] == 0
+
+    def test_digest_size_is_bounded(self):
+        state = StoryState(max_characters=3, max_threads=2, recent_beats=3, line_chars=40)
+        state.sync([_scene(n, summary="x" * 500) for n in range(1, 11)])
+        short = len(state.digest())
+
+        state.sync([_scene(n, summary="x" * 500) for n in range(1, 201)])
+        assert len(state.digest()) <= short + 60  # only scene numbers got longer
+        assert state.digest().count("\n") == 5
@@ -294,3 +294,86 @@ class TestNewPipelineSteps:
         assert "3b" in artifacts
         assert "3c" in artifacts
         assert "5b" in artifacts
+
+
+class TestSpeculativeCheckpoints:
+    """3b/3c and 5b run alongside the Step 3/5 checkpoints when enabled."""
+
+    def _mock_steps(self, pipeline):
+        pipeline.current_project_id = "test"
+        pipeline.execute_step_1 = MagicMock(return_value=(True, {"title": "T", "logline": "L"}, "ok"))
+        pipeline.execute_step_2 = MagicMock(return_value=(True, {"genre": "dude_with_a_problem"}, "ok"))
+        pipeline.execute_step_3 = MagicMock(return_value=(True, {"hero": {"name": "Alex"}}, "ok"))
+        pipeline.execute_step_3b = MagicMock(side_effect=lambda s1, s2, s3: (True, {"hero_seen": s3["hero"]["name"]}, "ok"))
+        pipeline.execute_step_3c = MagicMock(return_value=(True, {"cast_summary": {}}, "ok"))
+        pipeline.execute_step_4 = MagicMock(return_value=(True, {"beats": []}, "ok"))
+        pipeline.execute_step_5 = MagicMock(return_value=(True, {"row_1_act_one": []}, "ok"))
+        pipeline.execute_step_5b = MagicMock(return_value=(True, {"style_bible": {}}, "ok"))
+        pipeline.execute_step_6 = MagicMock(return_value=(True, {"scenes": [], "total_pages": 1}, "ok"))
+        pipeline.execute_step_7 = MagicMock(return_value=(True, {"laws": []}, "ok"))
+        pipeline.execute_step_8 = MagicMock(return_value=(True, {"diagnostics": []}, "ok"))
+        pipeline.execute_step_9 = MagicMock(return_value=(True, {}, "ok"))
+        pipeline.execute_shot_pipeline = MagicMock(return_value=(False, {}, "skipped"))
+
+    def test_branch_runs_during_checkpoint_and_is_kept(self, tmp_path):
+        import threading
+        pipeline = ScreenplayPipeline(str(tmp_path), speculative_checkpoints=True)
+        self._mock_steps(pipeline)
+        branch_started = threading.Event()
+        pipeline.execute_step_3b.side_effect = lambda *a: branch_started.set() or (True, {"arena": {}}, "ok")
+
+        def checkpoint(step_num, artifact, *_):
+            if step_num == 3:
+                # Only completes if 3b is running concurrently
+                assert branch_started.wait(5)
+            return {**artifact, "metadata": {"version": "1.0.1"}}
+
+        pipeline._run_checkpoint_and_revise = MagicMock(side_effect=checkpoint)
+
+        success, artifacts, _ = pipeline.run_full_pipeline({"step_0": {}})
+        assert success is True
+        assert pipeline.execute_step_3b.call_count == 1
+        assert pipeline.execute_step_3c.call_count == 1
+        assert pipeline.execute_step_5b.call_count == 1
+        assert artifacts[3]["metadata"]["version"] == "1.0.1"
+
+    def test_revised_artifact_invalidates_branch(self, tmp_path):
+        pipeline = ScreenplayPipeline(str(tmp_path), speculative_checkpoints=True)
+        self._mock_steps(pipeline)
+
+        def checkpoint(step_num, artifact, *_):
+            if step_num == 3:
+                return {"hero": {"name": "Revised"}}
+            return artifact
+
+        pipeline._run_checkpoint_and_revise = MagicMock(side_effect=checkpoint)
+
+        success, artifacts, _ = pipeline.run_full_pipeline({"step_0": {}})
+        assert success is True
+        assert pipeline.execute_step_3b.call_count == 2
+        assert pipeline.execute_step_3c.call_count == 2
+        assert pipeline.execute_step_5b.call_count == 1
+        assert artifacts["3b"] == {"hero_seen": "Revised"}
+
+    def test_checkpoint_sees_a_snapshot_of_artifacts(self, tmp_path):
+        import threading
+        pipeline = ScreenplayPipeline(str(tmp_path), speculative_checkpoints=True)
+        self._mock_steps(pipeline)
+        branch_done = threading.Event()
+        pipeline.execute_step_3c.side_effect = lambda *a: branch_done.set() or (True, {"cast_summary": {}}, "ok")
+        seen = {}
+
+        def checkpoint(step_num, artifact, all_artifacts, *_):
+            if step_num == 3:
+                keys = set(all_artifacts)
+                assert branch_done.wait(5)
+                seen["keys"] = (keys, set(all_artifacts))
+            return artifact
+
+        pipeline._run_checkpoint_and_revise = MagicMock(side_effect=checkpoint)
+
+        success, artifacts, _ = pipeline.run_full_pipeline({"step_0": {}})
+        assert success is True
+        before, after = seen["keys"]
+        assert before == after and "3b" not in after
+        assert "3b" in artifacts and "3c" in artifacts
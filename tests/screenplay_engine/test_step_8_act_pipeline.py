@@ -0,0 +1,118 @@
+"""
+Tests for pipelined act-by-act generation in Step8Screenplay: the next act is
+drafted while the current act is checked, and reconciled only if the
+revision changed the current act's closing scenes.
+"""
+
+import threading
+
+import pytest
+
+from src.screenplay_engine.pipeline.steps.step_8_screenplay import Step8Screenplay
+
+
+def _ctx():
+    return {
+        "board_cards": [{"card_number": i + 1} for i in range(20)],
+        "title": "T", "logline": "L", "genre": "g", "format_value": "feature",
+        "hero_summary": "", "characters_summary": "", "character_identifiers": "",
+        "hero_name": "HERO", "antagonist_name": "VILLAIN",
+        "project_id": "proj", "model_config": {"model_name": "m"},
+    }
+
+
+def _scenes(start, n, tag="draft"):
+    return [{"scene_number": start + i, "text": tag} for i in range(n)]
+
+
+@pytest.fixture
+def step(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCREENPLAY_PIPELINE_ACTS", "1")
+    step = Step8Screenplay(str(tmp_path))
+    monkeypatch.setattr(step, "_assemble_screenplay", lambda scenes, *a: {"scenes": scenes})
+    monkeypatch.setattr(step, "_add_metadata", lambda content, *a: {**content, "metadata": {}})
+    monkeypatch.setattr(step.validator, "validate", lambda sp: (True, []))
+    monkeypatch.setattr(step, "save_artifact", lambda sp, pid: "path")
+    return step
+
+
+def test_next_act_drafted_while_current_act_is_checked(step, monkeypatch):
+    second_draft_started = threading.Event()
+    reconciled = []
+
+    def draft(run, ctx, label, cards, previous, start):
+        if label == "Act 2A":
+            second_draft_started.set()
+        return _scenes(start, len(cards))
+
+    def check(run, ctx, label, cards, scenes, previous):
+        if label == "Act 1":
+            # Only completes if Act 2A is drafted concurrently
+            assert second_draft_started.wait(5)
+        return scenes, 0, 0
+
+    monkeypatch.setattr(step, "_draft_act", draft)
+    monkeypatch.setattr(step, "_check_and_revise_act", check)
+    monkeypatch.setattr(step, "_reconcile_act_opening", lambda *a: reconciled.append(a) or a[4])
+
+    ok, screenplay, _ = step._execute_act_by_act(_ctx())
+    assert ok
+    assert len(screenplay["scenes"]) == 20
+    assert reconciled == []
+    assert screenplay["metadata"]["pipelined_acts"] is True
+
+
+def test_reconciles_only_when_closing_scenes_change(step, monkeypatch):
+    reconciled = []
+
+    def check(run, ctx, label, cards, scenes, previous):
+        if label == "Act 1":
+            scenes = scenes[:-1] + [{"scene_number": scenes[-1]["scene_number"], "text": "revised"}]
+            return scenes, 1, 1
+        return scenes, 0, 0
+
+    def reconcile(run, ctx, label, cards, scenes, previous, tail):
+        reconciled.append((label, previous[-1]["text"]))
+        return [dict(s, text="reconciled") if i < tail else s for i, s in enumerate(scenes)]
+
+    monkeypatch.setattr(step, "_draft_act", lambda run, ctx, label, cards, prev, start: _scenes(start, len(cards)))
+    monkeypatch.setattr(step, "_check_and_revise_act", check)
+    monkeypatch.setattr(step, "_reconcile_act_opening", reconcile)
+
+    ok, screenplay, _ = step._execute_act_by_act(_ctx())
+    assert ok
+    assert reconciled == [("Act 2A", "revised")]
+    assert screenplay["scenes"][10]["text"] == "reconciled"
+    assert screenplay["scenes"][12]["text"] == "draft"
+    assert screenplay["metadata"]["acts_reconciled"] == 1
+
+
+def test_sequential_mode_drafts_after_check(step, monkeypatch):
+    monkeypatch.setenv("SCREENPLAY_PIPELINE_ACTS", "0")
+    order = []
+
+    def draft(run, ctx, label, cards, previous, start):
+        order.append(("draft", label, len(previous)))
+        return _scenes(start, len(cards))
+
+    def check(run, ctx, label, cards, scenes, previous):
+        order.append(("check", label))
+        return scenes, 0, 0
+
+    monkeypatch.setattr(step, "_draft_act", draft)
+    monkeypatch.setattr(step, "_check_and_revise_act", check)
+
+    ok, _, _ = step._execute_act_by_act(_ctx())
+    assert ok
+    assert order == [("draft", "Act 1", 0), ("check", "Act 1"),
+                     ("draft", "Act 2A", 10), ("check", "Act 2A")]
+
+
+def test_checker_failure_aborts(step, monkeypatch):
+    monkeypatch.setattr(step, "_draft_act", lambda run, ctx, label, cards, prev, start: _scenes(start, len(cards)))
+    monkeypatch.setattr(step.prompt_generator, "generate_act_diagnostic_prompt", lambda **kw: {})
+    monkeypatch.setattr(step, "_run_act_checker_with_retry", lambda **kw: (_ for _ in ()).throw(ValueError("bad json")))
+
+    ok, _, message = step._execute_act_by_act(_ctx())
+    assert not ok
+    assert "Checker diagnostic failed for Act 1" in message
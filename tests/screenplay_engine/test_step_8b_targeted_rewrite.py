@@ -0,0 +1,103 @@
+"""
+Tests for Step 8b targeted rewrites: bounded concurrency, bounded prompt
+context and splicing results back in scene order.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from src.pipeline.story_state import StoryState
+from src.screenplay_engine.pipeline.steps.step_8b_targeted_rewrite import Step8bTargetedRewrite
+
+
+def _screenplay(n):
+    return {"scenes": [
+        {"scene_number": i + 1, "slugline": f"INT. ROOM {i + 1} - DAY", "beat": "Fun and Games",
+         "emotional_start": "+", "emotional_end": "-", "conflict": f"conflict {i + 1}",
+         "characters_present": ["ALEX"],
+         "elements": [{"element_type": "action", "content": f"Original action {i + 1}."}]}
+        for i in range(n)
+    ]}
+
+
+def _diagnostics(scene_nums):
+    return {"diagnostics": [{
+        "check_name": "The Hero Leads",
+        "rough_spots": [{"scene": sn, "issue": "passive hero"} for sn in scene_nums],
+        "rewrite_suggestions": {str(sn): f"Make ALEX act in scene {sn}" for sn in scene_nums},
+    }]}
+
+
+def _rewrite_response(prompt, config):
+    scene_num = int(prompt["user"].split("Scene ", 1)[1].split()[0])
+    return json.dumps({"scene_number": scene_num, "elements": [
+        {"element_type": "action", "content": f"Rewritten action {scene_num}."}]})
+
+
+class TestStep8bTargetedRewrite:
+    def test_rewrites_are_concurrent_and_capped(self, tmp_path):
+        step = Step8bTargetedRewrite(str(tmp_path), max_workers=3)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def slow_generate(prompt, config):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return _rewrite_response(prompt, config)
+
+        grok = MagicMock()
+        grok.generate.side_effect = slow_generate
+        with patch("src.screenplay_engine.pipeline.steps.step_8b_targeted_rewrite.AIGenerator", return_value=grok):
+            ok, artifact, _ = step.execute(_screenplay(12), _diagnostics(range(2, 12)), {}, {})
+
+        assert ok
+        assert 1 < state["peak"] <= 3
+        assert artifact["metadata"]["step_8b_scenes_rewritten"] == 10
+        texts = [s["elements"][0]["content"] for s in artifact["scenes"]]
+        assert texts[0] == "Original action 1."
+        assert texts[1:11] == [f"Rewritten action {n}." for n in range(2, 12)]
+        assert [s["scene_number"] for s in artifact["scenes"]] == list(range(1, 13))
+
+    def test_context_window_is_bounded(self, tmp_path):
+        step = Step8bTargetedRewrite(str(tmp_path), context_scenes=2)
+        scenes = _screenplay(30)["scenes"]
+        story_state = StoryState()
+        story_state.sync(scenes)
+
+        full, synopsis = step._build_context_window(scenes, 30, story_state)
+        assert [s["scene_number"] for s in full] == [28, 29]
+        assert "Scene 27 " in synopsis and "Scene 5 " not in synopsis
+        assert "Original action" not in synopsis
+
+        # Digest size doesn't grow with screenplay length
+        long_scenes = _screenplay(120)["scenes"]
+        story_state.sync(long_scenes)
+        _, long_synopsis = step._build_context_window(long_scenes, 120, story_state)
+        assert len(long_synopsis) <= len(synopsis) + 20
+
+        prompt = step._build_scene_rewrite_prompt(
+            scenes[29], [{"check_name": "X", "fix_instruction": "Y"}], full, "T", "L", "ALEX",
+            earlier_synopsis=synopsis,
+        )
+        assert "Original action 28." in prompt["user"]
+        assert "Original action 5." not in prompt["user"]
+        assert "STORY SO FAR" in prompt["user"]
+
+    def test_failed_rewrite_keeps_original(self, tmp_path):
+        step = Step8bTargetedRewrite(str(tmp_path), max_workers=2)
+        grok = MagicMock()
+        grok.generate.side_effect = lambda prompt, config: (
+            "not json" if prompt["user"].startswith("TARGETED SCENE REWRITE — Scene 3\n") else _rewrite_response(prompt, config))
+        with patch("src.screenplay_engine.pipeline.steps.step_8b_targeted_rewrite.AIGenerator", return_value=grok):
+            ok, artifact, message = step.execute(_screenplay(4), _diagnostics([2, 3]), {}, {})
+
+        assert ok
+        assert artifact["scenes"][2]["elements"][0]["content"] == "Original action 3."
+        assert artifact["scenes"][1]["elements"][0]["content"] == "Rewritten action 2."
+        assert "scenes [3]" in message
@@ -966,6 +966,23 @@ class TestStep8Execution:
         loaded = step_executor.load_artifact(project_id)
         assert "Caf\u00e9" in loaded["scenes"][0]["elements"][1]["content"]
 
+    def test_stream_indexes_scenes_completed_by_one_chunk(self, step_executor, monkeypatch):
+        scenes = [_make_scene(n) for n in (1, 2, 3)]
+        text = json.dumps({"title": "T", "scenes": scenes})
+        chunks = [text[:len(text) // 4], text[len(text) // 4:]]  # second chunk finishes all three
+
+        class Generator:
+            def stream(self, prompt, model_config):
+                return iter(chunks)
+
+        seen = []
+        monkeypatch.setattr(step_executor, "generator", Generator())
+        monkeypatch.setattr(step_executor.validator, "validate_scene",
+                            lambda scene, index: seen.append((scene["scene_number"], index)) or (True, []))
+
+        assert step_executor._stream_monolithic({}, {}) == text
+        assert seen == [(1, 0), (2, 1), (3, 2)]
+
 
 # ===========================================================================
 # METADATA
@@ -1433,28 +1450,6 @@ class TestStep8SceneBySceneHelpers:
         identifiers = step_executor._build_character_identifiers({})
         assert "HERO" in identifiers  # Still generates hero placeholder
 
-    def test_build_previous_summary_empty(self, step_executor):
-        result = step_executor._build_previous_summary([])
-        assert result == ""
-
-    def test_build_previous_summary_with_scenes(self, step_executor):
-        scenes = [
-            _make_scene(scene_number=1, beat="Opening Image", conflict="A vs B; A wins"),
-            _make_scene(scene_number=2, beat="Theme Stated", conflict="C vs D; D loses"),
-        ]
-        result = step_executor._build_previous_summary(scenes)
-        assert "Scene 1" in result
-        assert "Scene 2" in result
-        assert "Opening Image" in result
-        assert "Theme Stated" in result
-        assert "A vs B" in result
-
-    def test_build_previous_summary_truncates_long_conflict(self, step_executor):
-        scene = _make_scene(conflict="X" * 200)
-        result = step_executor._build_previous_summary([scene])
-        assert "..." in result
-        assert len(result) < 300
-
     def test_parse_single_scene_valid_json(self, step_executor):
         scene_json = json.dumps(_make_scene())
         result = step_executor._parse_single_scene(scene_json)
@@ -0,0 +1,196 @@
+"""
+Test Suite for Step 10: First Draft
+Tests concurrent scene drafting, continuity handoff, chapter assembly
+and per-scene checkpoint/resume
+"""
+
+import json
+import unittest
+import threading
+import time
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+from src.pipeline.steps.step_10_first_draft import Step10FirstDraft
+
+
+def _inputs(n, chapter_breaks=(), dependent=()):
+    scenes, briefs = [], []
+    for i in range(n):
+        scene = {
+            "pov": "Ava",
+            "summary": f"Scene {i + 1} summary",
+            "word_target": 200,
+            "inbound_hook": f"in-{i + 1}",
+            "outbound_hook": f"out-{i + 1}",
+        }
+        if i in chapter_breaks:
+            scene["chapter_hint"] = "Ch1 Ch2 Ch3 Ch4"
+        scenes.append(scene)
+        brief = {"type": "Proactive"}
+        if i in dependent:
+            brief["depends_on_previous"] = True
+        briefs.append(brief)
+    return {"scene_briefs": briefs}, {"bibles": []}, {"scenes": scenes}
+
+
+class TestStep10ConcurrentDrafting(unittest.TestCase):
+    """Test the drafting scheduler in Step 10"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _fake_prose(self, contexts):
+        lock = threading.Lock()
+
+        def fake(scene_context, bible, word_target, min_words=500):
+            num = int(scene_context["summary"].split()[1])
+            time.sleep(0.001 * (10 - num % 10))
+            with lock:
+                contexts[num] = scene_context
+            return f"scene{num} " + "word " * 500 + f"end{num}", False
+        return fake
+
+    def test_assembly_is_deterministic(self):
+        """Chapters and scene order follow the scene list, not completion order"""
+        step = Step10FirstDraft(self.temp_dir, max_workers=4)
+        contexts = {}
+        with patch.object(step.bulletproof_prose_generator, "generate_scene_with_status",
+                          side_effect=self._fake_prose(contexts)):
+            ok, artifact, _ = step.execute(*_inputs(12, chapter_breaks=(3, 6)), "proj")
+
+        self.assertTrue(ok)
+        chapters = artifact["manuscript"]["chapters"]
+        self.assertEqual([c["number"] for c in chapters], [1, 2, 3])
+        layout = [[s["scene_number"] for s in c["scenes"]] for c in chapters]
+        self.assertEqual(layout, [[1, 2, 3], [4, 5, 6], list(range(7, 13))])
+        for chapter in chapters:
+            for scene in chapter["scenes"]:
+                self.assertTrue(scene["prose"].startswith(f"scene{scene['scene_number']} "))
+
+    def test_continuity_comes_from_hooks(self):
+        """Each scene sees its neighbours' hooks, not their prose"""
+        step = Step10FirstDraft(self.temp_dir, max_workers=4)
+        contexts = {}
+        with patch.object(step.bulletproof_prose_generator, "generate_scene_with_status",
+                          side_effect=self._fake_prose(contexts)):
+            step.execute(*_inputs(3), "proj")
+
+        self.assertEqual(contexts[2]["previous_outbound_hook"], "out-1")
+        self.assertEqual(contexts[2]["next_inbound_hook"], "in-3")
+        self.assertNotIn("previous_outbound_hook", contexts[1])
+        self.assertNotIn("previous_scene_text", contexts[2])
+
+    def test_story_so_far_comes_from_earlier_scenes(self):
+        """Each scene's prompt carries the digest of the scenes planned before it"""
+        step = Step10FirstDraft(self.temp_dir, max_workers=4)
+        contexts = {}
+        with patch.object(step.bulletproof_prose_generator, "generate_scene_with_status",
+                          side_effect=self._fake_prose(contexts)):
+            step.execute(*_inputs(3), "proj")
+
+        self.assertNotIn("story_so_far", contexts[1])
+        self.assertIn("Scene 2 summary", contexts[3]["story_so_far"])
+        self.assertNotIn("Scene 3 summary", contexts[3]["story_so_far"])
+        prompt = step.bulletproof_prose_generator._build_prose_prompt(contexts[3], None, 200)
+        self.assertIn(contexts[3]["story_so_far"], prompt["user"])
+
+    def test_hard_dependencies_are_serialized(self):
+        """Scenes that depend on the previous text run after it and receive it"""
+        step = Step10FirstDraft(self.temp_dir, max_workers=4)
+        step9, _, step8 = _inputs(5, dependent=(2, 3))
+        chains = step._build_scene_chains(list(zip(step8["scenes"], step9["scene_briefs"])))
+        self.assertEqual(chains, [[0], [1, 2, 3], [4]])
+
+        contexts = {}
+        with patch.object(step.bulletproof_prose_generator, "generate_scene_with_status",
+                          side_effect=self._fake_prose(contexts)):
+            step.execute(*_inputs(5, dependent=(2,)), "proj")
+
+        self.assertTrue(contexts[3]["previous_scene_text"].endswith("end2"))
+        self.assertNotIn("previous_scene_text", contexts[4])
+
+    def test_dependencies_ignored_when_not_serializing(self):
+        """With serialization off, every scene is its own chain"""
+        step = Step10FirstDraft(self.temp_dir, max_workers=4, serialize_dependencies=False)
+        step9, _, step8 = _inputs(4, dependent=(1, 2, 3))
+        chains = step._build_scene_chains(list(zip(step8["scenes"], step9["scene_briefs"])))
+        self.assertEqual(chains, [[0], [1], [2], [3]])
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class TestStep10SceneCheckpoints(unittest.TestCase):
+    """Test per-scene checkpointing and resume"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _run(self, step, inputs, fallback=False):
+        calls = []
+
+        def fake(scene_context, bible, word_target, min_words=500):
+            calls.append(scene_context["summary"])
+            return "word " * 500, fallback
+
+        with patch.object(step.bulletproof_prose_generator, "generate_scene_with_status",
+                          side_effect=fake):
+            ok, artifact, _ = step.execute(*inputs, "proj")
+        return calls, artifact
+
+    def test_each_scene_is_persisted(self):
+        """Every drafted scene lands in the JSONL log"""
+        step = Step10FirstDraft(self.temp_dir, max_workers=3)
+        self._run(step, _inputs(12))
+        log = Path(self.temp_dir) / "proj" / Step10FirstDraft.SCENE_CHECKPOINT_FILE
+        lines = log.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 12)
+        self.assertEqual(sorted(json.loads(l)["scene_number"] for l in lines), list(range(1, 13)))
+
+    def test_resume_skips_unchanged_scenes(self):
+        """A rerun only drafts scenes whose brief or prompt changed"""
+        step = Step10FirstDraft(self.temp_dir, max_workers=3)
+        inputs = _inputs(12)
+        first_calls, _ = self._run(step, inputs)
+        self.assertEqual(len(first_calls), 12)
+
+        second_calls, artifact = self._run(step, inputs)
+        self.assertEqual(second_calls, [])
+        self.assertEqual(artifact["manuscript"]["total_scenes"], 12)
+
+        inputs[0]["scene_briefs"][4]["goal"] = "a brand new goal for scene five"
+        third_calls, _ = self._run(step, inputs)
+        self.assertEqual(third_calls, ["Scene 5 summary"])
+
+    def test_torn_last_line_is_ignored(self):
+        """A crash mid-write leaves a partial line that resume tolerates"""
+        step = Step10FirstDraft(self.temp_dir, max_workers=3)
+        inputs = _inputs(12)
+        self._run(step, inputs)
+        log = Path(self.temp_dir) / "proj" / Step10FirstDraft.SCENE_CHECKPOINT_FILE
+        with open(log, "a", encoding="utf-8") as f:
+            f.write('{"scene_number": 3, "brief_ha')
+
+        calls, _ = self._run(Step10FirstDraft(self.temp_dir, max_workers=3), inputs)
+        self.assertEqual(calls, [])
+
+    def test_fallback_prose_is_not_checkpointed(self):
+        """Emergency prose is used for the run but drafted again on resume"""
+        step = Step10FirstDraft(self.temp_dir, max_workers=3)
+        inputs = _inputs(4)
+        self._run(step, inputs, fallback=True)
+        log = Path(self.temp_dir) / "proj" / Step10FirstDraft.SCENE_CHECKPOINT_FILE
+        self.assertFalse(log.exists() and log.read_text(encoding="utf-8").strip())
+
+        calls, _ = self._run(step, inputs)
+        self.assertEqual(len(calls), 4)
@@ -0,0 +1,162 @@
+"""
+Test Suite for Step 9 V2: Scene Briefs
+Tests concurrent brief generation, ordering and per-scene retry
+"""
+
+import json
+import unittest
+import threading
+import time
+import tempfile
+import shutil
+from unittest.mock import patch
+
+from src.pipeline.steps.step_9_scene_briefs_v2 import Step9SceneBriefsV2
+
+
+def _scenes(n):
+    return [
+        {"type": "Proactive" if i % 2 == 0 else "Reactive",
+         "pov": "Ava", "summary": f"Scene {i + 1} summary"}
+        for i in range(n)
+    ]
+
+
+class TestStep9ConcurrentBriefs(unittest.TestCase):
+    """Test bounded-concurrency brief generation"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_brief_order_matches_scene_order(self):
+        """Briefs come back in scene order even when they finish out of order"""
+        step = Step9SceneBriefsV2(self.temp_dir, max_workers=4)
+
+        def fake_brief(scene, scene_num, step8, config):
+            time.sleep(0.001 * (10 - scene_num))  # later scenes finish first
+            return {"type": scene["type"], "scene_num": scene_num}
+
+        with patch.object(step, "_generate_single_brief", side_effect=fake_brief):
+            ok, artifact, _ = step.execute({"scenes": _scenes(10)}, "proj")
+
+        self.assertTrue(ok)
+        nums = [b["scene_num"] for b in artifact["scene_briefs"]]
+        self.assertEqual(nums, list(range(1, 11)))
+
+    def test_worker_limit_is_respected(self):
+        """No more than max_workers briefs are in flight at once"""
+        step = Step9SceneBriefsV2(self.temp_dir, max_workers=3)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fake_brief(scene, scene_num, step8, config):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return {"type": scene["type"]}
+
+        with patch.object(step, "_generate_single_brief", side_effect=fake_brief):
+            step.execute({"scenes": _scenes(12)}, "proj")
+
+        self.assertLessEqual(state["peak"], 3)
+        self.assertGreater(state["peak"], 1)
+
+    def test_failed_scene_is_retried_alone(self):
+        """A failing scene is retried without regenerating the others"""
+        step = Step9SceneBriefsV2(self.temp_dir, max_workers=2)
+        calls = {}
+
+        def flaky(scene, scene_num, step8, config):
+            calls[scene_num] = calls.get(scene_num, 0) + 1
+            if scene_num == 2 and calls[scene_num] == 1:
+                raise RuntimeError("transient")
+            return {"type": scene["type"], "scene_num": scene_num}
+
+        with patch.object(step, "_generate_single_brief", side_effect=flaky):
+            _, artifact, _ = step.execute({"scenes": _scenes(4)}, "proj")
+
+        self.assertEqual(calls, {1: 1, 2: 2, 3: 1, 4: 1})
+        self.assertEqual(artifact["scene_briefs"][1]["scene_num"], 2)
+
+    def test_exhausted_retries_use_fallback_brief(self):
+        """A scene that keeps failing gets a concrete fallback brief"""
+        step = Step9SceneBriefsV2(self.temp_dir, max_workers=2)
+
+        with patch.object(step, "_generate_single_brief", side_effect=RuntimeError("down")):
+            _, artifact, _ = step.execute({"scenes": _scenes(2)}, "proj")
+
+        self.assertEqual(artifact["scene_briefs"][0]["type"], "Proactive")
+        self.assertIn("goal", artifact["scene_briefs"][0])
+        self.assertIn("reaction", artifact["scene_briefs"][1])
+
+    def test_rerun_regenerates_only_edited_scene(self):
+        """Unchanged scenes keep their brief from the previous run"""
+        step = Step9SceneBriefsV2(self.temp_dir, max_workers=2)
+        calls = []
+
+        def fake_brief(scene, scene_num, step8, config):
+            calls.append(scene_num)
+            return {"type": scene["type"], "summary": scene["summary"]}
+
+        scenes = _scenes(5)
+        with patch.object(step, "_generate_single_brief", side_effect=fake_brief):
+            step.execute({"scenes": scenes}, "proj")
+            calls.clear()
+            scenes[2]["summary"] = "Scene 3 rewritten"
+            _, artifact, _ = step.execute({"scenes": scenes}, "proj")
+
+        self.assertEqual(calls, [3])
+        self.assertEqual(artifact["scene_briefs"][2]["summary"], "Scene 3 rewritten")
+        self.assertEqual(artifact["scene_briefs"][0]["summary"], "Scene 1 summary")
+
+    def test_fallback_briefs_are_not_reused(self):
+        """A scene that fell back is generated again on the next run"""
+        step = Step9SceneBriefsV2(self.temp_dir, max_workers=2)
+        calls = []
+        down = {2}
+
+        def flaky(scene, scene_num, step8, config):
+            calls.append(scene_num)
+            if scene_num in down:
+                raise RuntimeError("down")
+            return {"type": scene["type"], "scene_num": scene_num}
+
+        with patch.object(step, "_generate_single_brief", side_effect=flaky):
+            _, first, _ = step.execute({"scenes": _scenes(2)}, "proj")
+            calls.clear()
+            down.clear()
+            _, second, _ = step.execute({"scenes": _scenes(2)}, "proj")
+
+        self.assertIsNone(first["metadata"]["scene_hashes"][1])
+        self.assertNotIn("scene_num", first["scene_briefs"][1])
+        self.assertEqual(calls, [2])
+        self.assertEqual(second["scene_briefs"][1]["scene_num"], 2)
+
+    def test_emergency_output_is_retried(self):
+        """Emergency generator output and unparseable replies count as failed attempts"""
+        step = Step9SceneBriefsV2(self.temp_dir, max_workers=1)
+        brief = json.dumps({
+            "goal": "steal the ledger from the vault before midnight",
+            "conflict": "the night guard knows her face and the cameras are live",
+            "setback": "the ledger is gone and the alarm is already ringing",
+            "stakes": "her brother is charged with the theft at dawn",
+        })
+        for first_reply in [("emergency", True), ("no brief here at all", False)]:
+            replies = [first_reply, (brief, False)]
+            with patch.object(step.bulletproof_generator, "generate_with_status",
+                              side_effect=lambda prompt, config: replies.pop(0)):
+                brief_data, is_fallback = step._generate_brief_with_retry(_scenes(1)[0], 1, {}, {})
+
+            self.assertFalse(is_fallback)
+            self.assertEqual(replies, [])
+            self.assertTrue(brief_data["goal"].startswith("steal the ledger"))
+
+
+if __name__ == "__main__":
+    unittest.main()